@@ -5,20 +5,31 @@ Provides a high-level interface to the Google People API for:
 - Listing contacts with pagination and sync token support
 - Creating, updating, and deleting contacts
 - Batch operations for efficient bulk processing
-- Exponential backoff retry logic for rate limits
+- Client-side rate limiting per account, and jittered exponential backoff
+  retry when the quota is exceeded anyway
 """
 
 import logging
+import random
+import threading
 import time
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, TypeVar
 
+import httplib2
+from google.auth.exceptions import GoogleAuthError
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from gcontact_sync.api.rate_limiter import READ, WRITE, RateLimiter, RateLimitStats
 from gcontact_sync.sync.contact import Contact
 
+# Failures below the HTTP status level: connection errors and timeouts from
+# the transport, and credential refresh errors
+TRANSPORT_ERRORS = (OSError, httplib2.HttpLib2Error, GoogleAuthError)
+
 # Person fields to request from the API
 # These are the fields we sync between accounts
 PERSON_FIELDS = ",".join(
@@ -34,6 +45,12 @@ PERSON_FIELDS = ",".join(
     ]
 )
 
+# Minimal fields for callers that only need to identify contacts (names,
+# emails and phones for matching; metadata for the deleted flag)
+IDENTITY_PERSON_FIELDS = ",".join(
+    ["names", "emailAddresses", "phoneNumbers", "metadata"]
+)
+
 # Fields to update when modifying contacts
 # Note: "photos" cannot be updated via batchUpdateContacts - must use updateContactPhoto
 UPDATE_PERSON_FIELDS = ",".join(
@@ -52,6 +69,13 @@ DEFAULT_PAGE_SIZE = 100
 # Maximum contacts per batch operation
 DEFAULT_BATCH_SIZE = 200
 
+# Contact batches sent at once by the batch_* methods (1 = one at a time)
+DEFAULT_MAX_IN_FLIGHT_BATCHES = 1
+
+# Sub-requests per batch HTTP request (Google allows at most 1000)
+DEFAULT_BATCH_HTTP_SIZE = 100
+MAX_BATCH_HTTP_SIZE = 1000
+
 # Retry configuration defaults
 DEFAULT_MAX_RETRIES = 5
 DEFAULT_INITIAL_RETRY_DELAY = 1.0  # seconds
@@ -59,11 +83,21 @@ DEFAULT_MAX_RETRY_DELAY = 60.0  # seconds
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class PeopleAPIError(Exception):
     """Raised when a People API operation fails."""
 
-    pass
+    @property
+    def status(self) -> int | None:
+        """HTTP status of the response behind the error, if any."""
+        cause = self.__cause__
+        if isinstance(cause, HttpError):
+            return int(cause.resp.status)
+        status = getattr(cause, "status", None)
+        return status if isinstance(status, int) else None
 
 
 class RateLimitError(PeopleAPIError):
@@ -72,6 +106,95 @@ class RateLimitError(PeopleAPIError):
     pass
 
 
+class BatchWriteError(PeopleAPIError):
+    """
+    Raised when some batches of a batch write fail.
+
+    The other batches have been written. Batches not sent because the rate
+    limit ran out get the RateLimitError that stopped the write.
+
+    Attributes:
+        results: One entry per input item, in order: the written item (or
+            True for deletes), or None if the item was not written
+        errors: One entry per input item, in order: the PeopleAPIError of the
+            item's batch, or None if the item was written
+    """
+
+    def __init__(
+        self,
+        message: str,
+        results: list[Any],
+        errors: list[PeopleAPIError | None],
+    ):
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+
+    @property
+    def failed_indexes(self) -> list[int]:
+        """Indexes of the input items that were not written."""
+        return [i for i, error in enumerate(self.errors) if error is not None]
+
+    @property
+    def rate_limited(self) -> bool:
+        """Whether the write stopped because the rate limit ran out."""
+        return any(isinstance(error, RateLimitError) for error in self.errors)
+
+
+class ContactStream:
+    """
+    Iterator over contacts listed page by page.
+
+    Returned by PeopleAPI.iter_contacts(). Pages are requested lazily as the
+    stream is consumed, so only one page of raw API results is held at a
+    time. The stream can be iterated once.
+
+    Attributes:
+        sync_token: Sync token returned with the final page. Only set once the
+            stream has been exhausted.
+        exhausted: Whether every page has been read
+        count: Number of contacts yielded so far
+
+    Usage:
+        stream = api.iter_contacts()
+        for contact in stream:
+            ...
+        next_sync_token = stream.sync_token
+    """
+
+    def __init__(self, pages: Iterator[tuple[list[Contact], str | None]]):
+        """
+        Initialize the stream.
+
+        Args:
+            pages: Iterator of (parsed contacts, next sync token) per page
+        """
+        self.sync_token: str | None = None
+        self.exhausted = False
+        self.count = 0
+        self._contacts = self._iter_pages(pages)
+
+    def _iter_pages(
+        self, pages: Iterator[tuple[list[Contact], str | None]]
+    ) -> Iterator[Contact]:
+        """Flatten pages into contacts, recording the final sync token."""
+        next_sync_token: str | None = None
+        for page, page_sync_token in pages:
+            yield from page
+            next_sync_token = page_sync_token
+
+        self.sync_token = next_sync_token
+        self.exhausted = True
+
+    def __iter__(self) -> "ContactStream":
+        return self
+
+    def __next__(self) -> Contact:
+        contact = next(self._contacts)
+        self.count += 1
+        return contact
+
+
 class PeopleAPI:
     """
     Google People API wrapper for contact operations.
@@ -113,6 +236,9 @@ class PeopleAPI:
         max_retries: int = DEFAULT_MAX_RETRIES,
         initial_retry_delay: float = DEFAULT_INITIAL_RETRY_DELAY,
         max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        rate_limiter: RateLimiter | None = None,
+        batch_http_size: int = DEFAULT_BATCH_HTTP_SIZE,
+        max_in_flight_batches: int = DEFAULT_MAX_IN_FLIGHT_BATCHES,
     ):
         """
         Initialize the People API wrapper.
@@ -124,6 +250,13 @@ class PeopleAPI:
             max_retries: Maximum retry attempts for failed API calls (default 5)
             initial_retry_delay: Initial backoff delay in seconds (default 1.0)
             max_retry_delay: Maximum backoff delay in seconds (default 60.0)
+            rate_limiter: Rate limiter for the account's requests (default: a
+                new RateLimiter with the default quotas). Pass the same
+                limiter to every PeopleAPI for one account.
+            batch_http_size: Maximum sub-requests per batch HTTP request for
+                photo and group operations (default 100, at most 1000)
+            max_in_flight_batches: Contact batches the batch_* methods keep in
+                flight at once, each on its own worker thread (default 1)
         """
         self.credentials = credentials
         self.page_size = min(page_size, 1000)  # API max is 1000
@@ -131,13 +264,22 @@ class PeopleAPI:
         self.max_retries = max_retries
         self.initial_retry_delay = initial_retry_delay
         self.max_retry_delay = max_retry_delay
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.batch_http_size = max(1, min(batch_http_size, MAX_BATCH_HTTP_SIZE))
+        self.max_in_flight_batches = max(1, max_in_flight_batches)
         self._service = None
+        # Thread that built _service; None if _service was set directly
+        self._service_thread: int | None = None
+        self._thread_services = threading.local()
 
     @property
     def service(self) -> Any:
         """
         Get or create the Google API service object.
 
+        The service's HTTP transport (httplib2) is not thread-safe, so a
+        thread other than the one that built the service gets its own.
+
         Returns:
             Google People API service resource
 
@@ -145,25 +287,57 @@ class PeopleAPI:
             PeopleAPIError: If service cannot be created
         """
         if self._service is None:
-            try:
-                self._service = build(
-                    "people", "v1", credentials=self.credentials, cache_discovery=False
-                )
-                logger.debug("Created People API service")
-            except Exception as e:
-                logger.error(f"Failed to create People API service: {e}")
-                raise PeopleAPIError(f"Failed to create API service: {e}") from e
-        return self._service
+            self._service = self._build_service()
+            self._service_thread = threading.get_ident()
+            return self._service
+
+        if self._service_thread in (None, threading.get_ident()):
+            return self._service
+
+        service = getattr(self._thread_services, "service", None)
+        if service is None:
+            service = self._build_service()
+            self._thread_services.service = service
+        return service
+
+    def _build_service(self) -> Any:
+        """Build a new People API service object."""
+        try:
+            service = build(
+                "people", "v1", credentials=self.credentials, cache_discovery=False
+            )
+            logger.debug("Created People API service")
+            return service
+        except Exception as e:
+            logger.error(f"Failed to create People API service: {e}")
+            raise PeopleAPIError(f"Failed to create API service: {e}") from e
+
+    def rate_limit_stats(self) -> dict[str, RateLimitStats]:
+        """
+        Get request counters for this account's rate limiter.
+
+        Returns:
+            Dictionary mapping quota class ("read", "write") to its stats
+        """
+        return self.rate_limiter.stats()
 
     def _retry_with_backoff(
-        self, operation: Callable[[], Any], operation_name: str
+        self,
+        operation: Callable[[], Any],
+        operation_name: str,
+        quota: str = READ,
     ) -> Any:
         """
-        Execute an operation with exponential backoff retry.
+        Execute an operation with rate limiting and exponential backoff retry.
+
+        Each attempt waits for the account's rate limiter first. Retry delays
+        are jittered, and a rate limit response pauses every request of the
+        same quota class for the delay, not just this one.
 
         Args:
             operation: Callable to execute
             operation_name: Name for logging purposes
+            quota: Quota class of the request (READ or WRITE)
 
         Returns:
             Result of the operation
@@ -175,20 +349,29 @@ class PeopleAPI:
         delay = self.initial_retry_delay
 
         for attempt in range(self.max_retries):
+            if attempt:
+                self.rate_limiter.record_retry(quota)
+            self.rate_limiter.acquire(quota)
             try:
-                return operation()
+                result = operation()
+                self.rate_limiter.on_success(quota)
+                return result
 
             except HttpError as e:
                 status_code = e.resp.status
+                # Equal jitter: keeps at least half the delay, spreads the rest
+                jittered = random.uniform(delay / 2, delay)
 
                 # Rate limit or quota exceeded - retry with backoff
                 if status_code in (429, 403):
                     if attempt < self.max_retries - 1:
                         logger.warning(
                             f"{operation_name} rate limited, retrying in "
-                            f"{delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+                            f"{jittered:.1f}s "
+                            f"(attempt {attempt + 1}/{self.max_retries})"
                         )
-                        time.sleep(delay)
+                        # The limiter waits out the delay on the next acquire
+                        self.rate_limiter.on_throttled(quota, jittered)
                         delay = min(delay * 2, self.max_retry_delay)
                         continue
                     else:
@@ -201,9 +384,9 @@ class PeopleAPI:
                 if status_code >= 500 and attempt < self.max_retries - 1:
                     logger.warning(
                         f"{operation_name} server error ({status_code}), "
-                        f"retrying in {delay:.1f}s"
+                        f"retrying in {jittered:.1f}s"
                     )
-                    time.sleep(delay)
+                    time.sleep(jittered)
                     delay = min(delay * 2, self.max_retry_delay)
                     continue
 
@@ -211,11 +394,241 @@ class PeopleAPI:
                 logger.error(f"{operation_name} failed with status {status_code}: {e}")
                 raise PeopleAPIError(f"{operation_name} failed: {e}") from e
 
+            except TRANSPORT_ERRORS as e:
+                logger.error(f"{operation_name} failed: {e}")
+                raise PeopleAPIError(f"{operation_name} failed: {e}") from e
+
         # Should not reach here, but just in case
         raise PeopleAPIError(f"{operation_name} failed after all retries")
 
+    def _execute_batch(
+        self,
+        requests: Sequence[Callable[..., Any]],
+        operation_name: str,
+        quota: str = WRITE,
+    ) -> list[Any]:
+        """
+        Execute many requests as batch HTTP requests, with retry.
+
+        Requests are sent in multipart batches of up to batch_http_size
+        sub-requests. Sub-requests that fail with a rate limit or server error
+        are retried together in a later batch, with the same backoff and rate
+        limiting as _retry_with_backoff. Other failures are returned, not
+        raised, so callers can map each one as they would a single request.
+
+        Args:
+            requests: Callables building each request (not executing it)
+            operation_name: Name for logging purposes
+            quota: Quota class of the requests (READ or WRITE)
+
+        Returns:
+            One entry per request, in order: its response, or the exception it
+            failed with (an HttpError, one of TRANSPORT_ERRORS, or a
+            RateLimitError if retries ran out)
+        """
+        outcomes: list[Any] = [None] * len(requests)
+        pending = list(range(len(requests)))
+        delay = self.initial_retry_delay
+
+        for attempt in range(self.max_retries):
+            retry: list[int] = []
+            throttled = False
+
+            for start in range(0, len(pending), self.batch_http_size):
+                chunk = pending[start : start + self.batch_http_size]
+                if attempt:
+                    self.rate_limiter.record_retry(quota, len(chunk))
+                self.rate_limiter.acquire(quota, len(chunk))
+
+                for index, (response, error) in self._send_batch(
+                    requests, chunk
+                ).items():
+                    if error is None:
+                        outcomes[index] = response
+                        self.rate_limiter.on_success(quota)
+                        continue
+
+                    status = error.resp.status if isinstance(error, HttpError) else 0
+                    if status in (429, 403) or status >= 500:
+                        if attempt < self.max_retries - 1:
+                            retry.append(index)
+                            throttled = throttled or status < 500
+                            continue
+                        if status < 500:
+                            rate_error = RateLimitError(
+                                f"Rate limit exceeded for {operation_name} "
+                                f"after {self.max_retries} retries"
+                            )
+                            rate_error.__cause__ = error
+                            error = rate_error
+                    outcomes[index] = error
+
+            if not retry:
+                break
+
+            jittered = random.uniform(delay / 2, delay)
+            logger.warning(
+                f"{operation_name}: retrying {len(retry)} of {len(requests)} "
+                f"requests in {jittered:.1f}s "
+                f"(attempt {attempt + 1}/{self.max_retries})"
+            )
+            if throttled:
+                self.rate_limiter.on_throttled(quota, jittered)
+            else:
+                time.sleep(jittered)
+            delay = min(delay * 2, self.max_retry_delay)
+            pending = sorted(retry)
+
+        return outcomes
+
+    def _send_batch(
+        self, requests: Sequence[Callable[..., Any]], indexes: list[int]
+    ) -> dict[int, tuple[Any, Exception | None]]:
+        """
+        Send one batch HTTP request.
+
+        Args:
+            requests: Callables building each request
+            indexes: Indexes into requests of the sub-requests to send
+
+        Returns:
+            Dictionary mapping each index to (response, exception). If the
+            batch request itself fails, with an HTTP error or one of
+            TRANSPORT_ERRORS, every sub-request gets its error.
+        """
+        responses: dict[int, tuple[Any, Exception | None]] = {}
+
+        def collect(request_id: str, response: Any, exception: Any) -> None:
+            responses[int(request_id)] = (response, exception)
+
+        batch = self.service.new_batch_http_request(callback=collect)
+        for index in indexes:
+            batch.add(requests[index](), request_id=str(index))
+
+        try:
+            batch.execute()
+        except (HttpError, *TRANSPORT_ERRORS) as e:
+            return dict.fromkeys(indexes, (None, e))
+
+        return {
+            index: responses.get(
+                index, (None, PeopleAPIError("No response in batch reply"))
+            )
+            for index in indexes
+        }
+
+    def _run_batches(
+        self,
+        items: Sequence[T],
+        batch_size: int | None,
+        send: Callable[[int, Sequence[T]], list[R | None]],
+        operation_name: str,
+    ) -> list[R | None]:
+        """
+        Split items into batches and send them, keeping several in flight.
+
+        Up to max_in_flight_batches batches are sent at once on worker
+        threads; each thread gets its own service (see the service property)
+        and all of them share the account's rate limiter.
+
+        A failed batch does not stop the others, except when the rate limit
+        ran out: batches not yet started are then skipped, since they would
+        only fail the same way.
+
+        Args:
+            items: Items to send
+            batch_size: Maximum items per batch (default: instance batch_size)
+            send: Callable taking (batch number, batch) and returning one
+                result (or None) per item of the batch
+            operation_name: Name for error messages
+
+        Returns:
+            One result (or None) per item, in item order
+
+        Raises:
+            BatchWriteError: If any batch failed or was skipped
+        """
+        effective_batch_size = batch_size if batch_size is not None else self.batch_size
+        batches = [
+            items[i : i + effective_batch_size]
+            for i in range(0, len(items), effective_batch_size)
+        ]
+        # Per batch: its results, the error it failed with, or None if skipped
+        outcomes: list[list[R | None] | PeopleAPIError | None] = [None] * len(batches)
+
+        workers = min(self.max_in_flight_batches, len(batches))
+        if workers <= 1:
+            for index, batch in enumerate(batches):
+                try:
+                    outcomes[index] = send(index + 1, batch)
+                except PeopleAPIError as e:
+                    outcomes[index] = e
+                    if isinstance(e, RateLimitError):
+                        break
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="people-batch"
+            ) as executor:
+                futures: list[Future[list[R | None]]] = [
+                    executor.submit(send, number, batch)
+                    for number, batch in enumerate(batches, 1)
+                ]
+                try:
+                    for index, future in enumerate(futures):
+                        try:
+                            outcomes[index] = future.result()
+                        except CancelledError:
+                            continue
+                        except PeopleAPIError as e:
+                            outcomes[index] = e
+                            if isinstance(e, RateLimitError):
+                                for pending in futures:
+                                    pending.cancel()
+                except BaseException:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+        stopped_by = next((o for o in outcomes if isinstance(o, RateLimitError)), None)
+        results: list[R | None] = []
+        errors: list[PeopleAPIError | None] = []
+        for batch, outcome in zip(batches, outcomes, strict=True):
+            if isinstance(outcome, list):
+                results.extend(outcome)
+                errors.extend([None] * len(batch))
+            else:
+                results.extend([None] * len(batch))
+                errors.extend([outcome or stopped_by] * len(batch))
+
+        failed = [error for error in errors if error is not None]
+        if failed:
+            raise BatchWriteError(
+                f"{operation_name}: {len(failed)} of {len(items)} items "
+                f"not written: {failed[0]}",
+                results,
+                errors,
+            )
+        return results
+
+    @staticmethod
+    def _batch_error(operation_name: str, error: Exception) -> PeopleAPIError:
+        """Wrap a failed sub-request's error as a PeopleAPIError."""
+        if isinstance(error, PeopleAPIError):
+            return error
+        wrapped = PeopleAPIError(f"{operation_name} failed: {error}")
+        wrapped.__cause__ = error
+        return wrapped
+
+    @staticmethod
+    def _is_status(error: Exception, status: int) -> bool:
+        """Check whether an error is an HttpError with the given status."""
+        return isinstance(error, HttpError) and error.resp.status == status
+
     def list_contacts(
-        self, sync_token: str | None = None, request_sync_token: bool = True
+        self,
+        sync_token: str | None = None,
+        request_sync_token: bool = True,
+        person_fields: str = PERSON_FIELDS,
     ) -> tuple[list[Contact], str | None]:
         """
         List all contacts or get changes since last sync.
@@ -226,6 +639,10 @@ class PeopleAPI:
         Args:
             sync_token: Token from previous sync for incremental updates
             request_sync_token: Whether to request a new sync token (default True)
+            person_fields: Comma-separated person fields to request (default
+                all synced fields). With fewer fields, such as
+                IDENTITY_PERSON_FIELDS, contacts are partial: they cannot be
+                hashed or written back.
 
         Returns:
             Tuple of (list of Contact objects, new sync token or None)
@@ -238,17 +655,137 @@ class PeopleAPI:
             If sync_token is expired or invalid, API returns 410 GONE.
             In this case, caller should retry without sync_token for full sync.
         """
+        stream = self.iter_contacts(
+            sync_token=sync_token,
+            request_sync_token=request_sync_token,
+            person_fields=person_fields,
+        )
+        contacts = list(stream)
+
+        logger.info(f"Listed {len(contacts)} contacts")
+        return contacts, stream.sync_token
+
+    def iter_contacts(
+        self,
+        sync_token: str | None = None,
+        request_sync_token: bool = True,
+        person_fields: str = PERSON_FIELDS,
+    ) -> ContactStream:
+        """
+        Stream all contacts, or the changes since last sync, page by page.
+
+        Like list_contacts(), but contacts are yielded as each page arrives
+        instead of being collected into one list. The new sync token is
+        available as the stream's sync_token attribute once it is exhausted.
+
+        Args:
+            sync_token: Token from previous sync for incremental updates
+            request_sync_token: Whether to request a new sync token (default True)
+            person_fields: Comma-separated person fields to request (see
+                list_contacts)
+
+        Returns:
+            ContactStream yielding Contact objects
+
+        Raises:
+            PeopleAPIError: While iterating, if listing fails (including an
+                expired sync token)
+            RateLimitError: While iterating, if rate limit exceeded
+        """
         logger.debug(f"Listing contacts (sync_token={bool(sync_token)})")
+        return ContactStream(
+            self._list_contact_pages(sync_token, request_sync_token, person_fields)
+        )
 
-        contacts: list[Contact] = []
-        page_token: str | None = None
+    def list_people(
+        self, sync_token: str | None = None, request_sync_token: bool = True
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        List all people, or the changes since last sync, as raw API dictionaries.
+
+        Like list_contacts(), but the person dictionaries are returned as the
+        API sent them (with every synced field), e.g. to be stored locally
+        and parsed later with Contact.from_api_response(). Deleted people in
+        an incremental listing have metadata.deleted set.
+
+        Args:
+            sync_token: Token from previous sync for incremental updates
+            request_sync_token: Whether to request a new sync token (default True)
+
+        Returns:
+            Tuple of (list of person dictionaries, new sync token or None)
+
+        Raises:
+            PeopleAPIError: If listing fails (including an expired sync token)
+            RateLimitError: If rate limit exceeded
+        """
+        people: list[dict[str, Any]] = []
         next_sync_token: str | None = None
+        for page, page_sync_token in self._list_person_pages(
+            sync_token, request_sync_token
+        ):
+            people.extend(page)
+            next_sync_token = page_sync_token or next_sync_token
+
+        logger.info(f"Listed {len(people)} people")
+        return people, next_sync_token
+
+    def _list_contact_pages(
+        self,
+        sync_token: str | None,
+        request_sync_token: bool,
+        person_fields: str = PERSON_FIELDS,
+    ) -> Iterator[tuple[list[Contact], str | None]]:
+        """
+        Request contact pages one at a time.
+
+        Args:
+            sync_token: Token from previous sync for incremental updates
+            request_sync_token: Whether to request a new sync token
+            person_fields: Comma-separated person fields to request
+
+        Yields:
+            Tuple of (contacts parsed from the page, next sync token or None)
+        """
+        # Contacts read with every synced field are not partial
+        partial_fields = None if person_fields == PERSON_FIELDS else person_fields
+
+        for people, next_sync_token in self._list_person_pages(
+            sync_token, request_sync_token, person_fields
+        ):
+            contacts: list[Contact] = []
+            for person in people:
+                try:
+                    contacts.append(Contact.from_api_response(person, partial_fields))
+                except Exception as e:
+                    logger.warning(f"Failed to parse contact: {e}")
+                    continue
+            yield contacts, next_sync_token
+
+    def _list_person_pages(
+        self,
+        sync_token: str | None,
+        request_sync_token: bool,
+        person_fields: str = PERSON_FIELDS,
+    ) -> Iterator[tuple[list[dict[str, Any]], str | None]]:
+        """
+        Request pages of raw person dictionaries one at a time.
+
+        Args:
+            sync_token: Token from previous sync for incremental updates
+            request_sync_token: Whether to request a new sync token
+            person_fields: Comma-separated person fields to request
+
+        Yields:
+            Tuple of (people on the page, next sync token or None)
+        """
+        page_token: str | None = None
 
         while True:
             # Build request parameters
             params: dict[str, Any] = {
                 "resourceName": "people/me",
-                "personFields": PERSON_FIELDS,
+                "personFields": person_fields,
                 "pageSize": self.page_size,
             }
 
@@ -278,26 +815,13 @@ class PeopleAPI:
                     ) from e
                 raise
 
-            # Parse contacts from response
-            connections = response.get("connections", [])
-            for person in connections:
-                try:
-                    contact = Contact.from_api_response(person)
-                    contacts.append(contact)
-                except Exception as e:
-                    logger.warning(f"Failed to parse contact: {e}")
-                    continue
-
             # Get next page token or sync token
             page_token = response.get("nextPageToken")
-            next_sync_token = response.get("nextSyncToken")
+            yield response.get("connections", []), response.get("nextSyncToken")
 
             if not page_token:
                 break
 
-        logger.info(f"Listed {len(contacts)} contacts")
-        return contacts, next_sync_token
-
     def get_contact(self, resource_name: str) -> Contact:
         """
         Get a single contact by resource name.
@@ -354,7 +878,9 @@ class PeopleAPI:
                 .execute()
             )
 
-        response = self._retry_with_backoff(execute_create, "create_contact")
+        response = self._retry_with_backoff(
+            execute_create, "create_contact", quota=WRITE
+        )
         created_contact = Contact.from_api_response(response)
 
         logger.info(f"Created contact: {created_contact.resource_name}")
@@ -406,7 +932,7 @@ class PeopleAPI:
 
         try:
             response = self._retry_with_backoff(
-                execute_update, f"update_contact({target_resource})"
+                execute_update, f"update_contact({target_resource})", quota=WRITE
             )
             updated_contact = Contact.from_api_response(response)
             logger.info(f"Updated contact: {target_resource}")
@@ -445,7 +971,9 @@ class PeopleAPI:
             )
 
         try:
-            self._retry_with_backoff(execute_delete, f"delete_contact({resource_name})")
+            self._retry_with_backoff(
+                execute_delete, f"delete_contact({resource_name})", quota=WRITE
+            )
             logger.info(f"Deleted contact: {resource_name}")
             return True
 
@@ -473,20 +1001,17 @@ class PeopleAPI:
             List of created contacts with resource_names and etags
 
         Raises:
-            PeopleAPIError: If batch creation fails
+            BatchWriteError: If any batch fails; the batches written are
+                reported in its results
         """
         if not contacts:
             return []
 
         logger.debug(f"Batch creating {len(contacts)} contacts")
 
-        effective_batch_size = batch_size if batch_size is not None else self.batch_size
-        created_contacts: list[Contact] = []
-
-        # Process in batches
-        for i in range(0, len(contacts), effective_batch_size):
-            batch = contacts[i : i + effective_batch_size]
-            batch_num = i // effective_batch_size + 1
+        def create_batch(
+            batch_num: int, batch: Sequence[Contact]
+        ) -> list[Contact | None]:
             logger.debug(f"Processing batch {batch_num} ({len(batch)} contacts)")
 
             # Build batch request body
@@ -505,14 +1030,25 @@ class PeopleAPI:
             response = self._retry_with_backoff(
                 execute_batch_create,
                 f"batch_create_contacts(batch {batch_num})",
+                quota=WRITE,
             )
 
-            # Parse created contacts
+            # Parse created contacts (returned in request order)
+            created: list[Contact | None] = []
             for created_person in response.get("createdPeople", []):
                 person_data = created_person.get("person", {})
-                if person_data:
-                    contact = Contact.from_api_response(person_data)
-                    created_contacts.append(contact)
+                created.append(
+                    Contact.from_api_response(person_data) if person_data else None
+                )
+            return (created + [None] * len(batch))[: len(batch)]
+
+        created_contacts = [
+            contact
+            for contact in self._run_batches(
+                contacts, batch_size, create_batch, "batch_create_contacts"
+            )
+            if contact is not None
+        ]
 
         logger.info(f"Batch created {len(created_contacts)} contacts")
         return created_contacts
@@ -535,20 +1071,17 @@ class PeopleAPI:
             List of updated contacts
 
         Raises:
-            PeopleAPIError: If batch update fails
+            BatchWriteError: If any batch fails; the batches written are
+                reported in its results
         """
         if not contacts_with_resources:
             return []
 
         logger.debug(f"Batch updating {len(contacts_with_resources)} contacts")
 
-        effective_batch_size = batch_size if batch_size is not None else self.batch_size
-        updated_contacts: list[Contact] = []
-
-        # Process in batches
-        for i in range(0, len(contacts_with_resources), effective_batch_size):
-            batch = contacts_with_resources[i : i + effective_batch_size]
-            batch_num = i // effective_batch_size + 1
+        def update_batch(
+            batch_num: int, batch: Sequence[tuple[str, Contact]]
+        ) -> list[Contact | None]:
             logger.debug(f"Processing batch {batch_num} ({len(batch)} contacts)")
 
             # Build batch request body
@@ -572,15 +1105,29 @@ class PeopleAPI:
             response = self._retry_with_backoff(
                 execute_batch_update,
                 f"batch_update_contacts(batch {batch_num})",
+                quota=WRITE,
             )
 
-            # Parse updated contacts
+            # Parse updated contacts (keyed by resource name)
+            updated: list[Contact | None] = []
             update_results = response.get("updateResult", {})
-            for _resource_name, result in update_results.items():
-                person_data = result.get("person", {})
-                if person_data:
-                    contact = Contact.from_api_response(person_data)
-                    updated_contacts.append(contact)
+            for resource_name, _contact in batch:
+                person_data = update_results.get(resource_name, {}).get("person")
+                updated.append(
+                    Contact.from_api_response(person_data) if person_data else None
+                )
+            return updated
+
+        updated_contacts = [
+            contact
+            for contact in self._run_batches(
+                contacts_with_resources,
+                batch_size,
+                update_batch,
+                "batch_update_contacts",
+            )
+            if contact is not None
+        ]
 
         logger.info(f"Batch updated {len(updated_contacts)} contacts")
         return updated_contacts
@@ -601,23 +1148,18 @@ class PeopleAPI:
             Number of contacts deleted
 
         Raises:
-            PeopleAPIError: If batch delete fails
+            BatchWriteError: If any batch fails; the batches written are
+                reported in its results
         """
         if not resource_names:
             return 0
 
         logger.debug(f"Batch deleting {len(resource_names)} contacts")
 
-        effective_batch_size = batch_size if batch_size is not None else self.batch_size
-        deleted_count = 0
-
-        # Process in batches
-        for i in range(0, len(resource_names), effective_batch_size):
-            batch = resource_names[i : i + effective_batch_size]
-            batch_num = i // effective_batch_size + 1
+        def delete_batch(batch_num: int, batch: Sequence[str]) -> list[bool | None]:
             logger.debug(f"Processing batch {batch_num} ({len(batch)} contacts)")
 
-            batch_body: dict[str, list[str]] = {"resourceNames": batch}
+            batch_body: dict[str, list[str]] = {"resourceNames": list(batch)}
 
             def execute_batch_delete(
                 b: dict[str, list[str]] = batch_body,
@@ -627,9 +1169,15 @@ class PeopleAPI:
             self._retry_with_backoff(
                 execute_batch_delete,
                 f"batch_delete_contacts(batch {batch_num})",
+                quota=WRITE,
             )
+            return [True] * len(batch)
 
-            deleted_count += len(batch)
+        deleted_count = len(
+            self._run_batches(
+                resource_names, batch_size, delete_batch, "batch_delete_contacts"
+            )
+        )
 
         logger.info(f"Batch deleted {deleted_count} contacts")
         return deleted_count
@@ -762,7 +1310,9 @@ class PeopleAPI:
             )
 
         try:
-            self._retry_with_backoff(execute_upload, f"upload_photo({resource_name})")
+            self._retry_with_backoff(
+                execute_upload, f"upload_photo({resource_name})", quota=WRITE
+            )
             logger.info(f"Uploaded photo for contact: {resource_name}")
             return True
 
@@ -801,7 +1351,7 @@ class PeopleAPI:
 
         try:
             self._retry_with_backoff(
-                execute_delete_photo, f"delete_photo({resource_name})"
+                execute_delete_photo, f"delete_photo({resource_name})", quota=WRITE
             )
             logger.info(f"Deleted photo for contact: {resource_name}")
             return True
@@ -814,6 +1364,104 @@ class PeopleAPI:
                 return True
             raise
 
+    def batch_upload_photos(
+        self, photos: list[tuple[str, bytes]]
+    ) -> list[bool | PeopleAPIError]:
+        """
+        Upload photos for multiple contacts using batch HTTP requests.
+
+        Args:
+            photos: List of (resource_name, photo_bytes) tuples
+
+        Returns:
+            One entry per photo, in order: True if the upload succeeded, or
+            the PeopleAPIError upload_photo() would have raised
+
+        Raises:
+            ValueError: If any resource_name or photo_bytes is missing
+        """
+        if any(not resource_name or not data for resource_name, data in photos):
+            raise ValueError("resource_name and photo_bytes are required")
+        if not photos:
+            return []
+
+        logger.debug(f"Batch uploading {len(photos)} photos")
+
+        import base64
+
+        requests = [
+            lambda rn=resource_name, data=data: (
+                self.service.people().updateContactPhoto(
+                    resourceName=rn,
+                    body={"photoBytes": base64.b64encode(data).decode("utf-8")},
+                )
+            )
+            for resource_name, data in photos
+        ]
+        outcomes = self._execute_batch(requests, "batch_upload_photos")
+
+        results: list[bool | PeopleAPIError] = []
+        for (resource_name, _), outcome in zip(photos, outcomes, strict=True):
+            if not isinstance(outcome, Exception):
+                results.append(True)
+            elif self._is_status(outcome, 404):
+                error = PeopleAPIError(f"Contact not found: {resource_name}")
+                error.__cause__ = outcome
+                results.append(error)
+            else:
+                results.append(
+                    self._batch_error(f"upload_photo({resource_name})", outcome)
+                )
+
+        uploaded = sum(1 for r in results if r is True)
+        logger.info(f"Batch uploaded {uploaded} of {len(photos)} photos")
+        return results
+
+    def batch_delete_photos(
+        self, resource_names: list[str]
+    ) -> list[bool | PeopleAPIError]:
+        """
+        Delete photos of multiple contacts using batch HTTP requests.
+
+        Args:
+            resource_names: Contacts' resource names
+
+        Returns:
+            One entry per contact, in order: True if the photo was deleted (or
+            not found), or the PeopleAPIError delete_photo() would have raised
+
+        Raises:
+            ValueError: If any resource_name is missing
+        """
+        if not all(resource_names):
+            raise ValueError("resource_name is required")
+        if not resource_names:
+            return []
+
+        logger.debug(f"Batch deleting {len(resource_names)} photos")
+
+        requests = [
+            lambda rn=resource_name: self.service.people().deleteContactPhoto(
+                resourceName=rn
+            )
+            for resource_name in resource_names
+        ]
+        outcomes = self._execute_batch(requests, "batch_delete_photos")
+
+        results: list[bool | PeopleAPIError] = []
+        for resource_name, outcome in zip(resource_names, outcomes, strict=True):
+            # 404: already deleted or no photo
+            if not isinstance(outcome, Exception) or self._is_status(outcome, 404):
+                results.append(True)
+            else:
+                results.append(
+                    self._batch_error(f"delete_photo({resource_name})", outcome)
+                )
+
+        deleted = sum(1 for r in results if r is True)
+        logger.info(f"Batch deleted {deleted} of {len(resource_names)} photos")
+        return results
+
     # ========== Contact Groups Methods ==========
 
     def list_contact_groups(
@@ -956,7 +1604,7 @@ class PeopleAPI:
 
         try:
             response = self._retry_with_backoff(
-                execute_create, f"create_contact_group({name})"
+                execute_create, f"create_contact_group({name})", quota=WRITE
             )
             logger.info(
                 f"Created contact group: {response.get('resourceName')} ({name})"
@@ -1010,7 +1658,7 @@ class PeopleAPI:
 
         try:
             response = self._retry_with_backoff(
-                execute_update, f"update_contact_group({resource_name})"
+                execute_update, f"update_contact_group({resource_name})", quota=WRITE
             )
             logger.info(f"Updated contact group: {resource_name} -> {name}")
             return dict(response)
@@ -1059,7 +1707,7 @@ class PeopleAPI:
 
         try:
             self._retry_with_backoff(
-                execute_delete, f"delete_contact_group({resource_name})"
+                execute_delete, f"delete_contact_group({resource_name})", quota=WRITE
             )
             logger.info(f"Deleted contact group: {resource_name}")
             return True
@@ -1134,7 +1782,7 @@ class PeopleAPI:
 
         try:
             response = self._retry_with_backoff(
-                execute_modify, f"modify_group_members({resource_name})"
+                execute_modify, f"modify_group_members({resource_name})", quota=WRITE
             )
             logger.info(
                 f"Modified group members for {resource_name}: "
@@ -1145,3 +1793,151 @@ class PeopleAPI:
             if e.resp.status == 404:
                 raise PeopleAPIError(f"Contact group not found: {resource_name}") from e
             raise
+
+    def batch_create_contact_groups(
+        self, names: list[str]
+    ) -> list[dict[str, Any] | PeopleAPIError]:
+        """
+        Create multiple contact groups using batch HTTP requests.
+
+        Args:
+            names: Names for the new contact groups
+
+        Returns:
+            One entry per name, in order: the created contact group dict, or
+            the PeopleAPIError create_contact_group() would have raised
+        """
+        if not names:
+            return []
+
+        logger.debug(f"Batch creating {len(names)} contact groups")
+
+        requests = [
+            lambda n=name: self.service.contactGroups().create(
+                body={"contactGroup": {"name": n}}
+            )
+            for name in names
+        ]
+        outcomes = self._execute_batch(requests, "batch_create_contact_groups")
+
+        results: list[dict[str, Any] | PeopleAPIError] = []
+        for name, outcome in zip(names, outcomes, strict=True):
+            if not isinstance(outcome, Exception):
+                results.append(dict(outcome))
+            elif self._is_status(outcome, 409):
+                error = PeopleAPIError(
+                    f"Contact group with name '{name}' already exists"
+                )
+                error.__cause__ = outcome
+                results.append(error)
+            else:
+                results.append(
+                    self._batch_error(f"create_contact_group({name})", outcome)
+                )
+
+        created = sum(1 for r in results if isinstance(r, dict))
+        logger.info(f"Batch created {created} of {len(names)} contact groups")
+        return results
+
+    def batch_delete_contact_groups(
+        self, resource_names: list[str], delete_contacts: bool = False
+    ) -> list[bool | PeopleAPIError]:
+        """
+        Delete multiple contact groups using batch HTTP requests.
+
+        Args:
+            resource_names: Groups' resource names
+            delete_contacts: If True, also delete the contacts in the groups
+
+        Returns:
+            One entry per group, in order: True if the group was deleted (or
+            not found), or the PeopleAPIError delete_contact_group() would
+            have raised
+        """
+        if not resource_names:
+            return []
+
+        logger.debug(f"Batch deleting {len(resource_names)} contact groups")
+
+        requests = [
+            lambda rn=resource_name: self.service.contactGroups().delete(
+                resourceName=rn, deleteContacts=delete_contacts
+            )
+            for resource_name in resource_names
+        ]
+        outcomes = self._execute_batch(requests, "batch_delete_contact_groups")
+
+        results: list[bool | PeopleAPIError] = []
+        for resource_name, outcome in zip(resource_names, outcomes, strict=True):
+            # 404: already deleted
+            if not isinstance(outcome, Exception) or self._is_status(outcome, 404):
+                results.append(True)
+            else:
+                results.append(
+                    self._batch_error(f"delete_contact_group({resource_name})", outcome)
+                )
+
+        deleted = sum(1 for r in results if r is True)
+        logger.info(f"Batch deleted {deleted} of {len(resource_names)} contact groups")
+        return results
+
+    def batch_modify_group_members(
+        self,
+        changes: list[tuple[str, list[str] | None, list[str] | None]],
+    ) -> list[dict[str, Any] | PeopleAPIError]:
+        """
+        Modify the members of multiple contact groups using batch HTTP requests.
+
+        Args:
+            changes: List of (group_resource_name, add_resource_names,
+                remove_resource_names) tuples, as for modify_group_members()
+
+        Returns:
+            One entry per change, in order: the modify response dict, or the
+            PeopleAPIError modify_group_members() would have raised
+
+        Raises:
+            ValueError: If a change has neither contacts to add nor to remove
+        """
+        if any(not add and not remove for _, add, remove in changes):
+            raise ValueError(
+                "At least one of add_resource_names or remove_resource_names "
+                "must be provided"
+            )
+        if not changes:
+            return []
+
+        logger.debug(f"Batch modifying members of {len(changes)} contact groups")
+
+        requests = []
+        for resource_name, add, remove in changes:
+            body: dict[str, Any] = {}
+            if add:
+                body["resourceNamesToAdd"] = add
+            if remove:
+                body["resourceNamesToRemove"] = remove
+            requests.append(
+                lambda rn=resource_name, b=body: (
+                    self.service.contactGroups()
+                    .members()
+                    .modify(resourceName=rn, body=b)
+                )
+            )
+        outcomes = self._execute_batch(requests, "batch_modify_group_members")
+
+        results: list[dict[str, Any] | PeopleAPIError] = []
+        for (resource_name, _, _), outcome in zip(changes, outcomes, strict=True):
+            if not isinstance(outcome, Exception):
+                results.append(dict(outcome))
+            elif self._is_status(outcome, 404):
+                error = PeopleAPIError(f"Contact group not found: {resource_name}")
+                error.__cause__ = outcome
+                results.append(error)
+            else:
+                results.append(
+                    self._batch_error(f"modify_group_members({resource_name})", outcome)
+                )
+
+        modified = sum(1 for r in results if isinstance(r, dict))
+        logger.info(f"Batch modified {modified} of {len(changes)} contact groups")
+        return results
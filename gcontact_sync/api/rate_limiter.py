@@ -0,0 +1,222 @@
+"""
+Client-side rate limiting for Google People API requests.
+
+The People API enforces per-user quotas per minute, with reads and writes
+counted separately. Rather than sending requests as fast as possible and
+backing off after a 429, each account paces its requests with a token bucket
+per quota class:
+- Requests take a token before they are sent, waiting for one if needed
+- A 429 (or quota 403) halves the bucket's rate and pauses the whole bucket
+  for the retry delay, so concurrent callers wait together instead of each
+  hitting the quota and backing off on their own
+- Each successful request raises the rate again, up to the configured quota
+  (additive increase, multiplicative decrease)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+# Default quotas (requests per minute per account)
+DEFAULT_READ_REQUESTS_PER_MINUTE = 90.0
+DEFAULT_WRITE_REQUESTS_PER_MINUTE = 60.0
+
+# Requests that may be sent back to back before pacing starts
+DEFAULT_BURST = 10
+
+# Rate adjustment after throttling
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_STEPS = 20  # successes to climb from zero back to the quota
+MIN_RATE_FRACTION = 0.05  # lowest rate, as a fraction of the quota
+
+# Quota classes
+READ = "read"
+WRITE = "write"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Counters for one quota class.
+
+    Attributes:
+        requests: Requests sent (including retries)
+        retries: Requests retried after an error
+        throttled: Responses rejected for exceeding the quota
+        throttled_seconds: Total time callers waited for the limiter
+        current_rate: Current rate in requests per minute
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    throttled_seconds: float = 0.0
+    current_rate: float = 0.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate adapts to throttling.
+
+    Callers reserve a token and are told how long to wait for it, so waits
+    for concurrent callers are spread out evenly rather than all ending at
+    once.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = DEFAULT_BURST):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            requests_per_minute: Quota to pace requests to (0 = unlimited,
+                though pauses after throttling still apply)
+            burst: Maximum tokens held, i.e. requests that can be sent at once
+        """
+        self.max_rate = requests_per_minute / 60.0
+        self.burst = max(1, burst)
+        self._rate = self.max_rate
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+        self.stats = RateLimitStats(current_rate=requests_per_minute)
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second."""
+        with self._lock:
+            return self._rate
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time since the last update (lock held)."""
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Take tokens, blocking until they are available.
+
+        Args:
+            tokens: Requests about to be sent (e.g. the sub-requests of a
+                batch HTTP request, which each count against the quota)
+        """
+        with self._lock:
+            self.stats.requests += tokens
+            now = time.monotonic()
+            wait = max(self._resume_at - now, 0.0)
+            if self.max_rate:
+                self._refill(now)
+                self._tokens -= tokens
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            self.stats.throttled_seconds += wait
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Raise the rate after a successful request."""
+        with self._lock:
+            if self.max_rate and self._rate < self.max_rate:
+                self._refill(time.monotonic())
+                self._rate = min(
+                    self.max_rate, self._rate + self.max_rate / RATE_INCREASE_STEPS
+                )
+                self.stats.current_rate = self._rate * 60.0
+
+    def on_throttled(self, retry_after: float) -> None:
+        """
+        Slow down after the server rejected a request for exceeding the quota.
+
+        Args:
+            retry_after: Seconds before any caller may send another request
+        """
+        with self._lock:
+            self.stats.throttled += 1
+            now = time.monotonic()
+            self._resume_at = max(self._resume_at, now + retry_after)
+            if not self.max_rate:
+                return
+
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._rate = max(
+                self.max_rate * MIN_RATE_FRACTION, self._rate * RATE_DECREASE_FACTOR
+            )
+            self.stats.current_rate = self._rate * 60.0
+            rate = self.stats.current_rate
+
+        logger.debug(
+            f"Throttled: pausing {retry_after:.1f}s, "
+            f"rate now {rate:.0f} requests/minute"
+        )
+
+    def record_retry(self, count: int = 1) -> None:
+        """Count retried requests."""
+        with self._lock:
+            self.stats.retries += count
+
+    def snapshot(self) -> RateLimitStats:
+        """Get a copy of the current counters."""
+        with self._lock:
+            return RateLimitStats(**vars(self.stats))
+
+
+class RateLimiter:
+    """
+    Rate limiter for one account, with a bucket per quota class.
+
+    Usage:
+        limiter = RateLimiter()
+        limiter.acquire(WRITE)
+        ...send the request...
+        limiter.on_success(WRITE)
+    """
+
+    def __init__(
+        self,
+        read_requests_per_minute: float = DEFAULT_READ_REQUESTS_PER_MINUTE,
+        write_requests_per_minute: float = DEFAULT_WRITE_REQUESTS_PER_MINUTE,
+        burst: int = DEFAULT_BURST,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            read_requests_per_minute: Read quota (0 = unlimited)
+            write_requests_per_minute: Write quota (0 = unlimited)
+            burst: Requests of each class that can be sent at once
+        """
+        self.buckets = {
+            READ: TokenBucket(read_requests_per_minute, burst),
+            WRITE: TokenBucket(write_requests_per_minute, burst),
+        }
+
+    def acquire(self, quota: str, tokens: int = 1) -> None:
+        """Block until requests of the given quota class may be sent."""
+        self.buckets[quota].acquire(tokens)
+
+    def on_success(self, quota: str) -> None:
+        """Record a successful request."""
+        self.buckets[quota].on_success()
+
+    def on_throttled(self, quota: str, retry_after: float) -> None:
+        """Record a request rejected for exceeding the quota."""
+        self.buckets[quota].on_throttled(retry_after)
+
+    def record_retry(self, quota: str, count: int = 1) -> None:
+        """Record retried requests."""
+        self.buckets[quota].record_retry(count)
+
+    def stats(self) -> dict[str, RateLimitStats]:
+        """
+        Get a snapshot of the counters for each quota class.
+
+        Returns:
+            Dictionary mapping quota class (READ, WRITE) to its stats
+        """
+        return {quota: bucket.snapshot() for quota, bucket in self.buckets.items()}
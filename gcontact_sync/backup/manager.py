@@ -10,12 +10,19 @@ Provides functionality to:
 
 from __future__ import annotations
 
+import dataclasses
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 
+def _is_object(value: Any) -> bool:
+    """Whether value is a model object (dataclass or plain object) to serialize."""
+    return dataclasses.is_dataclass(value) or hasattr(value, "__dict__")
+
+
 class BackupManager:
     """
     Manager for creating and managing contact data backups.
@@ -67,12 +74,14 @@ class BackupManager:
 
     def create_backup(
         self,
-        account1_contacts: list[Any],
+        account1_contacts: Iterable[Any],
         account1_groups: list[Any],
-        account2_contacts: list[Any],
+        account2_contacts: Iterable[Any],
         account2_groups: list[Any],
         account1_email: str = "account1",
         account2_email: str = "account2",
+        account1_sync_token: str | None = None,
+        account2_sync_token: str | None = None,
     ) -> Path | None:
         """
         Create a timestamped backup of contacts and groups from both accounts.
@@ -81,12 +90,18 @@ class BackupManager:
         containing contact and group data organized by account.
 
         Args:
-            account1_contacts: List of Contact objects from account 1
+            account1_contacts: Contact objects from account 1. May be a
+                single-pass stream such as PeopleAPI.iter_contacts(); each
+                contact is serialized as it is read.
             account1_groups: List of ContactGroup objects from account 1
-            account2_contacts: List of Contact objects from account 2
+            account2_contacts: Contact objects from account 2 (list or stream)
             account2_groups: List of ContactGroup objects from account 2
             account1_email: Email address of account 1 (for identification)
             account2_email: Email address of account 2 (for identification)
+            account1_sync_token: Sync token returned by the listing that produced
+                account1_contacts, if any. Lets a later incremental sync rebuild
+                a backup from this one plus the changes since the token.
+            account2_sync_token: Sync token for account2_contacts, if any
 
         Returns:
             Path to created backup file, or None if backup failed
@@ -98,11 +113,13 @@ class BackupManager:
                 "accounts": {
                     "account1": {
                         "email": "user1@gmail.com",
+                        "sync_token": "...",
                         "contacts": [...],
                         "groups": [...]
                     },
                     "account2": {
                         "email": "user2@gmail.com",
+                        "sync_token": "...",
                         "contacts": [...],
                         "groups": [...]
                     }
@@ -122,11 +139,13 @@ class BackupManager:
             "accounts": {
                 "account1": {
                     "email": account1_email,
+                    "sync_token": account1_sync_token,
                     "contacts": self._serialize_contacts(account1_contacts),
                     "groups": self._serialize_groups(account1_groups),
                 },
                 "account2": {
                     "email": account2_email,
+                    "sync_token": account2_sync_token,
                     "contacts": self._serialize_contacts(account2_contacts),
                     "groups": self._serialize_groups(account2_groups),
                 },
@@ -217,6 +236,67 @@ class BackupManager:
         except (OSError, json.JSONDecodeError):
             return None
 
+    def find_contacts_snapshot(
+        self, account_key: str, sync_token: str
+    ) -> list[dict[str, Any]] | None:
+        """
+        Find the backed-up contacts of an account as of a sync token.
+
+        Searches backups newest first for one whose account was listed with
+        the given sync token, so that applying the changes since that token
+        reproduces the account's current contacts without a full listing.
+
+        Args:
+            account_key: "account1" or "account2"
+            sync_token: Sync token the incremental listing started from
+
+        Returns:
+            Serialized contacts from the matching backup, or None if no
+            backup was taken at that token
+        """
+        if not sync_token:
+            return None
+
+        for backup_file in self.list_backups():
+            backup_data = self.load_backup(backup_file)
+            if not backup_data or backup_data.get("version") == "1.0":
+                continue
+
+            account_data = backup_data.get("accounts", {}).get(account_key, {})
+            if account_data.get("sync_token") == sync_token:
+                contacts: list[dict[str, Any]] = account_data.get("contacts", [])
+                return contacts
+
+        return None
+
+    def merge_contact_delta(
+        self, base_contacts: list[dict[str, Any]], changed_contacts: list[Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Apply incremental contact changes to serialized backup contacts.
+
+        Changed contacts replace the backed-up entry with the same resource
+        name (or are appended if new); contacts marked as deleted are removed.
+
+        Args:
+            base_contacts: Serialized contacts from an earlier backup
+            changed_contacts: Contact objects returned by an incremental listing
+
+        Returns:
+            Serialized contacts reflecting the current state of the account
+        """
+        merged: dict[str, dict[str, Any]] = {
+            contact.get("resource_name", ""): contact for contact in base_contacts
+        }
+
+        for contact in changed_contacts:
+            if getattr(contact, "deleted", False):
+                merged.pop(contact.resource_name, None)
+            else:
+                merged[contact.resource_name] = self._serialize_object(contact)
+
+        return list(merged.values())
+
     def apply_retention(self) -> None:
         """
         Apply retention policy by deleting old backups.
@@ -244,12 +324,15 @@ class BackupManager:
             with contextlib.suppress(OSError):
                 backup.unlink()
 
-    def _serialize_contacts(self, contacts: list[Any]) -> list[dict[str, Any]]:
+    def _serialize_contacts(self, contacts: Iterable[Any]) -> list[dict[str, Any]]:
         """
         Serialize contact objects to JSON-compatible dictionaries.
 
+        Contacts are consumed in a single pass, so only their serialized form
+        is kept when a stream is passed in.
+
         Args:
-            contacts: List of Contact objects or dictionaries
+            contacts: Contact objects or dictionaries (list or single-pass iterable)
 
         Returns:
             List of dictionaries ready for JSON serialization
@@ -257,7 +340,7 @@ class BackupManager:
         serialized = []
 
         for contact in contacts:
-            if hasattr(contact, "__dict__"):
+            if _is_object(contact):
                 # Convert Contact dataclass to dictionary
                 contact_dict = self._serialize_object(contact)
             elif isinstance(contact, dict):
@@ -283,7 +366,7 @@ class BackupManager:
         serialized = []
 
         for group in groups:
-            if hasattr(group, "__dict__"):
+            if _is_object(group):
                 # Convert ContactGroup dataclass to dictionary
                 group_dict = self._serialize_object(group)
             elif isinstance(group, dict):
@@ -301,7 +384,8 @@ class BackupManager:
         Serialize an object to a JSON-compatible dictionary.
 
         Handles:
-        - Dataclass objects (__dict__)
+        - Dataclass objects (public fields, also when slotted)
+        - Other objects (__dict__)
         - datetime objects (converted to ISO format)
         - bytes objects (converted to base64 for photo data)
 
@@ -315,7 +399,16 @@ class BackupManager:
 
         result: dict[str, Any] = {}
 
-        for key, value in obj.__dict__.items():
+        if dataclasses.is_dataclass(obj):
+            attributes = {
+                f.name: getattr(obj, f.name)
+                for f in dataclasses.fields(obj)
+                if not f.name.startswith("_")
+            }
+        else:
+            attributes = obj.__dict__
+
+        for key, value in attributes.items():
             if value is None:
                 result[key] = None
             elif isinstance(value, datetime):
@@ -325,6 +418,8 @@ class BackupManager:
                 result[key] = base64.b64encode(value).decode("ascii")
             elif isinstance(value, (str, int, float, bool, list, dict)):
                 result[key] = value
+            elif isinstance(value, tuple):
+                result[key] = list(value)
             else:
                 # For other types, convert to string
                 result[key] = str(value)
@@ -23,7 +23,7 @@ Usage:
 
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import click
 
@@ -44,7 +44,7 @@ from gcontact_sync.utils import DEFAULT_CONFIG_DIR, resolve_config_dir
 from gcontact_sync.utils.logging import get_logger, setup_logging
 
 if TYPE_CHECKING:
-    pass
+    from gcontact_sync.sync.photo_cache import PhotoCache
 
 # Valid account identifiers
 VALID_ACCOUNTS = (ACCOUNT_1, ACCOUNT_2)
@@ -71,6 +71,17 @@ def get_config_dir(config_dir: str | None) -> Path:
     return resolve_config_dir(config_dir)
 
 
+def get_photo_cache(config: dict[str, Any], config_dir: Path) -> "PhotoCache | None":
+    """Create the photo cache under the config directory, unless disabled."""
+    if not config.get("photo_cache_enabled", True):
+        return None
+
+    from gcontact_sync.sync.photo_cache import PhotoCache
+
+    max_mb = config.get("photo_cache_max_mb", 100)
+    return PhotoCache(config_dir / "photo_cache", max_bytes=max_mb * 1024 * 1024)
+
+
 def get_config_file(config_file: str | None) -> Path:
     """Get the configuration file path."""
     if config_file:
@@ -605,8 +616,13 @@ def sync_command(
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize API clients and database
-        api1 = PeopleAPI(credentials=creds1)
-        api2 = PeopleAPI(credentials=creds2)
+        max_in_flight_batches = config.get("api_max_in_flight_batches", 1)
+        api1 = PeopleAPI(
+            credentials=creds1, max_in_flight_batches=max_in_flight_batches
+        )
+        api2 = PeopleAPI(
+            credentials=creds2, max_in_flight_batches=max_in_flight_batches
+        )
         database = SyncDatabase(str(db_path))
         database.initialize()
 
@@ -655,6 +671,9 @@ def sync_command(
             llm_model=config.get("llm_model", "claude-haiku-4-5-20250514"),
             llm_max_tokens=config.get("llm_max_tokens", 500),
             llm_batch_max_tokens=config.get("llm_batch_max_tokens", 2000),
+            llm_max_concurrency=config.get("llm_max_concurrency", 4),
+            llm_requests_per_minute=config.get("llm_requests_per_minute", 50),
+            llm_tokens_per_minute=config.get("llm_tokens_per_minute", 40000),
         )
 
         # Create sync engine with account emails for better logging
@@ -669,6 +688,13 @@ def sync_command(
             match_config=match_config,
             duplicate_handling=duplicate_handling,
             config=sync_config,
+            concurrent_fetch=config.get("concurrent_fetch", False),
+            concurrent_execute=config.get("concurrent_execute", False),
+            contact_mirror=config.get("contact_mirror", False),
+            incremental_analysis=config.get("incremental_analysis", False),
+            photo_cache=get_photo_cache(config, config_dir),
+            photo_pool_maxsize=config.get("photo_pool_maxsize", 10),
+            photo_connect_retries=config.get("photo_connect_retries", 2),
         )
 
         # Store account emails in context for summary display
@@ -704,13 +730,24 @@ def sync_command(
         mode = "Analyzing" if effective_dry_run else "Synchronizing"
         click.echo(f"\n{mode} contacts and groups...")
 
-        result = engine.sync(
-            dry_run=effective_dry_run,
-            full_sync=effective_full,
-            backup_enabled=effective_backup_enabled,
-            backup_dir=backup_dir,
-            backup_retention_count=backup_retention_count,
-        )
+        try:
+            result = engine.sync(
+                dry_run=effective_dry_run,
+                full_sync=effective_full,
+                backup_enabled=effective_backup_enabled,
+                backup_dir=backup_dir,
+                backup_retention_count=backup_retention_count,
+            )
+        finally:
+            engine.close()
+            database.close()
+            for email, api in ((account1_email, api1), (account2_email, api2)):
+                for quota, usage in api.rate_limit_stats().items():
+                    logger.debug(
+                        f"{email} {quota} requests: {usage.requests} "
+                        f"({usage.retries} retried, {usage.throttled} throttled, "
+                        f"{usage.throttled_seconds:.1f}s waiting)"
+                    )
 
         # Display results with actual email addresses
         click.echo("\n" + "=" * 50)
@@ -1527,24 +1564,31 @@ def restore_command(
             contacts_to_restore = bm.get_contacts_for_restore(backup_data, acc_key)
             groups_to_restore = bm.get_groups_for_restore(backup_data, acc_key)
 
-            # Restore groups first (contacts may reference them)
+            # Restore groups first (contacts may reference them), skipping
+            # system groups, in batch requests
+            user_groups = [
+                group
+                for group in groups_to_restore
+                if group.group_type == "USER_CONTACT_GROUP"
+            ]
             groups_created = 0
             groups_failed = 0
-            for group in groups_to_restore:
-                # Skip system groups
-                if group.group_type != "USER_CONTACT_GROUP":
-                    continue
-                try:
-                    api.create_contact_group(group.name)
+            try:
+                outcomes: list[Any] = api.batch_create_contact_groups(
+                    [group.name for group in user_groups]
+                )
+            except Exception as e:
+                outcomes = [e] * len(user_groups)
+            for group, outcome in zip(user_groups, outcomes, strict=True):
+                if not isinstance(outcome, Exception):
                     groups_created += 1
                     logger.debug(f"Restored group: {group.name}")
-                except Exception as e:
-                    # Group may already exist
-                    if "already exists" in str(e):
-                        logger.debug(f"Group already exists: {group.name}")
-                    else:
-                        groups_failed += 1
-                        logger.warning(f"Failed to restore group {group.name}: {e}")
+                # Group may already exist
+                elif "already exists" in str(outcome):
+                    logger.debug(f"Group already exists: {group.name}")
+                else:
+                    groups_failed += 1
+                    logger.warning(f"Failed to restore group {group.name}: {outcome}")
 
             click.echo(f"  Groups: {groups_created} created, {groups_failed} failed")
 
@@ -1739,8 +1783,13 @@ def daemon_start_command(
                 db_path = config_dir / "sync.db"
                 db_path.parent.mkdir(parents=True, exist_ok=True)
 
-                api1 = PeopleAPI(credentials=creds1)
-                api2 = PeopleAPI(credentials=creds2)
+                max_in_flight_batches = config.get("api_max_in_flight_batches", 1)
+                api1 = PeopleAPI(
+                    credentials=creds1, max_in_flight_batches=max_in_flight_batches
+                )
+                api2 = PeopleAPI(
+                    credentials=creds2, max_in_flight_batches=max_in_flight_batches
+                )
                 database = SyncDatabase(str(db_path))
                 database.initialize()
 
@@ -1791,6 +1840,9 @@ def daemon_start_command(
                     llm_model=config.get("llm_model", "claude-haiku-4-5-20250514"),
                     llm_max_tokens=config.get("llm_max_tokens", 500),
                     llm_batch_max_tokens=config.get("llm_batch_max_tokens", 2000),
+                    llm_max_concurrency=config.get("llm_max_concurrency", 4),
+                    llm_requests_per_minute=config.get("llm_requests_per_minute", 50),
+                    llm_tokens_per_minute=config.get("llm_tokens_per_minute", 40000),
                 )
 
                 # Get conflict strategy from config
@@ -1826,16 +1878,27 @@ def daemon_start_command(
                     match_config=match_config,
                     duplicate_handling=config.get("duplicate_handling", "skip"),
                     config=sync_config,
+                    concurrent_fetch=config.get("concurrent_fetch", False),
+                    concurrent_execute=config.get("concurrent_execute", False),
+                    contact_mirror=config.get("contact_mirror", False),
+                    incremental_analysis=config.get("incremental_analysis", False),
+                    photo_cache=get_photo_cache(config, config_dir),
+                    photo_pool_maxsize=config.get("photo_pool_maxsize", 10),
+                    photo_connect_retries=config.get("photo_connect_retries", 2),
                 )
 
                 # Run sync
-                result = engine.sync(
-                    dry_run=False,
-                    full_sync=False,
-                    backup_enabled=backup_enabled,
-                    backup_dir=backup_dir,
-                    backup_retention_count=backup_retention_count,
-                )
+                try:
+                    result = engine.sync(
+                        dry_run=False,
+                        full_sync=False,
+                        backup_enabled=backup_enabled,
+                        backup_dir=backup_dir,
+                        backup_retention_count=backup_retention_count,
+                    )
+                finally:
+                    engine.close()
+                    database.close()
 
                 created = (
                     result.stats.created_in_account1 + result.stats.created_in_account2
@@ -90,6 +90,62 @@ def generate_default_config() -> str:
 # Default: 100 (not yet used in current implementation)
 # batch_size: 100
 
+# Fetch both accounts at the same time during analysis
+# Each account is listed on its own worker thread with its own API client,
+# roughly halving fetch time for large address books
+# Default: false
+# concurrent_fetch: false
+
+# Write to both accounts at the same time when executing a sync
+# Each step (groups, then contact creates, updates and deletes) still
+# finishes in both accounts before the next one starts
+# Default: false
+# concurrent_execute: false
+
+# Contact batches kept in flight at once per account when writing
+# Default: 1 (one batch at a time)
+# api_max_in_flight_batches: 1
+
+# Keep a local copy of both accounts' contacts in the sync database
+# Incremental syncs then download only the contacts changed since the last
+# sync, while matching still compares against every contact
+# Default: false
+# contact_mirror: false
+
+# With contact_mirror enabled, only re-analyze the contacts changed since the
+# last sync instead of every synced pair. Run 'sync --full' after changing
+# group filters or sync labels so that unchanged contacts are checked again
+# Default: false
+# incremental_analysis: false
+
+# Cache processed contact photos in <config_dir>/photo_cache
+# Unchanged photos are then not downloaded and converted again on later syncs
+# Default: true
+# photo_cache_enabled: true
+
+# Maximum size of the photo cache in megabytes
+# Least recently used photos are evicted beyond this size
+# Default: 100
+# photo_cache_max_mb: 100
+
+# Keep-alive HTTP connections per host for photo downloads
+# Default: 10
+# photo_pool_maxsize: 10
+
+# Retries for photo download connections that fail to open
+# Default: 2
+# photo_connect_retries: 2
+
+# LLM match review batches kept in flight at once
+# Default: 4
+# llm_max_concurrency: 4
+
+# Request and token budget per minute for LLM match review
+# Batches wait when the next one would go over either budget
+# Default: 50 requests, 40000 tokens
+# llm_requests_per_minute: 50
+# llm_tokens_per_minute: 40000
+
 
 # Daemon Options
 # --------------
@@ -172,6 +172,16 @@ class ConfigLoader:
             "api_max_retries": int,
             "api_initial_retry_delay": (int, float),
             "api_max_retry_delay": (int, float),
+            "api_max_in_flight_batches": int,
+            "concurrent_fetch": bool,
+            "concurrent_execute": bool,
+            "contact_mirror": bool,
+            "incremental_analysis": bool,
+            # Photo options
+            "photo_cache_enabled": bool,
+            "photo_cache_max_mb": int,
+            "photo_pool_maxsize": int,
+            "photo_connect_retries": int,
             # Matching options
             "name_similarity_threshold": (int, float),
             "name_only_threshold": (int, float),
@@ -184,6 +194,9 @@ class ConfigLoader:
             "llm_model": str,
             "llm_max_tokens": int,
             "llm_batch_max_tokens": int,
+            "llm_max_concurrency": int,
+            "llm_requests_per_minute": int,
+            "llm_tokens_per_minute": int,
             "anthropic_api_key": str,
             "anthropic_api_key_env": str,
             # Auth options
@@ -285,11 +298,17 @@ class ConfigLoader:
             "api_page_size",
             "api_batch_size",
             "api_max_retries",
+            "api_max_in_flight_batches",
             "llm_batch_size",
             "llm_max_tokens",
             "llm_batch_max_tokens",
+            "llm_max_concurrency",
+            "llm_requests_per_minute",
+            "llm_tokens_per_minute",
             "auth_timeout",
             "backup_retention_count",
+            "photo_cache_max_mb",
+            "photo_pool_maxsize",
         ]
         for key in positive_int_keys:
             if key in config:
@@ -297,6 +316,16 @@ class ConfigLoader:
                 if value < 1:
                     raise ConfigError(f"{key} must be >= 1, got {value}")
 
+        # Non-negative integer values (0 disables)
+        non_negative_int_keys = [
+            "photo_connect_retries",
+        ]
+        for key in non_negative_int_keys:
+            if key in config:
+                value = config[key]
+                if value < 0:
+                    raise ConfigError(f"{key} must be >= 0, got {value}")
+
         # Positive float values (delays)
         positive_float_keys = [
             "api_initial_retry_delay",
@@ -4,8 +4,10 @@ SQLite database module for sync state management.
 Provides persistent storage for sync tokens, contact mappings, and sync state.
 """
 
+import json
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
@@ -34,6 +36,10 @@ CREATE TABLE IF NOT EXISTS contact_mapping (
 );
 
 CREATE INDEX IF NOT EXISTS idx_contact_mapping_key ON contact_mapping(matching_key);
+CREATE INDEX IF NOT EXISTS idx_contact_mapping_res1
+    ON contact_mapping(account1_resource_name);
+CREATE INDEX IF NOT EXISTS idx_contact_mapping_res2
+    ON contact_mapping(account2_resource_name);
 CREATE INDEX IF NOT EXISTS idx_sync_state_account ON sync_state(account_id);
 
 CREATE TABLE IF NOT EXISTS llm_match_attempts (
@@ -86,6 +92,140 @@ CREATE TABLE IF NOT EXISTS contact_group_mappings (
 );
 
 CREATE INDEX IF NOT EXISTS idx_grp_map_name ON contact_group_mappings(group_name);
+
+-- Contacts whose write to the other account failed, retried by the next sync
+CREATE TABLE IF NOT EXISTS pending_contact_writes (
+    account_id TEXT NOT NULL,
+    resource_name TEXT NOT NULL,
+    last_error TEXT,
+    failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY(account_id, resource_name)
+);
+
+CREATE TABLE IF NOT EXISTS contact_mirror (
+    account_id TEXT NOT NULL,
+    resource_name TEXT NOT NULL,
+    etag TEXT,
+    person_json TEXT NOT NULL,
+    matching_key TEXT,
+    content_hash TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY(account_id, resource_name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_contact_mirror_key
+    ON contact_mirror(account_id, matching_key);
+
+CREATE TABLE IF NOT EXISTS group_mirror (
+    account_id TEXT NOT NULL,
+    resource_name TEXT NOT NULL,
+    group_json TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY(account_id, resource_name)
+);
+
+CREATE TABLE IF NOT EXISTS mirror_state (
+    account_id TEXT PRIMARY KEY,
+    contacts_listed_at TIMESTAMP
+);
+"""
+
+# Connection tuning applied to every file-backed connection.
+# WAL lets readers proceed during writes and, with synchronous=NORMAL, only
+# fsyncs at checkpoints instead of on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",  # 16 MiB page cache (negative = KiB)
+    "PRAGMA mmap_size=67108864",  # 64 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Prepared statements kept per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 256
+
+# Bound parameters per IN (...) lookup, below SQLite's oldest default limit
+_MAX_SQL_VARIABLES = 500
+
+# Insert-or-update statement shared by single and bulk LLM decision writes
+_UPSERT_LLM_MATCH_ATTEMPT_SQL = """
+INSERT INTO llm_match_attempts (
+    contact1_resource_name,
+    contact2_resource_name,
+    contact1_display_name,
+    contact2_display_name,
+    contact1_content_hash,
+    contact2_content_hash,
+    is_match,
+    confidence,
+    reasoning,
+    model_used,
+    created_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(contact1_resource_name, contact2_resource_name)
+DO UPDATE SET
+    contact1_display_name = excluded.contact1_display_name,
+    contact2_display_name = excluded.contact2_display_name,
+    contact1_content_hash = excluded.contact1_content_hash,
+    contact2_content_hash = excluded.contact2_content_hash,
+    is_match = excluded.is_match,
+    confidence = excluded.confidence,
+    reasoning = excluded.reasoning,
+    model_used = excluded.model_used,
+    created_at = excluded.created_at
+"""
+
+# Bulk insert-or-update for contact mappings. Like upsert_contact_mapping(),
+# NULL values leave the stored column untouched and updated_at only changes
+# when at least one column is provided.
+_UPSERT_CONTACT_MAPPING_SQL = """
+INSERT INTO contact_mapping (
+    matching_key,
+    account1_resource_name,
+    account2_resource_name,
+    account1_etag,
+    account2_etag,
+    last_synced_hash,
+    created_at,
+    updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(matching_key)
+DO UPDATE SET
+    account1_resource_name = COALESCE(
+        excluded.account1_resource_name, account1_resource_name
+    ),
+    account2_resource_name = COALESCE(
+        excluded.account2_resource_name, account2_resource_name
+    ),
+    account1_etag = COALESCE(excluded.account1_etag, account1_etag),
+    account2_etag = COALESCE(excluded.account2_etag, account2_etag),
+    last_synced_hash = COALESCE(excluded.last_synced_hash, last_synced_hash),
+    updated_at = excluded.updated_at
+WHERE excluded.account1_resource_name IS NOT NULL
+    OR excluded.account2_resource_name IS NOT NULL
+    OR excluded.account1_etag IS NOT NULL
+    OR excluded.account2_etag IS NOT NULL
+    OR excluded.last_synced_hash IS NOT NULL
+"""
+
+# Insert-or-replace for one mirrored person
+_UPSERT_CONTACT_MIRROR_SQL = """
+INSERT INTO contact_mirror (
+    account_id,
+    resource_name,
+    etag,
+    person_json,
+    matching_key,
+    content_hash,
+    updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(account_id, resource_name)
+DO UPDATE SET
+    etag = excluded.etag,
+    person_json = excluded.person_json,
+    matching_key = excluded.matching_key,
+    content_hash = excluded.content_hash,
+    updated_at = excluded.updated_at
 """
 
 
@@ -107,23 +247,53 @@ class SyncDatabase:
         db.initialize()
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, persistent_connection: bool = True):
         """
         Initialize the database manager.
 
         Args:
             db_path: Path to SQLite database file, or ':memory:' for in-memory database
+            persistent_connection: Keep one tuned connection open per thread
+                for file databases (default). If False, every operation opens
+                and closes its own connection.
         """
         self.db_path = db_path
+        self.persistent_connection = persistent_connection
         self._shared_connection: sqlite3.Connection | None = None
+        # Serializes connection() blocks on the shared in-memory connection,
+        # so transactions from worker threads never interleave
+        self._shared_lock = threading.RLock()
+        self._local = threading.local()
+        self._open_connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a new connection with row access by column name.
+
+        Returns:
+            sqlite3.Connection: New database connection
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            # Each thread uses its own connection; close() may run elsewhere
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        return conn
 
     def _get_connection(self) -> sqlite3.Connection:
         """
         Get a database connection.
 
         For in-memory databases, returns a shared connection to ensure
-        schema persists across operations. For file databases, creates
-        a new connection each time.
+        schema persists across operations. For file databases, returns the
+        calling thread's long-lived connection (opened on first use with WAL
+        and the other CONNECTION_PRAGMAS), so statements stay prepared and
+        connect costs are paid once. With persistent_connection=False a new
+        connection is created each time.
 
         Returns:
             sqlite3.Connection: Database connection
@@ -131,26 +301,35 @@ class SyncDatabase:
         if self.db_path == ":memory:":
             # For in-memory, use shared connection so schema persists
             if self._shared_connection is None:
-                self._shared_connection = sqlite3.connect(
-                    ":memory:",
-                    detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-                )
-                self._shared_connection.row_factory = sqlite3.Row
+                self._shared_connection = self._connect()
             return self._shared_connection
-        else:
-            # For file databases, create new connection
-            conn = sqlite3.connect(
-                self.db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-            )
-            conn.row_factory = sqlite3.Row
-            return conn
+
+        if not self.persistent_connection:
+            return self._connect()
+
+        conn: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = self._connect()
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.connection = conn
+            with self._connections_lock:
+                self._open_connections.append(conn)
+        return conn
+
+    def _is_shared(self) -> bool:
+        """Whether connections outlive a single connection() block."""
+        return self.db_path == ":memory:" or self.persistent_connection
 
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
         Context manager for database connections.
 
+        Commits on success and rolls back on error. Each block is one
+        transaction. In-memory databases share one connection between
+        threads, so their blocks run one thread at a time.
+
         Yields:
             sqlite3.Connection: Database connection
 
@@ -159,8 +338,16 @@ class SyncDatabase:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM sync_state")
         """
+        if self.db_path == ":memory:":
+            with self._shared_lock:
+                yield from self._transaction()
+        else:
+            yield from self._transaction()
+
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Yield a connection for one connection() block."""
         conn = self._get_connection()
-        is_shared = self.db_path == ":memory:"
+        is_shared = self._is_shared()
         try:
             yield conn
             conn.commit()
@@ -172,6 +359,32 @@ class SyncDatabase:
             if not is_shared:
                 conn.close()
 
+    def close(self) -> None:
+        """
+        Close all connections held by this database manager.
+
+        Safe to call more than once; connections are reopened on next use.
+        """
+        with self._connections_lock:
+            connections = self._open_connections
+            self._open_connections = []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+        with self._shared_lock:
+            if self._shared_connection is not None:
+                self._shared_connection.close()
+                self._shared_connection = None
+
+    def __enter__(self) -> "SyncDatabase":
+        """Support use as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close connections when leaving a with block."""
+        self.close()
+
     def initialize(self) -> None:
         """
         Initialize the database schema.
@@ -412,6 +625,64 @@ class SyncDatabase:
             )
             return cursor.rowcount > 0
 
+    def bulk_upsert_contact_mappings(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert or update many contact mappings in a single transaction.
+
+        Each row dictionary takes the same keys as the arguments of
+        upsert_contact_mapping(); only matching_key is required. Missing or
+        None values leave the stored column unchanged.
+
+        Args:
+            rows: List of contact mapping dictionaries
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+        with self.connection() as conn:
+            conn.executemany(
+                _UPSERT_CONTACT_MAPPING_SQL,
+                [
+                    (
+                        row["matching_key"],
+                        row.get("account1_resource_name"),
+                        row.get("account2_resource_name"),
+                        row.get("account1_etag"),
+                        row.get("account2_etag"),
+                        row.get("last_synced_hash"),
+                        now,
+                        now,
+                    )
+                    for row in rows
+                ],
+            )
+        return len(rows)
+
+    def bulk_delete_contact_mappings(self, matching_keys: list[str]) -> int:
+        """
+        Delete many contact mappings in a single transaction.
+
+        Args:
+            matching_keys: Normalized contact identifiers to delete
+
+        Returns:
+            Number of mappings deleted
+        """
+        if not matching_keys:
+            return 0
+
+        with self.connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "DELETE FROM contact_mapping WHERE matching_key = ?",
+                [(key,) for key in matching_keys],
+            )
+            return conn.total_changes - before
+
     def update_matching_key(self, old_key: str, new_key: str) -> bool:
         """
         Update the matching key for a contact mapping.
@@ -473,6 +744,64 @@ class SyncDatabase:
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_mappings_for_resource_names(
+        self,
+        account1_resource_names: Iterable[str],
+        account2_resource_names: Iterable[str],
+    ) -> list[dict[str, Any]]:
+        """
+        Get the contact mappings that involve any of the given contacts.
+
+        Args:
+            account1_resource_names: Resource names of account 1 contacts
+            account2_resource_names: Resource names of account 2 contacts
+
+        Returns:
+            List of matching contact mapping dictionaries, each at most once
+        """
+        mappings: dict[str, dict[str, Any]] = {}
+        with self.connection() as conn:
+            for column, resource_names in (
+                ("account1_resource_name", list(account1_resource_names)),
+                ("account2_resource_name", list(account2_resource_names)),
+            ):
+                for start in range(0, len(resource_names), _MAX_SQL_VARIABLES):
+                    chunk = resource_names[start : start + _MAX_SQL_VARIABLES]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"""
+                        SELECT
+                            matching_key,
+                            account1_resource_name,
+                            account2_resource_name,
+                            account1_etag,
+                            account2_etag,
+                            last_synced_hash,
+                            created_at,
+                            updated_at
+                        FROM contact_mapping
+                        WHERE {column} IN ({placeholders})
+                        """,  # nosec B608 - column and placeholders are not user input
+                        chunk,
+                    )
+                    for row in cursor.fetchall():
+                        mappings[row["matching_key"]] = dict(row)
+        return list(mappings.values())
+
+    def get_mapped_resource_name_pairs(self) -> list[tuple[str | None, str | None]]:
+        """
+        Get the resource names of every mapped pair of contacts.
+
+        Returns:
+            List of (account 1 resource name, account 2 resource name) tuples
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "SELECT account1_resource_name, account2_resource_name "
+                "FROM contact_mapping"
+            )
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
     # =========================================================================
     # LLM Match Attempt Operations
     # =========================================================================
@@ -557,32 +886,7 @@ class SyncDatabase:
         """
         with self.connection() as conn:
             conn.execute(
-                """
-                INSERT INTO llm_match_attempts (
-                    contact1_resource_name,
-                    contact2_resource_name,
-                    contact1_display_name,
-                    contact2_display_name,
-                    contact1_content_hash,
-                    contact2_content_hash,
-                    is_match,
-                    confidence,
-                    reasoning,
-                    model_used,
-                    created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(contact1_resource_name, contact2_resource_name)
-                DO UPDATE SET
-                    contact1_display_name = excluded.contact1_display_name,
-                    contact2_display_name = excluded.contact2_display_name,
-                    contact1_content_hash = excluded.contact1_content_hash,
-                    contact2_content_hash = excluded.contact2_content_hash,
-                    is_match = excluded.is_match,
-                    confidence = excluded.confidence,
-                    reasoning = excluded.reasoning,
-                    model_used = excluded.model_used,
-                    created_at = excluded.created_at
-                """,
+                _UPSERT_LLM_MATCH_ATTEMPT_SQL,
                 (
                     contact1_resource_name,
                     contact2_resource_name,
@@ -598,6 +902,45 @@ class SyncDatabase:
                 ),
             )
 
+    def upsert_llm_match_attempts(self, attempts: list[dict[str, Any]]) -> int:
+        """
+        Store or update many LLM match decisions in a single transaction.
+
+        Each attempt dictionary takes the same keys as the arguments of
+        upsert_llm_match_attempt().
+
+        Args:
+            attempts: List of match attempt dictionaries
+
+        Returns:
+            Number of attempts written
+        """
+        if not attempts:
+            return 0
+
+        now = datetime.utcnow()
+        with self.connection() as conn:
+            conn.executemany(
+                _UPSERT_LLM_MATCH_ATTEMPT_SQL,
+                [
+                    (
+                        attempt["contact1_resource_name"],
+                        attempt["contact2_resource_name"],
+                        attempt["contact1_display_name"],
+                        attempt["contact2_display_name"],
+                        attempt["contact1_content_hash"],
+                        attempt["contact2_content_hash"],
+                        attempt["is_match"],
+                        attempt["confidence"],
+                        attempt["reasoning"],
+                        attempt["model_used"],
+                        now,
+                    )
+                    for attempt in attempts
+                ],
+            )
+        return len(attempts)
+
     def delete_llm_match_attempts_for_contact(self, resource_name: str) -> int:
         """
         Delete all LLM match attempts involving a contact.
@@ -620,6 +963,36 @@ class SyncDatabase:
             )
             return cursor.rowcount
 
+    def get_all_llm_match_attempts(self) -> list[dict[str, Any]]:
+        """
+        Get all cached LLM match decisions.
+
+        Used to preload the decision cache once per sync instead of querying
+        one pair at a time.
+
+        Returns:
+            List of all match attempt dictionaries
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT
+                    contact1_resource_name,
+                    contact2_resource_name,
+                    contact1_display_name,
+                    contact2_display_name,
+                    contact1_content_hash,
+                    contact2_content_hash,
+                    is_match,
+                    confidence,
+                    reasoning,
+                    model_used,
+                    created_at
+                FROM llm_match_attempts
+                """
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_llm_match_attempt_count(self) -> int:
         """
         Get the total number of cached LLM match attempts.
@@ -666,6 +1039,10 @@ class SyncDatabase:
         with self.connection() as conn:
             conn.execute("DELETE FROM sync_state")
             conn.execute("DELETE FROM contact_mapping")
+            conn.execute("DELETE FROM pending_contact_writes")
+            conn.execute("DELETE FROM contact_mirror")
+            conn.execute("DELETE FROM group_mirror")
+            conn.execute("DELETE FROM mirror_state")
 
     def vacuum(self) -> None:
         """
@@ -1107,3 +1484,268 @@ class SyncDatabase:
         with self.connection() as conn:
             cursor = conn.execute("DELETE FROM contact_group_mappings")
             return cursor.rowcount
+
+    # =========================================================================
+    # Pending Contact Write Operations
+    # =========================================================================
+
+    def get_pending_contact_writes(self, account_id: str) -> list[str]:
+        """
+        Get the contacts of an account whose write to the other account failed.
+
+        Args:
+            account_id: Account holding the source contacts
+
+        Returns:
+            Resource names of the source contacts, sorted
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "SELECT resource_name FROM pending_contact_writes "
+                "WHERE account_id = ? ORDER BY resource_name",
+                (account_id,),
+            )
+            return [row["resource_name"] for row in cursor.fetchall()]
+
+    def update_pending_contact_writes(
+        self,
+        retried: list[tuple[str, str]],
+        failed: list[tuple[str, str, str]],
+    ) -> None:
+        """
+        Record the outcome of retrying pending writes in one transaction.
+
+        Args:
+            retried: (account_id, resource_name) of pending contacts that a
+                sync analyzed again; removed unless they failed again
+            failed: (account_id, resource_name, error) of contacts whose
+                write failed in that sync
+        """
+        now = datetime.utcnow()
+        with self.connection() as conn:
+            conn.executemany(
+                "DELETE FROM pending_contact_writes "
+                "WHERE account_id = ? AND resource_name = ?",
+                retried,
+            )
+            conn.executemany(
+                """
+                INSERT INTO pending_contact_writes (
+                    account_id, resource_name, last_error, failed_at
+                ) VALUES (?, ?, ?, ?)
+                ON CONFLICT(account_id, resource_name) DO UPDATE SET
+                    last_error = excluded.last_error,
+                    failed_at = excluded.failed_at
+                """,
+                [(*write, now) for write in failed],
+            )
+
+    # =========================================================================
+    # Local Mirror Operations
+    # =========================================================================
+
+    def _mirror_rows(
+        self, account_id: str, rows: list[dict[str, Any]], now: datetime
+    ) -> list[tuple[Any, ...]]:
+        """Build contact_mirror parameters from mirror row dictionaries."""
+        return [
+            (
+                account_id,
+                row["resource_name"],
+                row.get("etag"),
+                json.dumps(row["person"], separators=(",", ":")),
+                row.get("matching_key"),
+                row.get("content_hash"),
+                now,
+            )
+            for row in rows
+        ]
+
+    def replace_contact_mirror(
+        self, account_id: str, rows: list[dict[str, Any]]
+    ) -> int:
+        """
+        Replace an account's mirrored contacts after a full listing.
+
+        Each row dictionary has resource_name, etag, person (the raw People
+        API person), matching_key and content_hash. Marks the account's
+        mirror as complete, so later sync-token deltas can be applied to it.
+
+        Args:
+            account_id: The account identifier
+            rows: Mirror rows for every contact of the account
+
+        Returns:
+            Number of contacts stored
+        """
+        now = datetime.utcnow()
+        with self.connection() as conn:
+            conn.execute(
+                "DELETE FROM contact_mirror WHERE account_id = ?", (account_id,)
+            )
+            conn.executemany(
+                _UPSERT_CONTACT_MIRROR_SQL, self._mirror_rows(account_id, rows, now)
+            )
+            conn.execute(
+                """
+                INSERT INTO mirror_state (account_id, contacts_listed_at)
+                VALUES (?, ?)
+                ON CONFLICT(account_id) DO UPDATE SET
+                    contacts_listed_at = excluded.contacts_listed_at
+                """,
+                (account_id, now),
+            )
+        return len(rows)
+
+    def apply_contact_mirror_changes(
+        self,
+        account_id: str,
+        rows: list[dict[str, Any]],
+        deleted_resource_names: list[str],
+    ) -> None:
+        """
+        Apply a sync-token delta to an account's mirrored contacts.
+
+        Applying the same delta twice leaves the mirror unchanged, so a delta
+        listed again after a failed sync is safe to apply.
+
+        Args:
+            account_id: The account identifier
+            rows: Mirror rows (see replace_contact_mirror) of changed contacts
+            deleted_resource_names: Resource names of deleted contacts
+        """
+        now = datetime.utcnow()
+        with self.connection() as conn:
+            conn.executemany(
+                _UPSERT_CONTACT_MIRROR_SQL, self._mirror_rows(account_id, rows, now)
+            )
+            conn.executemany(
+                "DELETE FROM contact_mirror WHERE account_id = ? AND resource_name = ?",
+                [(account_id, name) for name in deleted_resource_names],
+            )
+
+    def get_contact_mirror(self, account_id: str) -> list[dict[str, Any]]:
+        """
+        Get an account's mirrored contacts.
+
+        Args:
+            account_id: The account identifier
+
+        Returns:
+            List of mirror row dictionaries, with the raw person decoded
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT
+                    resource_name,
+                    etag,
+                    person_json,
+                    matching_key,
+                    content_hash
+                FROM contact_mirror
+                WHERE account_id = ?
+                ORDER BY resource_name
+                """,
+                (account_id,),
+            )
+            rows = []
+            for row in cursor.fetchall():
+                mirrored = dict(row)
+                mirrored["person"] = json.loads(mirrored.pop("person_json"))
+                rows.append(mirrored)
+            return rows
+
+    def is_contact_mirror_complete(self, account_id: str) -> bool:
+        """
+        Check whether an account's mirror holds a full listing.
+
+        Args:
+            account_id: The account identifier
+
+        Returns:
+            True if replace_contact_mirror() has stored a full listing
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM mirror_state "
+                "WHERE account_id = ? AND contacts_listed_at IS NOT NULL",
+                (account_id,),
+            )
+            return cursor.fetchone() is not None
+
+    def get_contact_mirror_count(self, account_id: str | None = None) -> int:
+        """
+        Get the number of mirrored contacts.
+
+        Args:
+            account_id: Optional account to count (default: all accounts)
+
+        Returns:
+            Number of mirrored contacts
+        """
+        with self.connection() as conn:
+            if account_id:
+                cursor = conn.execute(
+                    "SELECT COUNT(*) FROM contact_mirror WHERE account_id = ?",
+                    (account_id,),
+                )
+            else:
+                cursor = conn.execute("SELECT COUNT(*) FROM contact_mirror")
+            row = cursor.fetchone()
+            return row[0] if row else 0
+
+    def replace_group_mirror(
+        self, account_id: str, groups: list[dict[str, Any]]
+    ) -> int:
+        """
+        Replace an account's mirrored groups with a full group listing.
+
+        Args:
+            account_id: The account identifier
+            groups: Raw group dictionaries as returned by the API
+
+        Returns:
+            Number of groups stored
+        """
+        now = datetime.utcnow()
+        with self.connection() as conn:
+            conn.execute("DELETE FROM group_mirror WHERE account_id = ?", (account_id,))
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO group_mirror (
+                    account_id, resource_name, group_json, updated_at
+                ) VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (
+                        account_id,
+                        group.get("resourceName", ""),
+                        json.dumps(group, separators=(",", ":")),
+                        now,
+                    )
+                    for group in groups
+                ],
+            )
+        return len(groups)
+
+    def get_group_mirror(self, account_id: str) -> list[dict[str, Any]]:
+        """
+        Get an account's mirrored groups.
+
+        Args:
+            account_id: The account identifier
+
+        Returns:
+            List of raw group dictionaries
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT group_json FROM group_mirror
+                WHERE account_id = ?
+                ORDER BY resource_name
+                """,
+                (account_id,),
+            )
+            return [json.loads(row["group_json"]) for row in cursor.fetchall()]
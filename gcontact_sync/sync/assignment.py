@@ -0,0 +1,214 @@
+"""
+Maximum-weight bipartite assignment for contact matching.
+
+Given scored candidate pairs between two contact lists, picks the set of
+one-to-one pairs with the highest total score. Unlike a greedy first-hit
+scan, a weaker pair can never claim a contact whose best partner appears
+later in the list.
+
+The candidate graph produced by blocking is sparse, so it is split into
+connected components first. Components with a single edge (the common
+case) are assigned directly; larger components are solved exactly with
+shortest augmenting paths over the candidate edges only, so a large
+component (e.g. many contacts sharing a company phone) never builds a dense
+cost matrix. Components above MAX_EXACT_COMPONENT_EDGES fall back to a greedy
+highest-weight-first assignment to bound the worst case.
+"""
+
+import heapq
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Largest component (in candidate edges) solved exactly; bigger ones are
+# assigned greedily by descending weight
+MAX_EXACT_COMPONENT_EDGES = 20000
+
+
+def max_weight_assignment(
+    edges: dict[tuple[int, int], float],
+) -> list[tuple[int, int]]:
+    """
+    Solve a sparse maximum-weight bipartite matching.
+
+    Args:
+        edges: Mapping of (left index, right index) to a positive weight.
+            Pairs not present cannot be assigned.
+
+    Returns:
+        Assigned (left index, right index) pairs sorted by left index. Each
+        left and right index appears at most once. The result is
+        deterministic for a given input.
+    """
+    assignment: list[tuple[int, int]] = []
+
+    for component in _connected_components(edges):
+        if len(component) == 1:
+            assignment.append(component[0])
+        elif len(component) > MAX_EXACT_COMPONENT_EDGES:
+            logger.debug(
+                f"Assigning component of {len(component)} candidate pairs greedily"
+            )
+            assignment.extend(_greedy_component(component, edges))
+        else:
+            assignment.extend(_solve_component(component, edges))
+
+    assignment.sort()
+    return assignment
+
+
+def _connected_components(
+    edges: dict[tuple[int, int], float],
+) -> list[list[tuple[int, int]]]:
+    """
+    Group edges into connected components of the bipartite graph.
+
+    Args:
+        edges: Weighted edges keyed by (left index, right index)
+
+    Returns:
+        List of components, each a sorted list of edges
+    """
+    # Union-find over left nodes ("L", i) and right nodes ("R", j)
+    parent: dict[tuple[str, int], tuple[str, int]] = {}
+
+    def find(node: tuple[str, int]) -> tuple[str, int]:
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    for left, right in edges:
+        a = ("L", left)
+        b = ("R", right)
+        parent.setdefault(a, a)
+        parent.setdefault(b, b)
+        root_a = find(a)
+        root_b = find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    components: dict[tuple[str, int], list[tuple[int, int]]] = {}
+    for edge in sorted(edges):
+        components.setdefault(find(("L", edge[0])), []).append(edge)
+
+    return list(components.values())
+
+
+def _solve_component(
+    component: list[tuple[int, int]],
+    edges: dict[tuple[int, int], float],
+) -> list[tuple[int, int]]:
+    """
+    Solve one connected component exactly with sparse shortest augmenting paths.
+
+    Each left node also has a private "unassigned" option of weight 0, so
+    every left node can always be placed and the minimum-cost assignment of
+    cost = max weight - weight is a maximum-weight matching. Left nodes are
+    added one at a time; Dijkstra over the candidate edges (with column
+    potentials keeping reduced costs non-negative) finds the cheapest way to
+    make room for each, and stops at the first free column.
+
+    Args:
+        component: Edges of the component
+        edges: Weights for all edges
+
+    Returns:
+        Assigned (left index, right index) pairs within the component
+    """
+    lefts = sorted({left for left, _ in component})
+    rights = sorted({right for _, right in component})
+    row_pos = {node: r for r, node in enumerate(lefts)}
+    col_pos = {node: c for c, node in enumerate(rights)}
+    unassigned_col = len(rights)  # row r's "unassigned" column is this + r
+
+    top = max(edges[edge] for edge in component)
+    adjacency: list[list[tuple[int, float]]] = [
+        [(unassigned_col + r, top)] for r in range(len(lefts))
+    ]
+    for left, right in component:
+        adjacency[row_pos[left]].append((col_pos[right], top - edges[(left, right)]))
+    for row_edges in adjacency:
+        row_edges.sort()
+
+    cost = [dict(row_edges) for row_edges in adjacency]
+    potential = [0.0] * (len(rights) + len(lefts))
+    owner = [-1] * (len(rights) + len(lefts))  # row assigned to each column
+    assigned = [-1] * len(lefts)  # column assigned to each row
+
+    for start in range(len(lefts)):
+        dist: dict[int, float] = {}
+        via: dict[int, int] = {}  # row the shortest path enters each column from
+        done: dict[int, None] = {}  # finalized columns, in order
+        heap: list[tuple[float, int]] = []
+
+        for col, c in adjacency[start]:
+            d = c - potential[col]
+            if d < dist.get(col, float("inf")):
+                dist[col] = d
+                via[col] = start
+                heapq.heappush(heap, (d, col))
+
+        while True:
+            d, col = heapq.heappop(heap)
+            if col in done or d > dist[col]:
+                continue
+            done[col] = None
+            row = owner[col]
+            if row < 0:
+                free_col, shortest = col, d
+                break
+            # Leaving row's current column is free (its reduced cost is zero)
+            base = d - (cost[row][col] - potential[col])
+            for next_col, c in adjacency[row]:
+                if next_col in done:
+                    continue
+                nd = base + c - potential[next_col]
+                if nd < dist.get(next_col, float("inf")):
+                    dist[next_col] = nd
+                    via[next_col] = row
+                    heapq.heappush(heap, (nd, next_col))
+
+        for col in done:
+            potential[col] += dist[col] - shortest
+
+        # Shift assignments back along the path
+        col = free_col
+        while True:
+            row = via[col]
+            previous = assigned[row]
+            assigned[row] = col
+            owner[col] = row
+            if row == start:
+                break
+            col = previous
+
+    return [(lefts[r], rights[c]) for r, c in enumerate(assigned) if c < unassigned_col]
+
+
+def _greedy_component(
+    component: list[tuple[int, int]],
+    edges: dict[tuple[int, int], float],
+) -> list[tuple[int, int]]:
+    """
+    Assign one component greedily, highest weight first.
+
+    Args:
+        component: Edges of the component
+        edges: Weights for all edges
+
+    Returns:
+        Assigned (left index, right index) pairs within the component
+    """
+    used_lefts: set[int] = set()
+    used_rights: set[int] = set()
+    pairs = []
+    for left, right in sorted(component, key=lambda edge: (-edges[edge], edge)):
+        if left not in used_lefts and right not in used_rights:
+            used_lefts.add(left)
+            used_rights.add(right)
+            pairs.append((left, right))
+    return pairs
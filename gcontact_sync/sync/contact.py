@@ -11,32 +11,66 @@ from __future__ import annotations
 
 import hashlib
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from gcontact_sync.utils import normalize_string
 
+# Everything but digits, stripped from phone numbers
+_NON_DIGITS = re.compile(r"\D")
 
-@dataclass
+# People API person fields that content_hash() and to_api_format() depend on
+CONTENT_PERSON_FIELDS = frozenset(
+    ["names", "emailAddresses", "phoneNumbers", "organizations", "biographies"]
+)
+
+
+@dataclass(slots=True)
+class _DerivedFields:
+    """
+    Values derived from a contact's syncable fields, computed on first use.
+
+    source holds the field values they were derived from; Contact discards
+    the whole set as soon as any of those values differs.
+    """
+
+    source: tuple[Any, ...]
+    normalized_emails: tuple[str, ...] | None = None
+    normalized_phones: tuple[str, ...] | None = None
+    matching_key: str | None = None
+    alternate_matching_keys: tuple[str, ...] | None = None
+    content_hash: str | None = None
+
+
+@dataclass(slots=True)
 class Contact:
     """
     Normalized contact representation for bidirectional sync.
 
+    Contacts are slotted (no per-instance __dict__) and their multi-valued
+    fields are tuples, to keep large address books small in memory. Lists
+    passed to the constructor are converted to tuples; assign a new tuple
+    to change a multi-valued field.
+
     Attributes:
         resource_name: Google's unique ID (e.g., "people/c12345")
         etag: Required for updates, prevents concurrent modification conflicts
         display_name: Full display name of the contact
         given_name: First name
         family_name: Last name
-        emails: List of email addresses
-        phones: List of phone numbers
-        organizations: List of organization names
+        emails: Email addresses
+        phones: Phone numbers
+        organizations: Organization names
         notes: Contact notes
         last_modified: Timestamp of last modification
         photo_url: URL to contact's photo
         photo_data: Binary photo data
         photo_etag: ETag for photo version tracking
+        populated_fields: People API person fields the contact was read with,
+            or None if it holds all of them. A field outside this set was not
+            requested, which is not the same as empty.
 
     Usage:
         # Create from API response
@@ -58,15 +92,13 @@ class Contact:
 
     given_name: str | None = None
     family_name: str | None = None
-    emails: list[str] = field(default_factory=list)
-    phones: list[str] = field(default_factory=list)
-    organizations: list[str] = field(default_factory=list)
+    emails: tuple[str, ...] = ()
+    phones: tuple[str, ...] = ()
+    organizations: tuple[str, ...] = ()
     notes: str | None = None
     last_modified: datetime | None = None
-    memberships: list[str] = field(default_factory=list)  # Contact group resource names
-    membership_names: list[str] = field(
-        default_factory=list
-    )  # Human-readable group names
+    memberships: tuple[str, ...] = ()  # Contact group resource names
+    membership_names: tuple[str, ...] = ()  # Human-readable group names
 
     # Photo fields
     photo_url: str | None = None
@@ -76,13 +108,34 @@ class Contact:
     # Additional fields for sync tracking
     deleted: bool = False  # True if contact was deleted in source
 
+    # Person fields requested from the API (None = all)
+    populated_fields: frozenset[str] | None = None
+
+    # Cache of matching keys, content hash and normalized phones
+    _derived: _DerivedFields | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Store multi-valued fields as tuples (accepts any iterable)."""
+        self.emails = tuple(self.emails)
+        self.phones = tuple(self.phones)
+        self.organizations = tuple(self.organizations)
+        self.memberships = tuple(self.memberships)
+        self.membership_names = tuple(self.membership_names)
+
     @classmethod
-    def from_api_response(cls, person: dict[str, Any]) -> Contact:
+    def from_api_response(
+        cls, person: dict[str, Any], person_fields: str | None = None
+    ) -> Contact:
         """
         Create a Contact from a Google People API response.
 
         Args:
             person: Dictionary from Google People API containing contact data
+            person_fields: Comma-separated person fields the response was
+                requested with, if it was a partial read (see
+                populated_fields). None for a read of all synced fields.
 
         Returns:
             Contact instance populated from the API response
@@ -114,32 +167,35 @@ class Contact:
             display_name = " ".join(parts)
 
         # Extract email addresses
-        emails = [
+        emails = tuple(
             e.get("value", "")
             for e in person.get("emailAddresses", [])
             if e.get("value")
-        ]
+        )
 
         # Extract phone numbers
-        phones = [
+        phones = tuple(
             p.get("value", "") for p in person.get("phoneNumbers", []) if p.get("value")
-        ]
+        )
 
         # Extract organizations
-        organizations = [
+        organizations = tuple(
             o.get("name", "") for o in person.get("organizations", []) if o.get("name")
-        ]
+        )
 
         # Extract notes from biographies
         biographies = person.get("biographies", [])
         notes = biographies[0].get("value") if biographies else None
 
-        # Extract memberships (contact group resource names)
-        memberships = [
-            m.get("contactGroupMembership", {}).get("contactGroupResourceName", "")
+        # Extract memberships (contact group resource names), interned since
+        # the same few groups are shared by many contacts
+        memberships = tuple(
+            sys.intern(
+                m.get("contactGroupMembership", {}).get("contactGroupResourceName", "")
+            )
             for m in person.get("memberships", [])
             if m.get("contactGroupMembership", {}).get("contactGroupResourceName")
-        ]
+        )
 
         # Extract last modified time from metadata
         last_modified = None
@@ -186,8 +242,27 @@ class Contact:
             memberships=memberships,
             photo_url=photo_url,
             deleted=deleted,
+            populated_fields=(
+                frozenset(person_fields.split(",")) if person_fields else None
+            ),
         )
 
+    @property
+    def is_partial(self) -> bool:
+        """Whether any field content_hash() depends on was not read."""
+        return self.populated_fields is not None and not (
+            CONTENT_PERSON_FIELDS.issubset(self.populated_fields)
+        )
+
+    def _require_content(self, operation: str) -> None:
+        """Raise if the contact was read without all of its content fields."""
+        if self.is_partial:
+            missing = sorted(CONTENT_PERSON_FIELDS - (self.populated_fields or set()))
+            raise ValueError(
+                f"Cannot {operation} for partial contact {self.resource_name}: "
+                f"{', '.join(missing)} not read"
+            )
+
     def to_api_format(self) -> dict[str, Any]:
         """
         Convert Contact to Google People API format for create/update operations.
@@ -201,7 +276,12 @@ class Contact:
             - Only includes non-empty fields
             - Photos are included for informational purposes but must be
               updated separately via the updateContactPhoto endpoint
+
+        Raises:
+            ValueError: If the contact is partial (fields not read would be
+                written as empty)
         """
+        self._require_content("build API format")
         person: dict[str, Any] = {}
 
         # Add names if available
@@ -277,6 +357,13 @@ class Contact:
             match even when one account has additional emails that the other
             doesn't have. This is the common case in contact sync scenarios.
         """
+        derived = self._derived_fields()
+        if derived.matching_key is None:
+            derived.matching_key = self._compute_matching_key()
+        return derived.matching_key
+
+    def _compute_matching_key(self) -> str:
+        """Build the key returned by matching_key()."""
         # Normalize and lowercase the display name, sorting words alphabetically
         # This handles name order variations like "Last, First" vs "First Last"
         name = normalize_string(
@@ -285,11 +372,7 @@ class Contact:
 
         # Get all normalized emails, sorted for consistency
         normalized_emails = sorted(
-            [
-                normalize_string(email, allow_email_chars=True)
-                for email in self.emails
-                if email and normalize_string(email, allow_email_chars=True)
-            ]
+            [email for email in self._normalize_emails() if email]
         )
 
         # Get all normalized phone numbers, sorted for consistency
@@ -332,16 +415,23 @@ class Contact:
             - Name + each individual email combination
             - Name + each individual phone combination
         """
+        derived = self._derived_fields()
+        if derived.alternate_matching_keys is None:
+            derived.alternate_matching_keys = tuple(
+                self._compute_alternate_matching_keys()
+            )
+        return list(derived.alternate_matching_keys)
+
+    def _compute_alternate_matching_keys(self) -> list[str]:
+        """Build the keys returned by alternate_matching_keys()."""
         keys: list[str] = []
         name = normalize_string(self.display_name, allow_email_chars=True)
 
         # Add individual email-based keys
-        for email in self.emails:
-            if email:
-                normalized_email = normalize_string(email, allow_email_chars=True)
-                if normalized_email:
-                    keys.append(f"email:{normalized_email}")
-                    keys.append(f"{name}|email:{normalized_email}")
+        for normalized_email in self._normalize_emails():
+            if normalized_email:
+                keys.append(f"email:{normalized_email}")
+                keys.append(f"{name}|email:{normalized_email}")
 
         # Add individual phone-based keys
         for phone in self._normalize_phones():
@@ -365,6 +455,10 @@ class Contact:
         Returns:
             SHA-256 hash string of contact content
 
+        Raises:
+            ValueError: If the contact is partial, so that fields that were
+                not read are never hashed as empty
+
         Note:
             Lists are sorted before hashing to ensure consistent ordering.
             Photos are excluded because: (1) photo_data isn't populated during
@@ -373,6 +467,15 @@ class Contact:
             Memberships are excluded because group assignments are not synced
             between accounts (UPDATE_PERSON_FIELDS doesn't include memberships).
         """
+        self._require_content("compute content hash")
+
+        derived = self._derived_fields()
+        if derived.content_hash is None:
+            derived.content_hash = self._compute_content_hash()
+        return derived.content_hash
+
+    def _compute_content_hash(self) -> str:
+        """Build the hash returned by content_hash()."""
         # Build a deterministic string from all content fields
         # Photos excluded - they're compared separately via photo_url
         # Memberships excluded - not synced between accounts
@@ -391,21 +494,75 @@ class Contact:
         # Generate SHA-256 hash
         return hashlib.sha256(content_string.encode("utf-8")).hexdigest()
 
-    def _normalize_phones(self) -> list[str]:
+    def _normalize_phones(self) -> tuple[str, ...]:
         """
         Normalize phone numbers for consistent hashing.
 
         Removes all non-digit characters for comparison.
 
         Returns:
-            List of normalized phone number strings
+            Normalized phone number strings
         """
-        normalized = []
-        for phone in self.phones:
+        derived = self._derived_fields()
+        if derived.normalized_phones is None:
             # Keep only digits
-            digits = re.sub(r"\D", "", phone)
-            normalized.append(digits)
-        return normalized
+            derived.normalized_phones = tuple(
+                _NON_DIGITS.sub("", phone) for phone in self.phones
+            )
+        return derived.normalized_phones
+
+    def _normalize_emails(self) -> tuple[str, ...]:
+        """
+        Normalize email addresses for matching keys.
+
+        Returns:
+            Normalized emails, in order ("" where nothing is left)
+        """
+        derived = self._derived_fields()
+        if derived.normalized_emails is None:
+            derived.normalized_emails = tuple(
+                normalize_string(email, allow_email_chars=True) if email else ""
+                for email in self.emails
+            )
+        return derived.normalized_emails
+
+    def seed_derived_fields(self, matching_key: str, content_hash: str) -> None:
+        """
+        Seed the cached matching key and content hash.
+
+        For values computed earlier from the same field values (e.g. stored
+        in the local mirror), so they are not derived again. Like any cached
+        value, they are discarded as soon as a field is reassigned.
+
+        Args:
+            matching_key: Previously computed matching_key()
+            content_hash: Previously computed content_hash()
+        """
+        derived = self._derived_fields()
+        derived.matching_key = matching_key
+        derived.content_hash = content_hash
+
+    def _derived_fields(self) -> _DerivedFields:
+        """
+        Get the cached values derived from the syncable fields.
+
+        The cache is checked against the current field values on every call,
+        so it is dropped as soon as a field is reassigned.
+        """
+        source = (
+            self.display_name,
+            self.given_name,
+            self.family_name,
+            tuple(self.emails),
+            tuple(self.phones),
+            tuple(self.organizations),
+            self.notes,
+        )
+        derived = self._derived
+        if derived is None or derived.source != source:
+            derived = _DerivedFields(source)
+            self._derived = derived
+        return derived
 
     def is_valid(self) -> bool:
         """
@@ -422,10 +579,13 @@ class Contact:
         """
         Check equality based on content (not resource_name or etag).
 
-        Two contacts are equal if their content hash matches.
+        Two contacts are equal if their content hash matches. Partial
+        contacts are only equal to themselves.
         """
         if not isinstance(other, Contact):
             return NotImplemented
+        if self.is_partial or other.is_partial:
+            return self is other
         return self.content_hash() == other.content_hash()
 
     def __hash__(self) -> int:
@@ -6,16 +6,25 @@ handling contact creation, updates, deletions, and conflict resolution.
 """
 
 import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from gcontact_sync.config import SyncConfig
-    from gcontact_sync.sync.matcher import MatchConfig
+    from gcontact_sync.sync.matcher import MatchConfig, MatchResult
 
-from gcontact_sync.api.people_api import PeopleAPI, PeopleAPIError
+from gcontact_sync.api.people_api import (
+    BatchWriteError,
+    PeopleAPI,
+    PeopleAPIError,
+    RateLimitError,
+)
 from gcontact_sync.auth.google_auth import ACCOUNT_1, ACCOUNT_2
 from gcontact_sync.backup.manager import BackupManager
 from gcontact_sync.storage.db import SyncDatabase
@@ -27,12 +36,22 @@ from gcontact_sync.sync.conflict import (
 )
 from gcontact_sync.sync.contact import Contact
 from gcontact_sync.sync.group import ContactGroup
-from gcontact_sync.sync.photo import PhotoError, download_photo, process_photo
+from gcontact_sync.sync.photo import (
+    DEFAULT_CONNECT_RETRIES,
+    DEFAULT_POOL_MAXSIZE,
+    create_photo_session,
+)
+from gcontact_sync.sync.photo_cache import PhotoCache
+from gcontact_sync.sync.photo_pipeline import PhotoPipeline, PhotoTask
 from gcontact_sync.utils import normalize_string
 from gcontact_sync.utils.logging import setup_matching_logger
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses of batch write errors caused by the records sent, which
+# splitting the batch can narrow down to the offending contacts
+RECORD_ERROR_STATUSES = frozenset({400, 412})
+
 
 class DuplicateHandling:
     """Strategy for handling potential duplicate contacts."""
@@ -99,6 +118,19 @@ class SyncStats:
     photos_deleted: int = 0
     photos_failed: int = 0
 
+    # Contacts whose create or update was deferred because the rate limit ran
+    # out; the sync tokens are then kept so the next sync reads those changes
+    # again
+    writes_pending_retry: int = 0
+
+    # Multi-tier matching statistics
+    match_pairs_considered: int = 0
+    match_pairs_pruned: int = 0
+
+    # Fetch timing statistics (seconds spent listing groups and contacts)
+    fetch_seconds_account1: float = 0.0
+    fetch_seconds_account2: float = 0.0
+
     # Group statistics
     groups_in_account1: int = 0
     groups_in_account2: int = 0
@@ -212,6 +244,14 @@ class SyncResult:
     # for groups that have contacts being synced
     groups_in_use: set[str] = field(default_factory=set)
 
+    # Contacts whose write failed in an earlier sync and that this sync
+    # analyzed again: (source account ID, resource name)
+    retried_writes: list[tuple[str, str]] = field(default_factory=list)
+
+    # Contacts whose create or update the API rejected in this sync, retried
+    # by the next one: (source account ID, resource name, error)
+    failed_writes: list[tuple[str, str, str]] = field(default_factory=list)
+
     # Statistics
     stats: SyncStats = field(default_factory=SyncStats)
 
@@ -358,6 +398,63 @@ class SyncResult:
         return "\n".join(lines)
 
 
+@dataclass
+class AccountSnapshot:
+    """
+    Groups and contacts listed from one account at the start of a sync.
+
+    Shared by the pre-sync backup and analysis so each account is only
+    listed once per sync.
+    """
+
+    # Syncable user groups
+    groups: list[ContactGroup]
+
+    # All groups exactly as returned by the API (for backups)
+    raw_groups: list[dict[str, Any]]
+
+    # All contacts, or only the changes since base_sync_token
+    contacts: list[Contact]
+
+    # Sync token for the next incremental listing
+    sync_token: str | None = None
+
+    # Sync token the listing started from (None for a full listing)
+    base_sync_token: str | None = None
+
+    # Contacts changed or deleted since the last sync, when contacts were
+    # listed through the local mirror (None when every contact is new)
+    changed_resource_names: frozenset[str] | None = None
+
+    # Contacts whose write failed in an earlier sync and that this listing
+    # includes again (see SyncDatabase.get_pending_contact_writes)
+    retried_writes: frozenset[str] = frozenset()
+
+    # Wall-clock seconds spent listing this account
+    fetch_seconds: float = 0.0
+
+
+@dataclass
+class BatchWriteOutcome:
+    """
+    Per-item result of a batch write that isolates failing records.
+
+    See SyncEngine._write_isolating_failures().
+    """
+
+    # (item, API result) for every item written
+    written: list[tuple[Any, Any]] = field(default_factory=list)
+
+    # (item, error) for every item that could not be written
+    failed: list[tuple[Any, PeopleAPIError]] = field(default_factory=list)
+
+    # Items not sent because the rate limit ran out
+    deferred: list[Any] = field(default_factory=list)
+
+    # The RateLimitError that stopped the write, if any
+    rate_limit_error: RateLimitError | None = None
+
+
 class SyncEngine:
     """
     Bidirectional sync engine for Google Contacts.
@@ -406,6 +503,13 @@ class SyncEngine:
         match_config: Optional["MatchConfig"] = None,
         duplicate_handling: str = DuplicateHandling.SKIP,
         config: Optional["SyncConfig"] = None,
+        concurrent_fetch: bool = False,
+        concurrent_execute: bool = False,
+        contact_mirror: bool = False,
+        incremental_analysis: bool = False,
+        photo_cache: PhotoCache | None = None,
+        photo_pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        photo_connect_retries: int = DEFAULT_CONNECT_RETRIES,
     ):
         """
         Initialize the sync engine.
@@ -427,6 +531,28 @@ class SyncEngine:
             config: Optional SyncConfig for tag-based contact filtering.
                 If provided, contacts will be filtered by group membership
                 according to the configuration. If None, all contacts are synced.
+            concurrent_fetch: If True, list groups and contacts of both accounts
+                at the same time, one worker thread per account. Each thread
+                only uses its own account's PeopleAPI (and HTTP transport).
+            concurrent_execute: If True, execute() writes to both accounts at
+                the same time, one worker thread per account. Each step (group
+                creates, updates and deletes, then contact creates, updates
+                and deletes) still finishes in both accounts before the next
+                one starts.
+            contact_mirror: If True, keep a local copy of each account's
+                contacts and groups in the sync database. Incremental syncs
+                then only download the changes since the last sync, while
+                analysis still sees every contact.
+            incremental_analysis: If True (and contact_mirror is enabled),
+                incremental syncs only re-evaluate the pairs and unmatched
+                contacts touched by the changes since the last sync, instead
+                of every mapping. Full syncs still analyze everything.
+            photo_cache: Optional on-disk cache of processed photos, so that
+                unchanged photos are not downloaded and processed again
+            photo_pool_maxsize: Keep-alive connections per host in the HTTP
+                session used for photo downloads
+            photo_connect_retries: Transport-level retries for failed photo
+                download connections
         """
         # Import here to avoid circular imports
         from gcontact_sync.sync.matcher import ContactMatcher, MatchConfig
@@ -451,10 +577,53 @@ class SyncEngine:
         # Sync configuration for tag-based filtering
         self.config = config
 
+        # Whether analyze() fetches both accounts in parallel
+        self.concurrent_fetch = concurrent_fetch
+
+        # Whether execute() writes to both accounts in parallel. Counters
+        # shared by the two accounts are updated under _stats_lock.
+        self.concurrent_execute = concurrent_execute
+        self._stats_lock = threading.Lock()
+
+        # Whether contacts are listed through the local mirror
+        self.contact_mirror = contact_mirror
+
+        # Whether incremental syncs only analyze the changed contacts
+        self.incremental_analysis = incremental_analysis
+
+        # Photo transfers run after each contact batch has been written.
+        # Downloads share one pooled keep-alive session, closed by close().
+        self.photo_session = create_photo_session(
+            pool_maxsize=photo_pool_maxsize, connect_retries=photo_connect_retries
+        )
+        self.photo_pipeline = PhotoPipeline(
+            cache=photo_cache, session=self.photo_session
+        )
+
         # Group resource names (set by _ensure_* or _resolve_* methods)
         self._sync_label_group_resources: dict[int, str | None] = {1: None, 2: None}
         self._target_group_resources: dict[int, str | None] = {1: None, 2: None}
 
+        # Group resource name translation tables keyed by source account,
+        # loaded once per execute() (see _load_group_membership_maps)
+        self._group_membership_maps: dict[int, dict[str, str | None]] | None = None
+
+    def close(self) -> None:
+        """
+        Release resources held by the engine (the photo download session).
+
+        Safe to call more than once.
+        """
+        self.photo_session.close()
+
+    def __enter__(self) -> "SyncEngine":
+        """Support use as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the engine when leaving a with block."""
+        self.close()
+
     def _get_account_label(self, account: int) -> str:
         """
         Get a human-readable label for an account.
@@ -929,6 +1098,10 @@ class SyncEngine:
 
         logger.info(f"Starting sync (dry_run={dry_run}, full_sync={full_sync})")
 
+        # List both accounts once; the listing is shared by the backup and
+        # the analysis below
+        snapshots = self._fetch_accounts(full_sync)
+
         # Create pre-sync backup if enabled (runs in all modes including dry-run)
         if backup_enabled:
             try:
@@ -938,40 +1111,20 @@ class SyncEngine:
                 else:
                     backup_dir = Path(backup_dir)
 
-                # Initialize backup manager
-                backup_manager = BackupManager(
-                    backup_dir=backup_dir,
-                    retention_count=backup_retention_count,
-                )
-
-                # Fetch all contacts and groups from both accounts
-                logger.info("Fetching contacts and groups for backup...")
-                contacts1, _ = self.api1.list_contacts()
-                contacts2, _ = self.api2.list_contacts()
-                groups1, _ = self.api1.list_contact_groups()
-                groups2, _ = self.api2.list_contact_groups()
-
-                # Create backup with data organized by account
-                backup_file = backup_manager.create_backup(
-                    account1_contacts=contacts1,
-                    account1_groups=groups1,
-                    account2_contacts=contacts2,
-                    account2_groups=groups2,
-                    account1_email=self.account1_email,
-                    account2_email=self.account2_email,
+                self._create_pre_sync_backup(
+                    BackupManager(
+                        backup_dir=backup_dir,
+                        retention_count=backup_retention_count,
+                    ),
+                    snapshots,
                 )
 
-                if backup_file:
-                    logger.info(f"Pre-sync backup created: {backup_file}")
-                else:
-                    logger.warning("Failed to create pre-sync backup")
-
             except Exception as e:
                 # Log error but don't fail sync - backup is optional
                 logger.warning(f"Pre-sync backup failed: {e}")
 
         # Analyze what needs to be synced
-        result = self.analyze(full_sync=full_sync)
+        result = self.analyze(full_sync=full_sync, snapshots=snapshots)
 
         # Apply changes if not dry run
         if not dry_run and result.has_changes():
@@ -979,7 +1132,84 @@ class SyncEngine:
 
         return result
 
-    def analyze(self, full_sync: bool = False) -> SyncResult:
+    def _create_pre_sync_backup(
+        self,
+        backup_manager: BackupManager,
+        snapshots: tuple[AccountSnapshot, AccountSnapshot],
+    ) -> Path | None:
+        """
+        Write a backup of both accounts from the data listed for this sync.
+
+        After a full listing the snapshot is backed up as is. After an
+        incremental listing the account's contacts are rebuilt from the backup
+        taken at the starting sync token plus the listed changes; only if no
+        such backup exists are the account's contacts streamed in full straight
+        into the backup.
+
+        Args:
+            backup_manager: BackupManager writing to the backup directory
+            snapshots: Data listed from account 1 and account 2
+
+        Returns:
+            Path to the backup file, or None if it could not be written
+        """
+        apis = (self.api1, self.api2)
+        backup_contacts: list[Iterable[Any]] = []
+
+        for index, snapshot in enumerate(snapshots):
+            account_key = f"account{index + 1}"
+            contacts: Iterable[Any] = snapshot.contacts
+
+            # Incremental listing: contacts only holds changes since the token
+            if snapshot.base_sync_token is not None:
+                base = backup_manager.find_contacts_snapshot(
+                    account_key, snapshot.base_sync_token
+                )
+                if base is not None:
+                    contacts = backup_manager.merge_contact_delta(
+                        base, snapshot.contacts
+                    )
+                    logger.debug(
+                        f"Built {account_key} backup from previous backup plus "
+                        f"{len(snapshot.contacts)} changes"
+                    )
+                else:
+                    logger.info(
+                        f"No backup at the stored sync token for {account_key}, "
+                        "listing all contacts for backup..."
+                    )
+                    contacts = apis[index].iter_contacts(request_sync_token=False)
+            else:
+                # A full view read from the local mirror also carries the
+                # contacts deleted since the last sync, for analysis only
+                contacts = [c for c in snapshot.contacts if not c.deleted]
+
+            backup_contacts.append(contacts)
+
+        snapshot1, snapshot2 = snapshots
+        backup_file = backup_manager.create_backup(
+            account1_contacts=backup_contacts[0],
+            account1_groups=snapshot1.raw_groups,
+            account2_contacts=backup_contacts[1],
+            account2_groups=snapshot2.raw_groups,
+            account1_email=self.account1_email,
+            account2_email=self.account2_email,
+            account1_sync_token=snapshot1.sync_token,
+            account2_sync_token=snapshot2.sync_token,
+        )
+
+        if backup_file:
+            logger.info(f"Pre-sync backup created: {backup_file}")
+        else:
+            logger.warning("Failed to create pre-sync backup")
+
+        return backup_file
+
+    def analyze(
+        self,
+        full_sync: bool = False,
+        snapshots: tuple[AccountSnapshot, AccountSnapshot] | None = None,
+    ) -> SyncResult:
         """
         Analyze groups and contacts in both accounts and determine sync operations.
 
@@ -992,6 +1222,8 @@ class SyncEngine:
 
         Args:
             full_sync: If True, ignore sync tokens and do full comparison
+            snapshots: Data already listed from both accounts (as sync() does
+                for the pre-sync backup). Fetched here if not provided.
 
         Returns:
             SyncResult containing all planned sync operations
@@ -1000,106 +1232,163 @@ class SyncEngine:
 
         result = SyncResult()
 
-        # === LOG FILTER CONFIGURATION ===
-        # Log filter configuration at sync start for visibility
-        if self.config and self.config.has_any_filter():
-            logger.info("Group filtering is enabled:")
-            if self.config.account1.has_filter():
-                logger.info(
-                    f"  {self.account1_email}: filtering by groups "
-                    f"{self.config.account1.sync_groups}"
-                )
+        # Load cached LLM decisions once instead of one query per uncertain pair
+        self.matcher.preload_llm_cache()
+
+        try:
+            # === LOG FILTER CONFIGURATION ===
+            # Log filter configuration at sync start for visibility
+            if self.config and self.config.has_any_filter():
+                logger.info("Group filtering is enabled:")
+                if self.config.account1.has_filter():
+                    logger.info(
+                        f"  {self.account1_email}: filtering by groups "
+                        f"{self.config.account1.sync_groups}"
+                    )
+                else:
+                    logger.info(
+                        f"  {self.account1_email}: no filter (sync all contacts)"
+                    )
+                if self.config.account2.has_filter():
+                    logger.info(
+                        f"  {self.account2_email}: filtering by groups "
+                        f"{self.config.account2.sync_groups}"
+                    )
+                else:
+                    logger.info(
+                        f"  {self.account2_email}: no filter (sync all contacts)"
+                    )
             else:
-                logger.info(f"  {self.account1_email}: no filter (sync all contacts)")
-            if self.config.account2.has_filter():
-                logger.info(
-                    f"  {self.account2_email}: filtering by groups "
-                    f"{self.config.account2.sync_groups}"
+                logger.debug("No group filtering configured (syncing all contacts)")
+
+            # === FETCH GROUPS AND CONTACTS FROM BOTH ACCOUNTS ===
+            # Fetch ALL contacts from both accounts - filtering happens during
+            # sync operation decisions to ensure matching against all contacts
+            if snapshots is None:
+                snapshots = self._fetch_accounts(full_sync)
+            snapshot1, snapshot2 = snapshots
+            contacts1, sync_token1 = snapshot1.contacts, snapshot1.sync_token
+            contacts2, sync_token2 = snapshot2.contacts, snapshot2.sync_token
+            result.stats.fetch_seconds_account1 = snapshot1.fetch_seconds
+            result.stats.fetch_seconds_account2 = snapshot2.fetch_seconds
+            result.retried_writes = [
+                (account_id, resource_name)
+                for account_id, snapshot in (
+                    (ACCOUNT_1, snapshot1),
+                    (ACCOUNT_2, snapshot2),
                 )
-            else:
-                logger.info(f"  {self.account2_email}: no filter (sync all contacts)")
-        else:
-            logger.debug("No group filtering configured (syncing all contacts)")
+                for resource_name in sorted(snapshot.retried_writes)
+            ]
+
+            # === ANALYZE GROUPS FIRST (before contacts) ===
+            # Groups must be synced first so memberships can be mapped correctly
+            # Returns groups for filter resolution
+            groups1, groups2 = self._analyze_groups(
+                result, snapshot1.groups, snapshot2.groups
+            )
 
-        # === ANALYZE GROUPS FIRST (before contacts) ===
-        # Groups must be synced first so memberships can be mapped correctly
-        # Returns groups for filter resolution
-        groups1, groups2 = self._analyze_groups(result)
+            # === RESOLVE SYNC LABEL GROUPS ===
+            # Find existing sync label groups (if configured) for use in detecting
+            # contacts that need the sync label added during analysis
+            self._resolve_sync_label_groups(groups1, groups2)
 
-        # === RESOLVE SYNC LABEL GROUPS ===
-        # Find existing sync label groups (if configured) for use in detecting
-        # contacts that need the sync label added during analysis
-        self._resolve_sync_label_groups(groups1, groups2)
+            # === RESOLVE TARGET GROUPS ===
+            # Find existing target groups for use in adding memberships during sync
+            self._resolve_target_groups(groups1, groups2)
 
-        # === RESOLVE TARGET GROUPS ===
-        # Find existing target groups for use in adding memberships during sync
-        self._resolve_target_groups(groups1, groups2)
+            # === RESOLVE GROUP FILTERS ===
+            # Convert configured group names to resource names for filtering
+            # Store as instance variables for use in sync operation decisions
+            self._allowed_groups_1: frozenset[str] = frozenset()
+            self._allowed_groups_2: frozenset[str] = frozenset()
 
-        # === RESOLVE GROUP FILTERS ===
-        # Convert configured group names to resource names for filtering
-        # Store as instance variables for use in sync operation decisions
-        self._allowed_groups_1: frozenset[str] = frozenset()
-        self._allowed_groups_2: frozenset[str] = frozenset()
+            if self.config:
+                if self.config.account1.has_filter():
+                    self._allowed_groups_1 = self._resolve_group_filters(
+                        self.config.account1.sync_groups,
+                        groups1,
+                        self.account1_email,
+                    )
+                    result.stats.filter_groups_account1 = len(self._allowed_groups_1)
+                    if self._allowed_groups_1:
+                        logger.info(
+                            f"Resolved {len(self._allowed_groups_1)} filter groups for "
+                            f"{self.account1_email}"
+                        )
 
-        if self.config:
-            if self.config.account1.has_filter():
-                self._allowed_groups_1 = self._resolve_group_filters(
-                    self.config.account1.sync_groups,
-                    groups1,
-                    self.account1_email,
-                )
-                result.stats.filter_groups_account1 = len(self._allowed_groups_1)
-                if self._allowed_groups_1:
-                    logger.info(
-                        f"Resolved {len(self._allowed_groups_1)} filter groups for "
-                        f"{self.account1_email}"
+                if self.config.account2.has_filter():
+                    self._allowed_groups_2 = self._resolve_group_filters(
+                        self.config.account2.sync_groups,
+                        groups2,
+                        self.account2_email,
                     )
+                    result.stats.filter_groups_account2 = len(self._allowed_groups_2)
+                    if self._allowed_groups_2:
+                        logger.info(
+                            f"Resolved {len(self._allowed_groups_2)} filter groups for "
+                            f"{self.account2_email}"
+                        )
 
-            if self.config.account2.has_filter():
-                self._allowed_groups_2 = self._resolve_group_filters(
-                    self.config.account2.sync_groups,
-                    groups2,
-                    self.account2_email,
+            # Populate membership_names for proper content_hash comparison
+            # (uses group names instead of resource IDs which differ between accounts)
+            self._populate_membership_names(contacts1, groups1)
+            self._populate_membership_names(contacts2, groups2)
+
+            # Track total contact counts (all contacts, for matching)
+            result.stats.contacts_in_account1 = len(contacts1)
+            result.stats.contacts_in_account2 = len(contacts2)
+
+            # Track filter statistics - will be updated during sync decisions
+            result.stats.contacts_before_filter_account1 = len(contacts1)
+            result.stats.contacts_before_filter_account2 = len(contacts2)
+            # These will be incremented as contacts are filtered during analysis
+            result.stats.contacts_filtered_out_account1 = 0
+            result.stats.contacts_filtered_out_account2 = 0
+
+            # Match contacts and plan updates, only for the changed contacts
+            # when the listing allows it
+            changes = self._get_incremental_changes(
+                full_sync, snapshot1, snapshot2, result
+            )
+            if changes is None:
+                self._analyze_all_contacts(contacts1, contacts2, result)
+            else:
+                self._analyze_changed_contacts(
+                    contacts1, contacts2, changes[0], changes[1], result
                 )
-                result.stats.filter_groups_account2 = len(self._allowed_groups_2)
-                if self._allowed_groups_2:
-                    logger.info(
-                        f"Resolved {len(self._allowed_groups_2)} filter groups for "
-                        f"{self.account2_email}"
-                    )
 
-        # === FETCH CONTACTS (all contacts for matching) ===
-        # Fetch ALL contacts from both accounts - filtering happens during
-        # sync operation decisions to ensure matching against all contacts
-        contacts1, sync_token1 = self._fetch_contacts(
-            self.api1,
-            ACCOUNT_1,
-            full_sync,
-            account_label=self.account1_email,
-        )
-        contacts2, sync_token2 = self._fetch_contacts(
-            self.api2,
-            ACCOUNT_2,
-            full_sync,
-            account_label=self.account2_email,
-        )
+            # Handle deleted contacts
+            self._analyze_deletions(contacts1, contacts2, result)
+        finally:
+            # Persist LLM decisions made during matching in one transaction,
+            # even if analysis fails
+            self.matcher.flush_llm_cache()
 
-        # Populate membership_names for proper content_hash comparison
-        # (uses group names instead of resource IDs which differ between accounts)
-        self._populate_membership_names(contacts1, groups1)
-        self._populate_membership_names(contacts2, groups2)
+        summary = result.summary(self.account1_email, self.account2_email)
+        logger.info(f"Analysis complete: {summary}")
+
+        # Store sync tokens for next incremental sync
+        self._pending_sync_tokens = {
+            ACCOUNT_1: sync_token1,
+            ACCOUNT_2: sync_token2,
+        }
 
-        # Track total contact counts (all contacts, for matching)
-        result.stats.contacts_in_account1 = len(contacts1)
-        result.stats.contacts_in_account2 = len(contacts2)
+        return result
 
-        # Track filter statistics - will be updated during sync decisions
-        result.stats.contacts_before_filter_account1 = len(contacts1)
-        result.stats.contacts_before_filter_account2 = len(contacts2)
-        # These will be incremented as contacts are filtered during analysis
-        result.stats.contacts_filtered_out_account1 = 0
-        result.stats.contacts_filtered_out_account2 = 0
+    def _analyze_all_contacts(
+        self,
+        contacts1: list[Contact],
+        contacts2: list[Contact],
+        result: SyncResult,
+    ) -> None:
+        """
+        Match all contacts of both accounts and plan the sync operations.
 
+        Args:
+            contacts1: All contacts from account 1
+            contacts2: All contacts from account 2
+            result: SyncResult to update with sync operations
+        """
         # Build indexes by matching key (for fast first-pass matching)
         index1 = self._build_contact_index(contacts1, self.account1_email)
         index2 = self._build_contact_index(contacts2, self.account2_email)
@@ -1158,19 +1447,169 @@ class SyncEngine:
             result,
         )
 
-        # Handle deleted contacts
-        self._analyze_deletions(contacts1, contacts2, result)
+    def _get_incremental_changes(
+        self,
+        full_sync: bool,
+        snapshot1: AccountSnapshot,
+        snapshot2: AccountSnapshot,
+        result: SyncResult,
+    ) -> tuple[frozenset[str], frozenset[str]] | None:
+        """
+        Decide whether analysis can be limited to the changed contacts.
 
-        summary = result.summary(self.account1_email, self.account2_email)
-        logger.info(f"Analysis complete: {summary}")
+        Incremental analysis needs both accounts listed as a delta through
+        the local mirror. Group changes force a full analysis, because
+        creating, renaming or deleting a group changes how the memberships of
+        every contact map onto the other account, so membership updates must
+        be re-planned for all contacts, not only the changed ones.
 
-        # Store sync tokens for next incremental sync
-        self._pending_sync_tokens = {
-            ACCOUNT_1: sync_token1,
-            ACCOUNT_2: sync_token2,
-        }
+        Args:
+            full_sync: If True, always analyze every contact
+            snapshot1: Data listed from account 1
+            snapshot2: Data listed from account 2
+            result: SyncResult holding the planned group operations
 
-        return result
+        Returns:
+            Tuple of (changed account 1 resource names, changed account 2
+            resource names), or None to analyze every contact
+        """
+        if full_sync or not (self.incremental_analysis and self.contact_mirror):
+            return None
+        changed1 = snapshot1.changed_resource_names
+        changed2 = snapshot2.changed_resource_names
+        if changed1 is None or changed2 is None:
+            return None
+        if result.has_group_changes():
+            logger.info("Groups changed since the last sync, analyzing all contacts")
+            return None
+        return changed1, changed2
+
+    def _analyze_changed_contacts(
+        self,
+        contacts1: list[Contact],
+        contacts2: list[Contact],
+        changed1: frozenset[str],
+        changed2: frozenset[str],
+        result: SyncResult,
+    ) -> None:
+        """
+        Re-evaluate only the contacts changed since the last sync.
+
+        Phase 0 only checks the mappings of changed contacts, so an unchanged
+        pair is not compared again. Contacts left without a pair (new
+        contacts, or contacts whose partner is gone) run through phases 1-3
+        together with every unmapped contact, just like in a full analysis.
+        The unchanged pairs are added to result.matched_contacts without
+        being compared, so duplicate detection and the reported match count
+        cover every pair.
+
+        Args:
+            contacts1: All contacts from account 1 (may include deleted)
+            contacts2: All contacts from account 2 (may include deleted)
+            changed1: Resource names changed in account 1
+            changed2: Resource names changed in account 2
+            result: SyncResult to update with sync operations
+        """
+        contacts1_by_resource = {c.resource_name: c for c in contacts1}
+        contacts2_by_resource = {c.resource_name: c for c in contacts2}
+
+        matched_from_1: set[str] = set()
+        matched_from_2: set[str] = set()
+
+        touched_mappings = self.database.get_mappings_for_resource_names(
+            changed1, changed2
+        )
+        self._phase_0_database_matching(
+            contacts1_by_resource,
+            contacts2_by_resource,
+            matched_from_1,
+            matched_from_2,
+            result,
+            mappings=touched_mappings,
+        )
+
+        touched1 = set(changed1)
+        touched2 = set(changed2)
+        for mapping in touched_mappings:
+            if mapping.get("account1_resource_name"):
+                touched1.add(mapping["account1_resource_name"])
+            if mapping.get("account2_resource_name"):
+                touched2.add(mapping["account2_resource_name"])
+
+        unpaired1 = [
+            contacts1_by_resource[r]
+            for r in sorted(touched1 - matched_from_1)
+            if r in contacts1_by_resource
+        ]
+        unpaired2 = [
+            contacts2_by_resource[r]
+            for r in sorted(touched2 - matched_from_2)
+            if r in contacts2_by_resource
+        ]
+
+        logger.info(
+            f"Incremental analysis: {len(changed1)} changed in "
+            f"{self.account1_email}, {len(changed2)} changed in "
+            f"{self.account2_email}; {len(touched_mappings)} pairs re-evaluated"
+        )
+
+        # Pairs not re-evaluated are still matched
+        mapped_pairs = self.database.get_mapped_resource_name_pairs()
+        unchanged_pairs = [
+            (contacts1_by_resource[res1], contacts2_by_resource[res2])
+            for res1, res2 in mapped_pairs
+            if res1 not in touched1
+            and res2 not in touched2
+            and res1 in contacts1_by_resource
+            and res2 in contacts2_by_resource
+        ]
+        result.matched_contacts.extend(unchanged_pairs)
+
+        if not any(not c.deleted for c in unpaired1 + unpaired2):
+            return
+
+        # Unmapped contacts are the only other candidates a full analysis
+        # would match against
+        mapped1 = {res1 for res1, _ in mapped_pairs}
+        mapped2 = {res2 for _, res2 in mapped_pairs}
+        unpaired1 += [
+            c
+            for c in contacts1
+            if c.resource_name not in mapped1 and c.resource_name not in touched1
+        ]
+        unpaired2 += [
+            c
+            for c in contacts2
+            if c.resource_name not in mapped2 and c.resource_name not in touched2
+        ]
+
+        index1 = self._build_contact_index(unpaired1, self.account1_email)
+        index2 = self._build_contact_index(unpaired2, self.account2_email)
+
+        self._phase_1_key_based_matching(
+            unpaired1,
+            unpaired2,
+            index1,
+            index2,
+            matched_from_1,
+            matched_from_2,
+            result,
+        )
+        self._phase_2_fuzzy_matching(
+            index1,
+            index2,
+            matched_from_1,
+            matched_from_2,
+            result,
+        )
+
+        self._phase_3_unmatched_handling(
+            index1,
+            index2,
+            matched_from_1,
+            matched_from_2,
+            result,
+        )
 
     def _phase_0_database_matching(
         self,
@@ -1179,6 +1618,7 @@ class SyncEngine:
         matched_from_1: set[str],
         matched_from_2: set[str],
         result: SyncResult,
+        mappings: list[dict[str, Any]] | None = None,
     ) -> None:
         """
         Phase 0: Use existing database mappings for contact matching.
@@ -1192,6 +1632,7 @@ class SyncEngine:
             matched_from_1: Set to update with matched resource_names from account 1
             matched_from_2: Set to update with matched resource_names from account 2
             result: SyncResult to update with sync operations
+            mappings: Mappings to check (default: all mappings in the database)
         """
         mlog = getattr(self, "_matching_logger", None)
 
@@ -1200,7 +1641,10 @@ class SyncEngine:
             mlog.info("PHASE 0: DATABASE MAPPING LOOKUP")
             mlog.info("=" * 60)
 
-        existing_mappings = self.database.get_all_contact_mappings()
+        if mappings is None:
+            existing_mappings = self.database.get_all_contact_mappings()
+        else:
+            existing_mappings = mappings
         if mlog:
             mlog.info(f"  Found {len(existing_mappings)} existing mappings in database")
 
@@ -1496,6 +1940,15 @@ class SyncEngine:
         """
         Use multi-tier matching for contacts that didn't match by key.
 
+        All pairs are scored up front with ContactMatcher.match_many(), which
+        normalizes each contact once and computes name similarity for the
+        whole cross product in bulk. The pairs that match on Tier 1/Tier 2
+        are then assigned globally with a maximum-weight bipartite matching,
+        so each contact is paired with its best partner rather than the first
+        acceptable one. Uncertain pairs of the contacts left over are then
+        adjudicated by the LLM in concurrent batches.
+        The number of pairs scored and pruned is recorded in result.stats.
+
         Args:
             unmatched1: Unmatched contacts from account 1
             unmatched2: Unmatched contacts from account 2
@@ -1506,62 +1959,237 @@ class SyncEngine:
         Returns:
             Number of new matches found
         """
+        from gcontact_sync.sync.assignment import max_weight_assignment
+        from gcontact_sync.sync.blocking import BlockingStats
+
         mlog = getattr(self, "_matching_logger", None)
         matches_found = 0
 
-        for contact1 in unmatched1:
-            if contact1.resource_name in matched_from_1:
-                continue
-
-            # Find potential matches in account 2
-            for contact2 in unmatched2:
-                if contact2.resource_name in matched_from_2:
-                    continue
-
-                # Use multi-tier matcher
-                match_result = self.matcher.match(contact1, contact2)
-
-                if match_result.is_match:
-                    if mlog:
-                        mlog.info(
-                            f"MULTI-TIER MATCH: {contact1.display_name} <-> "
-                            f"{contact2.display_name}"
-                        )
-                        mlog.info(f"  Tier: {match_result.tier.value}")
-                        mlog.info(f"  Confidence: {match_result.confidence.value}")
-                        mlog.info(f"  Reason: {match_result.reason}")
+        blocking_stats = BlockingStats()
+        scored = self.matcher.match_many(unmatched1, unmatched2, stats=blocking_stats)
+        result.stats.match_pairs_considered += blocking_stats.pairs_considered
+        result.stats.match_pairs_pruned += blocking_stats.pairs_pruned
 
-                    matched_from_1.add(contact1.resource_name)
-                    matched_from_2.add(contact2.resource_name)
-                    matches_found += 1
+        # Pass 1: globally optimal assignment over confirmed Tier 1/2 matches
+        edges: dict[tuple[int, int], float] = {}
+        tier_results: dict[tuple[int, int], MatchResult] = {}
+        for index1, candidates in enumerate(scored):
+            if unmatched1[index1].resource_name in matched_from_1:
+                continue
+            for index2, tier_result in candidates:
+                if (
+                    tier_result.is_match
+                    and unmatched2[index2].resource_name not in matched_from_2
+                ):
+                    edges[(index1, index2)] = self._match_weight(tier_result)
+                    tier_results[(index1, index2)] = tier_result
+
+        for index1, index2 in max_weight_assignment(edges):
+            contact1 = unmatched1[index1]
+            contact2 = unmatched2[index2]
+            # Guard against duplicate resource names within one account
+            if (
+                contact1.resource_name in matched_from_1
+                or contact2.resource_name in matched_from_2
+            ):
+                continue
+            self._accept_multi_tier_match(
+                contact1,
+                contact2,
+                tier_results[(index1, index2)],
+                matched_from_1,
+                matched_from_2,
+                result,
+            )
+            matches_found += 1
+
+        # Pass 2: uncertain candidates of still-unmatched contacts, adjudicated
+        # by the LLM in concurrent batches grouped by source contact
+        if self.matcher.config.use_llm_matching:
+            matches_found += self._llm_adjudicate_uncertain(
+                unmatched1,
+                unmatched2,
+                scored,
+                matched_from_1,
+                matched_from_2,
+                result,
+            )
 
-                    # Analyze the matched pair
-                    matching_key = contact1.matching_key()
-                    self._analyze_contact_pair(matching_key, contact1, contact2, result)
-                    break  # Move to next contact1
+        if mlog:
+            mlog.info(
+                f"  Candidate pairs considered: {blocking_stats.pairs_considered}"
+                f", pruned: {blocking_stats.pairs_pruned}"
+            )
 
         return matches_found
 
-    def _build_matched_identifier_index(
+    def _llm_adjudicate_uncertain(
         self,
-        matched_contacts: list[tuple[Contact, Contact]],
-    ) -> dict[str, tuple[Contact, Contact]]:
+        unmatched1: list[Contact],
+        unmatched2: list[Contact],
+        scored: list[list[tuple[int, "MatchResult"]]],
+        matched_from_1: set[str],
+        matched_from_2: set[str],
+        result: SyncResult,
+    ) -> int:
         """
-        Build an index mapping identifiers to matched contact pairs.
+        Resolve uncertain pairs of still-unmatched contacts with the LLM.
 
-        This is used for duplicate detection - when an unmatched contact
-        shares an identifier with an already-matched contact.
+        All uncertain pairs are collected first, grouped by account 1 contact
+        and sent through ContactMatcher.llm_match_many() in one go. Pairs the
+        LLM confirms are then assigned one-to-one by LLM confidence.
 
         Args:
-            matched_contacts: List of (contact1, contact2) matched pairs
+            unmatched1: Unmatched contacts from account 1
+            unmatched2: Unmatched contacts from account 2
+            scored: Output of ContactMatcher.match_many() for these lists
+            matched_from_1: Set of matched resource_names from account 1
+            matched_from_2: Set of matched resource_names from account 2
+            result: SyncResult to update
 
         Returns:
-            Dictionary mapping normalized identifiers to matched pairs
+            Number of new matches found
         """
-        index: dict[str, tuple[Contact, Contact]] = {}
+        from gcontact_sync.sync.assignment import max_weight_assignment
 
-        for contact1, contact2 in matched_contacts:
-            # Index all emails from both contacts in the pair
+        mlog = getattr(self, "_matching_logger", None)
+
+        groups: list[tuple[Contact, list[Contact]]] = []
+        group_indices: list[tuple[int, list[int]]] = []
+        for index1, candidates in enumerate(scored):
+            contact1 = unmatched1[index1]
+            if contact1.resource_name in matched_from_1:
+                continue
+            uncertain = [
+                index2
+                for index2, tier_result in candidates
+                if not tier_result.is_match
+                and unmatched2[index2].resource_name not in matched_from_2
+            ]
+            if uncertain:
+                groups.append((contact1, [unmatched2[i] for i in uncertain]))
+                group_indices.append((index1, uncertain))
+
+        if not groups:
+            return 0
+
+        if mlog:
+            mlog.info(
+                f"  Sending {sum(len(c) for _, c in groups)} uncertain pairs "
+                f"({len(groups)} source contacts) to LLM"
+            )
+
+        llm_results = self.matcher.llm_match_many(groups)
+
+        edges: dict[tuple[int, int], float] = {}
+        confirmed: dict[tuple[int, int], MatchResult] = {}
+        for (index1, indices2), row in zip(group_indices, llm_results, strict=True):
+            for index2, llm_result in zip(indices2, row, strict=True):
+                if llm_result.is_match:
+                    # Keep every confirmed pair assignable, even at 0 confidence
+                    edges[(index1, index2)] = max(llm_result.score, 0.0) + 1.0
+                    confirmed[(index1, index2)] = llm_result
+
+        matches_found = 0
+        for index1, index2 in max_weight_assignment(edges):
+            contact1 = unmatched1[index1]
+            contact2 = unmatched2[index2]
+            if (
+                contact1.resource_name in matched_from_1
+                or contact2.resource_name in matched_from_2
+            ):
+                continue
+            self._accept_multi_tier_match(
+                contact1,
+                contact2,
+                confirmed[(index1, index2)],
+                matched_from_1,
+                matched_from_2,
+                result,
+            )
+            matches_found += 1
+
+        return matches_found
+
+    @staticmethod
+    def _match_weight(match_result: "MatchResult") -> float:
+        """
+        Weight of a matched pair for the global assignment.
+
+        Confidence dominates (an exact identifier match always beats a fuzzy
+        one), and the similarity score breaks ties within a confidence level.
+
+        Args:
+            match_result: Tier 1/2 result of a matched pair
+
+        Returns:
+            Positive weight; higher is a better match
+        """
+        from gcontact_sync.sync.matcher import MatchConfidence
+
+        confidence_rank = {
+            MatchConfidence.HIGH: 3.0,
+            MatchConfidence.MEDIUM: 2.0,
+            MatchConfidence.LOW: 1.0,
+        }
+        return confidence_rank.get(match_result.confidence, 0.0) + match_result.score
+
+    def _accept_multi_tier_match(
+        self,
+        contact1: Contact,
+        contact2: Contact,
+        match_result: "MatchResult",
+        matched_from_1: set[str],
+        matched_from_2: set[str],
+        result: SyncResult,
+    ) -> None:
+        """
+        Record a multi-tier match and analyze the matched pair.
+
+        Args:
+            contact1: Matched contact from account 1
+            contact2: Matched contact from account 2
+            match_result: Result that justified the match
+            matched_from_1: Set of matched resource_names from account 1
+            matched_from_2: Set of matched resource_names from account 2
+            result: SyncResult to update
+        """
+        mlog = getattr(self, "_matching_logger", None)
+        if mlog:
+            mlog.info(
+                f"MULTI-TIER MATCH: {contact1.display_name} <-> {contact2.display_name}"
+            )
+            mlog.info(f"  Tier: {match_result.tier.value}")
+            mlog.info(f"  Confidence: {match_result.confidence.value}")
+            mlog.info(f"  Reason: {match_result.reason}")
+
+        matched_from_1.add(contact1.resource_name)
+        matched_from_2.add(contact2.resource_name)
+
+        # Analyze the matched pair
+        matching_key = contact1.matching_key()
+        self._analyze_contact_pair(matching_key, contact1, contact2, result)
+
+    def _build_matched_identifier_index(
+        self,
+        matched_contacts: list[tuple[Contact, Contact]],
+    ) -> dict[str, tuple[Contact, Contact]]:
+        """
+        Build an index mapping identifiers to matched contact pairs.
+
+        This is used for duplicate detection - when an unmatched contact
+        shares an identifier with an already-matched contact.
+
+        Args:
+            matched_contacts: List of (contact1, contact2) matched pairs
+
+        Returns:
+            Dictionary mapping normalized identifiers to matched pairs
+        """
+        index: dict[str, tuple[Contact, Contact]] = {}
+
+        for contact1, contact2 in matched_contacts:
+            # Index all emails from both contacts in the pair
             for email in contact1.emails + contact2.emails:
                 if email:
                     normalized = self.matcher._normalize_email(email)
@@ -1745,8 +2373,8 @@ class SyncEngine:
                 display_name=target_contact.display_name,
                 given_name=target_contact.given_name,
                 family_name=target_contact.family_name,
-                emails=merged_emails,
-                phones=merged_phones,
+                emails=tuple(merged_emails),
+                phones=tuple(merged_phones),
                 organizations=target_contact.organizations,
                 notes=target_contact.notes,
                 last_modified=target_contact.last_modified,
@@ -1769,7 +2397,10 @@ class SyncEngine:
     # =========================================================================
 
     def _analyze_groups(
-        self, result: SyncResult
+        self,
+        result: SyncResult,
+        groups1: list[ContactGroup] | None = None,
+        groups2: list[ContactGroup] | None = None,
     ) -> tuple[list[ContactGroup], list[ContactGroup]]:
         """
         Analyze contact groups in both accounts and determine sync operations.
@@ -1779,6 +2410,8 @@ class SyncEngine:
 
         Args:
             result: SyncResult to populate with group sync operations
+            groups1: Groups already fetched from account 1, or None to fetch
+            groups2: Groups already fetched from account 2, or None to fetch
 
         Returns:
             Tuple of (groups from account1, groups from account2) for use in
@@ -1799,9 +2432,11 @@ class SyncEngine:
             mlog.info(f"Group sync mode: {group_sync_mode}")
             mlog.info("=" * 60)
 
-        # Fetch groups from both accounts
-        groups1 = self._fetch_groups(self.api1, ACCOUNT_1)
-        groups2 = self._fetch_groups(self.api2, ACCOUNT_2)
+        # Fetch groups from both accounts unless analyze() already did
+        if groups1 is None:
+            groups1 = self._fetch_groups(self.api1, ACCOUNT_1)
+        if groups2 is None:
+            groups2 = self._fetch_groups(self.api2, ACCOUNT_2)
 
         result.stats.groups_in_account1 = len(groups1)
         result.stats.groups_in_account2 = len(groups2)
@@ -2097,6 +2732,153 @@ class SyncEngine:
             mlog.info("-" * 40)
             mlog.info("")
 
+    def _fetch_accounts(
+        self, full_sync: bool
+    ) -> tuple[AccountSnapshot, AccountSnapshot]:
+        """
+        Fetch groups and contacts from both accounts.
+
+        With concurrent_fetch enabled the two accounts are listed at the same
+        time on a two-thread pool. The accounts have independent credentials
+        and quotas, and each thread only touches its own account's PeopleAPI,
+        so no HTTP transport is shared between threads.
+
+        Args:
+            full_sync: If True, ignore stored sync tokens
+
+        Returns:
+            Tuple of (account 1 snapshot, account 2 snapshot)
+        """
+        start = time.perf_counter()
+
+        if self.concurrent_fetch:
+            with ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="gcontact-fetch"
+            ) as executor:
+                future1 = executor.submit(
+                    self._fetch_account,
+                    self.api1,
+                    ACCOUNT_1,
+                    full_sync,
+                    self.account1_email,
+                )
+                future2 = executor.submit(
+                    self._fetch_account,
+                    self.api2,
+                    ACCOUNT_2,
+                    full_sync,
+                    self.account2_email,
+                )
+                snapshot1 = future1.result()
+                snapshot2 = future2.result()
+        else:
+            snapshot1 = self._fetch_account(
+                self.api1, ACCOUNT_1, full_sync, self.account1_email
+            )
+            snapshot2 = self._fetch_account(
+                self.api2, ACCOUNT_2, full_sync, self.account2_email
+            )
+
+        logger.info(
+            f"Fetched both accounts in {time.perf_counter() - start:.2f}s "
+            f"({self.account1_email}: {snapshot1.fetch_seconds:.2f}s, "
+            f"{self.account2_email}: {snapshot2.fetch_seconds:.2f}s, "
+            f"concurrent={self.concurrent_fetch})"
+        )
+
+        return snapshot1, snapshot2
+
+    def _fetch_account(
+        self,
+        api: PeopleAPI,
+        account_id: str,
+        full_sync: bool,
+        account_label: str,
+    ) -> AccountSnapshot:
+        """
+        Fetch groups and contacts from one account and time the listing.
+
+        Args:
+            api: PeopleAPI instance for the account
+            account_id: Account identifier
+            full_sync: If True, ignore stored sync token
+            account_label: Human-readable label for the account (for logging)
+
+        Returns:
+            AccountSnapshot with the listed data
+        """
+        start = time.perf_counter()
+        raw_groups = self._fetch_group_data(api, account_id)
+        pending_writes = self.database.get_pending_contact_writes(account_id)
+        retried_writes = frozenset(pending_writes)
+        changed_resource_names = None
+        if self.contact_mirror:
+            contacts, sync_token, changed_resource_names = self._list_contacts_mirrored(
+                api, account_id, full_sync, account_label
+            )
+            base_sync_token = None
+            if changed_resource_names is not None:
+                # The mirror holds every contact; only mark them as changed
+                changed_resource_names |= retried_writes
+        else:
+            contacts, sync_token, base_sync_token = self._list_contacts(
+                api, account_id, full_sync, account_label
+            )
+            if base_sync_token is not None:
+                retried_writes = self._add_pending_write_contacts(
+                    api, pending_writes, contacts
+                )
+        if retried_writes:
+            logger.info(
+                f"Retrying {len(retried_writes)} contacts from {account_label} "
+                f"whose write failed in an earlier sync"
+            )
+        return AccountSnapshot(
+            groups=self._groups_from_data(raw_groups),
+            raw_groups=raw_groups,
+            contacts=contacts,
+            sync_token=sync_token,
+            base_sync_token=base_sync_token,
+            changed_resource_names=changed_resource_names,
+            retried_writes=retried_writes,
+            fetch_seconds=time.perf_counter() - start,
+        )
+
+    def _add_pending_write_contacts(
+        self, api: PeopleAPI, resource_names: list[str], contacts: list[Contact]
+    ) -> frozenset[str]:
+        """
+        Add contacts whose write failed earlier to an incremental listing.
+
+        Unchanged contacts are not in a sync-token delta, so they are fetched
+        one by one; the retry table only holds the few contacts the API
+        rejected.
+
+        Args:
+            api: PeopleAPI instance for the account
+            resource_names: Pending contacts of the account
+            contacts: Contacts listed since the sync token (extended in place)
+
+        Returns:
+            Resource names of the pending contacts now in contacts, or gone
+            from the account. Contacts that could not be fetched are retried
+            by a later sync.
+        """
+        listed = {contact.resource_name for contact in contacts}
+        retried: set[str] = set()
+        for resource_name in resource_names:
+            if resource_name not in listed:
+                try:
+                    contacts.append(api.get_contact(resource_name))
+                except PeopleAPIError as e:
+                    if e.status != 404:
+                        logger.warning(
+                            f"Could not fetch contact to retry: {resource_name}: {e}"
+                        )
+                        continue
+            retried.add(resource_name)
+        return frozenset(retried)
+
     def _fetch_groups(self, api: PeopleAPI, account_id: str) -> list[ContactGroup]:
         """
         Fetch contact groups from an account.
@@ -2108,17 +2890,57 @@ class SyncEngine:
         Returns:
             List of ContactGroup objects (only user groups, not system groups)
         """
+        return self._groups_from_data(self._fetch_group_data(api, account_id))
+
+    def _fetch_group_data(
+        self, api: PeopleAPI, account_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all contact groups of an account as raw API dictionaries.
+
+        Args:
+            api: PeopleAPI instance for the account
+            account_id: Account identifier
+
+        Returns:
+            List of group dictionaries, or an empty list if listing failed
+        """
         try:
             # API returns tuple of (list[dict], sync_token)
             groups_data, _ = api.list_contact_groups()
-            # Convert raw dicts to ContactGroup objects
-            groups = [ContactGroup.from_api_response(g) for g in groups_data]
-            # Filter to only syncable groups (user groups with names, not deleted)
-            return [g for g in groups if g.is_syncable()]
         except PeopleAPIError as e:
             logger.error(f"Failed to fetch groups from {account_id}: {e}")
+            if self.contact_mirror:
+                mirrored = self.database.get_group_mirror(account_id)
+                if mirrored:
+                    logger.warning(
+                        f"Using {len(mirrored)} groups from the local mirror "
+                        f"for {account_id}"
+                    )
+                    return mirrored
             return []
 
+        if self.contact_mirror:
+            self.database.replace_group_mirror(account_id, list(groups_data))
+        return list(groups_data)
+
+    def _groups_from_data(
+        self, groups_data: list[dict[str, Any]]
+    ) -> list[ContactGroup]:
+        """
+        Convert raw group dictionaries to syncable ContactGroup objects.
+
+        Args:
+            groups_data: Group dictionaries as returned by the API
+
+        Returns:
+            List of ContactGroup objects (only user groups, not system groups)
+        """
+        # Convert raw dicts to ContactGroup objects
+        groups = [ContactGroup.from_api_response(g) for g in groups_data]
+        # Filter to only syncable groups (user groups with names, not deleted)
+        return [g for g in groups if g.is_syncable()]
+
     def _resolve_group_filters(
         self,
         configured_groups: list[str],
@@ -2508,106 +3330,77 @@ class SyncEngine:
             if self.config and self.config.group_sync_mode == "used":
                 self._filter_groups_for_used_mode(result)
 
-            # === EXECUTE GROUP OPERATIONS FIRST ===
-            # Groups must be synced before contacts so membership mappings exist
-
-            # Create groups in account 1
-            if result.groups_to_create_in_account1:
-                self._execute_group_creates(
-                    result.groups_to_create_in_account1,
-                    self.api1,
-                    account=1,
-                    result=result,
-                )
-
-            # Create groups in account 2
-            if result.groups_to_create_in_account2:
-                self._execute_group_creates(
-                    result.groups_to_create_in_account2,
-                    self.api2,
-                    account=2,
-                    result=result,
-                )
-
-            # Update groups in account 1
-            if result.groups_to_update_in_account1:
-                self._execute_group_updates(
-                    result.groups_to_update_in_account1,
-                    self.api1,
-                    account=1,
-                    result=result,
-                )
-
-            # Update groups in account 2
-            if result.groups_to_update_in_account2:
-                self._execute_group_updates(
-                    result.groups_to_update_in_account2,
-                    self.api2,
-                    account=2,
-                    result=result,
-                )
-
-            # Delete groups in account 1
-            if result.groups_to_delete_in_account1:
-                self._execute_group_deletes(
-                    result.groups_to_delete_in_account1,
-                    self.api1,
-                    account=1,
-                    result=result,
-                )
+            # Load group mappings once so membership translation for every
+            # contact below is a dictionary lookup
+            self._load_group_membership_maps()
 
-            # Delete groups in account 2
-            if result.groups_to_delete_in_account2:
-                self._execute_group_deletes(
-                    result.groups_to_delete_in_account2,
-                    self.api2,
-                    account=2,
-                    result=result,
-                )
+            # === EXECUTE GROUP OPERATIONS FIRST ===
+            # Groups must be synced before contacts so membership mappings exist.
+            # Each step runs for both accounts (concurrently if enabled) and
+            # finishes before the next one starts.
+            self._execute_for_accounts(
+                self._execute_group_creates,
+                result.groups_to_create_in_account1,
+                result.groups_to_create_in_account2,
+                result,
+            )
+            self._execute_for_accounts(
+                self._execute_group_updates,
+                result.groups_to_update_in_account1,
+                result.groups_to_update_in_account2,
+                result,
+            )
+            self._execute_for_accounts(
+                self._execute_group_deletes,
+                result.groups_to_delete_in_account1,
+                result.groups_to_delete_in_account2,
+                result,
+            )
 
             # === EXECUTE CONTACT OPERATIONS ===
+            self._execute_for_accounts(
+                self._execute_creates,
+                result.to_create_in_account1,
+                result.to_create_in_account2,
+                result,
+            )
+            self._execute_for_accounts(
+                self._execute_updates,
+                result.to_update_in_account1,
+                result.to_update_in_account2,
+                result,
+            )
+            self._execute_for_accounts(
+                self._execute_deletes,
+                result.to_delete_in_account1,
+                result.to_delete_in_account2,
+                result,
+            )
 
-            # Create contacts in account 1
-            if result.to_create_in_account1:
-                self._execute_creates(
-                    result.to_create_in_account1, self.api1, account=1, result=result
-                )
-
-            # Create contacts in account 2
-            if result.to_create_in_account2:
-                self._execute_creates(
-                    result.to_create_in_account2, self.api2, account=2, result=result
-                )
-
-            # Update contacts in account 1
-            if result.to_update_in_account1:
-                self._execute_updates(
-                    result.to_update_in_account1, self.api1, account=1, result=result
-                )
-
-            # Update contacts in account 2
-            if result.to_update_in_account2:
-                self._execute_updates(
-                    result.to_update_in_account2, self.api2, account=2, result=result
-                )
+            # Update matching keys for renamed contacts
+            self._apply_key_updates()
 
-            # Delete contacts in account 1
-            if result.to_delete_in_account1:
-                self._execute_deletes(
-                    result.to_delete_in_account1, self.api1, account=1, result=result
+            # Contacts the API rejected are retried by the next sync through
+            # the retry table, so they do not hold the sync tokens back
+            self.database.update_pending_contact_writes(
+                result.retried_writes, result.failed_writes
+            )
+            if result.failed_writes:
+                logger.warning(
+                    f"{len(result.failed_writes)} contacts were not written; "
+                    f"the next sync retries them"
                 )
 
-            # Delete contacts in account 2
-            if result.to_delete_in_account2:
-                self._execute_deletes(
-                    result.to_delete_in_account2, self.api2, account=2, result=result
+            # Update sync tokens, unless the rate limit deferred some writes:
+            # the next sync then reads those changes again. Contacts written
+            # meanwhile have mappings, so they are not written twice.
+            if result.stats.writes_pending_retry:
+                logger.warning(
+                    f"{result.stats.writes_pending_retry} contacts were not "
+                    f"written; keeping sync tokens so the next sync retries them"
                 )
-
-            # Update matching keys for renamed contacts
-            self._apply_key_updates()
-
-            # Update sync tokens
-            self._update_sync_tokens()
+            else:
+                self._update_sync_tokens()
 
             # Log summary including groups if any group operations occurred
             stats = result.stats
@@ -2632,6 +3425,56 @@ class SyncEngine:
             logger.error(f"Sync execution failed: {e}")
             raise
 
+        finally:
+            # Mappings may change outside this engine before the next run
+            self._group_membership_maps = None
+
+    def _execute_for_accounts(
+        self,
+        execute_step: Callable[[Any, PeopleAPI, int, SyncResult], None],
+        operations1: Sequence[Any],
+        operations2: Sequence[Any],
+        result: SyncResult,
+    ) -> None:
+        """
+        Run one execute step for account 1 and account 2.
+
+        The two accounts have no dependency within a step, so with
+        concurrent_execute enabled they run on a two-thread pool, each thread
+        only using its own account's PeopleAPI. Either way the step has
+        finished in both accounts when this returns; if it failed in one, the
+        error is raised once the other account is done too.
+
+        Args:
+            execute_step: One of the _execute_* methods
+            operations1: Operations for account 1 (skipped if empty)
+            operations2: Operations for account 2 (skipped if empty)
+            result: SyncResult to update with stats
+        """
+        jobs = [
+            (operations, api, account)
+            for operations, api, account in (
+                (operations1, self.api1, 1),
+                (operations2, self.api2, 2),
+            )
+            if operations
+        ]
+
+        if not self.concurrent_execute or len(jobs) < 2:
+            for operations, api, account in jobs:
+                execute_step(operations, api, account, result)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="gcontact-execute"
+        ) as executor:
+            futures = [
+                executor.submit(execute_step, operations, api, account, result)
+                for operations, api, account in jobs
+            ]
+        for future in futures:
+            future.result()
+
     def _fetch_contacts(
         self,
         api: PeopleAPI,
@@ -2656,8 +3499,37 @@ class SyncEngine:
         Returns:
             Tuple of (list of contacts, new sync token).
         """
-        # Use account_label for logging, fall back to account_id
-        label = account_label or account_id
+        contacts, new_token, _ = self._list_contacts(
+            api, account_id, full_sync, account_label or account_id
+        )
+        return contacts, new_token
+
+    def _list_contacts(
+        self,
+        api: PeopleAPI,
+        account_id: str,
+        full_sync: bool,
+        label: str,
+    ) -> tuple[list[Contact], str | None, str | None]:
+        """
+        List contacts from an account, incrementally when a sync token is stored.
+
+        Args:
+            api: PeopleAPI instance for the account
+            account_id: Account identifier
+            full_sync: If True, ignore stored sync token
+            label: Human-readable label for the account (used in logging)
+
+        Returns:
+            Tuple of (contacts, new sync token, sync token the listing started
+            from). The last item is None when all contacts were listed.
+        """
+        if self.contact_mirror:
+            contacts, new_token, _ = self._list_contacts_mirrored(
+                api, account_id, full_sync, label
+            )
+            return contacts, new_token, None
+
         sync_token = None
 
         if not full_sync:
@@ -2682,48 +3554,163 @@ class SyncEngine:
                     f"Sync token expired for {account_id}, performing full sync"
                 )
                 self.database.clear_sync_token(account_id)
+                sync_token = None
                 contacts, new_token = api.list_contacts()
             else:
                 raise
 
         logger.info(f"Fetched {len(contacts)} contacts from {label}")
-        return contacts, new_token
+        return contacts, new_token, sync_token or None
 
-    def _populate_membership_names(
+    def _list_contacts_mirrored(
         self,
-        contacts: list[Contact],
-        groups: list[ContactGroup],
-    ) -> None:
+        api: PeopleAPI,
+        account_id: str,
+        full_sync: bool,
+        label: str,
+    ) -> tuple[list[Contact], str | None, frozenset[str] | None]:
         """
-        Populate membership_names field for contacts using group resource→name mapping.
+        List contacts through the account's local mirror.
 
-        This allows content_hash to use human-readable group names instead of
-        resource IDs, enabling proper cross-account comparison (since the same
-        group has different resource IDs in each account).
+        A full listing replaces the mirror. When a sync token is stored and
+        the mirror holds a full listing, only the changes since the token are
+        downloaded and applied to the mirror, and the contacts are then read
+        back from it. Either way the result holds every contact of the
+        account, followed by the contacts deleted since the token.
 
         Args:
-            contacts: List of contacts to update (modified in place)
-            groups: List of contact groups to build mapping from
-        """
-        # Build resource_name → group_name mapping
-        resource_to_name: dict[str, str] = {g.resource_name: g.name for g in groups}
+            api: PeopleAPI instance for the account
+            account_id: Account identifier
+            full_sync: If True, ignore stored sync token
+            label: Human-readable label for the account (used in logging)
 
-        for contact in contacts:
-            contact.membership_names = [
-                resource_to_name.get(res, res)  # Fall back to resource if unknown
+        Returns:
+            Tuple of (contacts, new sync token, resource names of the contacts
+            changed or deleted since the stored token). The last item is None
+            when all contacts were listed.
+        """
+        sync_token = None
+        if not full_sync and self.database.is_contact_mirror_complete(account_id):
+            state = self.database.get_sync_state(account_id)
+            if state:
+                sync_token = state.get("sync_token")
+
+        if sync_token:
+            try:
+                people, new_token = api.list_people(sync_token=sync_token)
+            except PeopleAPIError as e:
+                if "expired" not in str(e).lower():
+                    raise
+                logger.warning(
+                    f"Sync token expired for {account_id}, performing full sync"
+                )
+                self.database.clear_sync_token(account_id)
+                sync_token = None
+
+        if not sync_token:
+            people, new_token = api.list_people()
+            parsed = self._parse_people(people)
+            self.database.replace_contact_mirror(account_id, [row for _, row in parsed])
+            logger.info(
+                f"Fetched {len(parsed)} contacts from {label} into the local mirror"
+            )
+            return [contact for contact, _ in parsed], new_token, None
+
+        changed = self._parse_people(people)
+        deleted = [contact for contact, _ in changed if contact.deleted]
+        self.database.apply_contact_mirror_changes(
+            account_id,
+            [row for contact, row in changed if not contact.deleted],
+            [contact.resource_name for contact in deleted],
+        )
+
+        contacts = []
+        for row in self.database.get_contact_mirror(account_id):
+            contact = Contact.from_api_response(row["person"])
+            # Unchanged contacts keep the key and hash stored with their row
+            contact.seed_derived_fields(row["matching_key"], row["content_hash"])
+            contacts.append(contact)
+        logger.info(
+            f"Fetched {len(changed)} changed contacts from {label} "
+            f"({len(deleted)} deleted); {len(contacts)} contacts in local mirror"
+        )
+        changed_resource_names = frozenset(
+            contact.resource_name for contact, _ in changed
+        )
+        return contacts + deleted, new_token, changed_resource_names
+
+    @staticmethod
+    def _parse_people(
+        people: list[dict[str, Any]],
+    ) -> list[tuple[Contact, dict[str, Any]]]:
+        """
+        Parse raw people into contacts and local mirror rows.
+
+        Args:
+            people: Person dictionaries as returned by PeopleAPI.list_people()
+
+        Returns:
+            List of (contact, mirror row) tuples; people that cannot be
+            parsed are skipped
+        """
+        parsed: list[tuple[Contact, dict[str, Any]]] = []
+        for person in people:
+            try:
+                contact = Contact.from_api_response(person)
+            except Exception as e:
+                logger.warning(f"Failed to parse contact: {e}")
+                continue
+            parsed.append(
+                (
+                    contact,
+                    {
+                        "resource_name": contact.resource_name,
+                        "etag": contact.etag,
+                        "person": person,
+                        "matching_key": contact.matching_key(),
+                        "content_hash": contact.content_hash(),
+                    },
+                )
+            )
+        return parsed
+
+    def _populate_membership_names(
+        self,
+        contacts: list[Contact],
+        groups: list[ContactGroup],
+    ) -> None:
+        """
+        Populate membership_names field for contacts using group resource→name mapping.
+
+        This allows content_hash to use human-readable group names instead of
+        resource IDs, enabling proper cross-account comparison (since the same
+        group has different resource IDs in each account).
+
+        Args:
+            contacts: List of contacts to update (modified in place)
+            groups: List of contact groups to build mapping from
+        """
+        # Build resource_name → group_name mapping
+        resource_to_name: dict[str, str] = {g.resource_name: g.name for g in groups}
+
+        for contact in contacts:
+            contact.membership_names = tuple(
+                resource_to_name.get(res, res)  # Fall back to resource if unknown
                 for res in contact.memberships
-            ]
+            )
 
     def _build_contact_index(
-        self, contacts: list[Contact], account_label: str = "unknown"
+        self, contacts: Iterable[Contact], account_label: str = "unknown"
     ) -> dict[str, Contact]:
         """
         Build an index of contacts by matching key.
 
-        Filters out invalid contacts (those without name or email).
+        Filters out invalid contacts (those without name or email). Contacts
+        are consumed in a single pass, so a stream from
+        PeopleAPI.iter_contacts() can be indexed as it is listed.
 
         Args:
-            contacts: List of contacts to index
+            contacts: Contacts to index (list or single-pass iterable)
             account_label: Label for the account (for logging)
 
         Returns:
@@ -2735,10 +3722,12 @@ class SyncEngine:
         if mlog:
             mlog.info("-" * 60)
             mlog.info(f"Building contact index for {account_label}")
-            mlog.info(f"Processing {len(contacts)} contacts")
             mlog.info("-" * 60)
 
+        processed = 0
         for contact in contacts:
+            processed += 1
+
             # Skip deleted contacts in the index (handled separately)
             if contact.deleted:
                 if mlog:
@@ -2820,7 +3809,8 @@ class SyncEngine:
 
         if mlog:
             mlog.info(
-                f"Index complete: {len(index)} unique contacts for {account_label}"
+                f"Index complete: {len(index)} unique contacts for {account_label} "
+                f"(processed {processed} contacts)"
             )
             mlog.info("")
 
@@ -3227,19 +4217,29 @@ class SyncEngine:
             contacts2: Contacts from account 2 (may include deleted)
             result: SyncResult to populate with deletions
         """
+        # Matching keys of mappings to remove, deleted in one transaction
+        stale_keys: list[str] = []
+
         # Find deleted contacts in account 1
         for contact in contacts1:
             if contact.deleted:
-                self._handle_deleted_contact(contact, account=1, result=result)
+                stale_keys.extend(
+                    self._handle_deleted_contact(contact, account=1, result=result)
+                )
 
         # Find deleted contacts in account 2
         for contact in contacts2:
             if contact.deleted:
-                self._handle_deleted_contact(contact, account=2, result=result)
+                stale_keys.extend(
+                    self._handle_deleted_contact(contact, account=2, result=result)
+                )
+
+        if stale_keys:
+            self.database.bulk_delete_contact_mappings(stale_keys)
 
     def _handle_deleted_contact(
         self, deleted_contact: Contact, account: int, result: SyncResult
-    ) -> None:
+    ) -> list[str]:
         """
         Handle a deleted contact by propagating deletion to other account.
 
@@ -3247,6 +4247,9 @@ class SyncEngine:
             deleted_contact: Contact marked as deleted
             account: Account number where contact was deleted (1 or 2)
             result: SyncResult to populate with deletions
+
+        Returns:
+            Matching keys of the mappings that should be removed
         """
         # Look up mapping by resource name
         mappings = self.database.get_mappings_by_resource_name(
@@ -3257,11 +4260,9 @@ class SyncEngine:
             logger.debug(
                 f"No mapping found for deleted contact: {deleted_contact.resource_name}"
             )
-            return
+            return []
 
         for mapping in mappings:
-            matching_key = mapping["matching_key"]
-
             if account == 1:
                 # Deleted in account 1 - delete in account 2
                 other_resource = mapping.get("account2_resource_name")
@@ -3279,90 +4280,38 @@ class SyncEngine:
                         f"Will delete in {self.account1_email}: {other_resource}"
                     )
 
-            # Remove the mapping
-            self.database.delete_contact_mapping(matching_key)
+        # Mappings are removed by the caller in a single transaction
+        return [mapping["matching_key"] for mapping in mappings]
 
-    def _sync_photo_for_contact(
-        self,
-        source_contact: Contact,
-        dest_resource_name: str,
-        dest_api: PeopleAPI,
-        account_label: str,
-        result: SyncResult,
-    ) -> None:
+    def _sync_photos(self, tasks: list[PhotoTask], result: SyncResult) -> None:
         """
-        Synchronize photo for a single contact.
+        Transfer photos for contacts that have just been created or updated.
 
-        Downloads photo from source contact and uploads to destination contact.
-        If source has no photo, deletes photo from destination if present.
+        Runs every task through the photo pipeline (concurrent download,
+        processing and rate-limited upload). If a source has no photo, the
+        destination photo is deleted instead.
 
-        Updates result statistics to track photo operation success/failure.
+        Photo failures never fail the contact sync. A failed transfer of an
+        existing photo moves it from photos_synced (counted during analysis)
+        to photos_failed.
 
         Args:
-            source_contact: Contact with photo data (from source account)
-            dest_resource_name: Resource name in destination account
-            dest_api: PeopleAPI instance for destination account
-            account_label: Label for destination account (for logging)
+            tasks: Photo transfers for the contacts just written
             result: SyncResult to update with photo operation status
         """
-        try:
-            if source_contact.photo_url:
-                # Source has photo - download, process, and upload to destination
-                logger.debug(
-                    f"Syncing photo for {source_contact.display_name} "
-                    f"to {account_label}"
-                )
-
-                try:
-                    # Download photo from source URL
-                    photo_data = download_photo(source_contact.photo_url)
-
-                    # Process photo (validate, convert to JPEG, resize if needed)
-                    processed_photo = process_photo(photo_data)
-
-                    # Upload to destination contact
-                    dest_api.upload_photo(dest_resource_name, processed_photo)
+        if not tasks:
+            return
 
-                    logger.info(
-                        f"Successfully synced photo for {source_contact.display_name} "
-                        f"to {account_label}"
-                    )
+        logger.debug(f"Syncing photos for {len(tasks)} contacts")
 
-                except PhotoError as e:
-                    logger.warning(
-                        f"Failed to sync photo for {source_contact.display_name}: {e}"
-                    )
-                    # Track photo failure
-                    # Decrement photos_synced (was counted in analyze phase)
-                    # and increment photos_failed
+        for photo_result in self.photo_pipeline.run(tasks):
+            if (
+                not photo_result.succeeded
+                and photo_result.task.source_contact.photo_url
+            ):
+                with self._stats_lock:
                     result.stats.photos_synced -= 1
                     result.stats.photos_failed += 1
-                    # Continue sync even if photo fails - don't break contact sync
-
-            else:
-                # Source has no photo - delete photo from destination if present
-                # This ensures photo deletions are propagated
-                try:
-                    dest_api.delete_photo(dest_resource_name)
-                    logger.debug(
-                        f"Deleted photo from {source_contact.display_name} "
-                        f"in {account_label}"
-                    )
-                except PeopleAPIError as e:
-                    # Ignore errors when deleting (photo may not exist)
-                    logger.debug(
-                        f"Could not delete photo for {source_contact.display_name}: {e}"
-                    )
-
-        except Exception as e:
-            # Catch any unexpected errors to prevent breaking the sync
-            logger.error(
-                f"Unexpected error syncing photo for {source_contact.display_name}: {e}"
-            )
-            # Track as failed if we were attempting to sync a photo
-            if source_contact.photo_url:
-                result.stats.photos_synced -= 1
-                result.stats.photos_failed += 1
 
     def _execute_creates(
         self, contacts: list[Contact], api: PeopleAPI, account: int, result: SyncResult
@@ -3382,129 +4331,132 @@ class SyncEngine:
         account_label = self._get_account_label(account)
         logger.info(f"Creating {len(contacts)} contacts in {account_label}")
 
-        try:
-            # Map memberships from source account to target account
-            # If creating in account 1, source is account 2 (and vice versa)
-            source_account = 2 if account == 1 else 1
-
-            # Get sync label group resource name for target account (if enabled)
-            sync_label_resource = self._get_sync_label_resource(account)
-
-            # Get target group resource name for target account (if configured)
-            target_group_resource = self._get_target_group_resource(account)
-
-            # Get preserve_source_groups setting for target account
-            preserve_source_groups = True
-            if self.config:
-                account_config = (
-                    self.config.account1 if account == 1 else self.config.account2
-                )
-                preserve_source_groups = account_config.preserve_source_groups
+        # Map memberships from source account to target account
+        # If creating in account 1, source is account 2 (and vice versa)
+        source_account = 2 if account == 1 else 1
 
-            contacts_with_mapped_memberships = []
-            for contact in contacts:
-                # Only map source memberships if preserve_source_groups is True
-                if preserve_source_groups:
-                    mapped_memberships = self._map_memberships(
-                        contact.memberships, source_account, account
-                    )
-                else:
-                    mapped_memberships = []
+        # Get sync label group resource name for target account (if enabled)
+        sync_label_resource = self._get_sync_label_resource(account)
 
-                # Add sync label group membership if enabled
-                if (
-                    sync_label_resource
-                    and sync_label_resource not in mapped_memberships
-                ):
-                    mapped_memberships = list(mapped_memberships) + [
-                        sync_label_resource
-                    ]
+        # Get target group resource name for target account (if configured)
+        target_group_resource = self._get_target_group_resource(account)
 
-                # Add target group membership if configured
-                if (
-                    target_group_resource
-                    and target_group_resource not in mapped_memberships
-                ):
-                    mapped_memberships = list(mapped_memberships) + [
-                        target_group_resource
-                    ]
+        # Get preserve_source_groups setting for target account
+        preserve_source_groups = True
+        if self.config:
+            account_config = (
+                self.config.account1 if account == 1 else self.config.account2
+            )
+            preserve_source_groups = account_config.preserve_source_groups
 
-                # Create new contact with mapped memberships
-                mapped_contact = Contact(
-                    resource_name=contact.resource_name,
-                    etag=contact.etag,
-                    display_name=contact.display_name,
-                    given_name=contact.given_name,
-                    family_name=contact.family_name,
-                    emails=contact.emails,
-                    phones=contact.phones,
-                    organizations=contact.organizations,
-                    notes=contact.notes,
-                    memberships=mapped_memberships,
+        contacts_with_mapped_memberships = []
+        for contact in contacts:
+            # Only map source memberships if preserve_source_groups is True
+            if preserve_source_groups:
+                mapped_memberships = self._map_memberships(
+                    contact.memberships, source_account, account
                 )
-                contacts_with_mapped_memberships.append(mapped_contact)
+            else:
+                mapped_memberships = []
+
+            # Add sync label group membership if enabled
+            if sync_label_resource and sync_label_resource not in mapped_memberships:
+                mapped_memberships = list(mapped_memberships) + [sync_label_resource]
+
+            # Add target group membership if configured
+            if (
+                target_group_resource
+                and target_group_resource not in mapped_memberships
+            ):
+                mapped_memberships = list(mapped_memberships) + [target_group_resource]
+
+            # Create new contact with mapped memberships
+            mapped_contact = Contact(
+                resource_name=contact.resource_name,
+                etag=contact.etag,
+                display_name=contact.display_name,
+                given_name=contact.given_name,
+                family_name=contact.family_name,
+                emails=contact.emails,
+                phones=contact.phones,
+                organizations=contact.organizations,
+                notes=contact.notes,
+                memberships=tuple(mapped_memberships),
+            )
+            contacts_with_mapped_memberships.append(mapped_contact)
 
-            # Use batch create for efficiency
-            created = api.batch_create_contacts(contacts_with_mapped_memberships)
+        # Use batch create for efficiency. Batches the API rejects are split
+        # to isolate the bad contacts, so the rest are still created.
+        outcome = self._write_isolating_failures(
+            list(zip(contacts, contacts_with_mapped_memberships, strict=True)),
+            lambda pairs: api.batch_create_contacts([mapped for _, mapped in pairs]),
+        )
 
-            # Collect created contact resource names for sync label
-            created_resource_names: list[str] = []
+        # Collect created contact resource names for sync label
+        created_resource_names: list[str] = []
 
-            # Update mappings with new resource names
-            for original, created_contact in zip(contacts, created, strict=True):
-                matching_key = original.matching_key()
-                content_hash = original.content_hash()
+        # Mapping rows for the new resource names, written in one
+        # transaction once the whole batch has been processed
+        mapping_rows: list[dict[str, Any]] = []
 
-                if account == 1:
-                    self.database.upsert_contact_mapping(
-                        matching_key=matching_key,
-                        account1_resource_name=created_contact.resource_name,
-                        account1_etag=created_contact.etag,
-                        last_synced_hash=content_hash,
-                    )
-                    result.stats.created_in_account1 += 1
-                else:
-                    self.database.upsert_contact_mapping(
-                        matching_key=matching_key,
-                        account2_resource_name=created_contact.resource_name,
-                        account2_etag=created_contact.etag,
-                        last_synced_hash=content_hash,
-                    )
-                    result.stats.created_in_account2 += 1
+        # Photos are transferred once the whole batch has been created
+        photo_tasks: list[PhotoTask] = []
+
+        for (original, _mapped), created_contact in outcome.written:
+            mapping_rows.append(
+                {
+                    "matching_key": original.matching_key(),
+                    f"account{account}_resource_name": (created_contact.resource_name),
+                    f"account{account}_etag": created_contact.etag,
+                    "last_synced_hash": original.content_hash(),
+                }
+            )
+            if account == 1:
+                result.stats.created_in_account1 += 1
+            else:
+                result.stats.created_in_account2 += 1
 
-                # Sync photo after creating contact
-                self._sync_photo_for_contact(
+            photo_tasks.append(
+                PhotoTask(
                     source_contact=original,
                     dest_resource_name=created_contact.resource_name,
                     dest_api=api,
                     account_label=account_label,
-                    result=result,
                 )
+            )
 
-                # Track for sync label group membership
-                created_resource_names.append(created_contact.resource_name)
+            # Track for sync label group membership
+            created_resource_names.append(created_contact.resource_name)
 
-            # Add created contacts to sync label group
-            # (must use modify_group_members, not batch_create_contacts)
-            if sync_label_resource and created_resource_names:
-                try:
-                    api.modify_group_members(
-                        resource_name=sync_label_resource,
-                        add_resource_names=created_resource_names,
-                    )
-                    logger.debug(
-                        f"Added {len(created_resource_names)} created contacts to "
-                        f"sync label group in {account_label}"
-                    )
-                except PeopleAPIError as e:
-                    logger.warning(
-                        f"Failed to add created contacts to sync label group: {e}"
-                    )
+        self.database.bulk_upsert_contact_mappings(mapping_rows)
 
-        except PeopleAPIError as e:
-            logger.error(f"Failed to create contacts in {account_label}: {e}")
-            result.stats.errors += len(contacts)
-            raise
+        # Add created contacts to sync label group
+        # (must use modify_group_members, not batch_create_contacts)
+        if sync_label_resource and created_resource_names:
+            try:
+                api.modify_group_members(
+                    resource_name=sync_label_resource,
+                    add_resource_names=created_resource_names,
+                )
+                logger.debug(
+                    f"Added {len(created_resource_names)} created contacts to "
+                    f"sync label group in {account_label}"
+                )
+            except PeopleAPIError as e:
+                logger.warning(
+                    f"Failed to add created contacts to sync label group: {e}"
+                )
+
+        self._sync_photos(photo_tasks, result)
+
+        source_account_id = ACCOUNT_1 if source_account == 1 else ACCOUNT_2
+        self._finish_batch_write(
+            outcome,
+            result,
+            f"create contacts in {account_label}",
+            lambda pair: pair[0].display_name or pair[0].resource_name,
+            retry_source=lambda pair: (source_account_id, pair[0].resource_name),
+        )
 
     def _execute_updates(
         self,
@@ -3545,127 +4497,141 @@ class SyncEngine:
             )
             preserve_source_groups = account_config.preserve_source_groups
 
-        try:
-            # Get current etags for the contacts being updated
-            updates_with_etags = []
-            for resource_name, source_contact in updates:
-                try:
-                    current = api.get_contact(resource_name)
-                    # Only map source memberships if preserve_source_groups is True
-                    if preserve_source_groups:
-                        mapped_memberships = self._map_memberships(
-                            source_contact.memberships, source_account, account
-                        )
-                    else:
-                        mapped_memberships = []
+        # Get current etags for the contacts being updated
+        updates_with_etags = []
+        # Current destination photo URLs, so unchanged photos aren't
+        # uploaded again
+        dest_photo_urls: dict[str, str | None] = {}
+        for resource_name, source_contact in updates:
+            try:
+                current = api.get_contact(resource_name)
+                dest_photo_urls[resource_name] = current.photo_url
+                # Only map source memberships if preserve_source_groups is True
+                if preserve_source_groups:
+                    mapped_memberships = self._map_memberships(
+                        source_contact.memberships, source_account, account
+                    )
+                else:
+                    mapped_memberships = []
 
-                    # Add sync label group membership if enabled
-                    if (
+                # Add sync label group membership if enabled
+                if (
+                    sync_label_resource
+                    and sync_label_resource not in mapped_memberships
+                ):
+                    mapped_memberships = list(mapped_memberships) + [
                         sync_label_resource
-                        and sync_label_resource not in mapped_memberships
-                    ):
-                        mapped_memberships = list(mapped_memberships) + [
-                            sync_label_resource
-                        ]
-
-                    # Add target group membership if configured
-                    if (
+                    ]
+
+                # Add target group membership if configured
+                if (
+                    target_group_resource
+                    and target_group_resource not in mapped_memberships
+                ):
+                    mapped_memberships = list(mapped_memberships) + [
                         target_group_resource
-                        and target_group_resource not in mapped_memberships
-                    ):
-                        mapped_memberships = list(mapped_memberships) + [
-                            target_group_resource
-                        ]
-
-                    # Create a contact with source data but target's resource name
-                    update_contact = Contact(
-                        resource_name=resource_name,
-                        etag=current.etag,
-                        display_name=source_contact.display_name,
-                        given_name=source_contact.given_name,
-                        family_name=source_contact.family_name,
-                        emails=source_contact.emails,
-                        phones=source_contact.phones,
-                        organizations=source_contact.organizations,
-                        notes=source_contact.notes,
-                        memberships=mapped_memberships,
-                    )
-                    updates_with_etags.append((resource_name, update_contact))
-                except PeopleAPIError as e:
-                    logger.warning(
-                        f"Could not fetch contact for update: {resource_name}: {e}"
-                    )
-                    result.stats.errors += 1
-                    continue
+                    ]
 
-            # Use batch update for efficiency
-            if updates_with_etags:
-                updated = api.batch_update_contacts(updates_with_etags)
+                # Create a contact with source data but target's resource name
+                update_contact = Contact(
+                    resource_name=resource_name,
+                    etag=current.etag,
+                    display_name=source_contact.display_name,
+                    given_name=source_contact.given_name,
+                    family_name=source_contact.family_name,
+                    emails=source_contact.emails,
+                    phones=source_contact.phones,
+                    organizations=source_contact.organizations,
+                    notes=source_contact.notes,
+                    memberships=tuple(mapped_memberships),
+                )
+                updates_with_etags.append((resource_name, update_contact))
+            except PeopleAPIError as e:
+                logger.warning(
+                    f"Could not fetch contact for update: {resource_name}: {e}"
+                )
+                with self._stats_lock:
+                    result.stats.errors += 1
+                continue
 
-                # Collect contacts that need sync label added
-                contacts_for_sync_label: list[str] = []
+        # Use batch update for efficiency. Batches the API rejects are split
+        # to isolate the bad contacts, so the rest are still updated.
+        if updates_with_etags:
+            outcome = self._write_isolating_failures(
+                updates_with_etags, api.batch_update_contacts
+            )
 
-                # Update mappings with new etags and sync photos
-                for (resource_name, source_contact), updated_contact in zip(
-                    updates_with_etags, updated, strict=True
-                ):
-                    matching_key = source_contact.matching_key()
-                    content_hash = source_contact.content_hash()
-
-                    if account == 1:
-                        self.database.upsert_contact_mapping(
-                            matching_key=matching_key,
-                            account1_etag=updated_contact.etag,
-                            last_synced_hash=content_hash,
-                        )
-                        result.stats.updated_in_account1 += 1
-                    else:
-                        self.database.upsert_contact_mapping(
-                            matching_key=matching_key,
-                            account2_etag=updated_contact.etag,
-                            last_synced_hash=content_hash,
-                        )
-                        result.stats.updated_in_account2 += 1
+            # Collect contacts that need sync label added
+            contacts_for_sync_label: list[str] = []
+
+            # Mapping rows with the new etags, written in one transaction
+            # once the whole batch has been processed
+            mapping_rows: list[dict[str, Any]] = []
+
+            # Photos are transferred once the whole batch has been updated.
+            # The source contacts (with photo_url) come from the updates
+            # list, not the rebuilt update contacts.
+            photo_tasks: list[PhotoTask] = []
+            sources_by_resource = dict(updates)
+
+            # Update mappings with new etags and sync photos
+            for (resource_name, source_contact), updated_contact in outcome.written:
+                mapping_rows.append(
+                    {
+                        "matching_key": source_contact.matching_key(),
+                        f"account{account}_etag": updated_contact.etag,
+                        "last_synced_hash": source_contact.content_hash(),
+                    }
+                )
+                if account == 1:
+                    result.stats.updated_in_account1 += 1
+                else:
+                    result.stats.updated_in_account2 += 1
 
-                    # Sync photo after updating contact
-                    # Note: We need the original source contact from the updates list
-                    # to get the photo_url
-                    original_source = next(
-                        src for res, src in updates if res == resource_name
-                    )
-                    self._sync_photo_for_contact(
-                        source_contact=original_source,
+                photo_tasks.append(
+                    PhotoTask(
+                        source_contact=sources_by_resource[resource_name],
                         dest_resource_name=resource_name,
                         dest_api=api,
                         account_label=account_label,
-                        result=result,
+                        dest_photo_url=dest_photo_urls.get(resource_name),
                     )
+                )
 
-                    # Track contacts that need sync label added
-                    # (must use modify_group_members, not batch_update_contacts)
-                    if sync_label_resource:
-                        contacts_for_sync_label.append(resource_name)
-
-                # Add contacts to sync label group (must be done via group API)
-                if sync_label_resource and contacts_for_sync_label:
-                    try:
-                        api.modify_group_members(
-                            resource_name=sync_label_resource,
-                            add_resource_names=contacts_for_sync_label,
-                        )
-                        logger.debug(
-                            f"Added {len(contacts_for_sync_label)} contacts to "
-                            f"sync label group in {account_label}"
-                        )
-                    except PeopleAPIError as e:
-                        logger.warning(
-                            f"Failed to add contacts to sync label group: {e}"
-                        )
+                # Track contacts that need sync label added
+                # (must use modify_group_members, not batch_update_contacts)
+                if sync_label_resource:
+                    contacts_for_sync_label.append(resource_name)
 
-        except PeopleAPIError as e:
-            logger.error(f"Failed to update contacts in {account_label}: {e}")
-            result.stats.errors += len(updates)
-            raise
+            self.database.bulk_upsert_contact_mappings(mapping_rows)
+
+            # Add contacts to sync label group (must be done via group API)
+            if sync_label_resource and contacts_for_sync_label:
+                try:
+                    api.modify_group_members(
+                        resource_name=sync_label_resource,
+                        add_resource_names=contacts_for_sync_label,
+                    )
+                    logger.debug(
+                        f"Added {len(contacts_for_sync_label)} contacts to "
+                        f"sync label group in {account_label}"
+                    )
+                except PeopleAPIError as e:
+                    logger.warning(f"Failed to add contacts to sync label group: {e}")
+
+            self._sync_photos(photo_tasks, result)
+
+            source_account_id = ACCOUNT_1 if source_account == 1 else ACCOUNT_2
+            self._finish_batch_write(
+                outcome,
+                result,
+                f"update contacts in {account_label}",
+                lambda update: update[0],
+                retry_source=lambda update: (
+                    source_account_id,
+                    sources_by_resource[update[0]].resource_name,
+                ),
+            )
 
     def _execute_deletes(
         self,
@@ -3688,19 +4654,156 @@ class SyncEngine:
         account_label = self._get_account_label(account)
         logger.info(f"Deleting {len(resource_names)} contacts in {account_label}")
 
-        try:
-            # Use batch delete for efficiency
-            deleted_count = api.batch_delete_contacts(resource_names)
+        # Use batch delete for efficiency. Batches the API rejects are split
+        # to isolate the contacts that cannot be deleted.
+        outcome = self._write_isolating_failures(
+            resource_names, api.batch_delete_contacts
+        )
 
-            if account == 1:
-                result.stats.deleted_in_account1 += deleted_count
-            else:
-                result.stats.deleted_in_account2 += deleted_count
+        if account == 1:
+            result.stats.deleted_in_account1 += len(outcome.written)
+        else:
+            result.stats.deleted_in_account2 += len(outcome.written)
+
+        # The mappings of these contacts are already gone, so a failed delete
+        # is reported but not retried
+        self._finish_batch_write(
+            outcome,
+            result,
+            f"delete contacts in {account_label}",
+            lambda resource_name: resource_name,
+            retry_source=None,
+        )
+
+    def _write_isolating_failures(
+        self, items: list[Any], write: Callable[[list[Any]], Any]
+    ) -> BatchWriteOutcome:
+        """
+        Write items in batches, isolating the records the API rejects.
+
+        Batches that were written are kept. Items failing with an error about
+        the request content (HTTP 400 or 412) are split in half and written
+        again, down to single items, so one bad contact costs about two
+        requests per halving instead of its whole batch. Other errors would
+        fail for any subset, so those items fail as a group. Once the rate
+        limit runs out, the remaining items are deferred without sending them.
+
+        Args:
+            items: Items to write
+            write: One of the PeopleAPI batch_* methods (or a wrapper). Must
+                return one result per item, or an int count for deletes.
+
+        Returns:
+            BatchWriteOutcome with the written, failed and deferred items
+        """
+        outcome = BatchWriteOutcome()
+        self._bisect_write(items, write, outcome)
+        return outcome
 
+    def _bisect_write(
+        self,
+        items: list[Any],
+        write: Callable[[list[Any]], Any],
+        outcome: BatchWriteOutcome,
+    ) -> None:
+        """Write items, splitting failed ones (see _write_isolating_failures)."""
+        if not items:
+            return
+        if outcome.rate_limit_error is not None:
+            outcome.deferred.extend(items)
+            return
+
+        errors: list[PeopleAPIError | None]
+        try:
+            written = write(items)
+        except BatchWriteError as e:
+            results, errors = e.results, e.errors
         except PeopleAPIError as e:
-            logger.error(f"Failed to delete contacts in {account_label}: {e}")
-            result.stats.errors += len(resource_names)
-            raise
+            results, errors = [None] * len(items), [e] * len(items)
+        else:
+            # batch_delete_contacts returns a count, not per-item results
+            results = [True] * len(items) if isinstance(written, int) else written
+            errors = [None] * len(items)
+
+        failed: list[tuple[Any, PeopleAPIError]] = []
+        for item, item_result, error in zip(items, results, errors, strict=True):
+            if error is None:
+                outcome.written.append((item, item_result))
+            else:
+                failed.append((item, error))
+
+        if not failed:
+            return
+
+        for _item, error in failed:
+            if isinstance(error, RateLimitError):
+                outcome.rate_limit_error = error
+                outcome.deferred.extend(item for item, _error in failed)
+                return
+
+        if len(failed) == 1 or any(
+            error.status not in RECORD_ERROR_STATUSES for _item, error in failed
+        ):
+            outcome.failed.extend(failed)
+            return
+
+        pending = [item for item, _error in failed]
+        middle = len(pending) // 2
+        self._bisect_write(pending[:middle], write, outcome)
+        self._bisect_write(pending[middle:], write, outcome)
+
+    def _finish_batch_write(
+        self,
+        outcome: BatchWriteOutcome,
+        result: SyncResult,
+        operation: str,
+        describe: Callable[[Any], str],
+        retry_source: Callable[[Any], tuple[str, str]] | None,
+    ) -> None:
+        """
+        Report the items of a batch write that were not written.
+
+        Failed items are queued in result.failed_writes for the next sync's
+        retry table. Items deferred by the rate limit are counted in
+        writes_pending_retry instead, which keeps the sync tokens so the next
+        sync reads them again.
+
+        Args:
+            outcome: Outcome of _write_isolating_failures()
+            result: SyncResult to update with stats
+            operation: Description for log messages (e.g. "create contacts in
+                user@example.com")
+            describe: Callable naming an item for log messages
+            retry_source: Callable giving (account ID, resource name) of an
+                item's source contact, or None if failed items are not retried
+
+        Raises:
+            RateLimitError: If the write stopped because the rate limit ran
+                out, after everything written has been recorded
+        """
+        for item, error in outcome.failed:
+            logger.error(f"Failed to {operation}: {describe(item)}: {error}")
+
+        not_written = len(outcome.failed) + len(outcome.deferred)
+        if not not_written:
+            return
+
+        with self._stats_lock:
+            result.stats.errors += not_written
+            if retry_source is not None:
+                result.stats.writes_pending_retry += len(outcome.deferred)
+                result.failed_writes.extend(
+                    (*retry_source(item), str(error)) for item, error in outcome.failed
+                )
+
+        if outcome.deferred:
+            logger.warning(
+                f"Could not {operation} for {len(outcome.deferred)} contacts: "
+                f"rate limit exceeded"
+            )
+
+        if outcome.rate_limit_error is not None:
+            raise outcome.rate_limit_error
 
     # =========================================================================
     # Group Sync Execution Methods
@@ -3716,7 +4819,8 @@ class SyncEngine:
         """
         Execute group creation operations.
 
-        Creates groups one at a time (no batch API for groups).
+        Creates all groups through batch HTTP requests; each group succeeds or
+        fails on its own.
 
         Args:
             groups: Groups to create
@@ -3727,10 +4831,15 @@ class SyncEngine:
         account_label = self._get_account_label(account)
         logger.info(f"Creating {len(groups)} groups in {account_label}")
 
-        for group in groups:
+        try:
+            responses = api.batch_create_contact_groups([g.name for g in groups])
+        except PeopleAPIError as e:
+            responses = [e] * len(groups)
+
+        for group, created_response in zip(groups, responses, strict=True):
             try:
-                # Create the group using the API
-                created_response = api.create_contact_group(group.name)
+                if isinstance(created_response, PeopleAPIError):
+                    raise created_response
 
                 # Extract the created group info
                 created_resource_name = created_response.get("resourceName", "")
@@ -3758,6 +4867,11 @@ class SyncEngine:
                     )
                     result.stats.groups_created_in_account2 += 1
 
+                source_account = 2 if account == 1 else 1
+                self._record_group_membership_mapping(
+                    source_account, group.resource_name, created_resource_name
+                )
+
                 logger.debug(
                     f"Created group '{group.name}' in {account_label}: "
                     f"{created_resource_name}"
@@ -3767,7 +4881,8 @@ class SyncEngine:
                 logger.error(
                     f"Failed to create group '{group.name}' in {account_label}: {e}"
                 )
-                result.stats.errors += 1
+                with self._stats_lock:
+                    result.stats.errors += 1
                 # Continue with other groups instead of failing completely
                 continue
 
@@ -3835,7 +4950,8 @@ class SyncEngine:
                     f"Failed to update group '{source_group.name}' "
                     f"in {account_label}: {e}"
                 )
-                result.stats.errors += 1
+                with self._stats_lock:
+                    result.stats.errors += 1
                 # Continue with other groups instead of failing completely
                 continue
 
@@ -3849,8 +4965,8 @@ class SyncEngine:
         """
         Execute group deletion operations.
 
-        Deletes groups one at a time (no batch API for groups).
-        Does not delete contacts within the group.
+        Deletes all groups through batch HTTP requests; each group succeeds or
+        fails on its own. Does not delete contacts within the groups.
 
         Args:
             resource_names: Group resource names to delete
@@ -3861,10 +4977,20 @@ class SyncEngine:
         account_label = self._get_account_label(account)
         logger.info(f"Deleting {len(resource_names)} groups in {account_label}")
 
-        for resource_name in resource_names:
+        try:
+            # Delete the groups (preserve contacts within them)
+            outcomes = api.batch_delete_contact_groups(
+                resource_names, delete_contacts=False
+            )
+        except PeopleAPIError as e:
+            outcomes = [e] * len(resource_names)
+
+        for resource_name, outcome in zip(resource_names, outcomes, strict=True):
             try:
-                # Delete the group (preserve contacts within it)
-                api.delete_contact_group(resource_name, delete_contacts=False)
+                if isinstance(outcome, PeopleAPIError):
+                    raise outcome
+
+                self._forget_group_membership_mapping(account, resource_name)
 
                 if account == 1:
                     result.stats.groups_deleted_in_account1 += 1
@@ -3877,13 +5003,14 @@ class SyncEngine:
                 logger.error(
                     f"Failed to delete group {resource_name} in {account_label}: {e}"
                 )
-                result.stats.errors += 1
+                with self._stats_lock:
+                    result.stats.errors += 1
                 # Continue with other groups instead of failing completely
                 continue
 
     def _map_memberships(
         self,
-        memberships: list[str],
+        memberships: Sequence[str],
         source_account: int,
         target_account: int,
     ) -> list[str]:
@@ -3895,7 +5022,9 @@ class SyncEngine:
         to the corresponding group resource names in the target account.
 
         Uses the group_mapping table in the database to find corresponding groups
-        that have been synced between accounts.
+        that have been synced between accounts. During execute() the table is
+        held in memory (see _load_group_membership_maps); otherwise each
+        membership is looked up in the database.
 
         Args:
             memberships: List of group resource names from the source account
@@ -3938,13 +5067,11 @@ class SyncEngine:
                 continue
 
             # Look up the group mapping by the source account's resource name
-            mapping = self.database.get_group_mapping_by_resource_name(
-                group_resource, source_account
+            found, target_resource = self._lookup_group_membership_mapping(
+                group_resource, source_account, target_account
             )
 
-            if mapping:
-                # Get the target account's resource name from the mapping
-                target_resource = mapping.get(f"account{target_account}_resource_name")
+            if found:
                 if target_resource:
                     mapped_memberships.append(target_resource)
                     if mlog:
@@ -3972,6 +5099,100 @@ class SyncEngine:
 
         return mapped_memberships
 
+    def _load_group_membership_maps(self) -> None:
+        """
+        Load all group mappings into in-memory translation tables.
+
+        Builds one dictionary per direction: account 1 group resource name to
+        account 2 resource name, and the reverse. A value of None means the
+        group is mapped but not yet present in the other account.
+        """
+        maps: dict[int, dict[str, str | None]] = {1: {}, 2: {}}
+        for mapping in self.database.get_all_group_mappings():
+            resource1 = mapping.get("account1_resource_name")
+            resource2 = mapping.get("account2_resource_name")
+            # Keep the first mapping per resource, as the per-row lookup did
+            if resource1:
+                maps[1].setdefault(resource1, resource2)
+            if resource2:
+                maps[2].setdefault(resource2, resource1)
+
+        self._group_membership_maps = maps
+        logger.debug(
+            f"Loaded group membership maps: {len(maps[1])} groups in account 1, "
+            f"{len(maps[2])} groups in account 2"
+        )
+
+    def _lookup_group_membership_mapping(
+        self, group_resource: str, source_account: int, target_account: int
+    ) -> tuple[bool, str | None]:
+        """
+        Translate a group resource name from one account to the other.
+
+        Args:
+            group_resource: Group resource name in the source account
+            source_account: Account number of the group (1 or 2)
+            target_account: Account number to translate to (1 or 2)
+
+        Returns:
+            Tuple of (mapping found, target resource name or None)
+        """
+        if self._group_membership_maps is not None:
+            table = self._group_membership_maps[source_account]
+            if group_resource not in table:
+                return False, None
+            return True, table[group_resource]
+
+        mapping = self.database.get_group_mapping_by_resource_name(
+            group_resource, source_account
+        )
+        if not mapping:
+            return False, None
+        return True, mapping.get(f"account{target_account}_resource_name")
+
+    def _record_group_membership_mapping(
+        self, source_account: int, source_resource: str, target_resource: str
+    ) -> None:
+        """
+        Add a newly created group to the in-memory translation tables.
+
+        Args:
+            source_account: Account number the group was copied from (1 or 2)
+            source_resource: Group resource name in the source account
+            target_resource: Resource name of the group created in the other account
+        """
+        if self._group_membership_maps is None:
+            return
+
+        target_account = 2 if source_account == 1 else 1
+        if source_resource:
+            self._group_membership_maps[source_account][source_resource] = (
+                target_resource
+            )
+        if target_resource:
+            self._group_membership_maps[target_account][target_resource] = (
+                source_resource or None
+            )
+
+    def _forget_group_membership_mapping(
+        self, account: int, resource_name: str
+    ) -> None:
+        """
+        Remove a deleted group from the in-memory translation tables.
+
+        Args:
+            account: Account number the group was deleted from (1 or 2)
+            resource_name: Resource name of the deleted group
+        """
+        if self._group_membership_maps is None:
+            return
+
+        other_account = 2 if account == 1 else 1
+        other_resource = self._group_membership_maps[account].pop(resource_name, None)
+        if other_resource:
+            # The surviving group no longer has a counterpart to map to
+            self._group_membership_maps[other_account][other_resource] = None
+
     def _apply_key_updates(self) -> None:
         """
         Apply pending matching key updates to the database.
@@ -8,6 +8,10 @@ the same person when deterministic and fuzzy matching are inconclusive.
 import json
 import logging
 import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -22,6 +26,20 @@ DEFAULT_LLM_MODEL = "claude-haiku-4-5-20250514"
 DEFAULT_LLM_MAX_TOKENS = 500
 DEFAULT_LLM_BATCH_MAX_TOKENS = 2000
 
+# Concurrent batch adjudication defaults
+DEFAULT_LLM_MAX_CONCURRENCY = 4
+DEFAULT_LLM_REQUESTS_PER_MINUTE = 50
+DEFAULT_LLM_TOKENS_PER_MINUTE = 40000
+DEFAULT_LLM_MAX_RETRIES = 3
+DEFAULT_LLM_INITIAL_RETRY_DELAY = 1.0
+DEFAULT_LLM_MAX_RETRY_DELAY = 30.0
+
+# HTTP status codes from the LLM API that are worth retrying
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# Rough characters-per-token ratio used to estimate prompt size
+CHARS_PER_TOKEN = 4
+
 
 @dataclass
 class LLMMatchDecision:
@@ -32,6 +50,61 @@ class LLMMatchDecision:
     reasoning: str
 
 
+class RequestBudget:
+    """
+    Sliding one-minute budget of requests and tokens, shared across threads.
+
+    acquire() blocks until sending one more request of the given size keeps
+    both the request count and the token count of the last 60 seconds
+    within their limits.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize the budget.
+
+        Args:
+            requests_per_minute: Maximum requests per rolling minute
+            tokens_per_minute: Maximum (estimated) tokens per rolling minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._sent: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until a request of the given size fits in the budget.
+
+        Args:
+            tokens: Estimated tokens the request will consume. A request
+                larger than the whole per-minute budget waits for an empty
+                window and is then let through.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0][0] >= self.WINDOW_SECONDS:
+                    _, expired = self._sent.popleft()
+                    self._tokens_in_window -= expired
+
+                fits = len(self._sent) < self.requests_per_minute and (
+                    not self._sent
+                    or self._tokens_in_window + tokens <= self.tokens_per_minute
+                )
+                if fits:
+                    self._sent.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+
+                wait = self.WINDOW_SECONDS - (now - self._sent[0][0])
+
+            time.sleep(max(wait, 0.01))
+
+
 class LLMMatcher:
     """
     LLM-based contact matcher for uncertain cases.
@@ -58,6 +131,12 @@ class LLMMatcher:
         model: str = DEFAULT_LLM_MODEL,
         max_tokens: int = DEFAULT_LLM_MAX_TOKENS,
         batch_max_tokens: int = DEFAULT_LLM_BATCH_MAX_TOKENS,
+        max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY,
+        requests_per_minute: int = DEFAULT_LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_LLM_TOKENS_PER_MINUTE,
+        max_retries: int = DEFAULT_LLM_MAX_RETRIES,
+        initial_retry_delay: float = DEFAULT_LLM_INITIAL_RETRY_DELAY,
+        max_retry_delay: float = DEFAULT_LLM_MAX_RETRY_DELAY,
     ):
         """
         Initialize the LLM matcher.
@@ -68,6 +147,15 @@ class LLMMatcher:
             model: Claude model to use for matching (default: claude-haiku-4-5-20250514)
             max_tokens: Max tokens for single match responses (default: 500)
             batch_max_tokens: Max tokens for batch match responses (default: 2000)
+            max_concurrency: Max batch requests in flight in match_batches()
+                (default: 4)
+            requests_per_minute: Request budget for match_batches() (default: 50)
+            tokens_per_minute: Estimated token budget for match_batches()
+                (default: 40000)
+            max_retries: Retries for transient API errors in match_batches()
+                (default: 3)
+            initial_retry_delay: First retry delay in seconds (default: 1.0)
+            max_retry_delay: Maximum retry delay in seconds (default: 30.0)
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self._client: Any = None
@@ -75,9 +163,24 @@ class LLMMatcher:
         self.model = model
         self.max_tokens = max_tokens
         self.batch_max_tokens = batch_max_tokens
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.initial_retry_delay = initial_retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._budget = RequestBudget(requests_per_minute, tokens_per_minute)
+        self._client_lock = threading.Lock()
+
+        # Session cache (see preload_cache); None means query the database
+        self._preloaded: dict[tuple[str, str], dict[str, Any]] | None = None
+        self._pending_writes: dict[tuple[str, str], dict[str, Any]] = {}
 
     def _get_client(self) -> Any:
         """Lazy-load the Anthropic client. Returns anthropic.Anthropic instance."""
+        with self._client_lock:
+            return self._load_client()
+
+    def _load_client(self) -> Any:
+        """Create the Anthropic client on first use."""
         if self._client is None:
             if not self.api_key:
                 raise ValueError(
@@ -181,6 +284,133 @@ class LLMMatcher:
             logger.error(f"Batch LLM matching failed: {e}")
             return []
 
+    def match_batches(
+        self,
+        groups: list[tuple["Contact", list["Contact"]]],
+        batch_size: int,
+    ) -> list[list[LLMMatchDecision]]:
+        """
+        Adjudicate many uncertain pairs with concurrent batch requests.
+
+        Each group is a source contact and its uncertain candidates. Cached
+        decisions are used where valid; the remaining candidates are split
+        into batches of at most batch_size and sent concurrently (bounded by
+        max_concurrency and the per-minute request/token budget), retrying
+        transient errors with exponential backoff. New decisions, including
+        "not a match" for candidates the LLM did not select, are cached in
+        one database write at the end.
+
+        Args:
+            groups: List of (source contact, candidate contacts)
+            batch_size: Maximum candidates per LLM request
+
+        Returns:
+            Decisions aligned with each group's candidate list. Candidates
+            whose batch failed get a non-match decision that is not cached.
+        """
+        failed = LLMMatchDecision(
+            is_match=False, confidence=0.0, reasoning="LLM batch matching failed"
+        )
+        decisions = [[failed] * len(candidates) for _, candidates in groups]
+
+        # Split uncached candidates into request-sized batches
+        jobs: list[tuple[int, list[int]]] = []
+        for group_index, (source, candidates) in enumerate(groups):
+            pending = []
+            for candidate_index, candidate in enumerate(candidates):
+                cached = self._get_cached_decision(source, candidate)
+                if cached:
+                    decisions[group_index][candidate_index] = cached
+                else:
+                    pending.append(candidate_index)
+            for start in range(0, len(pending), max(1, batch_size)):
+                jobs.append((group_index, pending[start : start + batch_size]))
+
+        to_cache: list[tuple[Contact, Contact, LLMMatchDecision]] = []
+
+        if jobs:
+            logger.debug(
+                f"Sending {len(jobs)} LLM batch requests "
+                f"(concurrency {self.max_concurrency})"
+            )
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                futures = {
+                    pool.submit(
+                        self._adjudicate_batch,
+                        groups[group_index][0],
+                        [groups[group_index][1][i] for i in indices],
+                    ): (group_index, indices)
+                    for group_index, indices in jobs
+                }
+                for future in as_completed(futures):
+                    group_index, indices = futures[future]
+                    source, candidates = groups[group_index]
+                    batch_decisions = future.result()
+                    if batch_decisions is None:
+                        continue
+                    for decision, candidate_index in zip(
+                        batch_decisions, indices, strict=True
+                    ):
+                        decisions[group_index][candidate_index] = decision
+                        to_cache.append((source, candidates[candidate_index], decision))
+
+        self._cache_decisions(to_cache)
+
+        return decisions
+
+    def _adjudicate_batch(
+        self, source: "Contact", candidates: list["Contact"]
+    ) -> list[LLMMatchDecision] | None:
+        """
+        Send one batch request, honoring the budget and retrying transient errors.
+
+        Args:
+            source: The contact to find matches for
+            candidates: Candidate contacts for this request
+
+        Returns:
+            One decision per candidate, or None if the request failed
+        """
+        prompt = self._build_batch_prompt(source, candidates)
+        estimated_tokens = len(prompt) // CHARS_PER_TOKEN + self.batch_max_tokens
+
+        for attempt in range(self.max_retries + 1):
+            self._budget.acquire(estimated_tokens)
+            try:
+                client = self._get_client()
+                response = client.messages.create(
+                    model=self.model,
+                    max_tokens=self.batch_max_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                return self._parse_batch_decisions(
+                    response.content[0].text, len(candidates)
+                )
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    logger.error(f"Batch LLM matching failed: {e}")
+                    return None
+
+                delay = min(
+                    self.initial_retry_delay * (2**attempt), self.max_retry_delay
+                )
+                logger.warning(
+                    f"Transient LLM error, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                time.sleep(delay)
+
+        return None
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Check whether an LLM API error is transient."""
+        status = getattr(error, "status_code", None)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES
+        # Connection and timeout errors carry no status code
+        return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
     def _build_match_prompt(self, contact1: "Contact", contact2: "Contact") -> str:
         """Build the prompt for matching two contacts."""
         c1_emails = ", ".join(contact1.emails) if contact1.emails else "None"
@@ -272,14 +502,7 @@ Only include candidates that ARE matches. Empty array if no matches."""
         """Parse the LLM response for a single match."""
         try:
             # Clean up response if it has markdown code blocks
-            text = response_text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-
-            data = json.loads(text)
+            data = json.loads(self._strip_code_fence(response_text))
             return LLMMatchDecision(
                 is_match=data.get("is_match", False),
                 confidence=float(data.get("confidence", 0.0)),
@@ -294,20 +517,66 @@ Only include candidates that ARE matches. Empty array if no matches."""
                 reasoning=f"Failed to parse LLM response: {e}",
             )
 
+    def _parse_batch_decisions(
+        self, response_text: str, candidate_count: int
+    ) -> list[LLMMatchDecision] | None:
+        """
+        Parse a batch response into one decision per candidate.
+
+        Candidates the LLM did not list as matches get a non-match decision.
+
+        Args:
+            response_text: Raw LLM response
+            candidate_count: Number of candidates in the request
+
+        Returns:
+            Decisions in candidate order, or None if the response is unparseable
+        """
+        try:
+            data = json.loads(self._strip_code_fence(response_text))
+            matches = data.get("matches", [])
+
+            decisions = [
+                LLMMatchDecision(
+                    is_match=False,
+                    confidence=0.0,
+                    reasoning="Not selected in batch review",
+                )
+                for _ in range(candidate_count)
+            ]
+            for match in matches:
+                idx = match.get("candidate_index", 0) - 1  # Convert to 0-based
+                if 0 <= idx < candidate_count:
+                    decisions[idx] = LLMMatchDecision(
+                        is_match=True,
+                        confidence=float(match.get("confidence", 0.8)),
+                        reasoning=match.get("reasoning", "LLM match"),
+                    )
+
+            return decisions
+
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to parse batch LLM response: {e}")
+            logger.debug(f"Response was: {response_text}")
+            return None
+
+    @staticmethod
+    def _strip_code_fence(response_text: str) -> str:
+        """Remove a surrounding markdown code block from an LLM response."""
+        text = response_text.strip()
+        if text.startswith("```"):
+            text = text.split("```")[1]
+            if text.startswith("json"):
+                text = text[4:]
+        return text.strip()
+
     def _parse_batch_response(
         self, response_text: str, candidates: list["Contact"]
     ) -> list[tuple["Contact", LLMMatchDecision]]:
         """Parse the LLM response for batch matching."""
         try:
             # Clean up response if it has markdown code blocks
-            text = response_text.strip()
-            if text.startswith("```"):
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            text = text.strip()
-
-            data = json.loads(text)
+            data = json.loads(self._strip_code_fence(response_text))
             matches = data.get("matches", [])
 
             results = []
@@ -332,6 +601,87 @@ Only include candidates that ARE matches. Empty array if no matches."""
     # Caching Methods
     # =========================================================================
 
+    def preload_cache(self) -> int:
+        """
+        Load every cached decision into memory for this sync session.
+
+        Until flush_cache() is called, lookups are served from an in-memory
+        dict keyed by the unordered resource-name pair, and new decisions are
+        buffered instead of being written one at a time.
+
+        Returns:
+            Number of decisions loaded
+        """
+        if not self._database:
+            return 0
+
+        # Don't lose decisions buffered by a session that was never flushed
+        if self._pending_writes:
+            self.flush_cache()
+
+        try:
+            attempts = self._database.get_all_llm_match_attempts()
+        except Exception as e:
+            logger.warning(f"Failed to preload LLM decision cache: {e}")
+            return 0
+
+        self._preloaded = {
+            self._pair_key(
+                attempt["contact1_resource_name"], attempt["contact2_resource_name"]
+            ): attempt
+            for attempt in attempts
+        }
+        self._pending_writes = {}
+        logger.debug(f"Preloaded {len(self._preloaded)} cached LLM decisions")
+        return len(self._preloaded)
+
+    def flush_cache(self) -> int:
+        """
+        Write buffered decisions in one transaction and end the cache session.
+
+        Returns:
+            Number of decisions written
+        """
+        pending = list(self._pending_writes.values())
+        self._preloaded = None
+        self._pending_writes = {}
+
+        if not self._database or not pending:
+            return 0
+
+        try:
+            return self._database.upsert_llm_match_attempts(pending)
+        except Exception as e:
+            logger.warning(f"Failed to write LLM decision cache: {e}")
+            return 0
+
+    @staticmethod
+    def _pair_key(resource_name1: str, resource_name2: str) -> tuple[str, str]:
+        """Cache key for an unordered contact pair."""
+        if resource_name1 <= resource_name2:
+            return (resource_name1, resource_name2)
+        return (resource_name2, resource_name1)
+
+    def _attempt_row(
+        self,
+        contact1: "Contact",
+        contact2: "Contact",
+        decision: LLMMatchDecision,
+    ) -> dict[str, Any]:
+        """Build the llm_match_attempts row for a decision."""
+        return {
+            "contact1_resource_name": contact1.resource_name,
+            "contact2_resource_name": contact2.resource_name,
+            "contact1_display_name": contact1.display_name,
+            "contact2_display_name": contact2.display_name,
+            "contact1_content_hash": contact1.content_hash(),
+            "contact2_content_hash": contact2.content_hash(),
+            "is_match": decision.is_match,
+            "confidence": decision.confidence,
+            "reasoning": decision.reasoning,
+            "model_used": self.model,
+        }
+
     def _get_cached_decision(
         self, contact1: "Contact", contact2: "Contact"
     ) -> LLMMatchDecision | None:
@@ -340,7 +690,7 @@ Only include candidates that ARE matches. Empty array if no matches."""
 
         A cached decision is valid only if both contacts' content hashes
         match what was stored. If either contact has changed, the cache
-        is invalidated.
+        is invalidated. Served from memory when the cache was preloaded.
 
         Args:
             contact1: First contact
@@ -352,9 +702,14 @@ Only include candidates that ARE matches. Empty array if no matches."""
         if not self._database:
             return None
 
-        attempt = self._database.get_llm_match_attempt(
-            contact1.resource_name, contact2.resource_name
-        )
+        if self._preloaded is not None:
+            attempt = self._preloaded.get(
+                self._pair_key(contact1.resource_name, contact2.resource_name)
+            )
+        else:
+            attempt = self._database.get_llm_match_attempt(
+                contact1.resource_name, contact2.resource_name
+            )
         if not attempt:
             return None
 
@@ -396,21 +751,42 @@ Only include candidates that ARE matches. Empty array if no matches."""
             contact2: Second contact
             decision: The LLM match decision to cache
         """
-        if not self._database:
+        self._cache_decisions([(contact1, contact2, decision)])
+
+    def _cache_decisions(
+        self,
+        decisions: list[tuple["Contact", "Contact", LLMMatchDecision]],
+    ) -> None:
+        """
+        Store many LLM decisions in the database cache in one transaction.
+
+        While the cache is preloaded, decisions are kept in memory and
+        buffered for flush_cache() instead.
+
+        Args:
+            decisions: List of (contact1, contact2, decision) to cache
+        """
+        if not self._database or not decisions:
             return
 
         try:
-            self._database.upsert_llm_match_attempt(
-                contact1_resource_name=contact1.resource_name,
-                contact2_resource_name=contact2.resource_name,
-                contact1_display_name=contact1.display_name,
-                contact2_display_name=contact2.display_name,
-                contact1_content_hash=contact1.content_hash(),
-                contact2_content_hash=contact2.content_hash(),
-                is_match=decision.is_match,
-                confidence=decision.confidence,
-                reasoning=decision.reasoning,
-                model_used=self.model,
-            )
+            rows = [
+                self._attempt_row(contact1, contact2, decision)
+                for contact1, contact2, decision in decisions
+            ]
+
+            if self._preloaded is not None:
+                for row in rows:
+                    key = self._pair_key(
+                        row["contact1_resource_name"], row["contact2_resource_name"]
+                    )
+                    self._preloaded[key] = row
+                    self._pending_writes[key] = row
+                return
+
+            if len(rows) == 1:
+                self._database.upsert_llm_match_attempt(**rows[0])
+            else:
+                self._database.upsert_llm_match_attempts(rows)
         except Exception as e:
-            logger.warning(f"Failed to cache LLM decision: {e}")
+            logger.warning(f"Failed to cache LLM decisions: {e}")
@@ -18,12 +18,14 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from gcontact_sync.utils import normalize_string
 
 if TYPE_CHECKING:
     from gcontact_sync.storage.db import SyncDatabase
+    from gcontact_sync.sync.blocking import BlockingStats
     from gcontact_sync.sync.contact import Contact
     from gcontact_sync.sync.llm_matcher import LLMMatcher
 
@@ -71,6 +73,10 @@ DEFAULT_NAME_ONLY_THRESHOLD = 0.95
 DEFAULT_UNCERTAIN_THRESHOLD = 0.7
 DEFAULT_LLM_BATCH_SIZE = 20
 
+# Upper bound on similarity matrix cells scored per cdist call in match_many()
+# (rows are chunked so memory stays bounded for large unmatched sets)
+MATCH_MANY_MAX_CELLS = 4_000_000
+
 # Minimum phone number length for valid matching
 # Phone numbers with fewer digits are likely invalid or could cause false matches
 # 7 digits = minimum for local numbers (e.g., 555-1234)
@@ -100,12 +106,32 @@ class MatchConfig:
     # Whether to use organization as a secondary matching signal
     use_organization_matching: bool = True
 
+    # Only compare contacts whose names reach uncertain_threshold or that share
+    # an email or phone suffix, instead of every cross-account pair
+    use_candidate_blocking: bool = True
+
     # LLM API configuration
     anthropic_api_key: str | None = None
     llm_model: str = "claude-haiku-4-5-20250514"
     llm_max_tokens: int = 500
     llm_batch_max_tokens: int = 2000
 
+    # Concurrent batch adjudication of uncertain pairs
+    llm_max_concurrency: int = 4
+    llm_requests_per_minute: int = 50
+    llm_tokens_per_minute: int = 40000
+
+
+@dataclass
+class _MatchFeatures:
+    """Normalized matching fields of a contact, computed once per contact."""
+
+    display_name: str
+    name: str
+    emails: set[str]
+    phones: set[str]
+    organizations: set[str]
+
 
 class ContactMatcher:
     """
@@ -177,12 +203,135 @@ class ContactMatcher:
         if result.is_match:
             return result
 
-        # Check if we should escalate to LLM
+        return self._escalate_uncertain(contact1, contact2, result)
+
+    def match_many(
+        self,
+        contacts1: list["Contact"],
+        contacts2: list["Contact"],
+        stats: Optional["BlockingStats"] = None,
+    ) -> list[list[tuple[int, MatchResult]]]:
+        """
+        Score every contact in one list against every contact in another.
+
+        Equivalent to calling the Tier 1 and Tier 2 checks of match() for each
+        pair, but each contact is normalized once and name similarity is
+        computed for the whole cross product with rapidfuzz.process.cdist
+        (multi-threaded, in C). Only pairs that share an email or phone, or
+        whose names reach uncertain_threshold, are scored in full; all other
+        pairs are guaranteed non-matches.
+
+        Tier 3 (LLM) is not run here. Callers decide which uncertain pairs to
+        escalate, e.g. with _escalate_uncertain().
+
+        Args:
+            contacts1: Contacts from the first account
+            contacts2: Contacts from the second account
+            stats: Optional BlockingStats to accumulate pairs considered/pruned
+
+        Returns:
+            For each contact in contacts1, a list of (index into contacts2,
+            MatchResult) for the pairs that matched or are uncertain, ordered
+            by index into contacts2
+        """
+        from gcontact_sync.sync.blocking import CandidateBlocker
+
+        features1 = [self._match_features(c) for c in contacts1]
+        features2 = [self._match_features(c) for c in contacts2]
+
+        if self.config.use_candidate_blocking:
+            candidates = self._name_candidates(features1, features2)
+
+            # Shared identifiers match regardless of name similarity
+            blocker = CandidateBlocker(self)
+            blocker.index(contacts2)
+            for i, contact1 in enumerate(contacts1):
+                candidates[i].update(blocker.candidates(contact1))
+        else:
+            candidates = [set(range(len(contacts2))) for _ in contacts1]
+
+        results: list[list[tuple[int, MatchResult]]] = []
+        for i, row in enumerate(candidates):
+            if stats is not None:
+                stats.pairs_considered += len(row)
+                stats.pairs_pruned += len(contacts2) - len(row)
+
+            row_results = []
+            for j in sorted(row):
+                result = self._tier1_from_features(features1[i], features2[j])
+                if not result.is_match:
+                    result = self._tier2_from_features(features1[i], features2[j])
+                if result.is_match or result.confidence == MatchConfidence.UNCERTAIN:
+                    row_results.append((j, result))
+            results.append(row_results)
+
+        return results
+
+    def _name_candidates(
+        self,
+        features1: list[_MatchFeatures],
+        features2: list[_MatchFeatures],
+    ) -> list[set[int]]:
+        """
+        Find pairs whose name similarity reaches the uncertain threshold.
+
+        Computes the name-similarity matrix with rapidfuzz.process.cdist in
+        row chunks of at most MATCH_MANY_MAX_CELLS cells.
+
+        Args:
+            features1: Normalized features of the first account's contacts
+            features2: Normalized features of the second account's contacts
+
+        Returns:
+            For each entry in features1, the set of candidate indices into
+            features2
+        """
+        candidates: list[set[int]] = [set() for _ in features1]
+        if not features1 or not features2:
+            return candidates
+
+        names1 = [f.name for f in features1]
+        names2 = [f.name for f in features2]
+
+        # WRatio is never lower than ratio, so it bounds the Tier 2 similarity.
+        # The cutoff is lowered slightly so float rounding never drops a pair
+        # that the exact per-pair score would keep.
+        cutoff = max(self.config.uncertain_threshold * 100 - 0.01, 0.0)
+        chunk = max(1, MATCH_MANY_MAX_CELLS // len(names2))
+
+        for start in range(0, len(names1), chunk):
+            scores = process.cdist(
+                names1[start : start + chunk],
+                names2,
+                scorer=fuzz.WRatio,
+                score_cutoff=cutoff,
+                workers=-1,
+            )
+            rows, cols = np.nonzero(scores >= cutoff)
+            for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+                candidates[start + row].add(col)
+
+        return candidates
+
+    def _escalate_uncertain(
+        self, contact1: "Contact", contact2: "Contact", result: MatchResult
+    ) -> MatchResult:
+        """
+        Escalate an uncertain Tier 1/2 result to the LLM if enabled.
+
+        Args:
+            contact1: First contact
+            contact2: Second contact
+            result: Result of the deterministic and fuzzy tiers
+
+        Returns:
+            The Tier 3 result if escalated, otherwise the given result
+        """
         if (
-            result.confidence == MatchConfidence.UNCERTAIN
+            not result.is_match
+            and result.confidence == MatchConfidence.UNCERTAIN
             and self.config.use_llm_matching
         ):
-            # Tier 3: LLM matching (to be implemented)
             return self._tier3_llm_match(contact1, contact2)
 
         return result
@@ -221,6 +370,39 @@ class ContactMatcher:
 
         return matches
 
+    def _match_features(self, contact: "Contact") -> _MatchFeatures:
+        """
+        Normalize the fields of a contact used by Tier 1 and Tier 2 matching.
+
+        Args:
+            contact: Contact to normalize
+
+        Returns:
+            _MatchFeatures with normalized name, emails, valid phones and
+            organizations
+        """
+        phones = set()
+        for phone in contact.phones:
+            if phone:
+                normalized = self._normalize_phone(phone)
+                # Filter out invalid phones (empty or too short)
+                if self._is_valid_phone(normalized):
+                    phones.add(normalized)
+
+        organizations = {
+            self._normalize_organization(o) for o in contact.organizations if o
+        }
+        # Remove empty strings from normalization
+        organizations.discard("")
+
+        return _MatchFeatures(
+            display_name=contact.display_name,
+            name=self._normalize_name(contact.display_name),
+            emails={self._normalize_email(e) for e in contact.emails if e},
+            phones=phones,
+            organizations=organizations,
+        )
+
     def _tier1_deterministic_match(
         self, contact1: "Contact", contact2: "Contact"
     ) -> MatchResult:
@@ -230,12 +412,16 @@ class ContactMatcher:
         Matches if contacts share any email, phone number, or have identical names
         (normalized, case-insensitive).
         """
-        # Normalize emails for comparison
-        emails1 = {self._normalize_email(e) for e in contact1.emails if e}
-        emails2 = {self._normalize_email(e) for e in contact2.emails if e}
+        return self._tier1_from_features(
+            self._match_features(contact1), self._match_features(contact2)
+        )
 
+    def _tier1_from_features(
+        self, features1: _MatchFeatures, features2: _MatchFeatures
+    ) -> MatchResult:
+        """Tier 1 matching on already-normalized contact features."""
         # Check for shared email
-        shared_emails = emails1 & emails2
+        shared_emails = features1.emails & features2.emails
         if shared_emails:
             return MatchResult(
                 is_match=True,
@@ -246,20 +432,8 @@ class ContactMatcher:
                 matched_on=list(shared_emails),
             )
 
-        # Normalize phones for comparison, filtering out invalid ones
-        phones1 = {
-            self._normalize_phone(p)
-            for p in contact1.phones
-            if p and self._is_valid_phone(self._normalize_phone(p))
-        }
-        phones2 = {
-            self._normalize_phone(p)
-            for p in contact2.phones
-            if p and self._is_valid_phone(self._normalize_phone(p))
-        }
-
-        # Check for shared phone (only valid phones remain in the sets)
-        shared_phones = phones1 & phones2
+        # Check for shared phone (only valid phones are in the sets)
+        shared_phones = features1.phones & features2.phones
         if shared_phones:
             return MatchResult(
                 is_match=True,
@@ -271,8 +445,8 @@ class ContactMatcher:
             )
 
         # Check for exact name match (normalized, case-insensitive)
-        name1 = self._normalize_name(contact1.display_name)
-        name2 = self._normalize_name(contact2.display_name)
+        name1 = features1.name
+        name2 = features2.name
 
         if name1 and name2 and name1 == name2:
             return MatchResult(
@@ -280,7 +454,7 @@ class ContactMatcher:
                 tier=MatchTier.EXACT_NAME,
                 confidence=MatchConfidence.HIGH,
                 score=1.0,
-                reason=f"Exact name match: {contact1.display_name}",
+                reason=f"Exact name match: {features1.display_name}",
                 matched_on=["name"],
             )
 
@@ -302,9 +476,17 @@ class ContactMatcher:
         Matches if names are similar (≥85%) AND they share at least one email or phone.
         Note: Exact name matches are handled in Tier 1.
         """
+        return self._tier2_from_features(
+            self._match_features(contact1), self._match_features(contact2)
+        )
+
+    def _tier2_from_features(
+        self, features1: _MatchFeatures, features2: _MatchFeatures
+    ) -> MatchResult:
+        """Tier 2 matching on already-normalized contact features."""
         # Calculate name similarity
-        name1 = self._normalize_name(contact1.display_name)
-        name2 = self._normalize_name(contact2.display_name)
+        name1 = features1.name
+        name2 = features2.name
 
         if not name1 or not name2:
             return MatchResult(
@@ -323,21 +505,12 @@ class ContactMatcher:
         similarity = max(name_score, jaro_score)
 
         # Check for shared identifiers
-        emails1 = {self._normalize_email(e) for e in contact1.emails if e}
-        emails2 = {self._normalize_email(e) for e in contact2.emails if e}
+        emails1 = features1.emails
+        emails2 = features2.emails
         shared_emails = emails1 & emails2
 
-        # Filter out invalid phones (empty or too short)
-        phones1 = {
-            self._normalize_phone(p)
-            for p in contact1.phones
-            if p and self._is_valid_phone(self._normalize_phone(p))
-        }
-        phones2 = {
-            self._normalize_phone(p)
-            for p in contact2.phones
-            if p and self._is_valid_phone(self._normalize_phone(p))
-        }
+        phones1 = features1.phones
+        phones2 = features2.phones
         shared_phones = phones1 & phones2
 
         # Fuzzy name + shared email
@@ -373,16 +546,7 @@ class ContactMatcher:
             self.config.use_organization_matching
             and similarity >= self.config.name_similarity_threshold
         ):
-            orgs1 = {
-                self._normalize_organization(o) for o in contact1.organizations if o
-            }
-            orgs2 = {
-                self._normalize_organization(o) for o in contact2.organizations if o
-            }
-            # Remove empty strings from normalization
-            orgs1.discard("")
-            orgs2.discard("")
-            shared_orgs = orgs1 & orgs2
+            shared_orgs = features1.organizations & features2.organizations
 
             if shared_orgs:
                 return MatchResult(
@@ -445,12 +609,12 @@ class ContactMatcher:
             reason=f"Different names ({similarity:.0%})",
         )
 
-    def _tier3_llm_match(self, contact1: "Contact", contact2: "Contact") -> MatchResult:
+    def _get_llm_client(self) -> tuple[Optional["LLMMatcher"], Exception | None]:
         """
-        Tier 3: LLM-assisted matching for uncertain cases.
+        Lazily create the LLM matcher.
 
-        Uses an LLM to analyze contacts and determine if they're the same person.
-        LLM decisions are cached in the database if one is configured.
+        Returns:
+            Tuple of (LLMMatcher or None, initialization error or None)
         """
         from gcontact_sync.sync.llm_matcher import LLMMatcher
 
@@ -462,19 +626,139 @@ class ContactMatcher:
                     model=self.config.llm_model,
                     max_tokens=self.config.llm_max_tokens,
                     batch_max_tokens=self.config.llm_batch_max_tokens,
+                    max_concurrency=self.config.llm_max_concurrency,
+                    requests_per_minute=self.config.llm_requests_per_minute,
+                    tokens_per_minute=self.config.llm_tokens_per_minute,
                 )
             except Exception as e:
                 logger.warning(f"Could not initialize LLM matcher: {e}")
-                return MatchResult(
-                    is_match=False,
-                    tier=MatchTier.NO_MATCH,
-                    confidence=MatchConfidence.UNCERTAIN,
-                    score=0.5,
-                    reason=f"LLM matching unavailable: {e}",
-                )
+                return None, e
+
+        return self._llm_client, None
+
+    def preload_llm_cache(self) -> int:
+        """
+        Load the LLM decision cache into memory for a sync session.
+
+        Does nothing if LLM matching is disabled or no database is configured.
+
+        Returns:
+            Number of cached decisions loaded
+        """
+        if not self.config.use_llm_matching or self._database is None:
+            return 0
+
+        llm_client, _ = self._get_llm_client()
+        if llm_client is None:
+            return 0
+        return llm_client.preload_cache()
+
+    def flush_llm_cache(self) -> int:
+        """
+        Write LLM decisions made during the session and end the session.
+
+        Returns:
+            Number of decisions written
+        """
+        if self._llm_client is None:
+            return 0
+        return self._llm_client.flush_cache()
+
+    def llm_match_many(
+        self, groups: list[tuple["Contact", list["Contact"]]]
+    ) -> list[list[MatchResult]]:
+        """
+        Tier 3 for many uncertain pairs at once.
+
+        Groups uncertain candidates by source contact and adjudicates them
+        with concurrent LLM batch requests (see LLMMatcher.match_batches()),
+        instead of one synchronous request per pair.
+
+        Args:
+            groups: List of (source contact, uncertain candidate contacts)
+
+        Returns:
+            MatchResults aligned with each group's candidate list. If LLM
+            matching is disabled or unavailable, every result is an
+            uncertain non-match.
+        """
+        llm_client = None
+        error: Exception | None = None
+        if self.config.use_llm_matching:
+            llm_client, error = self._get_llm_client()
+
+        if llm_client is None:
+            reason = (
+                f"LLM matching unavailable: {error}"
+                if error
+                else "LLM matching disabled"
+            )
+            return [
+                [
+                    MatchResult(
+                        is_match=False,
+                        tier=MatchTier.NO_MATCH,
+                        confidence=MatchConfidence.UNCERTAIN,
+                        score=0.5,
+                        reason=reason,
+                    )
+                    for _ in candidates
+                ]
+                for _, candidates in groups
+            ]
+
+        batch_decisions = llm_client.match_batches(
+            groups, batch_size=self.config.llm_batch_size
+        )
+
+        results = []
+        for decisions in batch_decisions:
+            row = []
+            for decision in decisions:
+                if decision.is_match:
+                    row.append(
+                        MatchResult(
+                            is_match=True,
+                            tier=MatchTier.LLM_MATCHED,
+                            confidence=MatchConfidence.LOW,
+                            score=decision.confidence,
+                            reason=f"LLM batch match: {decision.reasoning}",
+                            matched_on=["llm_analysis"],
+                        )
+                    )
+                else:
+                    row.append(
+                        MatchResult(
+                            is_match=False,
+                            tier=MatchTier.LLM_NOT_MATCHED,
+                            confidence=MatchConfidence.LOW,
+                            score=decision.confidence,
+                            reason=f"LLM no match: {decision.reasoning}",
+                        )
+                    )
+            results.append(row)
+
+        return results
+
+    def _tier3_llm_match(self, contact1: "Contact", contact2: "Contact") -> MatchResult:
+        """
+        Tier 3: LLM-assisted matching for uncertain cases.
+
+        Uses an LLM to analyze contacts and determine if they're the same person.
+        LLM decisions are cached in the database if one is configured.
+        """
+        llm_client, error = self._get_llm_client()
+        if llm_client is None:
+            return MatchResult(
+                is_match=False,
+                tier=MatchTier.NO_MATCH,
+                confidence=MatchConfidence.UNCERTAIN,
+                score=0.5,
+                reason=f"LLM matching unavailable: {error}",
+            )
 
         try:
-            decision = self._llm_client.match_pair(contact1, contact2)
+            decision = llm_client.match_pair(contact1, contact2)
 
             if decision.is_match:
                 return MatchResult(
@@ -522,24 +806,13 @@ class ContactMatcher:
         if not uncertain_pairs:
             return []
 
-        from gcontact_sync.sync.llm_matcher import LLMMatcher
-
-        if self._llm_client is None:
-            try:
-                self._llm_client = LLMMatcher(
-                    api_key=self.config.anthropic_api_key,
-                    database=self._database,
-                    model=self.config.llm_model,
-                    max_tokens=self.config.llm_max_tokens,
-                    batch_max_tokens=self.config.llm_batch_max_tokens,
-                )
-            except Exception as e:
-                logger.warning(f"Could not initialize LLM matcher: {e}")
-                return []
+        llm_client, _ = self._get_llm_client()
+        if llm_client is None:
+            return []
 
         try:
             candidates = [pair[0] for pair in uncertain_pairs]
-            llm_results = self._llm_client.match_batch(contact, candidates)
+            llm_results = llm_client.match_batch(contact, candidates)
 
             matches = []
             for matched_contact, decision in llm_results:
@@ -3,6 +3,7 @@ Photo download and processing for Google Contacts synchronization.
 
 Provides utilities for:
 - Downloading contact photos from URLs
+- Pooled keep-alive HTTP sessions and conditional (ETag) downloads
 - Image format validation and conversion
 - Size optimization to meet Google API requirements
 - Retry logic for network failures
@@ -11,10 +12,14 @@ Provides utilities for:
 import io
 import logging
 import time
+from dataclasses import dataclass
+from typing import Any
 
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 # Retry configuration
 MAX_RETRIES = 5
@@ -24,6 +29,12 @@ MAX_RETRY_DELAY = 60.0  # seconds
 # HTTP timeout configuration
 DOWNLOAD_TIMEOUT = 30.0  # seconds
 
+# HTTP session configuration
+DEFAULT_POOL_MAXSIZE = 10  # keep-alive connections per host
+DEFAULT_CONNECT_RETRIES = 2  # transport-level retries for failed connections
+
+USER_AGENT = "gcontact-sync/0.1.0"
+
 # Photo processing configuration
 MAX_PHOTO_SIZE = 5 * 1024 * 1024  # 5MB - Google API limit
 MAX_PHOTO_DIMENSION = 2048  # pixels - reasonable max dimension
@@ -44,8 +55,65 @@ class PhotoDownloadError(PhotoError):
     pass
 
 
+@dataclass
+class PhotoDownload:
+    """
+    Result of a conditional photo download.
+
+    Attributes:
+        data: Photo bytes, or None if the photo was not modified
+        etag: ETag of the photo as returned by the server, if any
+        not_modified: Whether the server answered 304 Not Modified
+    """
+
+    data: bytes | None
+    etag: str | None = None
+    not_modified: bool = False
+
+
+def create_photo_session(
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    connect_retries: int = DEFAULT_CONNECT_RETRIES,
+) -> requests.Session:
+    """
+    Create an HTTP session for photo downloads.
+
+    Connections are kept alive and pooled per host, so downloading many
+    photos from the same host reuses TCP and TLS connections instead of
+    opening a new one per photo. Failed connection attempts are retried by
+    the transport; HTTP errors and timeouts are left to download_photo().
+
+    Args:
+        pool_maxsize: Maximum pooled connections per host (default: 10)
+        connect_retries: Retries for failed connection attempts (default: 2)
+
+    Returns:
+        Configured requests.Session. Close it when no longer needed.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=connect_retries,
+            connect=connect_retries,
+            read=0,
+            status=0,
+            redirect=None,
+            backoff_factor=0.2,
+        ),
+    )
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def download_photo(
-    url: str, max_retries: int = MAX_RETRIES, timeout: float = DOWNLOAD_TIMEOUT
+    url: str,
+    max_retries: int = MAX_RETRIES,
+    timeout: float = DOWNLOAD_TIMEOUT,
+    session: requests.Session | None = None,
 ) -> bytes:
     """
     Download a photo from a URL with retry logic.
@@ -54,6 +122,7 @@ def download_photo(
         url: URL of the photo to download
         max_retries: Maximum number of retry attempts (default: 5)
         timeout: Request timeout in seconds (default: 30)
+        session: Optional pooled session from create_photo_session()
 
     Returns:
         Photo data as bytes
@@ -67,6 +136,42 @@ def download_photo(
         >>> len(photo_data) > 0
         True
     """
+    download = download_photo_if_modified(
+        url, max_retries=max_retries, timeout=timeout, session=session
+    )
+    if download.data is None:
+        # Only possible for conditional requests, which this isn't
+        raise PhotoDownloadError(f"No photo data returned from {url}")
+    return download.data
+
+
+def download_photo_if_modified(
+    url: str,
+    etag: str | None = None,
+    max_retries: int = MAX_RETRIES,
+    timeout: float = DOWNLOAD_TIMEOUT,
+    session: requests.Session | None = None,
+) -> PhotoDownload:
+    """
+    Download a photo unless it still matches a previously seen ETag.
+
+    With an etag the request carries If-None-Match, and a 304 Not Modified
+    response (which has no body) is returned as not_modified.
+
+    Args:
+        url: URL of the photo to download
+        etag: ETag from an earlier download of the same URL, if any
+        max_retries: Maximum number of retry attempts (default: 5)
+        timeout: Request timeout in seconds (default: 30)
+        session: Optional pooled session from create_photo_session()
+
+    Returns:
+        PhotoDownload with the photo data and its ETag, or not_modified set
+
+    Raises:
+        PhotoDownloadError: If download fails after all retries
+        PhotoError: For invalid input or other errors
+    """
     if not url:
         raise PhotoError("Photo URL cannot be empty")
 
@@ -81,11 +186,15 @@ def download_photo(
                 f"Downloading photo from {url} (attempt {attempt + 1}/{max_retries})"
             )
 
-            response = requests.get(
-                url,
-                timeout=timeout,
-                headers={"User-Agent": "gcontact-sync/0.1.0"},
-            )
+            headers = {"User-Agent": USER_AGENT}
+            if etag:
+                headers["If-None-Match"] = etag
+            get: Any = session.get if session is not None else requests.get
+            response = get(url, timeout=timeout, headers=headers)
+
+            if etag and response.status_code == 304:
+                logger.debug(f"Photo not modified: {url}")
+                return PhotoDownload(data=None, etag=etag, not_modified=True)
 
             # Check for HTTP errors
             response.raise_for_status()
@@ -106,7 +215,9 @@ def download_photo(
                 f"from {url}"
             )
 
-            return response.content
+            return PhotoDownload(
+                data=response.content, etag=response.headers.get("etag")
+            )
 
         except requests.HTTPError as e:
             status_code = e.response.status_code if e.response else None
@@ -0,0 +1,363 @@
+"""
+On-disk cache of processed contact photos.
+
+Processed photos (JPEG, ready for upload) are stored by content hash under a
+cache directory, and looked up by the source photo's URL and etag. Unchanged
+photos, and the same image shared by several contacts, are then downloaded
+and processed only once.
+
+Each entry also remembers the HTTP ETag the photo was served with and when
+it was last confirmed current, so a stale entry can be revalidated with a
+conditional request instead of downloaded again.
+
+The cache has a size cap; when it is exceeded the least recently used
+entries are evicted. Its index is kept in memory and written back by save().
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Default size cap for stored photos
+DEFAULT_PHOTO_CACHE_MAX_BYTES = 100 * 1024 * 1024  # 100MB
+
+# Index file inside the cache directory
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 2
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProcessedPhoto:
+    """
+    A processed photo ready for upload.
+
+    Attributes:
+        data: JPEG bytes
+        sha256: Hex SHA-256 of data
+        http_etag: ETag the source photo was served with, if known
+        validated_at: When the source photo was last confirmed unchanged
+            (seconds since the epoch; 0 if never cached)
+    """
+
+    data: bytes
+    sha256: str
+    http_etag: str | None = None
+    validated_at: float = 0.0
+
+    @classmethod
+    def from_data(cls, data: bytes) -> "ProcessedPhoto":
+        """Wrap processed photo bytes, computing their hash."""
+        return cls(data=data, sha256=hashlib.sha256(data).hexdigest())
+
+
+@dataclass
+class _CacheEntry:
+    """Index entry for one source photo."""
+
+    sha256: str
+    http_etag: str | None
+    validated_at: float
+
+
+class PhotoCache:
+    """
+    LRU cache of processed photos keyed by source URL and etag.
+
+    Entries point at content-addressed blob files, so the same image reached
+    through different URLs is stored once. All methods are thread-safe.
+
+    Usage:
+        cache = PhotoCache(config_dir / "photo_cache")
+        photo = cache.get(url, etag)
+        if photo is None:
+            photo = cache.put(url, etag, process_photo(download_photo(url)))
+        cache.save()
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_PHOTO_CACHE_MAX_BYTES):
+        """
+        Initialize the cache, loading its index if present.
+
+        Args:
+            cache_dir: Directory holding the index and photo files
+            max_bytes: Maximum total size of stored photos
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # Cache key -> entry, least recently used first
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Blob hash -> size in bytes
+        self._blobs: dict[str, int] = {}
+        # Blob hash -> number of entries pointing at it
+        self._refs: dict[str, int] = {}
+        self._total_bytes = 0
+
+        self._load_index()
+
+    @staticmethod
+    def _key(url: str, etag: str | None) -> str:
+        """Build the cache key for a source photo."""
+        return f"{etag or ''} {url}"
+
+    def _blob_path(self, photo_hash: str) -> Path:
+        return self.cache_dir / f"{photo_hash}.jpg"
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of stored photos."""
+        with self._lock:
+            return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def get(self, url: str, etag: str | None = None) -> ProcessedPhoto | None:
+        """
+        Get the processed photo for a source photo.
+
+        Args:
+            url: Source photo URL
+            etag: Source photo etag, if known
+
+        Returns:
+            ProcessedPhoto, or None if not cached (or its file is missing or
+            corrupt)
+        """
+        key = self._key(url, etag)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self._dirty = True
+
+        photo_hash = entry.sha256
+        try:
+            data = self._blob_path(photo_hash).read_bytes()
+        except OSError:
+            data = b""
+
+        if hashlib.sha256(data).hexdigest() != photo_hash:
+            logger.debug(f"Dropping unreadable cached photo for {url}")
+            with self._lock:
+                self._drop_blob(photo_hash)
+            return None
+
+        return ProcessedPhoto(
+            data=data,
+            sha256=photo_hash,
+            http_etag=entry.http_etag,
+            validated_at=entry.validated_at,
+        )
+
+    def get_hash(self, url: str, etag: str | None = None) -> str | None:
+        """
+        Get the hash of the processed photo for a source photo.
+
+        Args:
+            url: Source photo URL
+            etag: Source photo etag, if known
+
+        Returns:
+            Hex SHA-256 of the processed photo, or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(url, etag))
+            return entry.sha256 if entry else None
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def put(
+        self,
+        url: str,
+        etag: str | None,
+        data: bytes,
+        http_etag: str | None = None,
+    ) -> ProcessedPhoto:
+        """
+        Store a processed photo for a source photo.
+
+        Evicts least recently used entries if the cache grows over its cap.
+        Failing to write the photo file is logged, not raised.
+
+        Args:
+            url: Source photo URL
+            etag: Source photo etag, if known
+            data: Processed JPEG bytes
+            http_etag: ETag the source photo was served with, if any
+
+        Returns:
+            ProcessedPhoto for data
+        """
+        photo = ProcessedPhoto.from_data(data)
+        photo.http_etag = http_etag
+        photo.validated_at = time.time()
+        if len(data) > self.max_bytes:
+            return photo
+
+        key = self._key(url, etag)
+        with self._lock:
+            stored = photo.sha256 in self._blobs
+
+        if not stored:
+            try:
+                self._write_blob(photo)
+            except OSError as e:
+                logger.warning(f"Failed to cache photo for {url}: {e}")
+                return photo
+
+        with self._lock:
+            if photo.sha256 not in self._blobs:
+                self._blobs[photo.sha256] = len(data)
+                self._total_bytes += len(data)
+            self._refs[photo.sha256] = self._refs.get(photo.sha256, 0) + 1
+            previous = self._entries.pop(key, None)
+            self._entries[key] = _CacheEntry(
+                photo.sha256, http_etag, photo.validated_at
+            )
+            if previous is not None:
+                self._release(previous.sha256)
+            self._dirty = True
+            self._evict()
+
+        return photo
+
+    def mark_validated(self, url: str, etag: str | None = None) -> None:
+        """
+        Record that a cached source photo was confirmed unchanged.
+
+        Args:
+            url: Source photo URL
+            etag: Source photo etag, if known
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(url, etag))
+            if entry is not None:
+                entry.validated_at = time.time()
+                self._dirty = True
+
+    def _write_blob(self, photo: ProcessedPhoto) -> None:
+        """Write a photo file atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._blob_path(photo.sha256)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(photo.data)
+        os.replace(tmp_path, path)
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until under the cap (lock held)."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._release(entry.sha256)
+            self._dirty = True
+
+    def _release(self, photo_hash: str) -> None:
+        """Drop one entry's reference to a photo file (lock held)."""
+        refs = self._refs.get(photo_hash, 0) - 1
+        if refs > 0:
+            self._refs[photo_hash] = refs
+            return
+        self._refs.pop(photo_hash, None)
+        self._total_bytes -= self._blobs.pop(photo_hash, 0)
+        self._blob_path(photo_hash).unlink(missing_ok=True)
+
+    def _drop_blob(self, photo_hash: str) -> None:
+        """Remove a photo file and every entry pointing at it (lock held)."""
+        for key in [k for k, e in self._entries.items() if e.sha256 == photo_hash]:
+            del self._entries[key]
+        self._refs.pop(photo_hash, None)
+        self._total_bytes -= self._blobs.pop(photo_hash, 0)
+        self._blob_path(photo_hash).unlink(missing_ok=True)
+        self._dirty = True
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _load_index(self) -> None:
+        """Load the index written by a previous save(), if any."""
+        index_path = self.cache_dir / INDEX_FILENAME
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index: dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable photo cache index: {e}")
+            return
+
+        blobs: dict[str, int] = {}
+        entries: list[tuple[str, _CacheEntry]] = []
+        try:
+            # Index from another version: start over, removing its files
+            if index.get("version") == INDEX_VERSION:
+                blobs = {str(h): int(size) for h, size in index["blobs"].items()}
+                entries = [
+                    (str(key), _CacheEntry(str(h), http_etag, float(validated_at)))
+                    for key, h, http_etag, validated_at in index["entries"]
+                ]
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed photo cache index: {e}")
+            return
+
+        for key, entry in entries:
+            if entry.sha256 in blobs:
+                self._entries[key] = entry
+                self._refs[entry.sha256] = self._refs.get(entry.sha256, 0) + 1
+        self._blobs = {h: size for h, size in blobs.items() if h in self._refs}
+        self._total_bytes = sum(self._blobs.values())
+
+        # Remove photo files no entry points at, e.g. written after the index
+        # was last saved
+        for path in self.cache_dir.glob("*.jpg"):
+            if path.stem not in self._blobs:
+                path.unlink(missing_ok=True)
+
+    def save(self) -> None:
+        """
+        Write the index to disk if it has changed.
+
+        Failing to write the index is logged, not raised.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            index = {
+                "version": INDEX_VERSION,
+                "saved_at": time.time(),
+                "entries": [
+                    [key, e.sha256, e.http_etag, e.validated_at]
+                    for key, e in self._entries.items()
+                ],
+                "blobs": dict(self._blobs),
+            }
+            self._dirty = False
+
+        index_path = self.cache_dir / INDEX_FILENAME
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.warning(f"Failed to save photo cache index: {e}")
@@ -0,0 +1,579 @@
+"""
+Concurrent photo transfer pipeline for Google Contacts synchronization.
+
+Moves contact photos from a source account to a destination account through
+three bounded stages, each with its own thread pool:
+- Download: fetch the source photo (network bound)
+- Process: validate, convert and resize with Pillow (CPU bound)
+- Upload: write the photo to the destination contact (rate limited)
+
+Contacts whose source has no photo go straight to the upload stage, where the
+destination photo is deleted. A photo moves to the next stage as soon as its
+current stage finishes, so downloads, processing and uploads of different
+photos overlap instead of running one contact at a time. Photos that are
+ready while an upload is in progress are sent together in the next batch
+HTTP request.
+
+With a PhotoCache, photos already processed on an earlier run skip the
+download and processing stages, and uploads are skipped when the destination
+already holds a photo with the same processed hash. Cached photos older than
+revalidate_after are checked with a conditional request, which returns 304
+without a body when the photo is unchanged.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from gcontact_sync.api.people_api import PeopleAPI, PeopleAPIError
+from gcontact_sync.sync.contact import Contact
+from gcontact_sync.sync.photo import (
+    PhotoDownload,
+    PhotoError,
+    download_photo_if_modified,
+    process_photo,
+)
+from gcontact_sync.sync.photo_cache import PhotoCache, ProcessedPhoto
+
+# Stage sizes
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_PROCESS_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Upload stage rate limit (upload and delete requests per second, 0 = unlimited)
+DEFAULT_UPLOADS_PER_SECOND = 10.0
+
+# Photos uploaded or deleted per batch HTTP request (1 = one request each)
+DEFAULT_UPLOAD_BATCH_SIZE = 20
+
+# Maximum photos in the pipeline at once (bounds memory held by photo data)
+DEFAULT_MAX_IN_FLIGHT = 32
+
+# Age after which a cached photo is revalidated with a conditional request
+DEFAULT_REVALIDATE_AFTER = 7 * 24 * 3600.0  # seconds
+
+logger = logging.getLogger(__name__)
+
+# Callback completing a task with its result
+_Finish = Callable[["PhotoResult"], None]
+
+
+@dataclass
+class PhotoTask:
+    """
+    A photo transfer for one contact.
+
+    Attributes:
+        source_contact: Contact with the winning photo data (from source account)
+        dest_resource_name: Resource name of the contact in the destination
+        dest_api: PeopleAPI instance for the destination account
+        account_label: Label for the destination account (for logging)
+        dest_photo_url: URL of the destination contact's current photo, if
+            known. Lets the upload be skipped when it is the same image.
+    """
+
+    source_contact: Contact
+    dest_resource_name: str
+    dest_api: PeopleAPI
+    account_label: str
+    dest_photo_url: str | None = None
+
+
+@dataclass
+class PhotoResult:
+    """
+    Outcome of a photo transfer.
+
+    Attributes:
+        task: The transfer this result is for
+        succeeded: Whether the photo was uploaded (or deleted when the source
+            has no photo)
+        error: Error message if the transfer failed
+    """
+
+    task: PhotoTask
+    succeeded: bool
+    error: str | None = None
+
+
+class _RateLimiter:
+    """Spaces calls evenly so that at most `rate` start per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller's slot comes up."""
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass
+class _Upload:
+    """A photo waiting in the upload stage."""
+
+    task: PhotoTask
+    photo: ProcessedPhoto | None  # None: delete the destination photo
+    finish: _Finish
+
+
+class _UploadQueue:
+    """
+    Upload stage: worker threads sending queued uploads and deletes.
+
+    Each worker takes everything queued, up to batch_size photos, so photos
+    that become ready while a request is in progress share the next one.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[_Upload]], None],
+        workers: int,
+        batch_size: int,
+    ):
+        self._send = send
+        self._batch_size = batch_size
+        self._queue: queue.Queue[_Upload | None] = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"photo-upload_{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, upload: _Upload) -> None:
+        """Queue a photo for upload (or deletion)."""
+        self._queue.put(upload)
+
+    def close(self) -> None:
+        """Stop the workers once the queue is empty, and wait for them."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        while True:
+            upload = self._queue.get()
+            if upload is None:
+                return
+
+            batch = [upload]
+            while len(batch) < self._batch_size:
+                try:
+                    upload = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if upload is None:
+                    # Leave the stop signal for after this batch
+                    self._queue.put(None)
+                    break
+                batch.append(upload)
+
+            self._send(batch)
+
+
+class PhotoPipeline:
+    """
+    Transfers photos for many contacts concurrently.
+
+    Usage:
+        pipeline = PhotoPipeline()
+        results = pipeline.run(tasks)
+        failed = [r for r in results if not r.succeeded]
+    """
+
+    def __init__(
+        self,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        process_workers: int = DEFAULT_PROCESS_WORKERS,
+        upload_workers: int = DEFAULT_UPLOAD_WORKERS,
+        uploads_per_second: float = DEFAULT_UPLOADS_PER_SECOND,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        upload_batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+        cache: PhotoCache | None = None,
+        session: requests.Session | None = None,
+        revalidate_after: float = DEFAULT_REVALIDATE_AFTER,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            download_workers: Threads downloading source photos
+            process_workers: Threads processing photos with Pillow
+            upload_workers: Threads uploading or deleting destination photos
+            uploads_per_second: Maximum upload and delete requests started per
+                second across all upload threads, a batch request counting
+                once (0 = unlimited)
+            max_in_flight: Maximum photos between download and upload at once
+            upload_batch_size: Maximum photos uploaded or deleted per batch
+                HTTP request (1 = one request per photo)
+            cache: Optional cache of processed photos, saved after each run
+            session: Optional pooled HTTP session for downloads (see
+                create_photo_session); shared by all download threads
+            revalidate_after: Seconds after which a cached photo is checked
+                with a conditional request before being reused
+        """
+        self.download_workers = max(1, download_workers)
+        self.process_workers = max(1, process_workers)
+        self.upload_workers = max(1, upload_workers)
+        self.uploads_per_second = uploads_per_second
+        self.max_in_flight = max(1, max_in_flight)
+        self.upload_batch_size = max(1, upload_batch_size)
+        self.cache = cache
+        self.session = session
+        self.revalidate_after = revalidate_after
+
+    def run(self, tasks: list[PhotoTask]) -> list[PhotoResult]:
+        """
+        Transfer photos for all tasks and wait for them to finish.
+
+        Failures are reported in the results rather than raised, so one bad
+        photo never stops the others.
+
+        Args:
+            tasks: Photo transfers to perform
+
+        Returns:
+            One PhotoResult per task, in task order
+        """
+        if not tasks:
+            return []
+
+        results: list[PhotoResult | None] = [None] * len(tasks)
+        finished: list[Future[None]] = []
+        in_flight = threading.BoundedSemaphore(self.max_in_flight)
+        limiter = _RateLimiter(self.uploads_per_second)
+
+        uploads = _UploadQueue(
+            lambda batch: self._send_uploads(batch, limiter),
+            self.upload_workers,
+            self.upload_batch_size,
+        )
+
+        try:
+            with (
+                ThreadPoolExecutor(
+                    self.download_workers, thread_name_prefix="photo-download"
+                ) as downloads,
+                ThreadPoolExecutor(
+                    self.process_workers, thread_name_prefix="photo-process"
+                ) as processing,
+            ):
+                for index, task in enumerate(tasks):
+                    in_flight.acquire()
+                    done: Future[None] = Future()
+                    finished.append(done)
+
+                    def finish(
+                        result: PhotoResult,
+                        index: int = index,
+                        done: Future[None] = done,
+                    ) -> None:
+                        results[index] = result
+                        in_flight.release()
+                        done.set_result(None)
+
+                    if not task.source_contact.photo_url:
+                        uploads.put(_Upload(task, None, finish))
+                        continue
+
+                    def upload(
+                        photo: ProcessedPhoto,
+                        task: PhotoTask = task,
+                        finish: _Finish = finish,
+                    ) -> None:
+                        uploads.put(_Upload(task, photo, finish))
+
+                    def process(
+                        data: PhotoDownload | ProcessedPhoto,
+                        task: PhotoTask = task,
+                        finish: _Finish = finish,
+                        upload: Callable[[ProcessedPhoto], None] = upload,
+                    ) -> None:
+                        if isinstance(data, ProcessedPhoto):
+                            # Cache hit: nothing to process
+                            upload(data)
+                            return
+                        self._then(
+                            processing.submit(self._process, task, data),
+                            task,
+                            finish,
+                            upload,
+                        )
+
+                    self._then(
+                        downloads.submit(self._download, task), task, finish, process
+                    )
+
+                wait(finished)
+        finally:
+            uploads.close()
+
+        if self.cache is not None:
+            self.cache.save()
+
+        return [result for result in results if result is not None]
+
+    def _then(
+        self,
+        future: "Future[Any]",
+        task: PhotoTask,
+        finish: _Finish,
+        next_stage: Callable[[Any], None] | None = None,
+    ) -> None:
+        """
+        Hand a stage's output to the next stage, or finish the task.
+
+        A stage returns either the data for the next stage or a PhotoResult
+        when the task is done (successfully or not).
+        """
+
+        def on_done(completed: "Future[Any]") -> None:
+            try:
+                outcome = completed.result()
+                if isinstance(outcome, PhotoResult) or next_stage is None:
+                    finish(outcome)
+                else:
+                    next_stage(outcome)
+            except Exception as e:
+                finish(self._unexpected_failure(task, e))
+
+        future.add_done_callback(on_done)
+
+    # =========================================================================
+    # Stages
+    # =========================================================================
+
+    def _download(
+        self, task: PhotoTask
+    ) -> PhotoDownload | ProcessedPhoto | PhotoResult:
+        """Download the source photo, unless the cached copy is current."""
+        contact = task.source_contact
+        url = contact.photo_url or ""
+        logger.debug(
+            f"Syncing photo for {contact.display_name} to {task.account_label}"
+        )
+        try:
+            cached = None
+            if self.cache is not None:
+                cached = self.cache.get(url, contact.photo_etag)
+                if cached is not None and (
+                    time.time() - cached.validated_at < self.revalidate_after
+                ):
+                    logger.debug(f"Using cached photo for {contact.display_name}")
+                    return cached
+
+            download = download_photo_if_modified(
+                url,
+                etag=cached.http_etag if cached is not None else None,
+                session=self.session,
+            )
+            if download.not_modified and cached is not None:
+                logger.debug(f"Cached photo still current for {contact.display_name}")
+                if self.cache is not None:
+                    self.cache.mark_validated(url, contact.photo_etag)
+                return cached
+            return download
+        except PhotoError as e:
+            return self._photo_failure(task, e)
+        except Exception as e:
+            return self._unexpected_failure(task, e)
+
+    def _process(
+        self, task: PhotoTask, download: PhotoDownload
+    ) -> ProcessedPhoto | PhotoResult:
+        """Validate, convert and resize the downloaded photo."""
+        contact = task.source_contact
+        try:
+            processed = process_photo(download.data or b"")
+            if self.cache is not None:
+                return self.cache.put(
+                    contact.photo_url or "",
+                    contact.photo_etag,
+                    processed,
+                    http_etag=download.etag,
+                )
+            return ProcessedPhoto.from_data(processed)
+        except PhotoError as e:
+            return self._photo_failure(task, e)
+        except Exception as e:
+            return self._unexpected_failure(task, e)
+
+    def _send_uploads(self, batch: list[_Upload], limiter: _RateLimiter) -> None:
+        """
+        Upload or delete a batch of photos and finish their tasks.
+
+        Photos for the same destination account are sent in one batch
+        request, uploads and deletes separately; a single photo is sent on its
+        own.
+        """
+        groups: dict[tuple[int, bool], list[_Upload]] = {}
+        for upload in batch:
+            if upload.photo is not None and self._already_uploaded(
+                upload.task, upload.photo
+            ):
+                upload.finish(PhotoResult(task=upload.task, succeeded=True))
+                continue
+            key = (id(upload.task.dest_api), upload.photo is None)
+            groups.setdefault(key, []).append(upload)
+
+        for (_, is_delete), uploads in groups.items():
+            tasks = [upload.task for upload in uploads]
+            try:
+                if is_delete:
+                    results = self._delete_many(tasks, limiter)
+                else:
+                    photos = [upload.photo for upload in uploads if upload.photo]
+                    results = self._upload_many(tasks, photos, limiter)
+            except Exception as e:
+                results = [self._unexpected_failure(task, e) for task in tasks]
+
+            for upload, result in zip(uploads, results, strict=True):
+                upload.finish(result)
+
+    def _already_uploaded(self, task: PhotoTask, photo: ProcessedPhoto) -> bool:
+        """Check whether the destination already holds the same photo."""
+        if (
+            self.cache is not None
+            and task.dest_photo_url
+            and self.cache.get_hash(task.dest_photo_url) == photo.sha256
+        ):
+            logger.debug(
+                f"{task.account_label} already has the photo for "
+                f"{task.source_contact.display_name}, skipping upload"
+            )
+            return True
+        return False
+
+    def _upload_many(
+        self,
+        tasks: list[PhotoTask],
+        photos: list[ProcessedPhoto],
+        limiter: _RateLimiter,
+    ) -> list[PhotoResult]:
+        """Upload processed photos to destination contacts of one account."""
+        if len(tasks) == 1:
+            return [self._upload(tasks[0], photos[0], limiter)]
+
+        limiter.acquire()
+        outcomes = tasks[0].dest_api.batch_upload_photos(
+            [
+                (task.dest_resource_name, photo.data)
+                for task, photo in zip(tasks, photos, strict=True)
+            ]
+        )
+
+        results = []
+        for task, outcome in zip(tasks, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                results.append(self._unexpected_failure(task, outcome))
+                continue
+            logger.info(
+                f"Successfully synced photo for {task.source_contact.display_name} "
+                f"to {task.account_label}"
+            )
+            results.append(PhotoResult(task=task, succeeded=True))
+        return results
+
+    def _delete_many(
+        self, tasks: list[PhotoTask], limiter: _RateLimiter
+    ) -> list[PhotoResult]:
+        """Delete the photos of destination contacts of one account."""
+        if len(tasks) == 1:
+            return [self._delete(tasks[0], limiter)]
+
+        limiter.acquire()
+        outcomes = tasks[0].dest_api.batch_delete_photos(
+            [task.dest_resource_name for task in tasks]
+        )
+
+        results = []
+        for task, outcome in zip(tasks, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.debug(
+                    f"Could not delete photo for "
+                    f"{task.source_contact.display_name}: {outcome}"
+                )
+                results.append(
+                    PhotoResult(task=task, succeeded=False, error=str(outcome))
+                )
+                continue
+            logger.debug(
+                f"Deleted photo from {task.source_contact.display_name} "
+                f"in {task.account_label}"
+            )
+            results.append(PhotoResult(task=task, succeeded=True))
+        return results
+
+    def _upload(
+        self, task: PhotoTask, photo: ProcessedPhoto, limiter: _RateLimiter
+    ) -> PhotoResult:
+        """Upload the processed photo to the destination contact."""
+        contact = task.source_contact
+        try:
+            limiter.acquire()
+            task.dest_api.upload_photo(task.dest_resource_name, photo.data)
+        except Exception as e:
+            return self._unexpected_failure(task, e)
+
+        logger.info(
+            f"Successfully synced photo for {contact.display_name} "
+            f"to {task.account_label}"
+        )
+        return PhotoResult(task=task, succeeded=True)
+
+    def _delete(self, task: PhotoTask, limiter: _RateLimiter) -> PhotoResult:
+        """Delete the destination photo when the source has none."""
+        contact = task.source_contact
+        try:
+            limiter.acquire()
+            task.dest_api.delete_photo(task.dest_resource_name)
+        except PeopleAPIError as e:
+            # Ignore errors when deleting (photo may not exist)
+            logger.debug(f"Could not delete photo for {contact.display_name}: {e}")
+            return PhotoResult(task=task, succeeded=False, error=str(e))
+        except Exception as e:
+            return self._unexpected_failure(task, e)
+
+        logger.debug(
+            f"Deleted photo from {contact.display_name} in {task.account_label}"
+        )
+        return PhotoResult(task=task, succeeded=True)
+
+    # =========================================================================
+    # Failures
+    # =========================================================================
+
+    def _photo_failure(self, task: PhotoTask, error: PhotoError) -> PhotoResult:
+        """Record a photo that could not be downloaded or processed."""
+        logger.warning(
+            f"Failed to sync photo for {task.source_contact.display_name}: {error}"
+        )
+        return PhotoResult(task=task, succeeded=False, error=str(error))
+
+    def _unexpected_failure(self, task: PhotoTask, error: Exception) -> PhotoResult:
+        """Record an unexpected error during a photo transfer."""
+        logger.error(
+            f"Unexpected error syncing photo for "
+            f"{task.source_contact.display_name}: {error}"
+        )
+        return PhotoResult(task=task, succeeded=False, error=str(error))
@@ -8,7 +8,33 @@ used in cross-account contact and group identification.
 from __future__ import annotations
 
 import re
+import string
 import unicodedata
+from functools import lru_cache
+
+# Normalized values kept for reuse; names, group names and the emails shared
+# by both copies of a synced contact are normalized many times per sync
+NORMALIZE_CACHE_SIZE = 16384
+
+# Characters removed by strip_punctuation (after lowercasing)
+_PUNCTUATION = re.compile(r"[^a-z0-9\s]")
+_PUNCTUATION_EMAIL = re.compile(r"[^a-z0-9@\s]")
+
+
+def _ascii_deletion_table(keep: str) -> dict[int, None]:
+    """Build a str.translate() table deleting every ASCII char not in keep."""
+    return {
+        code: None
+        for code in range(128)
+        if chr(code) not in keep and not chr(code).isspace()
+    }
+
+
+# Same deletions as the patterns above, for ASCII input
+_ASCII_PUNCTUATION = _ascii_deletion_table(string.ascii_lowercase + string.digits)
+_ASCII_PUNCTUATION_EMAIL = _ascii_deletion_table(
+    string.ascii_lowercase + string.digits + "@"
+)
 
 
 def normalize_string(
@@ -21,6 +47,8 @@ def normalize_string(
     """
     Normalize a string for matching key generation.
 
+    Results are cached (see NORMALIZE_CACHE_SIZE).
+
     Args:
         value: String to normalize
         sort_words: If True, sort words alphabetically before joining.
@@ -38,32 +66,50 @@ def normalize_string(
     """
     if not value:
         return ""
+    return _normalize(
+        value, sort_words, allow_email_chars, remove_spaces, strip_punctuation
+    )
 
-    # Normalize unicode (decompose accents, etc.)
-    normalized = unicodedata.normalize("NFKD", value)
 
-    # Remove combining characters (accents)
-    normalized = "".join(c for c in normalized if not unicodedata.combining(c))
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(
+    value: str,
+    sort_words: bool,
+    allow_email_chars: bool,
+    remove_spaces: bool,
+    strip_punctuation: bool,
+) -> str:
+    """Normalize a non-empty string; see normalize_string()."""
+    if value.isascii():
+        # ASCII has nothing to decompose, so only case and punctuation remain
+        normalized = value.lower()
+        if strip_punctuation:
+            normalized = normalized.translate(
+                _ASCII_PUNCTUATION_EMAIL if allow_email_chars else _ASCII_PUNCTUATION
+            )
+    else:
+        # Normalize unicode (decompose accents, etc.)
+        normalized = unicodedata.normalize("NFKD", value)
 
-    # Convert to lowercase
-    normalized = normalized.lower()
+        # Remove combining characters (accents)
+        normalized = "".join(c for c in normalized if not unicodedata.combining(c))
 
-    # Optionally remove punctuation and special characters
-    if strip_punctuation:
-        # Build character pattern based on options
-        pattern = r"[^a-z0-9@\s]" if allow_email_chars else r"[^a-z0-9\s]"
-        normalized = re.sub(pattern, "", normalized)
+        # Convert to lowercase
+        normalized = normalized.lower()
 
-    # Normalize whitespace
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+        # Optionally remove punctuation and special characters
+        if strip_punctuation:
+            pattern = _PUNCTUATION_EMAIL if allow_email_chars else _PUNCTUATION
+            normalized = pattern.sub("", normalized)
+
+    # Split on any run of whitespace, dropping leading and trailing whitespace
+    words = normalized.split()
 
     # Sort words alphabetically if requested (for name normalization)
     # This handles "Last, First" vs "First Last" variations
     if sort_words:
-        words = normalized.split()
-        normalized = "".join(sorted(words))
-    elif remove_spaces:
+        return "".join(sorted(words))
+    if remove_spaces:
         # Remove spaces for key generation
-        normalized = normalized.replace(" ", "")
-
-    return normalized
+        return "".join(words)
+    return " ".join(words)
@@ -18,12 +18,17 @@ Usage:
 import argparse
 import sys
 from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from gcontact_sync.api.people_api import PeopleAPI
+from gcontact_sync.api.people_api import (
+    IDENTITY_PERSON_FIELDS,
+    ContactStream,
+    PeopleAPI,
+)
 from gcontact_sync.auth.google_auth import GoogleAuth
 from gcontact_sync.sync.contact import Contact
 
@@ -72,9 +77,10 @@ def get_contact_display_info(contact: Contact) -> str:
     return f"{display_name} ({resource_name})"
 
 
-def find_duplicates(contacts: list[Contact]) -> dict[tuple, list[Contact]]:
+def find_duplicates(contacts: Iterable[Contact]) -> dict[tuple, list[Contact]]:
     """
     Find duplicate contacts by grouping them by signature.
+    Contacts are consumed in a single pass, so a stream can be passed in.
     Returns dict mapping signature -> list of contacts with that signature.
     Only includes signatures with more than one contact.
     """
@@ -110,14 +116,17 @@ def pick_contact_to_keep(contacts: list[Contact]) -> tuple[Contact, list[Contact
     return sorted_contacts[0], sorted_contacts[1:]
 
 
-def fetch_all_contacts(api: PeopleAPI, verbose: bool = False) -> list[Contact]:
-    """Fetch all contacts using the API."""
+def fetch_all_contacts(api: PeopleAPI, verbose: bool = False) -> ContactStream:
+    """Stream all contacts using the API, page by page.
+
+    Only the fields used for signatures and picking the oldest contact are
+    requested.
+    """
     if verbose:
         print("  Fetching contacts...")
-    contacts, _ = api.list_contacts()
-    if verbose:
-        print(f"  Found {len(contacts)} contacts")
-    return contacts
+    return api.iter_contacts(
+        request_sync_token=False, person_fields=IDENTITY_PERSON_FIELDS
+    )
 
 
 def delete_contacts(
@@ -172,8 +181,10 @@ def process_account(
     # Fetch contacts
     contacts = fetch_all_contacts(api, verbose)
 
-    # Find duplicates
+    # Find duplicates while the contacts are streamed
     duplicates = find_duplicates(contacts)
+    if verbose:
+        print(f"  Found {contacts.count} contacts")
 
     if not duplicates:
         print(f"No duplicates found in {account_name}")
@@ -4,6 +4,7 @@ Unit tests for the People API module.
 Tests the PeopleAPI class for contact operations with mocked Google API responses.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,12 +15,22 @@ from gcontact_sync.api.people_api import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_MAX_RETRY_DELAY,
     DEFAULT_PAGE_SIZE,
+    IDENTITY_PERSON_FIELDS,
+    MAX_BATCH_HTTP_SIZE,
     PERSON_FIELDS,
     UPDATE_PERSON_FIELDS,
+    BatchWriteError,
+    ContactStream,
     PeopleAPI,
     PeopleAPIError,
     RateLimitError,
 )
+from gcontact_sync.api.rate_limiter import (
+    DEFAULT_WRITE_REQUESTS_PER_MINUTE,
+    READ,
+    WRITE,
+    RateLimiter,
+)
 from gcontact_sync.sync.contact import Contact
 
 # Re-export to prevent linter from removing unused imports
@@ -110,6 +121,40 @@ class TestPeopleAPIService:
         with pytest.raises(PeopleAPIError, match="Failed to create API service"):
             _ = api.service
 
+    @patch("gcontact_sync.api.people_api.build")
+    def test_service_per_thread(self, mock_build):
+        """Test another thread gets its own service (httplib2 isn't thread-safe)."""
+        mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+        api = PeopleAPI(MagicMock())
+        main_service = api.service
+        thread_services = []
+
+        def worker():
+            thread_services.append(api.service)
+            thread_services.append(api.service)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert thread_services[0] is not main_service
+        assert thread_services[0] is thread_services[1]
+        assert api.service is main_service
+        assert mock_build.call_count == 2
+
+    def test_injected_service_shared_across_threads(self):
+        """Test a service set directly is used by every thread."""
+        api = PeopleAPI(MagicMock())
+        api._service = MagicMock()
+        thread_services = []
+
+        thread = threading.Thread(target=lambda: thread_services.append(api.service))
+        thread.start()
+        thread.join()
+
+        assert thread_services == [api._service]
+
 
 class TestRetryWithBackoff:
     """Tests for the retry with backoff mechanism."""
@@ -131,6 +176,28 @@ class TestRetryWithBackoff:
         result = api._retry_with_backoff(operation, "test_operation")
         assert result == {"result": "success"}
 
+    @patch("time.sleep")
+    def test_transport_error_wrapped(self, mock_sleep, api):
+        """Test that connection errors raise PeopleAPIError without retrying."""
+        timeout = TimeoutError("timed out")
+        operation = MagicMock(side_effect=timeout)
+
+        with pytest.raises(PeopleAPIError, match="test_operation failed") as exc:
+            api._retry_with_backoff(operation, "test_operation")
+
+        assert exc.value.__cause__ is timeout
+        assert operation.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_credential_refresh_error_wrapped(self, api):
+        """Test that credential refresh errors raise PeopleAPIError."""
+        from google.auth.exceptions import RefreshError
+
+        operation = MagicMock(side_effect=RefreshError("invalid_grant"))
+
+        with pytest.raises(PeopleAPIError, match="invalid_grant"):
+            api._retry_with_backoff(operation, "test_operation")
+
     @patch("time.sleep")
     def test_rate_limit_retries_with_backoff(self, mock_sleep, api):
         """Test that rate limit errors trigger retries with backoff."""
@@ -240,13 +307,38 @@ class TestRetryWithBackoff:
                 raise HttpError(mock_resp, b"Rate limited")
             return {"result": "success"}
 
-        api._retry_with_backoff(operation, "test_operation")
+        # No pacing, and no jitter, so only the backoff delays remain
+        api.rate_limiter = RateLimiter(0, 0)
+        with patch(
+            "gcontact_sync.api.people_api.random.uniform", side_effect=lambda a, b: b
+        ):
+            api._retry_with_backoff(operation, "test_operation")
 
         # Check delays: 1, 2, 4 seconds
         delays = [call[0][0] for call in mock_sleep.call_args_list]
-        assert delays[0] == DEFAULT_INITIAL_RETRY_DELAY
-        assert delays[1] == DEFAULT_INITIAL_RETRY_DELAY * 2
-        assert delays[2] == DEFAULT_INITIAL_RETRY_DELAY * 4
+        assert delays[0] == pytest.approx(DEFAULT_INITIAL_RETRY_DELAY, abs=0.05)
+        assert delays[1] == pytest.approx(DEFAULT_INITIAL_RETRY_DELAY * 2, abs=0.05)
+        assert delays[2] == pytest.approx(DEFAULT_INITIAL_RETRY_DELAY * 4, abs=0.05)
+
+    @patch("time.sleep")
+    def test_backoff_delay_is_jittered(self, mock_sleep, api):
+        """Test that each delay is between half and all of the backoff delay."""
+        from googleapiclient.errors import HttpError
+
+        mock_resp = MagicMock()
+        mock_resp.status = 500
+
+        def operation():
+            raise HttpError(mock_resp, b"Server error")
+
+        with pytest.raises(PeopleAPIError):
+            api._retry_with_backoff(operation, "test_operation")
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(delays) == DEFAULT_MAX_RETRIES - 1
+        for attempt, delay in enumerate(delays):
+            full_delay = DEFAULT_INITIAL_RETRY_DELAY * 2**attempt
+            assert full_delay / 2 <= delay <= full_delay
 
     @patch("time.sleep")
     def test_backoff_capped_at_max(self, mock_sleep, api):
@@ -269,6 +361,76 @@ class TestRetryWithBackoff:
             assert delay <= DEFAULT_MAX_RETRY_DELAY
 
 
+class TestRateLimiting:
+    """Tests for rate limiting of API requests."""
+
+    @pytest.fixture
+    def api(self):
+        """Create a PeopleAPI instance with mocked service."""
+        api = PeopleAPI(MagicMock())
+        api._service = MagicMock()
+        return api
+
+    def test_default_rate_limiter(self, api):
+        """Test each PeopleAPI gets its own limiter by default."""
+        other = PeopleAPI(MagicMock())
+
+        assert isinstance(api.rate_limiter, RateLimiter)
+        assert api.rate_limiter is not other.rate_limiter
+
+    def test_shared_rate_limiter(self):
+        """Test a limiter can be shared by several PeopleAPI instances."""
+        limiter = RateLimiter()
+
+        api = PeopleAPI(MagicMock(), rate_limiter=limiter)
+
+        assert api.rate_limiter is limiter
+
+    def test_rate_limit_stats(self, api):
+        """Test rate_limit_stats reports the limiter's counters."""
+        api.get_contact("people/c1")
+
+        stats = api.rate_limit_stats()
+
+        assert set(stats) == {READ, WRITE}
+        assert stats[READ].requests == 1
+
+    def test_requests_counted_by_quota(self, api):
+        """Test reads and writes are counted against separate quotas."""
+        api.get_contact("people/c1")
+        api.delete_contact("people/c2")
+        api.delete_contact("people/c3")
+
+        stats = api.rate_limiter.stats()
+        assert stats[READ].requests == 1
+        assert stats[WRITE].requests == 2
+
+    @patch("time.sleep")
+    def test_rate_limit_slows_quota(self, mock_sleep, api):
+        """Test a 429 lowers the rate and is recorded as a retry."""
+        from googleapiclient.errors import HttpError
+
+        mock_resp = MagicMock()
+        mock_resp.status = 429
+        call_count = [0]
+
+        def operation():
+            call_count[0] += 1
+            if call_count[0] < 2:
+                raise HttpError(mock_resp, b"Rate limited")
+            return {}
+
+        api._retry_with_backoff(operation, "test_operation", quota=WRITE)
+
+        stats = api.rate_limiter.stats()
+        assert stats[WRITE].requests == 2
+        assert stats[WRITE].retries == 1
+        assert stats[WRITE].throttled == 1
+        assert stats[WRITE].throttled_seconds > 0
+        assert stats[WRITE].current_rate < DEFAULT_WRITE_REQUESTS_PER_MINUTE
+        assert stats[READ].requests == 0
+
+
 class TestListContacts:
     """Tests for list_contacts method."""
 
@@ -325,6 +487,24 @@ class TestListContacts:
         assert contacts[0].display_name == "John Doe"
         assert contacts[1].resource_name == "people/456"
 
+    def test_list_people_returns_raw_people(self, api):
+        """Test list_people returns person dictionaries as listed."""
+        person = {
+            "resourceName": "people/1",
+            "etag": "e1",
+            "names": [{"displayName": "A"}],
+        }
+        deleted = {"resourceName": "people/2", "metadata": {"deleted": True}}
+        api._service.people().connections().list().execute.return_value = {
+            "connections": [person, deleted],
+            "nextSyncToken": "token",
+        }
+
+        people, sync_token = api.list_people(sync_token="old")
+
+        assert people == [person, deleted]
+        assert sync_token == "token"
+
     def test_list_contacts_with_pagination(self, api):
         """Test list_contacts handles pagination."""
         # First page
@@ -433,6 +613,167 @@ class TestListContacts:
             api.list_contacts(sync_token="expired_token")
 
 
+class TestIterContacts:
+    """Tests for iter_contacts streaming method."""
+
+    @pytest.fixture
+    def api(self):
+        """Create a PeopleAPI instance with mocked service."""
+        mock_creds = MagicMock()
+        api = PeopleAPI(mock_creds)
+        api._service = MagicMock()
+        return api
+
+    @pytest.fixture
+    def pages(self):
+        """Two pages of API responses, the last carrying the sync token."""
+        return [
+            {
+                "connections": [
+                    {"resourceName": "people/1", "etag": "e1"},
+                    {"resourceName": "people/2", "etag": "e2"},
+                ],
+                "nextPageToken": "page2",
+            },
+            {
+                "connections": [{"resourceName": "people/3", "etag": "e3"}],
+                "nextSyncToken": "final_token",
+            },
+        ]
+
+    def test_iter_contacts_returns_stream(self, api):
+        """Test iter_contacts returns a ContactStream without fetching."""
+        stream = api.iter_contacts()
+
+        assert isinstance(stream, ContactStream)
+        api._service.people().connections().list().execute.assert_not_called()
+
+    def test_iter_contacts_fetches_pages_lazily(self, api, pages):
+        """Test the next page is only requested once the current one is used."""
+        execute = api._service.people().connections().list().execute
+        execute.side_effect = pages
+
+        stream = api.iter_contacts()
+
+        assert next(stream).resource_name == "people/1"
+        assert next(stream).resource_name == "people/2"
+        assert execute.call_count == 1
+        assert next(stream).resource_name == "people/3"
+        assert execute.call_count == 2
+
+    def test_iter_contacts_sync_token_after_exhaustion(self, api, pages):
+        """Test the final sync token is only set once the stream is exhausted."""
+        api._service.people().connections().list().execute.side_effect = pages
+
+        stream = api.iter_contacts()
+        first = next(stream)
+
+        assert stream.sync_token is None
+        assert stream.exhausted is False
+
+        rest = list(stream)
+
+        assert [c.resource_name for c in [first, *rest]] == [
+            "people/1",
+            "people/2",
+            "people/3",
+        ]
+        assert stream.sync_token == "final_token"
+        assert stream.exhausted is True
+        assert stream.count == 3
+
+    def test_iter_contacts_passes_sync_token(self, api):
+        """Test iter_contacts sends the sync token with the request."""
+        connections = api._service.people().connections()
+        connections.list.return_value.execute.return_value = {
+            "connections": [],
+            "nextSyncToken": "new_token",
+        }
+
+        stream = api.iter_contacts(sync_token="old_token")
+        assert list(stream) == []
+
+        assert connections.list.call_args.kwargs["syncToken"] == "old_token"
+        assert stream.sync_token == "new_token"
+
+    def test_iter_contacts_without_requesting_sync_token(self, api):
+        """Test request_sync_token=False omits requestSyncToken."""
+        connections = api._service.people().connections()
+        connections.list.return_value.execute.return_value = {"connections": []}
+
+        stream = api.iter_contacts(request_sync_token=False)
+        list(stream)
+
+        assert "requestSyncToken" not in connections.list.call_args.kwargs
+        assert stream.sync_token is None
+        assert stream.exhausted is True
+
+    def test_iter_contacts_expired_sync_token(self, api):
+        """Test an expired sync token raises while iterating."""
+        from googleapiclient.errors import HttpError
+
+        mock_resp = MagicMock()
+        mock_resp.status = 410
+
+        api._service.people().connections().list().execute.side_effect = HttpError(
+            mock_resp, b"Sync token expired"
+        )
+
+        stream = api.iter_contacts(sync_token="expired_token")
+
+        with pytest.raises(PeopleAPIError, match="Sync token expired"):
+            next(stream)
+
+    def test_iter_contacts_requests_all_fields_by_default(self, api, pages):
+        """Test contacts are read with every synced field by default."""
+        connections = api._service.people().connections()
+        connections.list.return_value.execute.side_effect = pages
+
+        contacts = list(api.iter_contacts())
+
+        assert connections.list.call_args.kwargs["personFields"] == PERSON_FIELDS
+        assert all(c.populated_fields is None for c in contacts)
+        assert not any(c.is_partial for c in contacts)
+
+    def test_iter_contacts_with_person_fields(self, api):
+        """Test a lean field mask is requested and recorded on each contact."""
+        connections = api._service.people().connections()
+        connections.list.return_value.execute.return_value = {
+            "connections": [
+                {
+                    "resourceName": "people/1",
+                    "etag": "e1",
+                    "names": [{"displayName": "John Doe"}],
+                    "emailAddresses": [{"value": "john@example.com"}],
+                }
+            ]
+        }
+
+        contacts = list(
+            api.iter_contacts(
+                request_sync_token=False, person_fields=IDENTITY_PERSON_FIELDS
+            )
+        )
+
+        assert (
+            connections.list.call_args.kwargs["personFields"] == IDENTITY_PERSON_FIELDS
+        )
+        assert contacts[0].emails == ("john@example.com",)
+        assert contacts[0].populated_fields == frozenset(
+            IDENTITY_PERSON_FIELDS.split(",")
+        )
+        assert contacts[0].is_partial is True
+
+    def test_list_contacts_with_person_fields(self, api):
+        """Test list_contacts passes the field mask through."""
+        connections = api._service.people().connections()
+        connections.list.return_value.execute.return_value = {"connections": []}
+
+        api.list_contacts(request_sync_token=False, person_fields="names")
+
+        assert connections.list.call_args.kwargs["personFields"] == "names"
+
+
 class TestGetContact:
     """Tests for get_contact method."""
 
@@ -831,6 +1172,147 @@ class TestBatchDeleteContacts:
         assert batch_delete_mock.call_count == 2
 
 
+class TestInFlightBatches:
+    """Tests for keeping several contact batches in flight."""
+
+    @pytest.fixture
+    def api(self):
+        """Create a PeopleAPI instance sending two batches at once."""
+        api = PeopleAPI(MagicMock(), max_in_flight_batches=2)
+        api._service = MagicMock()
+        return api
+
+    def test_default_sends_one_batch_at_a_time(self):
+        """Test that batches are sequential unless configured otherwise."""
+        assert PeopleAPI(MagicMock()).max_in_flight_batches == 1
+        assert (
+            PeopleAPI(MagicMock(), max_in_flight_batches=0).max_in_flight_batches == 1
+        )
+
+    def test_batches_in_flight_together_keep_order(self, api):
+        """Test that batches are sent concurrently and results stay in order."""
+        # Each batch waits for the other; sequential batches would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def batch_create(body):
+            names = [
+                c["contactPerson"]["names"][0]["givenName"] for c in body["contacts"]
+            ]
+            barrier.wait()
+            request = MagicMock()
+            request.execute.return_value = {
+                "createdPeople": [
+                    {"person": {"resourceName": f"people/{name}", "etag": "e"}}
+                    for name in names
+                ]
+            }
+            return request
+
+        api._service.people.return_value.batchCreateContacts.side_effect = batch_create
+        contacts = [Contact("", "", f"C{i}", given_name=f"c{i}") for i in range(4)]
+
+        result = api.batch_create_contacts(contacts, batch_size=2)
+
+        assert [c.resource_name for c in result] == [
+            "people/c0",
+            "people/c1",
+            "people/c2",
+            "people/c3",
+        ]
+
+    def test_failed_batch_raises(self, api):
+        """Test that an error in any in-flight batch is raised."""
+        from googleapiclient.errors import HttpError
+
+        mock_resp = MagicMock()
+        mock_resp.status = 400
+
+        def batch_delete(body):
+            request = MagicMock()
+            if "people/3" in body["resourceNames"]:
+                request.execute.side_effect = HttpError(mock_resp, b"Bad request")
+            return request
+
+        api._service.people.return_value.batchDeleteContacts.side_effect = batch_delete
+
+        with pytest.raises(PeopleAPIError, match="batch 2"):
+            api.batch_delete_contacts([f"people/{i}" for i in range(6)], batch_size=2)
+
+    @pytest.mark.parametrize("in_flight", [1, 2])
+    def test_failed_batch_reports_written_items(self, in_flight):
+        """Test that the other batches are written and reported per item."""
+        from googleapiclient.errors import HttpError
+
+        api = PeopleAPI(MagicMock(), max_in_flight_batches=in_flight)
+        api._service = MagicMock()
+        mock_resp = MagicMock()
+        mock_resp.status = 400
+
+        def batch_delete(body):
+            request = MagicMock()
+            if "people/3" in body["resourceNames"]:
+                request.execute.side_effect = HttpError(mock_resp, b"Bad request")
+            return request
+
+        api._service.people.return_value.batchDeleteContacts.side_effect = batch_delete
+
+        with pytest.raises(BatchWriteError) as exc_info:
+            api.batch_delete_contacts([f"people/{i}" for i in range(6)], batch_size=2)
+
+        error = exc_info.value
+        assert error.results == [True, True, None, None, True, True]
+        assert error.failed_indexes == [2, 3]
+        assert error.errors[2].status == 400
+        assert not error.rate_limited
+
+    def test_transport_error_fails_only_its_batch(self, api):
+        """Test that a connection error is reported per item, not raised raw."""
+
+        def batch_delete(body):
+            request = MagicMock()
+            if "people/3" in body["resourceNames"]:
+                request.execute.side_effect = TimeoutError("timed out")
+            return request
+
+        api._service.people.return_value.batchDeleteContacts.side_effect = batch_delete
+
+        with pytest.raises(BatchWriteError) as exc_info:
+            api.batch_delete_contacts([f"people/{i}" for i in range(6)], batch_size=2)
+
+        error = exc_info.value
+        assert error.results == [True, True, None, None, True, True]
+        assert isinstance(error.errors[2].__cause__, TimeoutError)
+        assert not error.rate_limited
+
+    @patch("time.sleep")
+    def test_rate_limit_skips_remaining_batches(self, mock_sleep):
+        """Test that batches after an exhausted rate limit are not sent."""
+        from googleapiclient.errors import HttpError
+
+        api = PeopleAPI(MagicMock(), max_retries=1)
+        api._service = MagicMock()
+        mock_resp = MagicMock()
+        mock_resp.status = 429
+        calls = []
+
+        def batch_delete(body):
+            calls.append(body["resourceNames"])
+            request = MagicMock()
+            if len(calls) == 2:
+                request.execute.side_effect = HttpError(mock_resp, b"Quota")
+            return request
+
+        api._service.people.return_value.batchDeleteContacts.side_effect = batch_delete
+
+        with pytest.raises(BatchWriteError) as exc_info:
+            api.batch_delete_contacts([f"people/{i}" for i in range(6)], batch_size=2)
+
+        assert len(calls) == 2
+        assert exc_info.value.rate_limited
+        assert exc_info.value.failed_indexes == [2, 3, 4, 5]
+        assert all(isinstance(e, RateLimitError) for e in exc_info.value.errors[2:])
+
+
 class TestGetSyncToken:
     """Tests for get_sync_token method."""
 
@@ -1576,3 +2058,257 @@ class TestContactGroupsEdgeCases:
         user_groups = [g for g in groups if g["groupType"] == "USER_CONTACT_GROUP"]
         assert len(system_groups) == 2
         assert len(user_groups) == 1
+
+
+def _http_error(status):
+    """Create an HttpError with the given status."""
+    from googleapiclient.errors import HttpError
+
+    resp = MagicMock()
+    resp.status = status
+    return HttpError(resp, b"error")
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest replying with scripted outcomes."""
+
+    def __init__(self, callback, replies, sent):
+        self._callback = callback
+        self._replies = replies
+        self._sent = sent
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request, request_id))
+
+    def execute(self):
+        self._sent.append([request for request, _ in self._requests])
+        for request, request_id in self._requests:
+            outcome = self._replies(request)
+            if isinstance(outcome, Exception):
+                self._callback(request_id, None, outcome)
+            else:
+                self._callback(request_id, outcome, None)
+
+
+class TestBatchHttpRequests:
+    """Tests for operations sent as batch HTTP requests."""
+
+    @pytest.fixture
+    def api(self):
+        """Create a PeopleAPI whose batch requests reply with self.replies."""
+        api = PeopleAPI(MagicMock(), rate_limiter=RateLimiter(0, 0))
+        api._service = MagicMock()
+        self.sent = []
+        self.replies = lambda request: {}
+        api._service.new_batch_http_request.side_effect = lambda callback: FakeBatch(
+            callback, lambda request: self.replies(request), self.sent
+        )
+        return api
+
+    def test_batch_http_size_capped(self):
+        """Test the batch size is capped at Google's limit."""
+        api = PeopleAPI(MagicMock(), batch_http_size=5000)
+
+        assert api.batch_http_size == MAX_BATCH_HTTP_SIZE
+
+    def test_empty_input_sends_nothing(self, api):
+        """Test empty batches make no requests."""
+        assert api.batch_upload_photos([]) == []
+        assert api.batch_delete_photos([]) == []
+        assert api.batch_create_contact_groups([]) == []
+        assert api.batch_delete_contact_groups([]) == []
+        assert api.batch_modify_group_members([]) == []
+        api._service.new_batch_http_request.assert_not_called()
+
+    def test_upload_photos_in_one_request(self, api):
+        """Test photos are uploaded as sub-requests of one batch request."""
+        results = api.batch_upload_photos(
+            [("people/c1", b"one"), ("people/c2", b"two")]
+        )
+
+        assert results == [True, True]
+        assert len(self.sent) == 1
+        assert len(self.sent[0]) == 2
+        api._service.people().updateContactPhoto.assert_any_call(
+            resourceName="people/c2", body={"photoBytes": "dHdv"}
+        )
+
+    def test_upload_photos_validates_input(self, api):
+        """Test missing photo data raises before any request is sent."""
+        with pytest.raises(ValueError):
+            api.batch_upload_photos([("people/c1", b"one"), ("people/c2", b"")])
+
+    def test_requests_split_by_batch_size(self, api):
+        """Test more requests than batch_http_size use several batch requests."""
+        api.batch_http_size = 2
+
+        results = api.batch_delete_photos([f"people/c{i}" for i in range(5)])
+
+        assert results == [True] * 5
+        assert [len(batch) for batch in self.sent] == [2, 2, 1]
+
+    def test_sub_request_errors_mapped(self, api):
+        """Test a failed sub-request is returned as the single-call error."""
+        people = api._service.people()
+        missing = people.updateContactPhoto.return_value
+        self.replies = lambda request: _http_error(404) if request is missing else {}
+
+        results = api.batch_upload_photos([("people/c1", b"one")])
+
+        assert isinstance(results[0], PeopleAPIError)
+        assert str(results[0]) == "Contact not found: people/c1"
+
+    @patch("time.sleep")
+    def test_rate_limited_sub_requests_retried(self, mock_sleep, api):
+        """Test only sub-requests rejected for rate limits are sent again."""
+        attempts = []
+
+        def reply(request):
+            attempts.append(request)
+            return _http_error(429) if len(attempts) == 2 else {}
+
+        self.replies = reply
+
+        results = api.batch_delete_photos(["people/c1", "people/c2", "people/c3"])
+
+        assert results == [True, True, True]
+        assert [len(batch) for batch in self.sent] == [3, 1]
+        assert mock_sleep.call_count == 1
+        stats = api.rate_limit_stats()[WRITE]
+        assert stats.requests == 4
+        assert stats.retries == 1
+        assert stats.throttled == 1
+
+    @patch("time.sleep")
+    def test_rate_limit_exhausted(self, mock_sleep, api):
+        """Test a sub-request still rate limited after all retries fails."""
+        self.replies = lambda request: _http_error(429)
+
+        results = api.batch_delete_photos(["people/c1"])
+
+        assert isinstance(results[0], RateLimitError)
+        assert len(self.sent) == DEFAULT_MAX_RETRIES
+
+    @patch("time.sleep")
+    def test_failed_batch_request_retried(self, mock_sleep, api):
+        """Test a server error for the whole batch request retries all of it."""
+        calls = [0]
+        real_factory = api._service.new_batch_http_request.side_effect
+
+        def factory(callback):
+            calls[0] += 1
+            batch = real_factory(callback)
+            if calls[0] == 1:
+                batch.execute = MagicMock(side_effect=_http_error(503))
+            return batch
+
+        api._service.new_batch_http_request.side_effect = factory
+
+        results = api.batch_delete_photos(["people/c1", "people/c2"])
+
+        assert results == [True, True]
+        assert calls[0] == 2
+
+    def test_client_error_not_retried(self, api):
+        """Test other errors are returned without retrying."""
+        self.replies = lambda request: _http_error(400)
+
+        results = api.batch_delete_photos(["people/c1"])
+
+        assert isinstance(results[0], PeopleAPIError)
+        assert "delete_photo(people/c1) failed" in str(results[0])
+        assert len(self.sent) == 1
+
+    def test_transport_failure_fails_every_sub_request(self, api):
+        """Test a connection error for the batch request fails each item."""
+        real_factory = api._service.new_batch_http_request.side_effect
+
+        def factory(callback):
+            batch = real_factory(callback)
+            batch.execute = MagicMock(side_effect=OSError("connection reset"))
+            return batch
+
+        api._service.new_batch_http_request.side_effect = factory
+
+        results = api.batch_create_contact_groups(["Friends", "Family"])
+
+        assert all(isinstance(r, PeopleAPIError) for r in results)
+        assert "create_contact_group(Family) failed" in str(results[1])
+        assert isinstance(results[1].__cause__, OSError)
+
+    def test_delete_photos_not_found_succeeds(self, api):
+        """Test deleting a photo that does not exist counts as deleted."""
+        self.replies = lambda request: _http_error(404)
+
+        assert api.batch_delete_photos(["people/c1"]) == [True]
+
+    def test_create_contact_groups(self, api):
+        """Test groups are created and duplicates reported per group."""
+        requests = {}
+
+        def create(body):
+            name = body["contactGroup"]["name"]
+            requests[name] = MagicMock()
+            return requests[name]
+
+        api._service.contactGroups().create.side_effect = create
+        self.replies = lambda request: (
+            _http_error(409)
+            if request is requests["Taken"]
+            else {"resourceName": "contactGroups/new"}
+        )
+
+        results = api.batch_create_contact_groups(["Friends", "Taken"])
+
+        assert results[0] == {"resourceName": "contactGroups/new"}
+        assert isinstance(results[1], PeopleAPIError)
+        assert "already exists" in str(results[1])
+
+    def test_delete_contact_groups(self, api):
+        """Test groups are deleted, keeping their contacts by default."""
+        self.replies = lambda request: _http_error(404)
+
+        results = api.batch_delete_contact_groups(["contactGroups/a"])
+
+        assert results == [True]
+        api._service.contactGroups().delete.assert_called_once_with(
+            resourceName="contactGroups/a", deleteContacts=False
+        )
+
+    def test_modify_group_members(self, api):
+        """Test member changes for several groups in one request."""
+        self.replies = lambda request: {"notFoundResourceNames": []}
+
+        results = api.batch_modify_group_members(
+            [
+                ("contactGroups/a", ["people/c1"], None),
+                ("contactGroups/b", None, ["people/c2"]),
+            ]
+        )
+
+        assert results == [{"notFoundResourceNames": []}] * 2
+        members = api._service.contactGroups().members()
+        members.modify.assert_any_call(
+            resourceName="contactGroups/a",
+            body={"resourceNamesToAdd": ["people/c1"]},
+        )
+        members.modify.assert_any_call(
+            resourceName="contactGroups/b",
+            body={"resourceNamesToRemove": ["people/c2"]},
+        )
+
+    def test_modify_group_members_requires_changes(self, api):
+        """Test a change without contacts to add or remove is rejected."""
+        with pytest.raises(ValueError, match="At least one"):
+            api.batch_modify_group_members([("contactGroups/a", None, [])])
+
+    def test_modify_group_members_group_not_found(self, api):
+        """Test a missing group is reported like modify_group_members."""
+        self.replies = lambda request: _http_error(404)
+
+        results = api.batch_modify_group_members(
+            [("contactGroups/gone", ["people/c1"], None)]
+        )
+
+        assert str(results[0]) == "Contact group not found: contactGroups/gone"
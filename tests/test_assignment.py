@@ -0,0 +1,111 @@
+"""
+Unit tests for maximum-weight bipartite assignment.
+
+Tests max_weight_assignment() used by phase 2 multi-tier matching.
+"""
+
+import itertools
+import random
+
+from gcontact_sync.sync import assignment as assignment_module
+from gcontact_sync.sync.assignment import max_weight_assignment
+
+
+def _brute_force_best(edges):
+    """Best total weight over all one-to-one subsets of edges."""
+    best = 0.0
+    edge_list = list(edges)
+    for size in range(len(edge_list) + 1):
+        for subset in itertools.combinations(edge_list, size):
+            lefts = [left for left, _ in subset]
+            rights = [right for _, right in subset]
+            if len(set(lefts)) == size and len(set(rights)) == size:
+                best = max(best, sum(edges[e] for e in subset))
+    return best
+
+
+class TestMaxWeightAssignment:
+    """Tests for max_weight_assignment()."""
+
+    def test_empty(self):
+        assert max_weight_assignment({}) == []
+
+    def test_single_edge(self):
+        assert max_weight_assignment({(3, 7): 1.0}) == [(3, 7)]
+
+    def test_independent_components(self):
+        edges = {(0, 0): 1.0, (1, 1): 2.0, (2, 5): 3.0}
+        assert max_weight_assignment(edges) == [(0, 0), (1, 1), (2, 5)]
+
+    def test_better_than_greedy_first_hit(self):
+        # Greedy would give left 0 its first partner (right 0) and leave
+        # left 1 unmatched; the optimum matches both
+        edges = {(0, 0): 4.0, (0, 1): 4.0, (1, 0): 4.0}
+        assert max_weight_assignment(edges) == [(0, 1), (1, 0)]
+
+    def test_prefers_higher_weight(self):
+        edges = {(0, 0): 2.5, (0, 1): 3.9, (1, 1): 3.0}
+        # 2.5 + 3.0 beats 3.9 alone
+        assert max_weight_assignment(edges) == [(0, 0), (1, 1)]
+
+    def test_one_to_one(self):
+        edges = {(0, 0): 1.0, (1, 0): 2.0, (2, 0): 3.0}
+        assert max_weight_assignment(edges) == [(2, 0)]
+
+    def test_more_rights_than_lefts(self):
+        edges = {(0, 0): 1.0, (0, 1): 2.0, (0, 2): 1.5}
+        assert max_weight_assignment(edges) == [(0, 1)]
+
+    def test_matches_brute_force(self):
+        edges = {
+            (0, 0): 3.2,
+            (0, 1): 2.1,
+            (1, 0): 3.9,
+            (1, 2): 1.0,
+            (2, 1): 2.8,
+            (2, 2): 3.7,
+            (3, 2): 2.0,
+            (3, 3): 1.1,
+        }
+        assignment = max_weight_assignment(edges)
+
+        assert len({left for left, _ in assignment}) == len(assignment)
+        assert len({right for _, right in assignment}) == len(assignment)
+        total = sum(edges[pair] for pair in assignment)
+        assert abs(total - _brute_force_best(edges)) < 1e-9
+
+    def test_deterministic(self):
+        edges = {(0, 0): 1.0, (0, 1): 1.0, (1, 0): 1.0, (1, 1): 1.0}
+        first = max_weight_assignment(edges)
+        assert all(max_weight_assignment(dict(edges)) == first for _ in range(5))
+        assert len(first) == 2
+
+    def test_large_component_solved_exactly(self):
+        # Every left shares one right (e.g. a company phone) and has a
+        # weaker private partner: all but one must take the private partner
+        edges = {(left, 0): 3.9 for left in range(5000)}
+        edges.update({(left, left + 1): 3.5 for left in range(5000)})
+
+        assignment = max_weight_assignment(edges)
+
+        assert len(assignment) == 5000
+        assert sum(1 for _, right in assignment if right == 0) == 1
+        total = sum(edges[pair] for pair in assignment)
+        assert abs(total - (3.9 + 4999 * 3.5)) < 1e-6
+
+    def test_matches_brute_force_on_random_graphs(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            edges = {
+                (rng.randrange(5), rng.randrange(5)): rng.choice([1.0, 2.5, 3.9])
+                for _ in range(rng.randint(1, 9))
+            }
+            total = sum(edges[pair] for pair in max_weight_assignment(edges))
+            assert abs(total - _brute_force_best(edges)) < 1e-9
+
+    def test_oversized_component_assigned_greedily(self, monkeypatch):
+        monkeypatch.setattr(assignment_module, "MAX_EXACT_COMPONENT_EDGES", 2)
+        edges = {(0, 0): 4.0, (0, 1): 4.0, (1, 0): 4.0}
+
+        # The exact solver would match both lefts
+        assert max_weight_assignment(edges) == [(0, 0)]
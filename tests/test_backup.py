@@ -13,6 +13,7 @@ from pathlib import Path
 import pytest
 
 from gcontact_sync.backup.manager import BackupManager
+from gcontact_sync.sync.contact import Contact
 
 
 def create_backup_helper(
@@ -557,6 +558,25 @@ class TestSerialization:
         assert result[0]["name"] == "John"
         assert result[0]["email"] == "john@example.com"
 
+    def test_serialize_contacts_with_contact_model(self, bm):
+        """Test serializing slotted Contact objects round-trips their fields."""
+        contact = Contact(
+            resource_name="people/c1",
+            etag="e1",
+            display_name="John Doe",
+            emails=["john@example.com"],
+            memberships=["contactGroups/friends"],
+        )
+        contact.content_hash()  # fills the private cache, which is not saved
+
+        [result] = bm._serialize_contacts([contact])
+
+        assert result["emails"] == ["john@example.com"]
+        assert result["memberships"] == ["contactGroups/friends"]
+        assert "_derived" not in result
+        json.dumps(result)
+        assert bm.deserialize_contact(result) == contact
+
     def test_serialize_contacts_skips_invalid_types(self, bm):
         """Test that invalid contact types are skipped."""
         contacts = [
@@ -680,6 +700,76 @@ class TestSerialization:
         assert result["custom"] == "custom_value"
 
 
+class TestIncrementalBackup:
+    """Tests for rebuilding backups from a previous backup plus changes."""
+
+    @pytest.fixture
+    def bm(self, tmp_path):
+        """Create a BackupManager instance."""
+        return BackupManager(tmp_path / "backups")
+
+    def test_create_backup_records_sync_tokens(self, bm):
+        """Test that sync tokens are stored per account."""
+        backup_path = bm.create_backup(
+            account1_contacts=[],
+            account1_groups=[],
+            account2_contacts=[],
+            account2_groups=[],
+            account1_sync_token="token1",
+            account2_sync_token="token2",
+        )
+
+        data = bm.load_backup(backup_path)
+        assert data["accounts"]["account1"]["sync_token"] == "token1"
+        assert data["accounts"]["account2"]["sync_token"] == "token2"
+
+    def test_find_contacts_snapshot_by_token(self, bm):
+        """Test finding the contacts backed up at a sync token."""
+        contacts = [{"resource_name": "people/1", "display_name": "John"}]
+        bm.create_backup(
+            account1_contacts=contacts,
+            account1_groups=[],
+            account2_contacts=[],
+            account2_groups=[],
+            account1_sync_token="token1",
+        )
+
+        assert bm.find_contacts_snapshot("account1", "token1") == contacts
+        assert bm.find_contacts_snapshot("account1", "other") is None
+        assert bm.find_contacts_snapshot("account2", "token1") is None
+
+    def test_find_contacts_snapshot_without_token(self, bm):
+        """Test that an empty token never matches."""
+        create_backup_helper(bm)
+
+        assert bm.find_contacts_snapshot("account1", "") is None
+
+    def test_merge_contact_delta(self, bm):
+        """Test applying changed, new and deleted contacts to a backup."""
+        from gcontact_sync.sync.contact import Contact
+
+        base = [
+            {"resource_name": "people/1", "display_name": "John"},
+            {"resource_name": "people/2", "display_name": "Jane"},
+            {"resource_name": "people/3", "display_name": "Bob"},
+        ]
+        changes = [
+            Contact("people/2", "e2", "Jane Updated"),
+            Contact("people/3", "e3", "", deleted=True),
+            Contact("people/4", "e4", "Carol"),
+        ]
+
+        merged = bm.merge_contact_delta(base, changes)
+
+        assert [c["resource_name"] for c in merged] == [
+            "people/1",
+            "people/2",
+            "people/4",
+        ]
+        assert merged[1]["display_name"] == "Jane Updated"
+        assert merged[2]["display_name"] == "Carol"
+
+
 class TestBackupIntegration:
     """Integration tests for complete backup workflows."""
 
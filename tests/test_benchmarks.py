@@ -0,0 +1,304 @@
+"""
+Performance benchmarks for hot paths of the sync engine.
+
+These are coarse before/after comparisons rather than precise measurements.
+Each benchmark prints its timings (visible with ``pytest -s``) and only
+asserts that both variants produce the same results, since wall-clock
+comparisons are unreliable on loaded machines.
+
+The benchmarks are deselected by default (see addopts in pyproject.toml).
+Run them with: pytest -m benchmark -s
+"""
+
+import re
+import time
+import tracemalloc
+import unicodedata
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gcontact_sync.api.people_api import PeopleAPI
+from gcontact_sync.storage.db import SyncDatabase
+from gcontact_sync.sync.contact import Contact, _DerivedFields
+from gcontact_sync.sync.engine import SyncEngine
+from gcontact_sync.utils.normalization import _normalize, normalize_string
+
+pytestmark = pytest.mark.benchmark
+
+
+def _per_op_ms(func, iterations):
+    """Run func(i) for each iteration and return mean milliseconds per call."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+class TestDatabaseConnectionBenchmark:
+    """Per-operation latency of SyncDatabase with and without a pooled connection."""
+
+    ITERATIONS = 200
+
+    def _measure(self, db):
+        db.initialize()
+        write_ms = _per_op_ms(
+            lambda i: db.upsert_contact_mapping(
+                f"key{i}", account1_resource_name=f"people/{i}"
+            ),
+            self.ITERATIONS,
+        )
+        read_ms = _per_op_ms(
+            lambda i: db.get_contact_mapping(f"key{i}"), self.ITERATIONS
+        )
+        assert db.get_mapping_count() == self.ITERATIONS
+        db.close()
+        return write_ms, read_ms
+
+    def test_persistent_connection_latency(self, tmp_path):
+        before = self._measure(
+            SyncDatabase(str(tmp_path / "before.db"), persistent_connection=False)
+        )
+        after = self._measure(SyncDatabase(str(tmp_path / "after.db")))
+
+        print(
+            f"\nupsert_contact_mapping: {before[0]:.3f} ms -> {after[0]:.3f} ms"
+            f"\nget_contact_mapping:    {before[1]:.3f} ms -> {after[1]:.3f} ms"
+        )
+
+
+class TestBulkMappingWriteBenchmark:
+    """Recording a batch of created contacts: per-row upserts vs one bulk write."""
+
+    ROWS = 5000
+
+    def _rows(self):
+        return [
+            {
+                "matching_key": f"key{i}",
+                "account2_resource_name": f"people/{i}",
+                "account2_etag": f"etag{i}",
+                "last_synced_hash": f"hash{i}",
+            }
+            for i in range(self.ROWS)
+        ]
+
+    def test_bulk_upsert_contact_mappings(self, tmp_path):
+        db = SyncDatabase(str(tmp_path / "single.db"))
+        db.initialize()
+        start = time.perf_counter()
+        for row in self._rows():
+            db.upsert_contact_mapping(**row)
+        single_s = time.perf_counter() - start
+        db.close()
+
+        db = SyncDatabase(str(tmp_path / "bulk.db"))
+        db.initialize()
+        start = time.perf_counter()
+        db.bulk_upsert_contact_mappings(self._rows())
+        bulk_s = time.perf_counter() - start
+        assert db.get_mapping_count() == self.ROWS
+        db.close()
+
+        print(
+            f"\n{self.ROWS} mapping writes: "
+            f"{single_s * 1000:.1f} ms -> {bulk_s * 1000:.1f} ms"
+        )
+
+
+def _synthetic_contacts(count, account, contact_class=Contact):
+    """Build count contacts that appear in both accounts with the same content."""
+    return [
+        contact_class(
+            resource_name=f"people/{account}{i}",
+            etag=f"etag{i}",
+            display_name=f"Person {i} Example",
+            given_name="Person",
+            family_name=f"{i} Example",
+            emails=[f"person{i}@example.com", f"p{i}@work.example.org"],
+            phones=[f"+1 (555) {i % 1000:03d}-{i % 10000:04d}"],
+            organizations=["Example Corp"],
+            memberships=["contactGroups/friends"],
+        )
+        for i in range(count)
+    ]
+
+
+def _analyze_seconds(count, contact_class=Contact):
+    """Time analyze() over two already synced synthetic accounts."""
+    db = SyncDatabase(":memory:")
+    db.initialize()
+    db.bulk_upsert_contact_mappings(
+        [
+            {
+                "matching_key": contact.matching_key(),
+                "account1_resource_name": f"people/a{i}",
+                "account2_resource_name": f"people/b{i}",
+                "last_synced_hash": contact.content_hash(),
+            }
+            for i, contact in enumerate(_synthetic_contacts(count, "a"))
+        ]
+    )
+    apis = []
+    for account in ("a", "b"):
+        api = MagicMock(spec=PeopleAPI)
+        api.list_contact_groups.return_value = ([], None)
+        api.list_contacts.return_value = (
+            _synthetic_contacts(count, account, contact_class),
+            None,
+        )
+        apis.append(api)
+    engine = SyncEngine(apis[0], apis[1], db, use_llm_matching=False)
+    engine._pending_key_updates = []
+
+    start = time.perf_counter()
+    result = engine.analyze(full_sync=True)
+    elapsed = time.perf_counter() - start
+
+    assert len(result.matched_contacts) == count
+    engine.close()
+    db.close()
+    return elapsed
+
+
+class TestContactDerivedFieldsBenchmark:
+    """Full analysis of a 20k-contact pair of accounts with and without caching."""
+
+    CONTACTS = 20000
+
+    def test_analyze_with_cached_derived_fields(self):
+        # Before: every call derives keys and hashes from scratch
+        with patch.object(
+            Contact,
+            "_derived_fields",
+            lambda contact: _DerivedFields(source=()),
+        ):
+            before = _analyze_seconds(self.CONTACTS)
+        after = _analyze_seconds(self.CONTACTS)
+
+        print(
+            f"\nanalyze() with {self.CONTACTS} contacts per account: "
+            f"{before:.2f} s -> {after:.2f} s"
+        )
+
+
+class _DictContact(Contact):
+    """Contact with a per-instance __dict__ and list fields, as before."""
+
+    def __post_init__(self):
+        self.emails = list(self.emails)
+        self.phones = list(self.phones)
+        self.organizations = list(self.organizations)
+        self.memberships = list(self.memberships)
+        self.membership_names = list(self.membership_names)
+
+
+class TestContactMemoryBenchmark:
+    """
+    Peak memory of analyze() with slotted, tuple-backed contacts vs the old layout.
+
+    Measured with tracemalloc rather than RSS: the RSS of a test process only
+    grows, so two runs in one process cannot be compared.
+    """
+
+    CONTACTS = 20000
+
+    def _peak_mib(self, contact_class):
+        tracemalloc.start()
+        try:
+            _analyze_seconds(self.CONTACTS, contact_class)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+    def test_slotted_contact_memory(self):
+        before = self._peak_mib(_DictContact)
+        after = self._peak_mib(Contact)
+
+        print(
+            f"\nanalyze() peak memory with {self.CONTACTS} contacts per account: "
+            f"{before:.1f} MiB -> {after:.1f} MiB"
+        )
+
+        assert after < before
+
+
+def _old_normalize_string(
+    value,
+    sort_words=False,
+    allow_email_chars=False,
+    remove_spaces=True,
+    strip_punctuation=True,
+):
+    """normalize_string() as it was before the ASCII fast path and cache."""
+    if not value:
+        return ""
+    normalized = unicodedata.normalize("NFKD", value)
+    normalized = "".join(c for c in normalized if not unicodedata.combining(c))
+    normalized = normalized.lower()
+    if strip_punctuation:
+        pattern = r"[^a-z0-9@\s]" if allow_email_chars else r"[^a-z0-9\s]"
+        normalized = re.sub(pattern, "", normalized)
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    if sort_words:
+        normalized = "".join(sorted(normalized.split()))
+    elif remove_spaces:
+        normalized = normalized.replace(" ", "")
+    return normalized
+
+
+def _uncached_normalize_string(
+    value,
+    sort_words=False,
+    allow_email_chars=False,
+    remove_spaces=True,
+    strip_punctuation=True,
+):
+    """normalize_string() bypassing its cache."""
+    return _normalize.__wrapped__(
+        value, sort_words, allow_email_chars, remove_spaces, strip_punctuation
+    )
+
+
+class TestNormalizeStringBenchmark:
+    """
+    Throughput of normalize_string() on typical contact names and emails.
+
+    The cached run measures repeated values (group names, and the names and
+    emails shared by both copies of a synced contact) on a warm cache.
+    """
+
+    VALUES = 5000
+
+    def _inputs(self):
+        values = []
+        for i in range(self.VALUES):
+            values.append((f"Doe{i}, Jane Marie", {"sort_words": True}))
+            values.append((f"Jane.Doe+{i}@Example.com", {"allow_email_chars": True}))
+            values.append((f"Acme Corp. {i}", {"remove_spaces": False}))
+        return values
+
+    def _ops_per_second(self, func, values):
+        start = time.perf_counter()
+        for value, options in values:
+            func(value, **options)
+        return len(values) / (time.perf_counter() - start)
+
+    def test_normalize_string_throughput(self):
+        values = self._inputs()
+        # Also warms the cache for the cached run below
+        _normalize.cache_clear()
+        for value, options in values:
+            assert normalize_string(value, **options) == _old_normalize_string(
+                value, **options
+            )
+
+        before = self._ops_per_second(_old_normalize_string, values)
+        uncached = self._ops_per_second(_uncached_normalize_string, values)
+        cached = self._ops_per_second(normalize_string, values)
+
+        print(
+            f"\nnormalize_string(): {before:,.0f} ops/s -> "
+            f"{uncached:,.0f} ops/s uncached, {cached:,.0f} ops/s cached"
+        )
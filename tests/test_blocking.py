@@ -0,0 +1,137 @@
+"""
+Unit tests for candidate blocking used by multi-tier matching.
+
+Tests the CandidateBlocker inverted index over email and phone keys.
+"""
+
+import pytest
+
+from gcontact_sync.sync.blocking import BlockingStats, CandidateBlocker
+from gcontact_sync.sync.contact import Contact
+from gcontact_sync.sync.matcher import ContactMatcher, MatchConfig
+
+
+@pytest.fixture
+def matcher():
+    """Create a matcher with LLM disabled for fast testing."""
+    return ContactMatcher(config=MatchConfig(use_llm_matching=False))
+
+
+@pytest.fixture
+def blocker(matcher):
+    """Create a candidate blocker."""
+    return CandidateBlocker(matcher)
+
+
+class TestBlockingKeys:
+    """Tests for CandidateBlocker.blocking_keys()."""
+
+    def test_email_keys_normalized(self, blocker):
+        contact = Contact("people/1", "e1", "", emails=["John@Example.COM "])
+        assert "email:john@example.com" in blocker.blocking_keys(contact)
+
+    def test_phone_key_uses_suffix(self, blocker):
+        contact = Contact("people/1", "e1", "", phones=["+1 (555) 123-4567"])
+        assert "phone:1234567" in blocker.blocking_keys(contact)
+
+    def test_short_phone_ignored(self, blocker):
+        contact = Contact("people/1", "e1", "", phones=["123"])
+        assert blocker.blocking_keys(contact) == set()
+
+    def test_names_have_no_keys(self, blocker):
+        contact = Contact("people/1", "e1", "John Smith")
+        assert blocker.blocking_keys(contact) == set()
+
+
+class TestCandidateBlocker:
+    """Tests for CandidateBlocker.index() and candidates()."""
+
+    def test_shared_email_is_candidate(self, blocker):
+        indexed = [
+            Contact("people/a", "e", "Alice", emails=["alice@example.com"]),
+            Contact("people/b", "e", "Bob", emails=["bob@example.com"]),
+        ]
+        blocker.index(indexed)
+
+        contact = Contact("people/x", "e", "Someone", emails=["bob@example.com"])
+        assert blocker.candidates(contact) == [1]
+
+    def test_shared_phone_suffix_is_candidate(self, blocker):
+        indexed = [Contact("people/a", "e", "", phones=["+44 20 5555 1234"])]
+        blocker.index(indexed)
+
+        contact = Contact("people/x", "e", "", phones=["(020) 5555-1234"])
+        assert blocker.candidates(contact) == [0]
+
+    def test_candidates_in_index_order(self, blocker):
+        indexed = [
+            Contact("people/a", "e", "Alice", emails=["team@example.com"]),
+            Contact("people/b", "e", "Bob", emails=["bob@example.com"]),
+            Contact("people/c", "e", "Carol", phones=["555-123-4567"]),
+        ]
+        blocker.index(indexed)
+
+        contact = Contact(
+            "people/x", "e", "", emails=["team@example.com"], phones=["5551234567"]
+        )
+        assert blocker.candidates(contact) == [0, 2]
+
+    def test_unrelated_contact_has_no_candidates(self, blocker):
+        indexed = [Contact("people/a", "e", "Alice", emails=["alice@example.com"])]
+        blocker.index(indexed)
+
+        contact = Contact("people/x", "e", "Zed", emails=["zed@example.org"])
+        assert blocker.candidates(contact) == []
+
+    def test_stats_track_considered_and_pruned(self, blocker):
+        indexed = [
+            Contact("people/a", "e", "", emails=["team@example.com"]),
+            Contact("people/b", "e", "", emails=["bob@example.com"]),
+            Contact("people/c", "e", "", emails=["team@example.com"]),
+        ]
+        blocker.index(indexed)
+
+        blocker.candidates(Contact("people/x", "e", "", emails=["team@example.com"]))
+        blocker.candidates(Contact("people/y", "e", "Zed"))
+
+        assert blocker.stats == BlockingStats(pairs_considered=2, pairs_pruned=4)
+
+
+class TestMatchManyRecall:
+    """Blocked match_many() finds every pair an all-pairs scan would."""
+
+    def test_matches_and_uncertain_pairs_are_never_pruned(self, matcher):
+        contacts1 = [
+            Contact("people/1", "e", "John Smith", emails=["js@example.com"]),
+            Contact("people/2", "e", "Jane Doe", phones=["555-123-4567"]),
+            Contact("people/3", "e", "Robert Brown"),
+            Contact("people/4", "e", "Maria Garcia", emails=["mg@work.com"]),
+            Contact("people/5", "e", "Katherine"),
+            Contact("people/6", "e", "Bob", emails=["bob@example.com"]),
+        ]
+        contacts2 = [
+            Contact("people/a", "e", "Johnny Smith", emails=["JS@example.com"]),
+            Contact("people/b", "e", "Jane D.", phones=["+1 555 123 4567"]),
+            Contact("people/c", "e", "Robert Brown"),
+            Contact("people/d", "e", "Mario Garcia", emails=["mario@home.com"]),
+            Contact("people/e", "e", "Catherine"),
+            Contact("people/f", "e", "Robert Z", emails=["bob@example.com"]),
+            Contact("people/g", "e", "Unrelated Person"),
+        ]
+
+        expected = []
+        for contact1 in contacts1:
+            row = []
+            for position, contact2 in enumerate(contacts2):
+                result = matcher.match(contact1, contact2)
+                if result.is_match or result.confidence.value == "uncertain":
+                    row.append((position, result))
+            expected.append(row)
+
+        scored = matcher.match_many(contacts1, contacts2)
+
+        assert [[j for j, _ in row] for row in scored] == [
+            [j for j, _ in row] for row in expected
+        ]
+        # Names differing in the first letter are still compared
+        assert any(j == 4 for j, _ in scored[4])
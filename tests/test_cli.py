@@ -633,6 +633,92 @@ class TestSyncCommand:
             call_kwargs = mock_engine_class.call_args.kwargs
             assert call_kwargs["conflict_strategy"] == ConflictStrategy.ACCOUNT1_WINS
 
+    @patch("gcontact_sync.cli.main.ConfigLoader")
+    @patch("gcontact_sync.sync.engine.SyncEngine")
+    @patch("gcontact_sync.storage.db.SyncDatabase")
+    @patch("gcontact_sync.api.people_api.PeopleAPI")
+    @patch("gcontact_sync.cli.main.GoogleAuth")
+    @patch("gcontact_sync.cli.main.setup_logging")
+    def test_sync_llm_rate_limits_from_config(
+        self,
+        mock_setup_logging,
+        mock_auth_class,
+        mock_api_class,
+        mock_db_class,
+        mock_engine_class,
+        mock_config_loader,
+    ):
+        """Test sync passes the LLM concurrency and budgets from config."""
+        mock_loader = MagicMock()
+        mock_loader.load_from_file.return_value = {
+            "llm_max_concurrency": 2,
+            "llm_requests_per_minute": 10,
+            "llm_tokens_per_minute": 5000,
+        }
+        mock_config_loader.return_value = mock_loader
+
+        mock_auth = MagicMock()
+        mock_auth.get_credentials.return_value = MagicMock()
+        mock_auth.get_account_email.return_value = "test@test.com"
+        mock_auth_class.return_value = mock_auth
+
+        mock_result = MagicMock()
+        mock_result.has_changes.return_value = False
+        mock_result.summary.return_value = "Test summary"
+        mock_result.conflicts = []
+        mock_result.matched_contacts = []
+        mock_result.to_create_in_account1 = []
+        mock_result.to_create_in_account2 = []
+
+        mock_engine = MagicMock()
+        mock_engine.sync.return_value = mock_result
+        mock_engine_class.return_value = mock_engine
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["sync"])
+            assert result.exit_code == 0
+            match_config = mock_engine_class.call_args.kwargs["match_config"]
+            assert match_config.llm_max_concurrency == 2
+            assert match_config.llm_requests_per_minute == 10
+            assert match_config.llm_tokens_per_minute == 5000
+
+    @patch("gcontact_sync.cli.main.ConfigLoader")
+    @patch("gcontact_sync.sync.engine.SyncEngine")
+    @patch("gcontact_sync.storage.db.SyncDatabase")
+    @patch("gcontact_sync.api.people_api.PeopleAPI")
+    @patch("gcontact_sync.cli.main.GoogleAuth")
+    @patch("gcontact_sync.cli.main.setup_logging")
+    def test_sync_closes_database_on_failure(
+        self,
+        mock_setup_logging,
+        mock_auth_class,
+        mock_api_class,
+        mock_db_class,
+        mock_engine_class,
+        mock_config_loader,
+    ):
+        """Test sync closes the database connection even when the sync fails."""
+        mock_loader = MagicMock()
+        mock_loader.load_from_file.return_value = {}
+        mock_config_loader.return_value = mock_loader
+
+        mock_auth = MagicMock()
+        mock_auth.get_credentials.return_value = MagicMock()
+        mock_auth.get_account_email.return_value = "test@test.com"
+        mock_auth_class.return_value = mock_auth
+
+        mock_engine = MagicMock()
+        mock_engine.sync.side_effect = Exception("API error")
+        mock_engine_class.return_value = mock_engine
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["sync"])
+            assert result.exit_code == 1
+            mock_engine.close.assert_called_once()
+            mock_db_class.return_value.close.assert_called_once()
+
 
 class TestResetCommand:
     """Tests for the reset command."""
@@ -1582,6 +1668,48 @@ class TestDaemonCommand:
             call_kwargs = mock_scheduler_class.call_args.kwargs
             assert call_kwargs["run_immediately"] is False
 
+    @patch("gcontact_sync.sync.engine.SyncEngine")
+    @patch("gcontact_sync.storage.db.SyncDatabase")
+    @patch("gcontact_sync.api.people_api.PeopleAPI")
+    @patch("gcontact_sync.cli.main.GoogleAuth")
+    @patch("gcontact_sync.cli.main.setup_logging")
+    @patch("gcontact_sync.daemon.DaemonScheduler")
+    @patch("gcontact_sync.daemon.parse_interval")
+    def test_daemon_sync_callback_closes_database(
+        self,
+        mock_parse_interval,
+        mock_scheduler_class,
+        mock_setup_logging,
+        mock_auth_class,
+        mock_api_class,
+        mock_db_class,
+        mock_engine_class,
+    ):
+        """Test each daemon sync cycle closes the database it opened."""
+        mock_parse_interval.return_value = 3600
+
+        mock_auth = MagicMock()
+        mock_auth.get_credentials.return_value = MagicMock()
+        mock_auth.get_account_email.return_value = "test@test.com"
+        mock_auth_class.return_value = mock_auth
+
+        mock_scheduler = MagicMock()
+        mock_scheduler_class.return_value = mock_scheduler
+
+        mock_engine = MagicMock()
+        mock_engine.sync.return_value.stats.errors = 0
+        mock_engine_class.return_value = mock_engine
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, ["daemon", "start", "--foreground"])
+            assert result.exit_code == 0
+
+            sync_callback = mock_scheduler.set_sync_callback.call_args.args[0]
+            assert sync_callback() is True
+            mock_engine.close.assert_called_once()
+            mock_db_class.return_value.close.assert_called_once()
+
     @patch("gcontact_sync.cli.main.GoogleAuth")
     @patch("gcontact_sync.cli.main.setup_logging")
     @patch("gcontact_sync.daemon.DaemonScheduler")
@@ -459,6 +459,62 @@ class TestConfigValidation:
         ):
             loader.validate(config)
 
+    def test_validate_concurrent_fetch_valid(self, loader):
+        """Test validating concurrent_fetch with boolean values."""
+        for value in [True, False]:
+            loader.validate({"concurrent_fetch": value})  # Should not raise
+
+    def test_validate_concurrent_fetch_wrong_type(self, loader):
+        """Test validating concurrent_fetch with wrong type."""
+        config = {"concurrent_fetch": "yes"}
+        with pytest.raises(ConfigError, match="Invalid type for 'concurrent_fetch'"):
+            loader.validate(config)
+
+    def test_validate_concurrent_execute_options(self, loader):
+        """Test validating the concurrent write options."""
+        loader.validate(
+            {"concurrent_execute": True, "api_max_in_flight_batches": 4}
+        )  # Should not raise
+
+        with pytest.raises(ConfigError, match="api_max_in_flight_batches must be >= 1"):
+            loader.validate({"api_max_in_flight_batches": 0})
+
+    def test_validate_photo_cache_options_valid(self, loader):
+        """Test validating photo cache options with valid values."""
+        loader.validate(
+            {"photo_cache_enabled": False, "photo_cache_max_mb": 50}
+        )  # Should not raise
+
+    def test_validate_photo_cache_max_mb_wrong_type(self, loader):
+        """Test validating photo_cache_max_mb with wrong type."""
+        config = {"photo_cache_max_mb": "100"}
+        with pytest.raises(ConfigError, match="Invalid type for 'photo_cache_max_mb'"):
+            loader.validate(config)
+
+    def test_validate_photo_session_options_valid(self, loader):
+        """Test validating photo download session options."""
+        loader.validate(
+            {"photo_pool_maxsize": 20, "photo_connect_retries": 0}
+        )  # Should not raise
+
+    def test_validate_photo_pool_maxsize_wrong_type(self, loader):
+        """Test validating photo_pool_maxsize with wrong type."""
+        with pytest.raises(ConfigError, match="Invalid type for 'photo_pool_maxsize'"):
+            loader.validate({"photo_pool_maxsize": 2.5})
+
+    def test_validate_photo_sizes_invalid(self, loader):
+        """Test validating the photo cache and pool sizes must be positive."""
+        for key in ("photo_cache_max_mb", "photo_pool_maxsize"):
+            with pytest.raises(ConfigError, match=f"{key} must be >= 1"):
+                loader.validate({key: 0})
+
+    def test_validate_photo_connect_retries_negative(self, loader):
+        """Test validating photo_connect_retries must not be negative."""
+        with pytest.raises(
+            ConfigError, match="photo_connect_retries must be >= 0, got -1"
+        ):
+            loader.validate({"photo_connect_retries": -1})
+
     def test_validate_api_max_retry_delay_valid(self, loader):
         """Test validating api_max_retry_delay with valid values."""
         for delay in [1.0, 30.0, 60.0, 120.0]:
@@ -563,6 +619,34 @@ class TestConfigValidation:
         with pytest.raises(ConfigError, match="Invalid type for 'llm_batch_size'"):
             loader.validate(config)
 
+    def test_validate_llm_rate_limits_valid(self, loader):
+        """Test validating the LLM concurrency and per-minute budgets."""
+        loader.validate(
+            {
+                "llm_max_concurrency": 8,
+                "llm_requests_per_minute": 100,
+                "llm_tokens_per_minute": 80000,
+            }
+        )  # Should not raise
+
+    def test_validate_llm_rate_limits_invalid(self, loader):
+        """Test validating the LLM concurrency and budgets must be positive."""
+        for key in (
+            "llm_max_concurrency",
+            "llm_requests_per_minute",
+            "llm_tokens_per_minute",
+        ):
+            with pytest.raises(ConfigError, match=f"{key} must be >= 1"):
+                loader.validate({key: 0})
+
+    def test_validate_llm_rate_limits_wrong_type(self, loader):
+        """Test validating the LLM token budget with wrong type."""
+        config = {"llm_tokens_per_minute": "40000"}
+        with pytest.raises(
+            ConfigError, match="Invalid type for 'llm_tokens_per_minute'"
+        ):
+            loader.validate(config)
+
     def test_validate_llm_model_valid(self, loader):
         """Test validating llm_model with valid string values."""
         config = {"llm_model": "claude-haiku-4-5-20250514"}
@@ -671,6 +755,9 @@ class TestConfigValidation:
             "llm_model": "claude-haiku-4-5-20250514",
             "llm_max_tokens": 500,
             "llm_batch_max_tokens": 2000,
+            "llm_max_concurrency": 4,
+            "llm_requests_per_minute": 50,
+            "llm_tokens_per_minute": 40000,
             # Auth options (Tier 2)
             "auth_timeout": 10,
             # Logging options (Tier 2)
@@ -5,9 +5,14 @@ Tests the Contact class for API conversion, matching key generation,
 content hashing, and comparison operations.
 """
 
+import sys
 from datetime import datetime, timezone
+from unittest.mock import patch
 
-from gcontact_sync.sync.contact import Contact
+import pytest
+
+from gcontact_sync.sync.contact import CONTENT_PERSON_FIELDS, Contact
+from gcontact_sync.utils import normalize_string
 
 
 class TestContactBasics:
@@ -40,13 +45,50 @@ class TestContactBasics:
         )
         assert contact.given_name == "John"
         assert contact.family_name == "Doe"
-        assert contact.emails == ["john@example.com", "john.doe@work.com"]
-        assert contact.phones == ["+1234567890", "+0987654321"]
-        assert contact.organizations == ["Acme Corp"]
+        assert contact.emails == ("john@example.com", "john.doe@work.com")
+        assert contact.phones == ("+1234567890", "+0987654321")
+        assert contact.organizations == ("Acme Corp",)
         assert contact.notes == "Important contact"
         assert contact.last_modified == last_mod
         assert contact.deleted is False
 
+    def test_contact_is_slotted(self):
+        """Test contacts have no per-instance __dict__ for unknown attributes."""
+        contact = Contact(
+            resource_name="people/c123", etag="abc123", display_name="John Doe"
+        )
+
+        assert not hasattr(contact, "__dict__")
+        with pytest.raises(AttributeError):
+            contact.nickname = "Johnny"
+
+    def test_slotted_contact_smaller_than_attribute_dict(self):
+        """Test a contact takes less memory than its fields in a __dict__."""
+        contact = Contact(
+            resource_name="people/c123",
+            etag="abc123",
+            display_name="John Doe",
+            emails=["john@example.com"],
+        )
+        fields = {name: getattr(contact, name) for name in Contact.__slots__}
+
+        assert sys.getsizeof(contact) < sys.getsizeof(fields)
+
+    def test_list_fields_stored_as_tuples(self):
+        """Test multi-valued fields passed as lists are stored as tuples."""
+        emails = ["john@example.com"]
+        contact = Contact(
+            resource_name="people/c123",
+            etag="abc123",
+            display_name="John Doe",
+            emails=emails,
+            memberships=["contactGroups/friends"],
+        )
+        emails.append("other@example.com")
+
+        assert contact.emails == ("john@example.com",)
+        assert contact.memberships == ("contactGroups/friends",)
+
     def test_contact_default_values(self):
         """Test that default values are applied correctly."""
         contact = Contact(
@@ -54,9 +96,9 @@ class TestContactBasics:
         )
         assert contact.given_name is None
         assert contact.family_name is None
-        assert contact.emails == []
-        assert contact.phones == []
-        assert contact.organizations == []
+        assert contact.emails == ()
+        assert contact.phones == ()
+        assert contact.organizations == ()
         assert contact.notes is None
         assert contact.last_modified is None
         assert contact.deleted is False
@@ -90,9 +132,9 @@ class TestContactFromApiResponse:
         assert contact.display_name == "John Doe"
         assert contact.given_name == "John"
         assert contact.family_name == "Doe"
-        assert contact.emails == ["john@example.com", "john.doe@work.com"]
-        assert contact.phones == ["+1234567890"]
-        assert contact.organizations == ["Acme Corp"]
+        assert contact.emails == ("john@example.com", "john.doe@work.com")
+        assert contact.phones == ("+1234567890",)
+        assert contact.organizations == ("Acme Corp",)
         assert contact.notes == "Some notes about John"
         assert contact.last_modified is not None
         assert contact.deleted is False
@@ -112,9 +154,9 @@ class TestContactFromApiResponse:
         assert contact.display_name == "Jane Smith"
         assert contact.given_name is None
         assert contact.family_name is None
-        assert contact.emails == []
-        assert contact.phones == []
-        assert contact.organizations == []
+        assert contact.emails == ()
+        assert contact.phones == ()
+        assert contact.organizations == ()
         assert contact.notes is None
 
     def test_from_api_response_empty_response(self):
@@ -179,7 +221,7 @@ class TestContactFromApiResponse:
 
         contact = Contact.from_api_response(api_response)
 
-        assert contact.emails == ["valid@example.com", "another@example.com"]
+        assert contact.emails == ("valid@example.com", "another@example.com")
 
     def test_from_api_response_empty_phone_values_filtered(self):
         """Test that empty phone values are filtered out."""
@@ -196,7 +238,7 @@ class TestContactFromApiResponse:
 
         contact = Contact.from_api_response(api_response)
 
-        assert contact.phones == ["+1234567890"]
+        assert contact.phones == ("+1234567890",)
 
     def test_from_api_response_empty_organization_values_filtered(self):
         """Test that empty organization values are filtered out."""
@@ -213,7 +255,7 @@ class TestContactFromApiResponse:
 
         contact = Contact.from_api_response(api_response)
 
-        assert contact.organizations == ["Acme Corp"]
+        assert contact.organizations == ("Acme Corp",)
 
     def test_from_api_response_deleted_contact(self):
         """Test creating contact marked as deleted."""
@@ -948,6 +990,159 @@ class TestContactEquality:
         assert d[contact1] == "value2"
 
 
+class TestContactPartial:
+    """Tests for contacts read with a partial field mask."""
+
+    PERSON = {
+        "resourceName": "people/c1",
+        "etag": "e1",
+        "names": [{"displayName": "John Doe"}],
+        "emailAddresses": [{"value": "john@example.com"}],
+    }
+
+    def test_full_read_is_not_partial(self):
+        """Test a contact read with every field is not partial."""
+        contact = Contact.from_api_response(self.PERSON)
+
+        assert contact.populated_fields is None
+        assert contact.is_partial is False
+
+    def test_partial_read_records_fields(self):
+        """Test the requested fields are recorded on the contact."""
+        contact = Contact.from_api_response(self.PERSON, "names,emailAddresses")
+
+        assert contact.populated_fields == frozenset({"names", "emailAddresses"})
+        assert contact.is_partial is True
+        assert (
+            contact.matching_key()
+            == Contact.from_api_response(self.PERSON).matching_key()
+        )
+
+    def test_all_content_fields_is_not_partial(self):
+        """Test a mask covering every content field is not partial."""
+        fields = ",".join(sorted(CONTENT_PERSON_FIELDS | {"metadata"}))
+
+        contact = Contact.from_api_response(self.PERSON, fields)
+
+        assert contact.is_partial is False
+        assert (
+            contact.content_hash()
+            == Contact.from_api_response(self.PERSON).content_hash()
+        )
+
+    def test_content_hash_raises_for_partial(self):
+        """Test fields that were not read are never hashed as empty."""
+        contact = Contact.from_api_response(self.PERSON, "names,emailAddresses")
+
+        with pytest.raises(ValueError, match="biographies, organizations"):
+            contact.content_hash()
+
+    def test_to_api_format_raises_for_partial(self):
+        """Test a partial contact cannot be written back."""
+        contact = Contact.from_api_response(self.PERSON, "names")
+
+        with pytest.raises(ValueError, match="partial contact people/c1"):
+            contact.to_api_format()
+
+    def test_partial_only_equal_to_itself(self):
+        """Test partial contacts are compared by identity, not content."""
+        partial = Contact.from_api_response(self.PERSON, "names")
+        other = Contact.from_api_response(self.PERSON, "names")
+        full = Contact.from_api_response(self.PERSON)
+
+        assert partial == partial
+        assert partial != other
+        assert partial != full
+        assert full != partial
+
+
+class TestContactDerivedFieldCache:
+    """Tests for caching of matching keys, content hash and normalized fields."""
+
+    @pytest.fixture
+    def contact(self):
+        """Create a contact with emails and phones."""
+        return Contact(
+            "people/c1",
+            "e1",
+            "John Doe",
+            emails=["John@Example.com"],
+            phones=["+1 (555) 123-4567"],
+        )
+
+    def test_values_computed_once(self, contact):
+        """Test repeated calls reuse the computed values."""
+        with patch(
+            "gcontact_sync.sync.contact.normalize_string",
+            wraps=normalize_string,
+        ) as normalize:
+            key = contact.matching_key()
+            calls = normalize.call_count
+            assert contact.matching_key() == key
+            contact.alternate_matching_keys()
+            contact.alternate_matching_keys()
+            assert normalize.call_count == calls + 1
+
+        with patch("gcontact_sync.sync.contact.hashlib.sha256") as sha256:
+            contact.content_hash()
+            contact.content_hash()
+        assert sha256.call_count == 1
+
+    def test_reassigned_field_invalidates(self, contact):
+        """Test assigning a syncable field recomputes derived values."""
+        key = contact.matching_key()
+        content_hash = contact.content_hash()
+
+        contact.display_name = "Jane Doe"
+
+        assert contact.matching_key() != key
+        assert contact.content_hash() != content_hash
+        assert contact.matching_key().startswith("doejane|")
+
+    def test_extended_field_invalidates(self, contact):
+        """Test adding to a multi-valued field recomputes derived values."""
+        content_hash = contact.content_hash()
+        keys = contact.alternate_matching_keys()
+
+        contact.phones += ("555-000-1111",)
+
+        assert contact.content_hash() != content_hash
+        assert "phone:5550001111" in contact.alternate_matching_keys()
+        assert "phone:5550001111" not in keys
+
+    def test_seeded_values_used_until_field_changes(self, contact):
+        """Test seeded key and hash are returned until a field is reassigned."""
+        contact.seed_derived_fields("stored|key", "stored-hash")
+
+        assert contact.matching_key() == "stored|key"
+        assert contact.content_hash() == "stored-hash"
+
+        contact.notes = "Changed"
+
+        assert contact.matching_key().startswith("doejohn|email:")
+        assert contact.content_hash() != "stored-hash"
+
+    def test_returned_keys_do_not_share_cache(self, contact):
+        """Test callers cannot change the cached alternate keys."""
+        contact.alternate_matching_keys().clear()
+
+        assert contact.alternate_matching_keys()
+
+    def test_cache_not_part_of_equality(self, contact):
+        """Test a contact with cached values equals a fresh copy."""
+        contact.content_hash()
+        fresh = Contact(
+            "people/c9",
+            "e9",
+            "John Doe",
+            emails=["John@Example.com"],
+            phones=["+1 (555) 123-4567"],
+        )
+
+        assert contact == fresh
+        assert "_derived" not in repr(contact)
+
+
 class TestContactRepr:
     """Tests for Contact __repr__ method."""
 
@@ -1521,7 +1716,26 @@ class TestContactMemberships:
             ],
         }
         contact = Contact.from_api_response(person)
-        assert contact.memberships == ["contactGroups/group1", "contactGroups/group2"]
+        assert contact.memberships == ("contactGroups/group1", "contactGroups/group2")
+
+    def test_memberships_share_interned_strings(self):
+        """Test contacts in the same group share one resource name string."""
+        groups = ["/".join(["contactGroups", "friends"]) for _ in range(2)]
+        assert groups[0] is not groups[1]
+
+        contacts = [
+            Contact.from_api_response(
+                {
+                    "resourceName": "people/c1",
+                    "memberships": [
+                        {"contactGroupMembership": {"contactGroupResourceName": group}}
+                    ],
+                }
+            )
+            for group in groups
+        ]
+
+        assert contacts[0].memberships[0] is contacts[1].memberships[0]
 
     def test_memberships_field_empty_when_not_in_response(self):
         """Verify memberships defaults to empty list."""
@@ -1531,7 +1745,7 @@ class TestContactMemberships:
             "names": [{"displayName": "Test Person"}],
         }
         contact = Contact.from_api_response(person)
-        assert contact.memberships == []
+        assert contact.memberships == ()
 
     def test_memberships_field_serialized_to_api_format(self):
         """Verify memberships are correctly serialized to API format."""
@@ -861,3 +861,317 @@ class TestLLMMatcherConfiguration:
 
         call_kwargs = mock_client.messages.create.call_args
         assert call_kwargs.kwargs["max_tokens"] == 1000
+
+
+class TestRequestBudget:
+    """Tests for the per-minute request/token budget."""
+
+    def test_within_budget_does_not_wait(self):
+        from gcontact_sync.sync.llm_matcher import RequestBudget
+
+        budget = RequestBudget(requests_per_minute=3, tokens_per_minute=100)
+        with patch("gcontact_sync.sync.llm_matcher.time.sleep") as mock_sleep:
+            budget.acquire(30)
+            budget.acquire(30)
+            budget.acquire(30)
+        mock_sleep.assert_not_called()
+
+    def test_request_limit_waits_for_window(self):
+        from gcontact_sync.sync.llm_matcher import RequestBudget
+
+        clock = [1000.0]
+        budget = RequestBudget(requests_per_minute=2, tokens_per_minute=10000)
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with (
+            patch(
+                "gcontact_sync.sync.llm_matcher.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch("gcontact_sync.sync.llm_matcher.time.sleep", side_effect=fake_sleep),
+        ):
+            budget.acquire(1)
+            budget.acquire(1)
+            budget.acquire(1)
+
+        # Third request had to wait for the first to leave the window
+        assert clock[0] >= 1060.0
+
+    def test_token_limit_waits_for_window(self):
+        from gcontact_sync.sync.llm_matcher import RequestBudget
+
+        clock = [0.0]
+        budget = RequestBudget(requests_per_minute=100, tokens_per_minute=100)
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with (
+            patch(
+                "gcontact_sync.sync.llm_matcher.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch("gcontact_sync.sync.llm_matcher.time.sleep", side_effect=fake_sleep),
+        ):
+            budget.acquire(80)
+            budget.acquire(80)
+
+        assert clock[0] >= 60.0
+
+    def test_oversized_request_allowed_on_empty_window(self):
+        from gcontact_sync.sync.llm_matcher import RequestBudget
+
+        budget = RequestBudget(requests_per_minute=10, tokens_per_minute=10)
+        with patch("gcontact_sync.sync.llm_matcher.time.sleep") as mock_sleep:
+            budget.acquire(500)
+        mock_sleep.assert_not_called()
+
+
+class TestMatchBatches:
+    """Tests for concurrent batch adjudication with match_batches()."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an initialized in-memory database."""
+        from gcontact_sync.storage.db import SyncDatabase
+
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        return db
+
+    @pytest.fixture
+    def groups(self):
+        """Two source contacts with uncertain candidates."""
+        source1 = Contact("people/1", "e", "John Doe", emails=["john@a.com"])
+        source2 = Contact("people/2", "e", "Jane Roe", emails=["jane@a.com"])
+        return [
+            (
+                source1,
+                [
+                    Contact("people/a", "e", "Johnny Doe", emails=["jd@b.com"]),
+                    Contact("people/b", "e", "John Dough"),
+                ],
+            ),
+            (source2, [Contact("people/c", "e", "Jane R", emails=["jr@b.com"])]),
+        ]
+
+    @staticmethod
+    def _response(matches):
+        response = MagicMock()
+        response.content = [MagicMock(text=json.dumps({"matches": matches}))]
+        return response
+
+    def _client_for(self, groups, answers):
+        """Mock client answering each request by its source contact name."""
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            for source, _ in groups:
+                if f"- Name: {source.display_name}\n" in prompt.split("Candidates")[0]:
+                    return self._response(answers[source.resource_name])
+            raise AssertionError("unexpected prompt")
+
+        client = MagicMock()
+        client.messages.create.side_effect = create
+        return client
+
+    def test_returns_decisions_aligned_with_candidates(self, groups):
+        answers = {
+            "people/1": [{"candidate_index": 2, "confidence": 0.9, "reasoning": "x"}],
+            "people/2": [],
+        }
+        matcher = LLMMatcher(api_key="test-key")
+        matcher._client = self._client_for(groups, answers)
+
+        decisions = matcher.match_batches(groups, batch_size=10)
+
+        assert [d.is_match for d in decisions[0]] == [False, True]
+        assert decisions[0][1].confidence == 0.9
+        assert [d.is_match for d in decisions[1]] == [False]
+        assert matcher._client.messages.create.call_count == 2
+
+    def test_splits_large_groups_into_batches(self, groups):
+        answers = {"people/1": [], "people/2": []}
+        matcher = LLMMatcher(api_key="test-key")
+        matcher._client = self._client_for(groups, answers)
+
+        matcher.match_batches(groups, batch_size=1)
+
+        assert matcher._client.messages.create.call_count == 3
+
+    def test_decisions_written_to_cache_in_bulk(self, db, groups):
+        answers = {
+            "people/1": [{"candidate_index": 1, "confidence": 0.8, "reasoning": "x"}],
+            "people/2": [],
+        }
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher._client = self._client_for(groups, answers)
+
+        with patch.object(
+            db, "upsert_llm_match_attempts", wraps=db.upsert_llm_match_attempts
+        ) as bulk:
+            matcher.match_batches(groups, batch_size=10)
+
+        bulk.assert_called_once()
+        assert db.get_llm_match_attempt_count() == 3
+        assert db.get_llm_match_attempt("people/1", "people/a")["is_match"] == 1
+        assert db.get_llm_match_attempt("people/1", "people/b")["is_match"] == 0
+
+    def test_cached_pairs_are_not_sent(self, db, groups):
+        answers = {"people/1": [], "people/2": []}
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher._client = self._client_for(groups, answers)
+        matcher.match_batches(groups, batch_size=10)
+        matcher._client.messages.create.reset_mock()
+
+        decisions = matcher.match_batches(groups, batch_size=10)
+
+        matcher._client.messages.create.assert_not_called()
+        assert all("(cached)" in d.reasoning for row in decisions for d in row)
+
+    def test_retries_transient_errors(self, groups):
+        rate_limited = RuntimeError("rate limited")
+        rate_limited.status_code = 429
+        client = MagicMock()
+        client.messages.create.side_effect = [rate_limited, self._response([])]
+
+        matcher = LLMMatcher(api_key="test-key", max_concurrency=1)
+        matcher._client = client
+
+        with patch("gcontact_sync.sync.llm_matcher.time.sleep") as mock_sleep:
+            decisions = matcher.match_batches(groups[1:], batch_size=10)
+
+        assert client.messages.create.call_count == 2
+        mock_sleep.assert_called_once_with(1.0)
+        assert decisions[0][0].reasoning == "Not selected in batch review"
+
+    def test_failed_batch_is_not_cached(self, db, groups):
+        client = MagicMock()
+        client.messages.create.side_effect = RuntimeError("bad request")
+
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher._client = client
+
+        decisions = matcher.match_batches(groups, batch_size=10)
+
+        # Non-retryable errors are not retried
+        assert client.messages.create.call_count == 2
+        assert all(not d.is_match for row in decisions for d in row)
+        assert db.get_llm_match_attempt_count() == 0
+
+    def test_unparseable_response_is_not_cached(self, db, groups):
+        response = MagicMock()
+        response.content = [MagicMock(text="not json")]
+        client = MagicMock()
+        client.messages.create.return_value = response
+
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher._client = client
+
+        matcher.match_batches(groups, batch_size=10)
+
+        assert db.get_llm_match_attempt_count() == 0
+
+    def test_empty_groups(self):
+        matcher = LLMMatcher(api_key="test-key")
+        assert matcher.match_batches([], batch_size=10) == []
+
+
+class TestPreloadedCache:
+    """Tests for the in-memory LLM decision cache session."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an initialized in-memory database."""
+        from gcontact_sync.storage.db import SyncDatabase
+
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        return db
+
+    @pytest.fixture
+    def contact1(self):
+        return Contact("people/123", "e1", "John Doe", emails=["john@a.com"])
+
+    @pytest.fixture
+    def contact2(self):
+        return Contact("people/456", "e2", "Johnny D", emails=["jd@b.com"])
+
+    def _store(self, db, contact1, contact2, is_match=True):
+        db.upsert_llm_match_attempt(
+            contact1_resource_name=contact1.resource_name,
+            contact2_resource_name=contact2.resource_name,
+            contact1_display_name=contact1.display_name,
+            contact2_display_name=contact2.display_name,
+            contact1_content_hash=contact1.content_hash(),
+            contact2_content_hash=contact2.content_hash(),
+            is_match=is_match,
+            confidence=0.9,
+            reasoning="stored",
+            model_used="test",
+        )
+
+    def test_preload_serves_lookups_from_memory(self, db, contact1, contact2):
+        self._store(db, contact1, contact2)
+        matcher = LLMMatcher(api_key="test-key", database=db)
+
+        assert matcher.preload_cache() == 1
+
+        with patch.object(db, "get_llm_match_attempt") as mock_get:
+            decision = matcher._get_cached_decision(contact2, contact1)
+
+        mock_get.assert_not_called()
+        assert decision.is_match is True
+        assert "(cached)" in decision.reasoning
+
+    def test_preloaded_entry_invalidated_on_change(self, db, contact1, contact2):
+        self._store(db, contact1, contact2)
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher.preload_cache()
+
+        contact1.emails += ("new@a.com",)
+
+        assert matcher._get_cached_decision(contact1, contact2) is None
+
+    def test_decisions_buffered_until_flush(self, db, contact1, contact2):
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher.preload_cache()
+        decision = LLMMatchDecision(is_match=False, confidence=0.2, reasoning="no")
+
+        matcher._cache_decision(contact1, contact2, decision)
+
+        # Visible to later lookups in the session, but not yet written
+        assert matcher._get_cached_decision(contact1, contact2) is not None
+        assert db.get_llm_match_attempt_count() == 0
+
+        assert matcher.flush_cache() == 1
+        assert db.get_llm_match_attempt_count() == 1
+
+    def test_flush_ends_session(self, db, contact1, contact2):
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher.preload_cache()
+        matcher.flush_cache()
+
+        with patch.object(db, "get_llm_match_attempt", return_value=None) as mock_get:
+            matcher._get_cached_decision(contact1, contact2)
+
+        mock_get.assert_called_once()
+
+    def test_preload_flushes_unflushed_session(self, db, contact1, contact2):
+        matcher = LLMMatcher(api_key="test-key", database=db)
+        matcher.preload_cache()
+        matcher._cache_decision(
+            contact1,
+            contact2,
+            LLMMatchDecision(is_match=True, confidence=0.8, reasoning="yes"),
+        )
+
+        assert matcher.preload_cache() == 1
+        assert db.get_llm_match_attempt_count() == 1
+
+    def test_preload_without_database(self):
+        matcher = LLMMatcher(api_key="test-key")
+        assert matcher.preload_cache() == 0
+        assert matcher.flush_cache() == 0
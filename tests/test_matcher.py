@@ -1341,3 +1341,198 @@ class TestOrganizationMatching:
 
         # Should NOT match on empty organizations
         assert result.tier != MatchTier.FUZZY_NAME_ORG
+
+
+class TestMatchMany:
+    """Tests for bulk matching with ContactMatcher.match_many()."""
+
+    @pytest.fixture
+    def contacts1(self):
+        return [
+            Contact("people/1", "e", "John Smith", emails=["john@work.com"]),
+            Contact("people/2", "e", "Jane Doe", phones=["555-123-4567"]),
+            Contact("people/3", "e", "Robert Brown"),
+            Contact("people/4", "e", "Maria Garcia", emails=["maria@a.com"]),
+            Contact("people/5", "e", "", emails=["noname@example.com"]),
+            Contact("people/6", "e", "Completely Different"),
+        ]
+
+    @pytest.fixture
+    def contacts2(self):
+        return [
+            Contact("people/a", "e", "Johnny Smith", emails=["JOHN@work.com"]),
+            Contact("people/b", "e", "Jane D", phones=["+1 (555) 123-4567"]),
+            Contact("people/c", "e", "Robert Brown"),
+            Contact("people/d", "e", "Mario Garcia", emails=["mario@b.com"]),
+            Contact("people/e", "e", "Someone", emails=["noname@example.com"]),
+            Contact("people/f", "e", "Xavier Quinn"),
+        ]
+
+    def test_equivalent_to_pairwise_match(self, matcher, contacts1, contacts2):
+        """Every match or uncertain pair from match() is returned with same result."""
+        scored = matcher.match_many(contacts1, contacts2)
+
+        assert len(scored) == len(contacts1)
+        for i, contact1 in enumerate(contacts1):
+            expected = []
+            for j, contact2 in enumerate(contacts2):
+                result = matcher.match(contact1, contact2)
+                if result.is_match or result.confidence == MatchConfidence.UNCERTAIN:
+                    expected.append((j, result))
+            assert scored[i] == expected
+
+    def test_candidates_ordered_by_index(self, matcher):
+        contact = Contact("people/1", "e", "Alex Smith")
+        candidates = [
+            Contact("people/a", "e", "Alex Smyth"),
+            Contact("people/b", "e", "Unrelated"),
+            Contact("people/c", "e", "Alex Smith"),
+        ]
+
+        scored = matcher.match_many([contact], candidates)
+
+        assert [j for j, _ in scored[0]] == [0, 2]
+        assert scored[0][1][1].tier == MatchTier.EXACT_NAME
+
+    def test_shared_identifier_matches_despite_different_names(self, matcher):
+        contact1 = Contact("people/1", "e", "Bob", emails=["bob@example.com"])
+        contact2 = Contact("people/2", "e", "Robert Z", emails=["bob@example.com"])
+
+        scored = matcher.match_many([contact1], [contact2])
+
+        assert len(scored[0]) == 1
+        assert scored[0][0][1].tier == MatchTier.EXACT_EMAIL
+
+    def test_stats_count_considered_and_pruned(self, matcher, contacts1, contacts2):
+        from gcontact_sync.sync.blocking import BlockingStats
+
+        stats = BlockingStats()
+        matcher.match_many(contacts1, contacts2, stats=stats)
+
+        total = len(contacts1) * len(contacts2)
+        assert stats.pairs_considered + stats.pairs_pruned == total
+        assert 0 < stats.pairs_considered < total
+
+    def test_blocking_disabled_scores_every_pair(self, contacts1, contacts2):
+        from gcontact_sync.sync.blocking import BlockingStats
+
+        blocked = ContactMatcher(config=MatchConfig(use_llm_matching=False))
+        full = ContactMatcher(
+            config=MatchConfig(use_llm_matching=False, use_candidate_blocking=False)
+        )
+        stats = BlockingStats()
+
+        result = full.match_many(contacts1, contacts2, stats=stats)
+
+        assert stats.pairs_considered == len(contacts1) * len(contacts2)
+        assert stats.pairs_pruned == 0
+        assert result == blocked.match_many(contacts1, contacts2)
+
+    def test_large_input_is_chunked(self, matcher, monkeypatch):
+        """Rows are scored in chunks without changing the result."""
+        import gcontact_sync.sync.matcher as matcher_module
+
+        contacts1 = [Contact(f"people/{i}", "e", f"Person {i}") for i in range(12)]
+        contacts2 = [Contact(f"people/x{i}", "e", f"Person {i}") for i in range(12)]
+        expected = matcher.match_many(contacts1, contacts2)
+
+        monkeypatch.setattr(matcher_module, "MATCH_MANY_MAX_CELLS", 25)
+
+        assert matcher.match_many(contacts1, contacts2) == expected
+
+    def test_empty_inputs(self, matcher):
+        contact = Contact("people/1", "e", "John")
+        assert matcher.match_many([], [contact]) == []
+        assert matcher.match_many([contact], []) == [[]]
+
+
+class TestLLMMatchMany:
+    """Tests for ContactMatcher.llm_match_many()."""
+
+    @pytest.fixture
+    def groups(self):
+        source = Contact("people/1", "e", "John Doe", emails=["john@a.com"])
+        return [
+            (
+                source,
+                [
+                    Contact("people/a", "e", "Johnny Doe", emails=["jd@b.com"]),
+                    Contact("people/b", "e", "John Dough"),
+                ],
+            )
+        ]
+
+    def test_disabled_returns_uncertain(self, matcher, groups):
+        results = matcher.llm_match_many(groups)
+
+        assert len(results) == 1
+        assert [r.is_match for r in results[0]] == [False, False]
+        assert all(r.confidence == MatchConfidence.UNCERTAIN for r in results[0])
+
+    def test_maps_decisions_to_results(self, matcher_with_llm, groups):
+        from unittest.mock import MagicMock
+
+        from gcontact_sync.sync.llm_matcher import LLMMatchDecision
+
+        llm_client = MagicMock()
+        llm_client.match_batches.return_value = [
+            [
+                LLMMatchDecision(is_match=True, confidence=0.9, reasoning="same"),
+                LLMMatchDecision(is_match=False, confidence=0.0, reasoning="no"),
+            ]
+        ]
+        matcher_with_llm._llm_client = llm_client
+
+        results = matcher_with_llm.llm_match_many(groups)
+
+        llm_client.match_batches.assert_called_once_with(
+            groups, batch_size=matcher_with_llm.config.llm_batch_size
+        )
+        assert results[0][0].is_match is True
+        assert results[0][0].tier == MatchTier.LLM_MATCHED
+        assert results[0][0].score == 0.9
+        assert results[0][1].is_match is False
+        assert results[0][1].tier == MatchTier.LLM_NOT_MATCHED
+
+    def test_unavailable_client_returns_uncertain(self, matcher_with_llm, groups):
+        from unittest.mock import patch
+
+        with patch(
+            "gcontact_sync.sync.llm_matcher.LLMMatcher",
+            side_effect=RuntimeError("no client"),
+        ):
+            results = matcher_with_llm.llm_match_many(groups)
+
+        assert all(not r.is_match for r in results[0])
+        assert "no client" in results[0][0].reason
+
+
+class TestLLMCacheSession:
+    """Tests for ContactMatcher.preload_llm_cache()/flush_llm_cache()."""
+
+    def test_preload_skipped_when_llm_disabled(self):
+        from unittest.mock import MagicMock
+
+        database = MagicMock()
+        matcher = ContactMatcher(
+            config=MatchConfig(use_llm_matching=False), database=database
+        )
+
+        assert matcher.preload_llm_cache() == 0
+        database.get_all_llm_match_attempts.assert_not_called()
+        assert matcher.flush_llm_cache() == 0
+
+    def test_preload_and_flush_delegate_to_llm_matcher(self):
+        from gcontact_sync.storage.db import SyncDatabase
+
+        database = SyncDatabase(":memory:")
+        database.initialize()
+        matcher = ContactMatcher(
+            config=MatchConfig(use_llm_matching=True, anthropic_api_key="test-key"),
+            database=database,
+        )
+
+        assert matcher.preload_llm_cache() == 0
+        assert matcher._llm_client._preloaded == {}
+        assert matcher.flush_llm_cache() == 0
+        assert matcher._llm_client._preloaded is None
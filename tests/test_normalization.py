@@ -1,6 +1,6 @@
 """Tests for string normalization utility."""
 
-from gcontact_sync.utils.normalization import normalize_string
+from gcontact_sync.utils.normalization import _normalize, normalize_string
 
 
 class TestNormalizeStringBasic:
@@ -141,3 +141,41 @@ class TestNormalizeStringGroupScenarios:
             "My   Custom   Group", strip_punctuation=False, remove_spaces=False
         )
         assert result == "my custom group"
+
+
+class TestNormalizeStringFastPath:
+    """Test that the ASCII fast path and the cache match the full path."""
+
+    def test_ascii_and_unicode_whitespace_handled_alike(self):
+        """Tabs, newlines and non-ASCII spaces all separate words."""
+        assert normalize_string("Jane\tMarie\nDoe ", remove_spaces=False) == (
+            "jane marie doe"
+        )
+        assert normalize_string("Jane　Doeé", remove_spaces=False) == ("jane doee")
+
+    def test_ascii_email_keeps_at_symbol(self):
+        """The ASCII translation table keeps @ only for emails."""
+        assert normalize_string("J.Doe+x@Example.COM", allow_email_chars=True) == (
+            "jdoex@examplecom"
+        )
+        assert normalize_string("J.Doe+x@Example.COM") == "jdoexexamplecom"
+
+    def test_compatibility_characters_decomposed(self):
+        """Non-ASCII compatibility characters still go through NFKD."""
+        assert normalize_string("ﬁle ①") == "file1"
+
+    def test_repeated_calls_use_cache(self):
+        """Repeated values are served from the cache with the same result."""
+        _normalize.cache_clear()
+
+        first = normalize_string("Café Société", sort_words=True)
+        second = normalize_string("Café Société", sort_words=True)
+
+        assert first == second == "cafesociete"
+        assert _normalize.cache_info().hits == 1
+
+    def test_options_are_cached_separately(self):
+        """The same value normalized with other options is not mixed up."""
+        assert normalize_string("A-B c") == "abc"
+        assert normalize_string("A-B c", strip_punctuation=False) == "a-bc"
+        assert normalize_string("A-B c", remove_spaces=False) == "ab c"
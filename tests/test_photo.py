@@ -21,7 +21,9 @@ from gcontact_sync.sync.photo import (
     MAX_RETRY_DELAY,
     PhotoDownloadError,
     PhotoError,
+    create_photo_session,
     download_photo,
+    download_photo_if_modified,
     process_photo,
 )
 
@@ -313,6 +315,87 @@ class TestDownloadPhotoRetries:
             download_photo("https://example.com/photo.jpg")
 
 
+class TestPhotoSession:
+    """Tests for the pooled photo download session."""
+
+    def test_session_pools_connections(self):
+        """Test the session mounts a pooled adapter for http and https."""
+        session = create_photo_session(pool_maxsize=4, connect_retries=3)
+
+        for prefix in ("https://", "http://"):
+            adapter = session.get_adapter(f"{prefix}example.com")
+            assert adapter._pool_maxsize == 4
+            assert adapter.max_retries.connect == 3
+            assert adapter.max_retries.read == 0
+        assert session.headers["User-Agent"] == "gcontact-sync/0.1.0"
+        session.close()
+
+    def test_download_uses_session(self):
+        """Test download_photo uses the given session instead of requests.get."""
+        session = Mock()
+        session.get.return_value = Mock(
+            content=b"image", headers={"content-type": "image/jpeg"}
+        )
+
+        with patch("gcontact_sync.sync.photo.requests.get") as mock_get:
+            result = download_photo("https://example.com/p.jpg", session=session)
+
+        assert result == b"image"
+        session.get.assert_called_once()
+        mock_get.assert_not_called()
+
+
+class TestDownloadPhotoIfModified:
+    """Tests for conditional photo downloads."""
+
+    @patch("gcontact_sync.sync.photo.requests.get")
+    def test_sends_if_none_match(self, mock_get):
+        """Test a known ETag is sent as If-None-Match."""
+        mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+
+        download_photo_if_modified("https://example.com/p.jpg", etag='"abc"')
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+
+    @patch("gcontact_sync.sync.photo.requests.get")
+    def test_not_modified(self, mock_get):
+        """Test a 304 response is reported as not modified without data."""
+        mock_get.return_value = Mock(status_code=304, content=b"", headers={})
+
+        result = download_photo_if_modified("https://example.com/p.jpg", etag='"a"')
+
+        assert result.not_modified is True
+        assert result.data is None
+        assert result.etag == '"a"'
+
+    @patch("gcontact_sync.sync.photo.requests.get")
+    def test_modified_returns_data_and_etag(self, mock_get):
+        """Test a 200 response returns the body and the new ETag."""
+        mock_get.return_value = Mock(
+            status_code=200,
+            content=b"new image",
+            headers={"content-type": "image/jpeg", "etag": '"b"'},
+        )
+
+        result = download_photo_if_modified("https://example.com/p.jpg", etag='"a"')
+
+        assert result.not_modified is False
+        assert result.data == b"new image"
+        assert result.etag == '"b"'
+
+    @patch("gcontact_sync.sync.photo.requests.get")
+    def test_no_etag_no_condition(self, mock_get):
+        """Test no If-None-Match header is sent without an ETag."""
+        mock_get.return_value = Mock(
+            status_code=200, content=b"image", headers={"content-type": "image/png"}
+        )
+
+        download_photo_if_modified("https://example.com/p.jpg")
+
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+
 class TestProcessPhotoBasics:
     """Tests for basic process_photo functionality."""
 
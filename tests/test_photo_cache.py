@@ -0,0 +1,267 @@
+"""
+Unit tests for the photo cache module.
+
+Tests the on-disk LRU cache of processed photos.
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from gcontact_sync.sync.photo_cache import (
+    INDEX_FILENAME,
+    PhotoCache,
+    ProcessedPhoto,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Directory for the cache."""
+    return tmp_path / "photo_cache"
+
+
+class TestProcessedPhoto:
+    """Tests for ProcessedPhoto."""
+
+    def test_from_data_hashes_bytes(self):
+        """Test from_data computes the SHA-256 of the data."""
+        photo = ProcessedPhoto.from_data(b"jpeg")
+
+        assert photo.data == b"jpeg"
+        assert photo.sha256 == hashlib.sha256(b"jpeg").hexdigest()
+
+
+class TestPhotoCacheLookup:
+    """Tests for storing and looking up photos."""
+
+    def test_get_missing(self, cache_dir):
+        """Test a photo that was never stored is a miss."""
+        cache = PhotoCache(cache_dir)
+
+        assert cache.get("https://example.com/a.jpg") is None
+        assert cache.get_hash("https://example.com/a.jpg") is None
+
+    def test_put_then_get(self, cache_dir):
+        """Test a stored photo is returned with its hash."""
+        cache = PhotoCache(cache_dir)
+
+        stored = cache.put("https://example.com/a.jpg", None, b"jpeg-a")
+        found = cache.get("https://example.com/a.jpg")
+
+        assert found == stored
+        assert found.data == b"jpeg-a"
+        assert cache.get_hash("https://example.com/a.jpg") == stored.sha256
+
+    def test_key_includes_etag(self, cache_dir):
+        """Test the same URL with a different etag is a different entry."""
+        cache = PhotoCache(cache_dir)
+        cache.put("https://example.com/a.jpg", "v1", b"jpeg-v1")
+
+        assert cache.get("https://example.com/a.jpg", "v2") is None
+        assert cache.get("https://example.com/a.jpg", "v1").data == b"jpeg-v1"
+
+    def test_same_image_stored_once(self, cache_dir):
+        """Test photos with identical bytes share one file."""
+        cache = PhotoCache(cache_dir)
+        cache.put("https://example.com/a.jpg", None, b"same")
+        cache.put("https://example.com/b.jpg", None, b"same")
+
+        assert len(cache) == 2
+        assert cache.total_bytes == len(b"same")
+        assert len(list(cache_dir.glob("*.jpg"))) == 1
+
+    def test_corrupt_file_is_a_miss(self, cache_dir):
+        """Test a photo file that no longer matches its hash is dropped."""
+        cache = PhotoCache(cache_dir)
+        photo = cache.put("https://example.com/a.jpg", None, b"jpeg-a")
+        (cache_dir / f"{photo.sha256}.jpg").write_bytes(b"garbage")
+
+        assert cache.get("https://example.com/a.jpg") is None
+        assert len(cache) == 0
+        assert not (cache_dir / f"{photo.sha256}.jpg").exists()
+
+
+class TestPhotoCacheEviction:
+    """Tests for the size cap."""
+
+    def test_evicts_least_recently_used(self, cache_dir):
+        """Test the least recently used photo is evicted over the cap."""
+        cache = PhotoCache(cache_dir, max_bytes=20)
+        cache.put("https://example.com/a.jpg", None, b"a" * 8)
+        cache.put("https://example.com/b.jpg", None, b"b" * 8)
+
+        # Touch a so that b is the least recently used
+        assert cache.get("https://example.com/a.jpg") is not None
+        cache.put("https://example.com/c.jpg", None, b"c" * 8)
+
+        assert cache.get_hash("https://example.com/b.jpg") is None
+        assert cache.get("https://example.com/a.jpg") is not None
+        assert cache.get("https://example.com/c.jpg") is not None
+        assert cache.total_bytes == 16
+        assert len(list(cache_dir.glob("*.jpg"))) == 2
+
+    def test_shared_photo_kept_until_last_entry_evicted(self, cache_dir):
+        """Test a file shared by several entries outlives the first eviction."""
+        cache = PhotoCache(cache_dir, max_bytes=16)
+        cache.put("https://example.com/a.jpg", None, b"s" * 8)
+        cache.put("https://example.com/b.jpg", None, b"s" * 8)
+        cache.put("https://example.com/c.jpg", None, b"c" * 8)
+
+        cache.put("https://example.com/d.jpg", None, b"d" * 8)
+
+        # a and b point at one file; both go before it is removed
+        assert cache.get_hash("https://example.com/a.jpg") is None
+        assert cache.get_hash("https://example.com/b.jpg") is None
+        assert cache.get("https://example.com/c.jpg") is not None
+        assert cache.total_bytes == 16
+        assert len(list(cache_dir.glob("*.jpg"))) == 2
+
+    def test_replaced_entry_releases_old_photo(self, cache_dir):
+        """Test storing a new photo under a key frees the old file."""
+        cache = PhotoCache(cache_dir, max_bytes=100)
+        cache.put("https://example.com/a.jpg", None, b"old")
+        cache.put("https://example.com/a.jpg", None, b"new")
+
+        assert cache.total_bytes == 3
+        assert [p.stem for p in cache_dir.glob("*.jpg")] == [
+            hashlib.sha256(b"new").hexdigest()
+        ]
+
+    def test_full_cache_evicts_in_order(self, cache_dir):
+        """Test a long run of puts into a full cache keeps the newest photos."""
+        cache = PhotoCache(cache_dir, max_bytes=1000 * 8)
+        for i in range(3000):
+            cache.put(f"https://example.com/{i}.jpg", None, b"%08d" % i)
+
+        assert len(cache) == 1000
+        assert cache.total_bytes == 1000 * 8
+        assert cache.get_hash("https://example.com/1999.jpg") is None
+        assert cache.get_hash("https://example.com/2000.jpg") is not None
+
+    def test_oversized_photo_not_stored(self, cache_dir):
+        """Test a photo larger than the cap is returned but not stored."""
+        cache = PhotoCache(cache_dir, max_bytes=4)
+
+        photo = cache.put("https://example.com/a.jpg", None, b"too large")
+
+        assert photo.data == b"too large"
+        assert len(cache) == 0
+
+
+class TestPhotoCachePersistence:
+    """Tests for saving and loading the index."""
+
+    def test_save_and_reload(self, cache_dir):
+        """Test entries survive across cache instances."""
+        cache = PhotoCache(cache_dir)
+        photo = cache.put("https://example.com/a.jpg", "v1", b"jpeg-a")
+        cache.save()
+
+        reloaded = PhotoCache(cache_dir)
+
+        assert reloaded.get("https://example.com/a.jpg", "v1") == photo
+
+    def test_reload_keeps_lru_order(self, cache_dir):
+        """Test recency order is restored from the index."""
+        cache = PhotoCache(cache_dir, max_bytes=20)
+        cache.put("https://example.com/a.jpg", None, b"a" * 8)
+        cache.put("https://example.com/b.jpg", None, b"b" * 8)
+        cache.get("https://example.com/a.jpg")
+        cache.save()
+
+        reloaded = PhotoCache(cache_dir, max_bytes=20)
+        reloaded.put("https://example.com/c.jpg", None, b"c" * 8)
+
+        assert reloaded.get_hash("https://example.com/b.jpg") is None
+        assert reloaded.get_hash("https://example.com/a.jpg") is not None
+
+    def test_unsaved_files_removed_on_load(self, cache_dir):
+        """Test photo files missing from the saved index are cleaned up."""
+        cache = PhotoCache(cache_dir)
+        cache.put("https://example.com/a.jpg", None, b"saved")
+        cache.save()
+        cache.put("https://example.com/b.jpg", None, b"unsaved")
+
+        PhotoCache(cache_dir)
+
+        assert len(list(cache_dir.glob("*.jpg"))) == 1
+
+    def test_unreadable_index_ignored(self, cache_dir):
+        """Test a corrupt index starts an empty cache."""
+        cache_dir.mkdir(parents=True)
+        (cache_dir / INDEX_FILENAME).write_text("{not json")
+
+        cache = PhotoCache(cache_dir)
+
+        assert len(cache) == 0
+
+    def test_save_without_changes_writes_nothing(self, cache_dir):
+        """Test save() is a no-op for an unchanged cache."""
+        PhotoCache(cache_dir).save()
+
+        assert not (cache_dir / INDEX_FILENAME).exists()
+
+    def test_index_format(self, cache_dir):
+        """Test the saved index lists entries and file sizes."""
+        cache = PhotoCache(cache_dir)
+        photo = cache.put("https://example.com/a.jpg", None, b"jpeg-a", '"v1"')
+        cache.save()
+
+        index = json.loads((cache_dir / INDEX_FILENAME).read_text())
+
+        assert index["version"] == 2
+        assert index["entries"] == [
+            [" https://example.com/a.jpg", photo.sha256, '"v1"', photo.validated_at]
+        ]
+        assert index["blobs"] == {photo.sha256: len(b"jpeg-a")}
+
+    def test_index_from_other_version_discarded(self, cache_dir):
+        """Test an index from another version is dropped with its files."""
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "abc.jpg").write_bytes(b"old")
+        (cache_dir / INDEX_FILENAME).write_text(
+            json.dumps({"version": 1, "entries": [], "blobs": {"abc": 3}})
+        )
+
+        cache = PhotoCache(cache_dir)
+
+        assert len(cache) == 0
+        assert not (cache_dir / "abc.jpg").exists()
+
+
+class TestPhotoCacheValidation:
+    """Tests for HTTP ETags and revalidation times."""
+
+    def test_put_records_http_etag(self, cache_dir):
+        """Test the ETag the source was served with is returned by get()."""
+        cache = PhotoCache(cache_dir)
+        cache.put("https://example.com/a.jpg", None, b"jpeg-a", http_etag='"v1"')
+
+        photo = cache.get("https://example.com/a.jpg")
+
+        assert photo.http_etag == '"v1"'
+        assert photo.validated_at > 0
+
+    def test_mark_validated(self, cache_dir, monkeypatch):
+        """Test mark_validated refreshes the validation time."""
+        cache = PhotoCache(cache_dir)
+        monkeypatch.setattr("gcontact_sync.sync.photo_cache.time.time", lambda: 100.0)
+        cache.put("https://example.com/a.jpg", None, b"jpeg-a")
+
+        monkeypatch.setattr("gcontact_sync.sync.photo_cache.time.time", lambda: 500.0)
+        cache.mark_validated("https://example.com/a.jpg")
+
+        assert cache.get("https://example.com/a.jpg").validated_at == 500.0
+
+    def test_validation_survives_reload(self, cache_dir):
+        """Test ETag and validation time are saved in the index."""
+        cache = PhotoCache(cache_dir)
+        stored = cache.put("https://example.com/a.jpg", None, b"a", '"v1"')
+        cache.save()
+
+        photo = PhotoCache(cache_dir).get("https://example.com/a.jpg")
+
+        assert photo.http_etag == '"v1"'
+        assert photo.validated_at == stored.validated_at
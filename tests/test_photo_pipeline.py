@@ -0,0 +1,458 @@
+"""
+Unit tests for the photo pipeline module.
+
+Tests the concurrent photo transfer pipeline with mocked download, processing
+and People API calls.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gcontact_sync.api.people_api import PeopleAPI, PeopleAPIError
+from gcontact_sync.sync.contact import Contact
+from gcontact_sync.sync.photo import PhotoDownload, PhotoDownloadError, PhotoError
+from gcontact_sync.sync.photo_cache import PhotoCache, ProcessedPhoto
+from gcontact_sync.sync.photo_pipeline import (
+    PhotoPipeline,
+    PhotoResult,
+    PhotoTask,
+    _RateLimiter,
+    _Upload,
+)
+
+
+def _task(index, api, photo=True):
+    """Create a photo task for contact number index."""
+    contact = Contact(
+        f"people/{index}",
+        f"e{index}",
+        f"Contact {index}",
+        photo_url=f"https://example.com/{index}.jpg" if photo else None,
+    )
+    return PhotoTask(
+        source_contact=contact,
+        dest_resource_name=f"people/dest{index}",
+        dest_api=api,
+        account_label="dest@example.com",
+    )
+
+
+@pytest.fixture
+def api():
+    """Create a mock destination PeopleAPI."""
+    return MagicMock(spec=PeopleAPI)
+
+
+@pytest.fixture
+def pipeline():
+    """Create a pipeline uploading one photo per request, without rate limiting."""
+    return PhotoPipeline(uploads_per_second=0, upload_batch_size=1)
+
+
+class TestPhotoPipelineRun:
+    """Tests for PhotoPipeline.run."""
+
+    def test_run_empty(self, pipeline):
+        """Test running without tasks returns no results."""
+        assert pipeline.run([]) == []
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_run_downloads_processes_and_uploads(
+        self, mock_download, mock_process, pipeline, api
+    ):
+        """Test each photo goes through download, processing and upload."""
+        mock_download.side_effect = lambda url, **kwargs: PhotoDownload(
+            f"raw:{url}".encode()
+        )
+        mock_process.side_effect = lambda data: data + b":jpeg"
+        tasks = [_task(i, api) for i in range(5)]
+
+        results = pipeline.run(tasks)
+
+        assert [r.task for r in results] == tasks
+        assert all(r.succeeded for r in results)
+        uploads = {call.args for call in api.upload_photo.call_args_list}
+        assert uploads == {
+            (f"people/dest{i}", f"raw:https://example.com/{i}.jpg:jpeg".encode())
+            for i in range(5)
+        }
+
+    def test_run_deletes_when_source_has_no_photo(self, pipeline, api):
+        """Test the destination photo is deleted when the source has none."""
+        results = pipeline.run([_task(1, api, photo=False)])
+
+        api.delete_photo.assert_called_once_with("people/dest1")
+        api.upload_photo.assert_not_called()
+        assert results[0].succeeded is True
+
+    def test_run_delete_error_is_reported_not_raised(self, pipeline, api):
+        """Test a failed delete (e.g. no photo) is reported in the result."""
+        api.delete_photo.side_effect = PeopleAPIError("No photo")
+
+        results = pipeline.run([_task(1, api, photo=False)])
+
+        assert results[0].succeeded is False
+        assert results[0].error == "No photo"
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_run_download_failure_does_not_stop_others(
+        self, mock_download, mock_process, pipeline, api
+    ):
+        """Test one failed download is reported while the rest still upload."""
+
+        def download(url, **kwargs):
+            if url.endswith("/1.jpg"):
+                raise PhotoDownloadError("404")
+            return PhotoDownload(b"raw")
+
+        mock_download.side_effect = download
+        mock_process.return_value = b"jpeg"
+
+        results = pipeline.run([_task(i, api) for i in range(3)])
+
+        assert [r.succeeded for r in results] == [True, False, True]
+        assert results[1].error == "404"
+        assert api.upload_photo.call_count == 2
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_run_process_failure(self, mock_download, mock_process, pipeline, api):
+        """Test a photo that cannot be processed is not uploaded."""
+        mock_download.return_value = PhotoDownload(b"not an image")
+        mock_process.side_effect = PhotoError("Invalid or unsupported image format")
+
+        results = pipeline.run([_task(1, api)])
+
+        assert results[0].succeeded is False
+        api.upload_photo.assert_not_called()
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_run_upload_failure(self, mock_download, mock_process, pipeline, api):
+        """Test an upload error is reported in the result."""
+        mock_download.return_value = PhotoDownload(b"raw")
+        mock_process.return_value = b"jpeg"
+        api.upload_photo.side_effect = PeopleAPIError("Upload failed")
+
+        results = pipeline.run([_task(1, api)])
+
+        assert isinstance(results[0], PhotoResult)
+        assert results[0].succeeded is False
+        assert results[0].error == "Upload failed"
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_run_downloads_concurrently(
+        self, mock_download, mock_process, pipeline, api
+    ):
+        """Test downloads overlap instead of running one at a time."""
+        # Each download waits for all the others; serial downloads would fail
+        barrier = threading.Barrier(4, timeout=5)
+
+        def download(url, **kwargs):
+            barrier.wait()
+            return PhotoDownload(b"raw")
+
+        mock_download.side_effect = download
+        mock_process.return_value = b"jpeg"
+
+        results = pipeline.run([_task(i, api) for i in range(4)])
+
+        assert all(r.succeeded for r in results)
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_run_bounds_photos_in_flight(self, mock_download, mock_process, api):
+        """Test no more than max_in_flight photos are in the pipeline at once."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def download(url, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            return PhotoDownload(b"raw")
+
+        def upload(resource_name, photo):
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+
+        mock_download.side_effect = download
+        mock_process.return_value = b"jpeg"
+        api.upload_photo.side_effect = upload
+
+        pipeline = PhotoPipeline(
+            max_in_flight=2, uploads_per_second=0, upload_batch_size=1
+        )
+        results = pipeline.run([_task(i, api) for i in range(8)])
+
+        assert len(results) == 8
+        assert peak <= 2
+
+
+class TestPhotoPipelineBatching:
+    """Tests for sending queued uploads and deletes in batch requests."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a pipeline with one upload worker batching up to 10 photos."""
+        return PhotoPipeline(
+            uploads_per_second=0, upload_workers=1, upload_batch_size=10
+        )
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_queued_uploads_share_a_batch(
+        self, mock_download, mock_process, pipeline, api
+    ):
+        """Test photos ready during an upload go out in one batch request."""
+        first_upload_started = threading.Event()
+
+        def download(url, **kwargs):
+            # The other photos only become ready once the first is uploading
+            if not url.endswith("/0.jpg"):
+                first_upload_started.wait(5)
+            return PhotoDownload(b"raw")
+
+        def upload(resource_name, photo):
+            first_upload_started.set()
+            time.sleep(0.3)
+            return True
+
+        mock_download.side_effect = download
+        mock_process.return_value = b"jpeg"
+        api.upload_photo.side_effect = upload
+        api.batch_upload_photos.side_effect = lambda photos: [True] * len(photos)
+
+        results = pipeline.run([_task(i, api) for i in range(5)])
+
+        assert all(r.succeeded for r in results)
+        api.upload_photo.assert_called_once()
+        api.batch_upload_photos.assert_called_once()
+        assert len(api.batch_upload_photos.call_args.args[0]) == 4
+
+    def test_deletes_batched(self, pipeline, api):
+        """Test deletes for one account go out in one batch request."""
+        api.batch_delete_photos.side_effect = lambda names: [
+            PeopleAPIError("No photo") if name == "people/dest2" else True
+            for name in names
+        ]
+        tasks = [_task(i, api, photo=False) for i in range(4)]
+
+        results = pipeline._delete_many(tasks, _RateLimiter(0))
+
+        assert [r.succeeded for r in results] == [True, True, False, True]
+        assert results[2].error == "No photo"
+        api.batch_delete_photos.assert_called_once_with(
+            ["people/dest0", "people/dest1", "people/dest2", "people/dest3"]
+        )
+        api.delete_photo.assert_not_called()
+
+    def test_batch_upload_errors_reported_per_photo(self, pipeline, api):
+        """Test a failed photo in a batch does not fail the others."""
+        api.batch_upload_photos.return_value = [
+            True,
+            PeopleAPIError("Contact not found: people/dest1"),
+        ]
+        tasks = [_task(i, api) for i in range(2)]
+        photos = [ProcessedPhoto.from_data(b"a"), ProcessedPhoto.from_data(b"b")]
+
+        results = pipeline._upload_many(tasks, photos, _RateLimiter(0))
+
+        assert [r.succeeded for r in results] == [True, False]
+        assert results[1].error == "Contact not found: people/dest1"
+
+    def test_send_groups_by_account_and_kind(self, pipeline):
+        """Test uploads and deletes for different accounts are sent separately."""
+        api_a = MagicMock(spec=PeopleAPI)
+        api_b = MagicMock(spec=PeopleAPI)
+        api_a.batch_upload_photos.side_effect = lambda photos: [True] * len(photos)
+        photo = ProcessedPhoto.from_data(b"jpeg")
+        finished = []
+        batch = [
+            _Upload(_task(0, api_a), photo, finished.append),
+            _Upload(_task(1, api_b), photo, finished.append),
+            _Upload(_task(2, api_a), photo, finished.append),
+            _Upload(_task(3, api_a, photo=False), None, finished.append),
+        ]
+
+        pipeline._send_uploads(batch, _RateLimiter(0))
+
+        assert len(finished) == 4
+        assert all(r.succeeded for r in finished)
+        api_a.batch_upload_photos.assert_called_once_with(
+            [("people/dest0", b"jpeg"), ("people/dest2", b"jpeg")]
+        )
+        api_b.upload_photo.assert_called_once_with("people/dest1", b"jpeg")
+        api_a.delete_photo.assert_called_once_with("people/dest3")
+
+    def test_send_failure_finishes_every_photo(self, pipeline, api):
+        """Test an unexpected error still finishes every photo in the batch."""
+        api.batch_upload_photos.side_effect = RuntimeError("boom")
+        photo = ProcessedPhoto.from_data(b"jpeg")
+        finished = []
+        batch = [_Upload(_task(i, api), photo, finished.append) for i in range(3)]
+
+        pipeline._send_uploads(batch, _RateLimiter(0))
+
+        assert [r.succeeded for r in finished] == [False, False, False]
+        assert all(r.error == "boom" for r in finished)
+
+
+class TestPhotoPipelineCache:
+    """Tests for the pipeline with a photo cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create an empty photo cache."""
+        return PhotoCache(tmp_path / "photo_cache")
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_miss_processes_and_stores(self, mock_download, mock_process, cache, api):
+        """Test a cache miss is downloaded, processed, cached and saved."""
+        mock_download.return_value = PhotoDownload(b"raw")
+        mock_process.return_value = b"jpeg"
+        pipeline = PhotoPipeline(uploads_per_second=0, cache=cache)
+
+        pipeline.run([_task(1, api)])
+
+        assert cache.get("https://example.com/1.jpg").data == b"jpeg"
+        assert PhotoCache(cache.cache_dir).get_hash("https://example.com/1.jpg")
+        api.upload_photo.assert_called_once_with("people/dest1", b"jpeg")
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_hit_skips_download_and_processing(
+        self, mock_download, mock_process, cache, api
+    ):
+        """Test a cached photo is uploaded without download or processing."""
+        cache.put("https://example.com/1.jpg", None, b"cached-jpeg")
+        pipeline = PhotoPipeline(uploads_per_second=0, cache=cache)
+
+        results = pipeline.run([_task(1, api)])
+
+        assert results[0].succeeded is True
+        mock_download.assert_not_called()
+        mock_process.assert_not_called()
+        api.upload_photo.assert_called_once_with("people/dest1", b"cached-jpeg")
+
+    def test_upload_skipped_when_destination_has_same_photo(self, cache, api):
+        """Test no upload when the destination photo has the same hash."""
+        cache.put("https://example.com/1.jpg", None, b"jpeg")
+        cache.put("https://example.com/dest1.jpg", None, b"jpeg")
+        task = _task(1, api)
+        task.dest_photo_url = "https://example.com/dest1.jpg"
+        pipeline = PhotoPipeline(uploads_per_second=0, cache=cache)
+
+        results = pipeline.run([task])
+
+        assert results[0].succeeded is True
+        api.upload_photo.assert_not_called()
+
+    def test_upload_when_destination_photo_differs(self, cache, api):
+        """Test a destination with a different photo is still uploaded."""
+        cache.put("https://example.com/1.jpg", None, b"new-jpeg")
+        cache.put("https://example.com/dest1.jpg", None, b"old-jpeg")
+        task = _task(1, api)
+        task.dest_photo_url = "https://example.com/dest1.jpg"
+        pipeline = PhotoPipeline(uploads_per_second=0, cache=cache)
+
+        pipeline.run([task])
+
+        api.upload_photo.assert_called_once_with("people/dest1", b"new-jpeg")
+
+
+class TestPhotoPipelineRevalidation:
+    """Tests for revalidating stale cached photos with conditional requests."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Cache holding a photo validated long ago."""
+        cache = PhotoCache(tmp_path / "photo_cache")
+        cache.put("https://example.com/1.jpg", None, b"cached-jpeg", '"v1"')
+        with patch("gcontact_sync.sync.photo_cache.time.time", return_value=0.0):
+            cache.mark_validated("https://example.com/1.jpg")
+        return cache
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_not_modified_reuses_cached_photo(
+        self, mock_download, mock_process, cache, api
+    ):
+        """Test a 304 reuses the cached photo and refreshes its validation."""
+        mock_download.return_value = PhotoDownload(None, etag='"v1"', not_modified=True)
+        pipeline = PhotoPipeline(uploads_per_second=0, cache=cache)
+
+        pipeline.run([_task(1, api)])
+
+        assert mock_download.call_args.kwargs["etag"] == '"v1"'
+        mock_process.assert_not_called()
+        api.upload_photo.assert_called_once_with("people/dest1", b"cached-jpeg")
+        assert cache.get("https://example.com/1.jpg").validated_at > 0
+
+    @patch("gcontact_sync.sync.photo_pipeline.process_photo")
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_modified_reprocesses(self, mock_download, mock_process, cache, api):
+        """Test a changed photo is processed and replaces the cached one."""
+        mock_download.return_value = PhotoDownload(b"new-raw", etag='"v2"')
+        mock_process.return_value = b"new-jpeg"
+        pipeline = PhotoPipeline(uploads_per_second=0, cache=cache)
+
+        pipeline.run([_task(1, api)])
+
+        api.upload_photo.assert_called_once_with("people/dest1", b"new-jpeg")
+        cached = cache.get("https://example.com/1.jpg")
+        assert cached.data == b"new-jpeg"
+        assert cached.http_etag == '"v2"'
+
+    @patch("gcontact_sync.sync.photo_pipeline.download_photo_if_modified")
+    def test_downloads_use_pipeline_session(self, mock_download, api):
+        """Test downloads go through the pipeline's shared session."""
+        session = MagicMock()
+        mock_download.return_value = PhotoDownload(b"raw")
+        pipeline = PhotoPipeline(uploads_per_second=0, session=session)
+
+        with patch(
+            "gcontact_sync.sync.photo_pipeline.process_photo", return_value=b"j"
+        ):
+            pipeline.run([_task(1, api)])
+
+        assert mock_download.call_args.kwargs["session"] is session
+
+
+class TestRateLimiter:
+    """Tests for the upload stage rate limiter."""
+
+    def test_unlimited_does_not_wait(self):
+        """Test a rate of 0 never sleeps."""
+        limiter = _RateLimiter(0)
+
+        with patch("gcontact_sync.sync.photo_pipeline.time.sleep") as mock_sleep:
+            for _ in range(10):
+                limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_spaces_calls(self):
+        """Test calls beyond the first wait for their slot."""
+        limiter = _RateLimiter(10.0)
+
+        with patch("gcontact_sync.sync.photo_pipeline.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+
+        # First call is immediate, later calls are spaced ~0.1s apart
+        assert mock_sleep.call_count == 2
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays[0] == pytest.approx(0.1, abs=0.05)
+        assert delays[1] == pytest.approx(0.2, abs=0.05)
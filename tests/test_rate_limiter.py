@@ -0,0 +1,238 @@
+"""
+Unit tests for the rate limiter module.
+
+Tests the adaptive token buckets that pace People API requests.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gcontact_sync.api.rate_limiter import (
+    DEFAULT_READ_REQUESTS_PER_MINUTE,
+    DEFAULT_WRITE_REQUESTS_PER_MINUTE,
+    MIN_RATE_FRACTION,
+    RATE_INCREASE_STEPS,
+    READ,
+    WRITE,
+    RateLimiter,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by sleeping."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.advance = True
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        if self.advance:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Patch the limiter's clock and sleep."""
+    fake = FakeClock()
+    with (
+        patch("gcontact_sync.api.rate_limiter.time.monotonic", fake.monotonic),
+        patch("gcontact_sync.api.rate_limiter.time.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+class TestTokenBucket:
+    """Tests for pacing requests."""
+
+    def test_burst_sent_without_waiting(self, clock):
+        """Test requests up to the burst size are not delayed."""
+        bucket = TokenBucket(60, burst=3)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_paced_after_burst(self, clock):
+        """Test requests beyond the burst are spaced at the rate."""
+        bucket = TokenBucket(60, burst=2)
+
+        for _ in range(5):
+            bucket.acquire()
+
+        # 60 per minute: one request per second once the burst is used
+        assert clock.sleeps == pytest.approx([1.0, 1.0, 1.0])
+        assert bucket.stats.throttled_seconds == pytest.approx(3.0)
+
+    def test_tokens_refill_over_time(self, clock):
+        """Test idle time refills tokens up to the burst size."""
+        bucket = TokenBucket(60, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_acquire_several_tokens(self, clock):
+        """Test a batch of requests waits for all of its tokens."""
+        bucket = TokenBucket(60, burst=2)
+
+        bucket.acquire(5)
+
+        assert clock.sleeps == pytest.approx([3.0])
+        assert bucket.stats.requests == 5
+
+    def test_unlimited(self, clock):
+        """Test a zero rate never delays requests."""
+        bucket = TokenBucket(0, burst=1)
+
+        for _ in range(100):
+            bucket.acquire()
+
+        assert clock.sleeps == []
+        assert bucket.stats.requests == 100
+
+    def test_concurrent_callers_spread_out(self, clock):
+        """Test concurrent callers each get their own slot."""
+        bucket = TokenBucket(60, burst=1)
+        bucket.acquire()
+        # All callers arrive at the same moment
+        clock.advance = False
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each waits one second longer than the previous one
+        assert sorted(clock.sleeps) == pytest.approx([1.0, 2.0, 3.0, 4.0])
+
+
+class TestTokenBucketAdaptation:
+    """Tests for learning from throttled responses."""
+
+    def test_throttled_halves_rate(self, clock):
+        """Test a throttled response halves the rate."""
+        bucket = TokenBucket(60)
+
+        bucket.on_throttled(1.0)
+
+        assert bucket.rate == pytest.approx(0.5)
+        assert bucket.stats.current_rate == pytest.approx(30.0)
+        assert bucket.stats.throttled == 1
+
+    def test_rate_has_floor(self, clock):
+        """Test repeated throttling stops at the minimum rate."""
+        bucket = TokenBucket(60)
+
+        for _ in range(50):
+            bucket.on_throttled(0.0)
+
+        assert bucket.rate == pytest.approx(MIN_RATE_FRACTION)
+
+    def test_throttled_pauses_all_callers(self, clock):
+        """Test the next request waits out the retry delay."""
+        bucket = TokenBucket(6000, burst=10)
+
+        bucket.on_throttled(5.0)
+        bucket.acquire()
+
+        assert clock.sleeps == pytest.approx([5.0])
+
+    def test_throttled_pause_applies_when_unlimited(self, clock):
+        """Test an unlimited bucket still honours the retry delay."""
+        bucket = TokenBucket(0)
+
+        bucket.on_throttled(2.0)
+        bucket.acquire()
+
+        assert clock.sleeps == pytest.approx([2.0])
+
+    def test_throttled_drains_burst(self, clock):
+        """Test requests after the pause are paced, not sent as a burst."""
+        bucket = TokenBucket(60, burst=10)
+
+        bucket.on_throttled(0.0)
+        bucket.acquire()
+        bucket.acquire()
+
+        # Rate is now 30 per minute: two seconds per token
+        assert clock.sleeps == pytest.approx([2.0, 2.0])
+
+    def test_success_recovers_rate(self, clock):
+        """Test successes raise the rate back to the quota, but not beyond."""
+        bucket = TokenBucket(60)
+        bucket.on_throttled(0.0)
+
+        for _ in range(RATE_INCREASE_STEPS):
+            bucket.on_success()
+
+        assert bucket.rate == pytest.approx(1.0)
+        assert bucket.stats.current_rate == pytest.approx(60.0)
+
+    def test_success_at_quota_is_noop(self, clock):
+        """Test successes never raise the rate above the quota."""
+        bucket = TokenBucket(60)
+
+        bucket.on_success()
+
+        assert bucket.rate == pytest.approx(1.0)
+
+
+class TestRateLimiter:
+    """Tests for the per-account limiter."""
+
+    def test_default_quotas(self):
+        """Test the default read and write quotas."""
+        limiter = RateLimiter()
+
+        stats = limiter.stats()
+        assert stats[READ].current_rate == DEFAULT_READ_REQUESTS_PER_MINUTE
+        assert stats[WRITE].current_rate == DEFAULT_WRITE_REQUESTS_PER_MINUTE
+
+    def test_quotas_are_independent(self, clock):
+        """Test throttled writes do not slow down reads."""
+        limiter = RateLimiter(60, 60, burst=1)
+
+        limiter.on_throttled(WRITE, 10.0)
+        limiter.acquire(READ)
+
+        assert clock.sleeps == []
+        assert limiter.stats()[READ].current_rate == 60
+        assert limiter.stats()[WRITE].current_rate == 30
+
+    def test_stats_counts(self, clock):
+        """Test requests and retries are counted per quota."""
+        limiter = RateLimiter()
+
+        limiter.acquire(READ)
+        limiter.acquire(WRITE)
+        limiter.record_retry(WRITE)
+        limiter.acquire(WRITE)
+
+        stats = limiter.stats()
+        assert stats[READ].requests == 1
+        assert stats[WRITE].requests == 2
+        assert stats[WRITE].retries == 1
+
+    def test_stats_is_snapshot(self, clock):
+        """Test stats() returns copies that do not change afterwards."""
+        limiter = RateLimiter()
+        stats = limiter.stats()
+
+        limiter.acquire(READ)
+
+        assert stats[READ].requests == 0
+        assert limiter.stats()[READ].requests == 1
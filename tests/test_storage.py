@@ -152,6 +152,132 @@ class TestConnectionContextManager:
             assert row is not None
 
 
+class TestPersistentConnection:
+    """Tests for the long-lived connection used by file databases."""
+
+    def test_file_database_reuses_connection(self, tmp_path):
+        """Test that one connection is reused across operations."""
+        db = SyncDatabase(str(tmp_path / "test.db"))
+        db.initialize()
+
+        with db.connection() as conn1:
+            pass
+        with db.connection() as conn2:
+            pass
+
+        assert conn1 is conn2
+        db.close()
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """Test that file connections are tuned with WAL and synchronous=NORMAL."""
+        db = SyncDatabase(str(tmp_path / "test.db"))
+        db.initialize()
+
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # 1 = NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        db.close()
+
+    def test_non_persistent_opens_new_connections(self, tmp_path):
+        """Test that persistent_connection=False keeps per-call connections."""
+        db = SyncDatabase(str(tmp_path / "test.db"), persistent_connection=False)
+        db.initialize()
+
+        with db.connection() as conn1:
+            pass
+        with db.connection() as conn2:
+            pass
+
+        assert conn1 is not conn2
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn1.execute("SELECT 1")
+
+    def test_close_and_reopen(self, tmp_path):
+        """Test that close() releases connections and later calls reconnect."""
+        db = SyncDatabase(str(tmp_path / "test.db"))
+        db.initialize()
+        db.update_sync_state("account1", "token1")
+
+        with db.connection() as conn:
+            pass
+        db.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert db.get_sync_state("account1")["sync_token"] == "token1"
+        db.close()
+
+    def test_context_manager_closes(self, tmp_path):
+        """Test using SyncDatabase in a with block."""
+        with SyncDatabase(str(tmp_path / "test.db")) as db:
+            db.initialize()
+            db.update_sync_state("account1", "token1")
+            with db.connection() as conn:
+                pass
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_each_thread_gets_own_connection(self, tmp_path):
+        """Test that worker threads do not share the main thread's connection."""
+        import threading
+
+        db = SyncDatabase(str(tmp_path / "test.db"))
+        db.initialize()
+        with db.connection() as main_conn:
+            pass
+
+        seen = []
+
+        def worker():
+            with db.connection() as conn:
+                seen.append(conn)
+                db.update_sync_state("thread", "token")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not main_conn
+        assert db.get_sync_state("thread")["sync_token"] == "token"
+        db.close()
+
+    def test_memory_database_blocks_do_not_interleave(self):
+        """Test that threads take turns on the shared in-memory connection."""
+        import threading
+
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        entered = threading.Event()
+        release = threading.Event()
+        worker_entered = threading.Event()
+
+        def holder():
+            with db.connection():
+                entered.set()
+                release.wait(5)
+                db.update_sync_state("holder", "token")
+
+        def worker():
+            with db.connection():
+                worker_entered.set()
+
+        first = threading.Thread(target=holder)
+        first.start()
+        entered.wait(5)
+        second = threading.Thread(target=worker)
+        second.start()
+
+        assert not worker_entered.wait(0.2)
+        release.set()
+        first.join()
+        second.join()
+
+        assert worker_entered.is_set()
+        assert db.get_sync_state("holder")["sync_token"] == "token"
+
+
 class TestSyncStateOperations:
     """Tests for sync state CRUD operations."""
 
@@ -340,6 +466,92 @@ class TestContactMappingOperations:
         keys = [r["matching_key"] for r in result]
         assert keys == ["alice", "bob", "charlie"]
 
+    def test_bulk_upsert_contact_mappings_creates_entries(self, db):
+        """Test bulk upsert inserts all rows."""
+        written = db.bulk_upsert_contact_mappings(
+            [
+                {
+                    "matching_key": f"key{i}",
+                    "account1_resource_name": f"people/{i}",
+                    "account1_etag": f"etag{i}",
+                    "last_synced_hash": f"hash{i}",
+                }
+                for i in range(50)
+            ]
+        )
+
+        assert written == 50
+        assert db.get_mapping_count() == 50
+        result = db.get_contact_mapping("key7")
+        assert result["account1_resource_name"] == "people/7"
+        assert result["account1_etag"] == "etag7"
+        assert result["account2_resource_name"] is None
+
+    def test_bulk_upsert_contact_mappings_partial_update(self, db):
+        """Test bulk upsert keeps columns that are not provided."""
+        db.upsert_contact_mapping(
+            matching_key="test_key",
+            account1_resource_name="people/a",
+            account2_resource_name="people/b",
+            account1_etag="old_etag",
+            last_synced_hash="hash_v1",
+        )
+
+        db.bulk_upsert_contact_mappings(
+            [{"matching_key": "test_key", "account1_etag": "new_etag"}]
+        )
+
+        result = db.get_contact_mapping("test_key")
+        assert result["account1_resource_name"] == "people/a"
+        assert result["account2_resource_name"] == "people/b"
+        assert result["account1_etag"] == "new_etag"
+        assert result["last_synced_hash"] == "hash_v1"
+
+    def test_bulk_upsert_contact_mappings_matches_single_upsert(self, db):
+        """Test bulk and single upserts produce the same mapping."""
+        rows = [
+            {"matching_key": "k", "account1_resource_name": "people/1"},
+            {"matching_key": "k", "account2_resource_name": "people/2"},
+            {"matching_key": "k", "last_synced_hash": "h"},
+        ]
+        db.bulk_upsert_contact_mappings(rows)
+
+        other = SyncDatabase(":memory:")
+        other.initialize()
+        for row in rows:
+            other.upsert_contact_mapping(**row)
+
+        fields = [
+            "account1_resource_name",
+            "account2_resource_name",
+            "account1_etag",
+            "account2_etag",
+            "last_synced_hash",
+        ]
+        bulk = db.get_contact_mapping("k")
+        single = other.get_contact_mapping("k")
+        assert {f: bulk[f] for f in fields} == {f: single[f] for f in fields}
+
+    def test_bulk_upsert_contact_mappings_empty(self, db):
+        """Test bulk upsert with no rows is a no-op."""
+        assert db.bulk_upsert_contact_mappings([]) == 0
+        assert db.get_mapping_count() == 0
+
+    def test_bulk_delete_contact_mappings(self, db):
+        """Test bulk delete removes only the given keys."""
+        db.bulk_upsert_contact_mappings(
+            [{"matching_key": key} for key in ["a", "b", "c"]]
+        )
+
+        deleted = db.bulk_delete_contact_mappings(["a", "c", "missing"])
+
+        assert deleted == 2
+        assert [r["matching_key"] for r in db.get_all_contact_mappings()] == ["b"]
+
+    def test_bulk_delete_contact_mappings_empty(self, db):
+        """Test bulk delete with no keys is a no-op."""
+        assert db.bulk_delete_contact_mappings([]) == 0
+
 
 class TestResourceNameLookup:
     """Tests for looking up mappings by resource name."""
@@ -387,6 +599,27 @@ class TestResourceNameLookup:
         with pytest.raises(ValueError, match="Account must be 1 or 2"):
             db.get_mappings_by_resource_name("people/a1", account=0)
 
+    def test_get_mappings_for_resource_names(self, db):
+        """Test finding the mappings of several contacts at once."""
+        result = db.get_mappings_for_resource_names(
+            ["people/a1", "people/unknown"], ["people/b1", "people/b2"]
+        )
+        assert sorted(m["matching_key"] for m in result) == ["user1", "user2"]
+        assert db.get_mappings_for_resource_names([], []) == []
+
+    def test_get_mappings_for_many_resource_names(self, db):
+        """Test that lookups larger than one SQL statement are chunked."""
+        names = [f"people/x{i}" for i in range(1200)] + ["people/a2"]
+        result = db.get_mappings_for_resource_names(names, [])
+        assert [m["matching_key"] for m in result] == ["user2"]
+
+    def test_get_mapped_resource_name_pairs(self, db):
+        """Test listing the resource names of every mapped pair."""
+        assert sorted(db.get_mapped_resource_name_pairs()) == [
+            ("people/a1", "people/b1"),
+            ("people/a2", "people/b2"),
+        ]
+
 
 class TestUtilityOperations:
     """Tests for utility operations."""
@@ -736,6 +969,83 @@ class TestLLMMatchAttemptOperations:
         )
         assert db.get_llm_match_attempt_count() == 2
 
+    def test_upsert_llm_match_attempts_bulk(self, db):
+        """Test storing many LLM match attempts in one call."""
+        attempts = [
+            {
+                "contact1_resource_name": f"people/{i}",
+                "contact2_resource_name": f"people/x{i}",
+                "contact1_display_name": f"A{i}",
+                "contact2_display_name": f"B{i}",
+                "contact1_content_hash": f"h{i}",
+                "contact2_content_hash": f"hx{i}",
+                "is_match": i % 2 == 0,
+                "confidence": 0.5,
+                "reasoning": "Bulk",
+                "model_used": "test",
+            }
+            for i in range(5)
+        ]
+
+        assert db.upsert_llm_match_attempts(attempts) == 5
+        assert db.get_llm_match_attempt_count() == 5
+
+        result = db.get_llm_match_attempt("people/2", "people/x2")
+        assert result["is_match"] == 1
+        assert result["contact2_content_hash"] == "hx2"
+
+    def test_upsert_llm_match_attempts_bulk_updates_existing(self, db):
+        """Test that bulk upsert updates existing pairs instead of duplicating."""
+        attempt = {
+            "contact1_resource_name": "people/1",
+            "contact2_resource_name": "people/2",
+            "contact1_display_name": "A",
+            "contact2_display_name": "B",
+            "contact1_content_hash": "h1",
+            "contact2_content_hash": "h2",
+            "is_match": False,
+            "confidence": 0.2,
+            "reasoning": "First",
+            "model_used": "test",
+        }
+        db.upsert_llm_match_attempts([attempt])
+        db.upsert_llm_match_attempts(
+            [{**attempt, "is_match": True, "reasoning": "Second"}]
+        )
+
+        assert db.get_llm_match_attempt_count() == 1
+        result = db.get_llm_match_attempt("people/1", "people/2")
+        assert result["is_match"] == 1
+        assert result["reasoning"] == "Second"
+
+    def test_get_all_llm_match_attempts(self, db):
+        """Test loading every cached LLM match attempt."""
+        assert db.get_all_llm_match_attempts() == []
+
+        db.upsert_llm_match_attempt(
+            contact1_resource_name="people/1",
+            contact2_resource_name="people/2",
+            contact1_display_name="A",
+            contact2_display_name="B",
+            contact1_content_hash="h1",
+            contact2_content_hash="h2",
+            is_match=True,
+            confidence=0.9,
+            reasoning="Test",
+            model_used="test",
+        )
+
+        attempts = db.get_all_llm_match_attempts()
+        assert len(attempts) == 1
+        assert attempts[0]["contact1_resource_name"] == "people/1"
+        assert attempts[0]["contact2_content_hash"] == "h2"
+        assert attempts[0]["is_match"] == 1
+
+    def test_upsert_llm_match_attempts_empty(self, db):
+        """Test that bulk upsert with no attempts is a no-op."""
+        assert db.upsert_llm_match_attempts([]) == 0
+        assert db.get_llm_match_attempt_count() == 0
+
     def test_llm_match_attempt_not_match_stored_correctly(self, db):
         """Test that is_match=False is stored correctly."""
         db.upsert_llm_match_attempt(
@@ -1186,3 +1496,135 @@ class TestContactGroupDatabaseTableExists:
                 "WHERE type='index' AND name='idx_grp_map_name'"
             )
             assert cursor.fetchone() is not None
+
+
+class TestPendingContactWriteOperations:
+    """Tests for contacts whose write is retried by the next sync."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an initialized in-memory database."""
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        return db
+
+    def test_failed_writes_recorded_per_account(self, db):
+        """Test that failed writes are stored per source account."""
+        db.update_pending_contact_writes(
+            [],
+            [
+                ("account1", "people/2", "Invalid"),
+                ("account1", "people/1", "Invalid"),
+                ("account2", "people/9", "Precondition failed"),
+            ],
+        )
+
+        assert db.get_pending_contact_writes("account1") == ["people/1", "people/2"]
+        assert db.get_pending_contact_writes("account2") == ["people/9"]
+
+    def test_retried_writes_removed_unless_failed_again(self, db):
+        """Test that retried entries are dropped and repeat failures kept."""
+        db.update_pending_contact_writes(
+            [],
+            [("account1", "people/1", "Invalid"), ("account1", "people/2", "Invalid")],
+        )
+
+        db.update_pending_contact_writes(
+            [("account1", "people/1"), ("account1", "people/2")],
+            [("account1", "people/2", "Still invalid")],
+        )
+
+        assert db.get_pending_contact_writes("account1") == ["people/2"]
+        with db.connection() as conn:
+            row = conn.execute(
+                "SELECT last_error FROM pending_contact_writes"
+            ).fetchone()
+        assert row["last_error"] == "Still invalid"
+
+    def test_clear_all_state_clears_pending_writes(self, db):
+        """Test that a reset forgets pending writes."""
+        db.update_pending_contact_writes([], [("account1", "people/1", "Invalid")])
+
+        db.clear_all_state()
+
+        assert db.get_pending_contact_writes("account1") == []
+
+
+class TestLocalMirrorOperations:
+    """Tests for the local contact and group mirror."""
+
+    @pytest.fixture
+    def db(self):
+        """Create an initialized in-memory database."""
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        return db
+
+    @staticmethod
+    def row(resource_name, name, content_hash="hash"):
+        """Build a mirror row for a person."""
+        return {
+            "resource_name": resource_name,
+            "etag": f"etag-{name}",
+            "person": {"resourceName": resource_name, "names": [{"displayName": name}]},
+            "matching_key": name.lower(),
+            "content_hash": content_hash,
+        }
+
+    def test_replace_marks_mirror_complete(self, db):
+        """Test that a full listing replaces the mirror and marks it complete."""
+        assert not db.is_contact_mirror_complete("account1")
+
+        db.replace_contact_mirror("account1", [self.row("people/1", "Old")])
+        db.replace_contact_mirror(
+            "account1", [self.row("people/2", "Ann"), self.row("people/3", "Bob")]
+        )
+
+        assert db.is_contact_mirror_complete("account1")
+        assert not db.is_contact_mirror_complete("account2")
+        rows = db.get_contact_mirror("account1")
+        assert [r["resource_name"] for r in rows] == ["people/2", "people/3"]
+        assert rows[0]["person"]["names"][0]["displayName"] == "Ann"
+        assert rows[0]["matching_key"] == "ann"
+
+    def test_apply_changes_is_idempotent(self, db):
+        """Test that applying a delta twice gives the same mirror."""
+        db.replace_contact_mirror(
+            "account1", [self.row("people/1", "Ann"), self.row("people/2", "Bob")]
+        )
+
+        for _ in range(2):
+            db.apply_contact_mirror_changes(
+                "account1",
+                [self.row("people/1", "Ann", "new"), self.row("people/3", "Cy")],
+                ["people/2"],
+            )
+
+        rows = db.get_contact_mirror("account1")
+        assert [(r["resource_name"], r["content_hash"]) for r in rows] == [
+            ("people/1", "new"),
+            ("people/3", "hash"),
+        ]
+        assert db.get_contact_mirror_count("account1") == 2
+
+    def test_group_mirror_round_trip(self, db):
+        """Test that raw groups are stored and read back per account."""
+        groups = [{"resourceName": "contactGroups/a", "name": "Family"}]
+
+        db.replace_group_mirror("account1", groups)
+
+        assert db.get_group_mirror("account1") == groups
+        assert db.get_group_mirror("account2") == []
+
+    def test_clear_all_state_clears_mirror(self, db):
+        """Test that a reset forces a full listing again."""
+        db.replace_contact_mirror("account1", [self.row("people/1", "Ann")])
+        db.replace_contact_mirror("account2", [self.row("people/9", "Zed")])
+        db.replace_group_mirror("account1", [{"resourceName": "contactGroups/a"}])
+
+        db.clear_all_state()
+
+        assert db.get_group_mirror("account1") == []
+        assert not db.is_contact_mirror_complete("account1")
+        assert db.get_contact_mirror_count() == 0
+        assert not db.is_contact_mirror_complete("account2")
@@ -5,12 +5,19 @@ Tests the SyncEngine class for bidirectional synchronization and
 ConflictResolver for conflict detection and resolution.
 """
 
+import threading
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gcontact_sync.api.people_api import PeopleAPI, PeopleAPIError
+from gcontact_sync.api.people_api import (
+    BatchWriteError,
+    PeopleAPI,
+    PeopleAPIError,
+    RateLimitError,
+)
+from gcontact_sync.auth.google_auth import ACCOUNT_1, ACCOUNT_2
 from gcontact_sync.storage.db import SyncDatabase
 from gcontact_sync.sync.conflict import (
     ConflictResolver,
@@ -20,10 +27,12 @@ from gcontact_sync.sync.conflict import (
 )
 from gcontact_sync.sync.contact import Contact
 from gcontact_sync.sync.engine import (
+    AccountSnapshot,
     SyncEngine,
     SyncResult,
     SyncStats,
 )
+from gcontact_sync.sync.photo_pipeline import PhotoPipeline, PhotoResult
 
 # ==============================================================================
 # Fixtures
@@ -121,6 +130,7 @@ def mock_database():
     db.get_contact_mapping.return_value = None
     db.get_mappings_by_resource_name.return_value = []
     db.get_mapping_count.return_value = 0
+    db.get_pending_contact_writes.return_value = []
     return db
 
 
@@ -1165,7 +1175,7 @@ class TestSyncEngineExecute:
         sync_engine.execute(result)
 
         mock_api1.batch_create_contacts.assert_called_once_with([contact])
-        mock_database.upsert_contact_mapping.assert_called()
+        mock_database.bulk_upsert_contact_mappings.assert_called_once()
         assert result.stats.created_in_account1 == 1
 
     def test_execute_creates_in_account2(
@@ -1189,6 +1199,37 @@ class TestSyncEngineExecute:
         mock_api2.batch_create_contacts.assert_called_once_with([contact])
         assert result.stats.created_in_account2 == 1
 
+    def test_execute_creates_write_mappings_in_one_batch(
+        self, sync_engine, mock_api1, mock_api2, mock_database
+    ):
+        """Test created contacts are recorded with a single bulk upsert."""
+        contacts = [
+            Contact(f"people/orig{i}", "e", f"Person {i}", emails=[f"p{i}@x.com"])
+            for i in range(3)
+        ]
+        created = [
+            Contact(f"people/new{i}", f"e_new{i}", f"Person {i}") for i in range(3)
+        ]
+
+        result = SyncResult()
+        result.to_create_in_account2.extend(contacts)
+        mock_api2.batch_create_contacts.return_value = created
+
+        sync_engine.execute(result)
+
+        mock_database.upsert_contact_mapping.assert_not_called()
+        mock_database.bulk_upsert_contact_mappings.assert_called_once()
+        rows = mock_database.bulk_upsert_contact_mappings.call_args.args[0]
+        assert rows == [
+            {
+                "matching_key": contact.matching_key(),
+                "account2_resource_name": f"people/new{i}",
+                "account2_etag": f"e_new{i}",
+                "last_synced_hash": contact.content_hash(),
+            }
+            for i, contact in enumerate(contacts)
+        ]
+
     def test_execute_updates_in_account1(
         self, sync_engine, mock_api1, mock_api2, mock_database
     ):
@@ -1473,6 +1514,27 @@ class TestSyncEngineDeletions:
 
         assert "people/1" in result.to_delete_in_account1
 
+    def test_analyze_removes_stale_mappings_in_one_call(
+        self, sync_engine, mock_api1, mock_api2, mock_database
+    ):
+        """Test that mappings of deleted contacts are removed in bulk."""
+        deleted1 = Contact("people/d1", "e1", "John Doe", deleted=True)
+        deleted2 = Contact("people/d2", "e2", "Jane Smith", deleted=True)
+
+        mock_api1.list_contacts.return_value = ([deleted1], "token1")
+        mock_api2.list_contacts.return_value = ([deleted2], "token2")
+        mock_database.get_mappings_by_resource_name.side_effect = [
+            [{"matching_key": "john", "account2_resource_name": "people/2"}],
+            [{"matching_key": "jane", "account1_resource_name": "people/1"}],
+        ]
+
+        sync_engine.analyze()
+
+        mock_database.bulk_delete_contact_mappings.assert_called_once_with(
+            ["john", "jane"]
+        )
+        mock_database.delete_contact_mapping.assert_not_called()
+
     def test_analyze_no_mapping_for_deleted_contact(
         self, sync_engine, mock_api1, mock_api2, mock_database
     ):
@@ -1606,20 +1668,44 @@ class TestSyncEngineEdgeCases:
         assert result.stats.contacts_in_account1 == 100
         assert len(result.to_create_in_account2) == 100
 
-    def test_execute_api_error_raises(
+    def test_execute_api_error_is_counted_not_raised(
         self, sync_engine, mock_api1, mock_api2, mock_database
     ):
-        """Test execute raises error on API failure."""
+        """Test a failed create is queued for retry without keeping sync tokens."""
         contact = Contact("people/1", "e1", "John Doe", emails=["john@example.com"])
 
         result = SyncResult()
         result.to_create_in_account1.append(contact)
+        sync_engine._pending_sync_tokens = {ACCOUNT_1: "t1", ACCOUNT_2: "t2"}
 
         mock_api1.batch_create_contacts.side_effect = PeopleAPIError("API Error")
 
-        with pytest.raises(PeopleAPIError):
+        sync_engine.execute(result)
+
+        assert result.stats.errors == 1
+        assert result.stats.writes_pending_retry == 0
+        assert result.failed_writes == [(ACCOUNT_2, "people/1", "API Error")]
+        mock_database.update_pending_contact_writes.assert_called_once_with(
+            [], result.failed_writes
+        )
+        assert mock_database.update_sync_state.call_count == 2
+
+    def test_execute_rate_limit_error_raises(
+        self, sync_engine, mock_api1, mock_api2, mock_database
+    ):
+        """Test execute stops when the rate limit runs out."""
+        contact = Contact("people/1", "e1", "John Doe", emails=["john@example.com"])
+
+        result = SyncResult()
+        result.to_create_in_account1.append(contact)
+
+        mock_api1.batch_create_contacts.side_effect = RateLimitError("quota")
+
+        with pytest.raises(RateLimitError):
             sync_engine.execute(result)
 
+        assert result.stats.errors == 1
+
     def test_sync_conflict_resolution_integration(
         self, sync_engine, mock_api1, mock_api2, mock_database
     ):
@@ -2242,10 +2328,12 @@ class TestSyncEngineGroupExecution:
         result = SyncResult()
         result.groups_to_create_in_account1.append(sample_group2)
 
-        mock_api1.create_contact_group.return_value = {
-            "resourceName": "contactGroups/new1",
-            "etag": "new_etag",
-        }
+        mock_api1.batch_create_contact_groups.return_value = [
+            {
+                "resourceName": "contactGroups/new1",
+                "etag": "new_etag",
+            }
+        ]
         mock_api1.list_contact_groups.return_value = ([], None)
         mock_api2.list_contact_groups.return_value = ([], None)
         mock_api1.list_contacts.return_value = ([], "token1")
@@ -2253,7 +2341,9 @@ class TestSyncEngineGroupExecution:
 
         sync_engine.execute(result)
 
-        mock_api1.create_contact_group.assert_called_once_with(sample_group2.name)
+        mock_api1.batch_create_contact_groups.assert_called_once_with(
+            [sample_group2.name]
+        )
         mock_database.upsert_group_mapping.assert_called()
         assert result.stats.groups_created_in_account1 == 1
 
@@ -2264,10 +2354,12 @@ class TestSyncEngineGroupExecution:
         result = SyncResult()
         result.groups_to_create_in_account2.append(sample_group1)
 
-        mock_api2.create_contact_group.return_value = {
-            "resourceName": "contactGroups/new2",
-            "etag": "new_etag",
-        }
+        mock_api2.batch_create_contact_groups.return_value = [
+            {
+                "resourceName": "contactGroups/new2",
+                "etag": "new_etag",
+            }
+        ]
         mock_api1.list_contact_groups.return_value = ([], None)
         mock_api2.list_contact_groups.return_value = ([], None)
         mock_api1.list_contacts.return_value = ([], "token1")
@@ -2275,7 +2367,9 @@ class TestSyncEngineGroupExecution:
 
         sync_engine.execute(result)
 
-        mock_api2.create_contact_group.assert_called_once_with(sample_group1.name)
+        mock_api2.batch_create_contact_groups.assert_called_once_with(
+            [sample_group1.name]
+        )
         assert result.stats.groups_created_in_account2 == 1
 
     def test_execute_group_updates_in_account1(
@@ -2328,6 +2422,7 @@ class TestSyncEngineGroupExecution:
         result = SyncResult()
         result.groups_to_delete_in_account1.append("contactGroups/to_delete")
 
+        mock_api1.batch_delete_contact_groups.return_value = [True]
         mock_api1.list_contact_groups.return_value = ([], None)
         mock_api2.list_contact_groups.return_value = ([], None)
         mock_api1.list_contacts.return_value = ([], "token1")
@@ -2335,8 +2430,8 @@ class TestSyncEngineGroupExecution:
 
         sync_engine.execute(result)
 
-        mock_api1.delete_contact_group.assert_called_once_with(
-            "contactGroups/to_delete", delete_contacts=False
+        mock_api1.batch_delete_contact_groups.assert_called_once_with(
+            ["contactGroups/to_delete"], delete_contacts=False
         )
         assert result.stats.groups_deleted_in_account1 == 1
 
@@ -2347,6 +2442,7 @@ class TestSyncEngineGroupExecution:
         result = SyncResult()
         result.groups_to_delete_in_account2.append("contactGroups/to_delete")
 
+        mock_api2.batch_delete_contact_groups.return_value = [True]
         mock_api1.list_contact_groups.return_value = ([], None)
         mock_api2.list_contact_groups.return_value = ([], None)
         mock_api1.list_contacts.return_value = ([], "token1")
@@ -2354,8 +2450,8 @@ class TestSyncEngineGroupExecution:
 
         sync_engine.execute(result)
 
-        mock_api2.delete_contact_group.assert_called_once_with(
-            "contactGroups/to_delete", delete_contacts=False
+        mock_api2.batch_delete_contact_groups.assert_called_once_with(
+            ["contactGroups/to_delete"], delete_contacts=False
         )
         assert result.stats.groups_deleted_in_account2 == 1
 
@@ -2382,7 +2478,7 @@ class TestSyncEngineGroupExecution:
         result.groups_to_create_in_account2.extend([group1, group2])
 
         # First create fails, second succeeds
-        mock_api2.create_contact_group.side_effect = [
+        mock_api2.batch_create_contact_groups.return_value = [
             PeopleAPIError("Failed"),
             {"resourceName": "contactGroups/new", "etag": "e_new"},
         ]
@@ -2396,6 +2492,42 @@ class TestSyncEngineGroupExecution:
         assert result.stats.groups_created_in_account2 == 1
         assert result.stats.errors == 1
 
+    def test_execute_group_batch_failure_counts_each_group(
+        self, sync_engine, mock_api2, mock_database, sample_group1
+    ):
+        """Test a failed batch request records an error for every group."""
+        mock_api2.batch_create_contact_groups.side_effect = PeopleAPIError("Down")
+        mock_api2.batch_delete_contact_groups.side_effect = PeopleAPIError("Down")
+        result = SyncResult()
+
+        sync_engine._execute_group_creates(
+            [sample_group1], mock_api2, account=2, result=result
+        )
+        sync_engine._execute_group_deletes(
+            ["contactGroups/a", "contactGroups/b"], mock_api2, account=2, result=result
+        )
+
+        assert result.stats.groups_created_in_account2 == 0
+        assert result.stats.groups_deleted_in_account2 == 0
+        assert result.stats.errors == 3
+
+    def test_execute_group_delete_error_continues(
+        self, sync_engine, mock_api1, mock_database
+    ):
+        """Test one failed delete in a batch does not stop the others."""
+        mock_api1.batch_delete_contact_groups.return_value = [
+            True,
+            PeopleAPIError("Failed"),
+        ]
+        result = SyncResult()
+
+        sync_engine._execute_group_deletes(
+            ["contactGroups/a", "contactGroups/b"], mock_api1, account=1, result=result
+        )
+
+        assert result.stats.groups_deleted_in_account1 == 1
+        assert result.stats.errors == 1
+
 
 # ==============================================================================
 # SyncEngine Membership Mapping Tests
@@ -2609,10 +2741,12 @@ class TestGroupSyncIntegration:
         mock_api2.list_contacts.return_value = ([], "token2")
         mock_api1.list_contact_groups.return_value = ([group_data], None)
         mock_api2.list_contact_groups.return_value = ([], None)
-        mock_api2.create_contact_group.return_value = {
-            "resourceName": "contactGroups/created",
-            "etag": "e_new",
-        }
+        mock_api2.batch_create_contact_groups.return_value = [
+            {
+                "resourceName": "contactGroups/created",
+                "etag": "e_new",
+            }
+        ]
 
         integration_engine.sync(dry_run=False)
 
@@ -2641,7 +2775,7 @@ class TestGroupSyncIntegration:
 
         # Should identify changes but not execute
         assert len(result.groups_to_create_in_account2) == 1
-        mock_api2.create_contact_group.assert_not_called()
+        mock_api2.batch_create_contact_groups.assert_not_called()
 
         # No mappings should exist
         mappings = real_database.get_all_group_mappings()
@@ -2702,10 +2836,12 @@ class TestGroupSyncIntegration:
         mock_api2.list_contacts.return_value = ([], "token2")
 
         # Mock create returns
-        mock_api2.create_contact_group.return_value = {
-            "resourceName": "contactGroups/work_new",
-            "etag": "e_new",
-        }
+        mock_api2.batch_create_contact_groups.return_value = [
+            {
+                "resourceName": "contactGroups/work_new",
+                "etag": "e_new",
+            }
+        ]
         mock_api2.batch_create_contacts.return_value = [
             Contact("people/new", "e_new", "John Doe", emails=["john@example.com"])
         ]
@@ -2714,7 +2850,7 @@ class TestGroupSyncIntegration:
 
         # Group should be created before contact
         # Verify order by checking the calls
-        mock_api2.create_contact_group.assert_called_once()
+        mock_api2.batch_create_contact_groups.assert_called_once()
         mock_api2.batch_create_contacts.assert_called_once()
 
 
@@ -2743,16 +2879,13 @@ class TestMembershipSyncInContactOperations:
         result.to_create_in_account2.append(contact)
 
         # Set up group mapping: account1's abc123 -> account2's xyz789
-        def mock_get_mapping(resource_name, account):
-            if resource_name == "contactGroups/abc123" and account == 1:
-                return {
-                    "group_name": "family",
-                    "account1_resource_name": "contactGroups/abc123",
-                    "account2_resource_name": "contactGroups/xyz789",
-                }
-            return None
-
-        mock_database.get_group_mapping_by_resource_name.side_effect = mock_get_mapping
+        mock_database.get_all_group_mappings.return_value = [
+            {
+                "group_name": "family",
+                "account1_resource_name": "contactGroups/abc123",
+                "account2_resource_name": "contactGroups/xyz789",
+            }
+        ]
 
         # Mock the API to return the created contact
         mock_api2.batch_create_contacts.return_value = [
@@ -2772,7 +2905,7 @@ class TestMembershipSyncInContactOperations:
         created_contacts = mock_api2.batch_create_contacts.call_args[0][0]
         assert len(created_contacts) == 1
         # Verify memberships were mapped
-        assert created_contacts[0].memberships == ["contactGroups/xyz789"]
+        assert created_contacts[0].memberships == ("contactGroups/xyz789",)
 
     def test_execute_creates_maps_memberships_reverse(
         self, sync_engine, mock_api1, mock_api2, mock_database
@@ -2790,130 +2923,845 @@ class TestMembershipSyncInContactOperations:
         result = SyncResult()
         result.to_create_in_account1.append(contact)
 
-        # Set up group mapping: account2's xyz789 -> account1's abc123
-        def mock_get_mapping(resource_name, account):
-            if resource_name == "contactGroups/xyz789" and account == 2:
-                return {
-                    "group_name": "family",
-                    "account1_resource_name": "contactGroups/abc123",
-                    "account2_resource_name": "contactGroups/xyz789",
-                }
-            return None
+        # Set up group mapping: account2's xyz789 -> account1's abc123
+        mock_database.get_all_group_mappings.return_value = [
+            {
+                "group_name": "family",
+                "account1_resource_name": "contactGroups/abc123",
+                "account2_resource_name": "contactGroups/xyz789",
+            }
+        ]
+
+        mock_api1.batch_create_contacts.return_value = [
+            Contact("people/new", "e_new", "Jane Doe", emails=["jane@example.com"])
+        ]
+
+        mock_api1.list_contact_groups.return_value = ([], None)
+        mock_api2.list_contact_groups.return_value = ([], None)
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+
+        sync_engine.execute(result)
+
+        # Verify memberships were mapped to account1's group
+        created_contacts = mock_api1.batch_create_contacts.call_args[0][0]
+        assert created_contacts[0].memberships == ("contactGroups/abc123",)
+
+    def test_execute_updates_maps_memberships(
+        self, sync_engine, mock_api1, mock_api2, mock_database
+    ):
+        """Test that contact update maps memberships to target account."""
+        # Source contact from account 1 with a group membership
+        source_contact = Contact(
+            "people/1",
+            "e1",
+            "John Doe",
+            emails=["john@example.com"],
+            memberships=["contactGroups/abc123"],
+        )
+
+        result = SyncResult()
+        result.to_update_in_account2.append(("people/target2", source_contact))
+
+        # Set up group mapping
+        mock_database.get_all_group_mappings.return_value = [
+            {
+                "group_name": "family",
+                "account1_resource_name": "contactGroups/abc123",
+                "account2_resource_name": "contactGroups/xyz789",
+            }
+        ]
+
+        # Mock get_contact to return current contact
+        mock_api2.get_contact.return_value = Contact(
+            "people/target2", "current_etag", "John Doe"
+        )
+        mock_api2.batch_update_contacts.return_value = [
+            Contact("people/target2", "new_etag", "John Doe")
+        ]
+
+        mock_api1.list_contact_groups.return_value = ([], None)
+        mock_api2.list_contact_groups.return_value = ([], None)
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+
+        sync_engine.execute(result)
+
+        # Verify batch_update_contacts was called
+        mock_api2.batch_update_contacts.assert_called_once()
+        # Get the updates that were passed
+        updates = mock_api2.batch_update_contacts.call_args[0][0]
+        assert len(updates) == 1
+        # Verify memberships were mapped
+        _resource_name, updated_contact = updates[0]
+        assert updated_contact.memberships == ("contactGroups/xyz789",)
+
+    def test_execute_creates_excludes_unmapped_memberships(
+        self, sync_engine, mock_api1, mock_api2, mock_database
+    ):
+        """Test that unmapped memberships are excluded during contact creation."""
+        contact = Contact(
+            "people/1",
+            "e1",
+            "John Doe",
+            emails=["john@example.com"],
+            memberships=[
+                "contactGroups/abc123",  # Has mapping
+                "contactGroups/unknown",  # No mapping
+                "contactGroups/myContacts",  # System group
+            ],
+        )
+
+        result = SyncResult()
+        result.to_create_in_account2.append(contact)
+
+        # Only abc123 has a mapping
+        mock_database.get_all_group_mappings.return_value = [
+            {
+                "group_name": "family",
+                "account1_resource_name": "contactGroups/abc123",
+                "account2_resource_name": "contactGroups/xyz789",
+            }
+        ]
+
+        mock_api2.batch_create_contacts.return_value = [
+            Contact("people/new", "e_new", "John Doe")
+        ]
+
+        mock_api1.list_contact_groups.return_value = ([], None)
+        mock_api2.list_contact_groups.return_value = ([], None)
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+
+        sync_engine.execute(result)
+
+        created_contacts = mock_api2.batch_create_contacts.call_args[0][0]
+        # Only the mapped group should be included
+        assert created_contacts[0].memberships == ("contactGroups/xyz789",)
+
+
+class TestGroupMembershipMaps:
+    """Tests for the in-memory group mapping tables used during execute."""
+
+    MAPPING = {
+        "group_name": "family",
+        "account1_resource_name": "contactGroups/abc123",
+        "account2_resource_name": "contactGroups/xyz789",
+    }
+
+    def test_execute_loads_mappings_once(self, sync_engine, mock_api2, mock_database):
+        """Test that memberships are translated without per-group queries."""
+        mock_database.get_all_group_mappings.return_value = [self.MAPPING]
+        contacts = [
+            Contact(
+                f"people/{i}", "e", f"Person {i}", memberships=["contactGroups/abc123"]
+            )
+            for i in range(5)
+        ]
+        mock_api2.batch_create_contacts.return_value = [
+            Contact(f"people/new{i}", "e", f"Person {i}") for i in range(5)
+        ]
+
+        result = SyncResult()
+        result.to_create_in_account2.extend(contacts)
+        sync_engine.execute(result)
+
+        mock_database.get_all_group_mappings.assert_called_once()
+        mock_database.get_group_mapping_by_resource_name.assert_not_called()
+        created = mock_api2.batch_create_contacts.call_args[0][0]
+        assert all(c.memberships == ("contactGroups/xyz789",) for c in created)
+
+    def test_maps_cleared_after_execute(self, sync_engine, mock_database):
+        """Test that the tables do not outlive the execute phase."""
+        mock_database.get_all_group_mappings.return_value = [self.MAPPING]
+
+        sync_engine.execute(SyncResult())
+
+        assert sync_engine._group_membership_maps is None
+
+    def test_created_group_is_mapped(
+        self, sync_engine, mock_api2, mock_database, sample_group1
+    ):
+        """Test that a group created in execute is used by later contacts."""
+        mock_database.get_all_group_mappings.return_value = []
+        mock_api2.batch_create_contact_groups.return_value = [
+            {
+                "resourceName": "contactGroups/new2",
+                "etag": "g_etag",
+            }
+        ]
+        mock_api2.batch_create_contacts.return_value = [
+            Contact("people/new", "e", "John Doe")
+        ]
+
+        result = SyncResult()
+        result.groups_to_create_in_account2.append(sample_group1)
+        result.to_create_in_account2.append(
+            Contact("people/1", "e", "John Doe", memberships=["contactGroups/abc123"])
+        )
+        sync_engine.execute(result)
+
+        created = mock_api2.batch_create_contacts.call_args[0][0]
+        assert created[0].memberships == ("contactGroups/new2",)
+
+    def test_deleted_group_is_unmapped(self, sync_engine, mock_database):
+        """Test that deleting a group removes it from both directions."""
+        mock_database.get_all_group_mappings.return_value = [self.MAPPING]
+        sync_engine._load_group_membership_maps()
+
+        sync_engine._forget_group_membership_mapping(2, "contactGroups/xyz789")
+
+        assert (
+            sync_engine._map_memberships(
+                ["contactGroups/abc123"], source_account=1, target_account=2
+            )
+            == []
+        )
+        assert "contactGroups/xyz789" not in sync_engine._group_membership_maps[2]
+
+
+class TestConcurrentFetch:
+    """Tests for fetching both accounts in analyze()."""
+
+    def test_sequential_fetch_records_timings(self, sync_engine, mock_api1, mock_api2):
+        """Test that per-account fetch timings are reported by default."""
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+
+        result = sync_engine.analyze()
+
+        assert sync_engine.concurrent_fetch is False
+        assert result.stats.fetch_seconds_account1 >= 0.0
+        assert result.stats.fetch_seconds_account2 >= 0.0
+
+    def test_concurrent_fetch_lists_accounts_in_parallel(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that both accounts are listed at the same time on worker threads."""
+        # Each listing waits for the other; a sequential fetch would time out
+        barrier = threading.Barrier(2, timeout=5)
+        threads: dict[str, str] = {}
+
+        def list_contacts(api_name, contacts, token):
+            def side_effect(*args, **kwargs):
+                threads[api_name] = threading.current_thread().name
+                barrier.wait()
+                return contacts, token
+
+            return side_effect
+
+        contact1 = Contact("people/1", "e1", "John Doe", emails=["john@example.com"])
+        contact2 = Contact("people/2", "e2", "Jane Roe", emails=["jane@example.com"])
+        mock_api1.list_contacts.side_effect = list_contacts("api1", [contact1], "t1")
+        mock_api2.list_contacts.side_effect = list_contacts("api2", [contact2], "t2")
+
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=mock_database,
+            use_llm_matching=False,
+            concurrent_fetch=True,
+        )
+        result = engine.analyze()
+
+        assert threads["api1"] != threads["api2"]
+        assert threading.main_thread().name not in threads.values()
+        assert result.stats.contacts_in_account1 == 1
+        assert result.stats.contacts_in_account2 == 1
+        assert result.to_create_in_account2 == [contact1]
+        assert result.to_create_in_account1 == [contact2]
+        assert engine._pending_sync_tokens == {ACCOUNT_1: "t1", ACCOUNT_2: "t2"}
+        assert result.stats.fetch_seconds_account1 > 0.0
+        assert result.stats.fetch_seconds_account2 > 0.0
+
+    def test_concurrent_fetch_propagates_errors(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that a failed listing in a worker thread fails analyze()."""
+        mock_api1.list_contacts.side_effect = PeopleAPIError("boom")
+        mock_api2.list_contacts.return_value = ([], "token2")
+
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=mock_database,
+            concurrent_fetch=True,
+        )
+
+        with pytest.raises(PeopleAPIError, match="boom"):
+            engine.analyze()
+
+
+class TestConcurrentExecute:
+    """Tests for writing to both accounts in execute()."""
+
+    def test_steps_run_in_order_for_both_accounts(self, sync_engine):
+        """Test that each step finishes in both accounts before the next."""
+        calls = []
+        for name in (
+            "_execute_group_creates",
+            "_execute_creates",
+            "_execute_deletes",
+        ):
+            setattr(
+                sync_engine,
+                name,
+                lambda ops, api, account, result, name=name: calls.append(
+                    (name, account)
+                ),
+            )
+
+        result = SyncResult()
+        result.groups_to_create_in_account1 = [MagicMock()]
+        result.to_create_in_account1 = [MagicMock()]
+        result.to_create_in_account2 = [MagicMock()]
+        result.to_delete_in_account2 = ["people/1"]
+
+        sync_engine.execute(result)
+
+        assert calls == [
+            ("_execute_group_creates", 1),
+            ("_execute_creates", 1),
+            ("_execute_creates", 2),
+            ("_execute_deletes", 2),
+        ]
+
+    def test_concurrent_execute_writes_accounts_in_parallel(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that both accounts' creates run at the same time."""
+        # Each create waits for the other; sequential creates would time out
+        barrier = threading.Barrier(2, timeout=5)
+        threads: dict[int, str] = {}
+
+        def batch_create(account):
+            def side_effect(contacts):
+                threads[account] = threading.current_thread().name
+                barrier.wait()
+                return [
+                    Contact(f"people/new{account}", "etag", c.display_name)
+                    for c in contacts
+                ]
+
+            return side_effect
+
+        mock_api1.batch_create_contacts.side_effect = batch_create(1)
+        mock_api2.batch_create_contacts.side_effect = batch_create(2)
+        mock_database.get_all_group_mappings.return_value = []
+
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=mock_database,
+            use_llm_matching=False,
+            concurrent_execute=True,
+        )
+        engine.photo_pipeline = MagicMock(spec=PhotoPipeline)
+        engine.photo_pipeline.run.return_value = []
+
+        result = SyncResult()
+        result.to_create_in_account1 = [
+            Contact("people/a", "e", "Jane Roe", emails=["jane@example.com"])
+        ]
+        result.to_create_in_account2 = [
+            Contact("people/b", "e", "John Doe", emails=["john@example.com"])
+        ]
+
+        engine.execute(result)
+
+        assert threads[1] != threads[2]
+        assert threading.main_thread().name not in threads.values()
+        assert result.stats.created_in_account1 == 1
+        assert result.stats.created_in_account2 == 1
+
+    def test_concurrent_execute_propagates_errors(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that running out of rate limit in one account fails execute()."""
+        mock_api1.batch_delete_contacts.side_effect = RateLimitError("boom")
+        mock_api2.batch_delete_contacts.return_value = 1
+        mock_database.get_all_group_mappings.return_value = []
+
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=mock_database,
+            concurrent_execute=True,
+        )
+        result = SyncResult()
+        result.to_delete_in_account1 = ["people/1"]
+        result.to_delete_in_account2 = ["people/2"]
+
+        with pytest.raises(RateLimitError, match="boom"):
+            engine.execute(result)
+
+        assert result.stats.deleted_in_account2 == 1
+        assert result.stats.errors == 1
+
+
+def record_error(message="Invalid contact"):
+    """Create a PeopleAPIError caused by an HTTP 400 response."""
+    from googleapiclient.errors import HttpError
+
+    resp = MagicMock()
+    resp.status = 400
+    error = PeopleAPIError(message)
+    error.__cause__ = HttpError(resp, b"Invalid contact")
+    return error
+
+
+class TestPartialBatchFailures:
+    """Tests for recording partial results when batch writes fail."""
+
+    @pytest.fixture
+    def engine(self, sync_engine, mock_database):
+        """Create a SyncEngine with photo transfers stubbed out."""
+        mock_database.get_all_group_mappings.return_value = []
+        sync_engine.photo_pipeline = MagicMock(spec=PhotoPipeline)
+        sync_engine.photo_pipeline.run.return_value = []
+        return sync_engine
+
+    def test_bad_contact_is_isolated(self, engine, mock_api2, mock_database):
+        """Test that a rejected batch is split until only the bad contact fails."""
+        contacts = [
+            Contact(f"people/{i}", "e", f"Contact {i}", emails=[f"c{i}@example.com"])
+            for i in range(8)
+        ]
+        contacts[5].display_name = "Bad"
+
+        def batch_create(batch):
+            if any(c.display_name == "Bad" for c in batch):
+                raise record_error()
+            return [Contact(f"people/new-{c.display_name}", "e", "") for c in batch]
+
+        mock_api2.batch_create_contacts.side_effect = batch_create
+
+        result = SyncResult()
+        result.to_create_in_account2 = contacts
+        engine.execute(result)
+
+        # 8 -> 4 + 4 -> 2 + 2 -> 1 + 1
+        assert mock_api2.batch_create_contacts.call_count == 7
+        assert result.stats.created_in_account2 == 7
+        assert result.stats.errors == 1
+        assert result.stats.writes_pending_retry == 0
+        assert result.failed_writes == [(ACCOUNT_1, "people/5", "Invalid contact")]
+        rows = [
+            row
+            for call in mock_database.bulk_upsert_contact_mappings.call_args_list
+            for row in call.args[0]
+        ]
+        assert len(rows) == 7
+        assert "people/new-Bad" not in {row["account2_resource_name"] for row in rows}
+
+    def test_written_batches_recorded_before_rate_limit(
+        self, engine, mock_api2, mock_database
+    ):
+        """Test that batches written before the rate limit ran out keep mappings."""
+        contacts = [
+            Contact(f"people/{i}", "e", f"Contact {i}", emails=[f"c{i}@example.com"])
+            for i in range(4)
+        ]
+        created = [Contact("people/new0", "e", ""), Contact("people/new1", "e", "")]
+        quota = RateLimitError("quota")
+        mock_api2.batch_create_contacts.side_effect = BatchWriteError(
+            "partial",
+            created + [None, None],
+            [None, None, quota, quota],
+        )
+
+        result = SyncResult()
+        result.to_create_in_account2 = contacts
+        with pytest.raises(RateLimitError):
+            engine.execute(result)
+
+        # Deferred contacts are not sent again in this run, and keep the
+        # sync tokens so the next sync reads them again
+        mock_api2.batch_create_contacts.assert_called_once()
+        assert result.stats.created_in_account2 == 2
+        assert result.stats.errors == 2
+        assert result.stats.writes_pending_retry == 2
+        assert result.failed_writes == []
+        mock_database.update_sync_state.assert_not_called()
+        rows = mock_database.bulk_upsert_contact_mappings.call_args.args[0]
+        assert [row["account2_resource_name"] for row in rows] == [
+            "people/new0",
+            "people/new1",
+        ]
+
+    def test_non_record_errors_are_not_split(self, engine, mock_api1):
+        """Test that errors unrelated to the records fail the batch as a whole."""
+        mock_api1.batch_delete_contacts.side_effect = PeopleAPIError("Forbidden")
+
+        result = SyncResult()
+        result.to_delete_in_account1 = ["people/1", "people/2", "people/3"]
+        engine.execute(result)
+
+        mock_api1.batch_delete_contacts.assert_called_once()
+        assert result.stats.errors == 3
+        # The mappings of deleted contacts are gone, so they are not retried
+        assert result.stats.writes_pending_retry == 0
+        assert result.failed_writes == []
+
+
+def person(resource_name, name, email, deleted=False):
+    """Build a raw People API person."""
+    data = {
+        "resourceName": resource_name,
+        "etag": f"etag-{resource_name}",
+        "names": [{"displayName": name}],
+        "emailAddresses": [{"value": email}],
+    }
+    if deleted:
+        data["metadata"] = {"deleted": True}
+    return data
+
+
+class TestContactMirror:
+    """Tests for listing contacts through the local mirror."""
+
+    @pytest.fixture
+    def database(self):
+        """Create an initialized in-memory database."""
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        return db
+
+    @pytest.fixture
+    def engine(self, mock_api1, mock_api2, database):
+        """Create a SyncEngine that lists contacts through the mirror."""
+        return SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=database,
+            use_llm_matching=False,
+            contact_mirror=True,
+        )
+
+    def test_first_listing_fills_mirror(self, engine, mock_api1, database):
+        """Test that a stored token is ignored until the mirror is complete."""
+        database.update_sync_state(ACCOUNT_1, sync_token="old")
+        mock_api1.list_people.return_value = (
+            [person("people/1", "Ann", "ann@example.com")],
+            "t1",
+        )
+
+        contacts, token, base = engine._list_contacts(
+            mock_api1, ACCOUNT_1, False, "account1"
+        )
+
+        mock_api1.list_people.assert_called_once_with()
+        assert [c.resource_name for c in contacts] == ["people/1"]
+        assert (token, base) == ("t1", None)
+        assert database.is_contact_mirror_complete(ACCOUNT_1)
+        [row] = database.get_contact_mirror(ACCOUNT_1)
+        assert row["matching_key"] == contacts[0].matching_key()
+        assert row["content_hash"] == contacts[0].content_hash()
+
+    def test_incremental_listing_applies_delta(self, engine, mock_api1, database):
+        """Test that only changes are listed, but every contact is analyzed."""
+        mock_api1.list_people.return_value = (
+            [
+                person("people/1", "Ann", "ann@example.com"),
+                person("people/2", "Bob", "bob@example.com"),
+            ],
+            "t1",
+        )
+        engine._list_contacts(mock_api1, ACCOUNT_1, False, "account1")
+        database.update_sync_state(ACCOUNT_1, sync_token="t1")
+
+        mock_api1.list_people.return_value = (
+            [
+                person("people/2", "Bob", "bob@example.com", deleted=True),
+                person("people/3", "Cy", "cy@example.com"),
+            ],
+            "t2",
+        )
+        contacts, token, base = engine._list_contacts(
+            mock_api1, ACCOUNT_1, False, "account1"
+        )
+
+        mock_api1.list_people.assert_called_with(sync_token="t1")
+        assert [(c.resource_name, c.deleted) for c in contacts] == [
+            ("people/1", False),
+            ("people/3", False),
+            ("people/2", True),
+        ]
+        assert (token, base) == ("t2", None)
+        assert database.get_contact_mirror_count(ACCOUNT_1) == 2
+
+    def test_mirrored_contacts_reuse_stored_key_and_hash(
+        self, engine, mock_api1, database
+    ):
+        """Test that contacts read from the mirror are not hashed again."""
+        mock_api1.list_people.return_value = (
+            [person("people/1", "Ann", "ann@example.com")],
+            "t1",
+        )
+        engine._list_contacts(mock_api1, ACCOUNT_1, False, "account1")
+        database.update_sync_state(ACCOUNT_1, sync_token="t1")
+        [row] = database.get_contact_mirror(ACCOUNT_1)
+        mock_api1.list_people.return_value = ([], "t2")
+
+        with (
+            patch.object(
+                Contact, "_compute_content_hash", autospec=True
+            ) as compute_hash,
+            patch.object(
+                Contact, "_compute_matching_key", autospec=True
+            ) as compute_key,
+        ):
+            contacts, _, _ = engine._list_contacts(
+                mock_api1, ACCOUNT_1, False, "account1"
+            )
+            assert contacts[0].content_hash() == row["content_hash"]
+            assert contacts[0].matching_key() == row["matching_key"]
+
+        compute_hash.assert_not_called()
+        compute_key.assert_not_called()
+
+    def test_groups_fall_back_to_mirror(self, engine, mock_api1):
+        """Test that mirrored groups are used when listing groups fails."""
+        groups = [{"resourceName": "contactGroups/a", "name": "Family"}]
+        mock_api1.list_contact_groups.return_value = (groups, None)
+        assert engine._fetch_group_data(mock_api1, ACCOUNT_1) == groups
+
+        mock_api1.list_contact_groups.side_effect = PeopleAPIError("boom")
+
+        assert engine._fetch_group_data(mock_api1, ACCOUNT_1) == groups
+
+
+class TestIncrementalAnalysis:
+    """Tests for analyzing only the contacts changed since the last sync."""
+
+    @pytest.fixture
+    def database(self):
+        """Create an initialized in-memory database."""
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        return db
+
+    @pytest.fixture
+    def engine(self, mock_api1, mock_api2, database):
+        """Create a SyncEngine with a synced Ann and Bob in both accounts."""
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=database,
+            use_llm_matching=False,
+            contact_mirror=True,
+            incremental_analysis=True,
+        )
+        # Normally set up by sync()
+        engine._pending_key_updates = []
+        for api, suffix in ((mock_api1, "a"), (mock_api2, "b")):
+            api.list_people.return_value = (
+                [
+                    person(f"people/ann-{suffix}", "Ann", "ann@example.com"),
+                    person(f"people/bob-{suffix}", "Bob", "bob@example.com"),
+                ],
+                "t1",
+            )
+        result = engine.analyze()
+        assert len(result.matched_contacts) == 2
+        for contact1, contact2 in result.matched_contacts:
+            database.upsert_contact_mapping(
+                contact1.matching_key(),
+                contact1.resource_name,
+                contact2.resource_name,
+                last_synced_hash=contact1.content_hash(),
+            )
+        database.update_sync_state(ACCOUNT_1, sync_token="t1")
+        database.update_sync_state(ACCOUNT_2, sync_token="t1")
+        mock_api2.list_people.return_value = ([], "t2")
+        return engine
+
+    def test_only_changed_pairs_are_reevaluated(self, engine, mock_api1):
+        """Test that unchanged pairs are skipped and new contacts are created."""
+        mock_api1.list_people.return_value = (
+            [
+                person("people/bob-a", "Bobby", "bob@example.com"),
+                person("people/cy-a", "Cy", "cy@example.com"),
+            ],
+            "t2",
+        )
+
+        with patch.object(
+            engine,
+            "_analyze_existing_pair",
+            wraps=engine._analyze_existing_pair,
+        ) as analyze_pair:
+            result = engine.analyze()
+
+        assert analyze_pair.call_count == 1
+        # Unchanged pairs are reported as matched without being compared
+        assert [
+            (c1.resource_name, c2.resource_name) for c1, c2 in result.matched_contacts
+        ] == [("people/bob-a", "people/bob-b"), ("people/ann-a", "people/ann-b")]
+        assert [(r, c.display_name) for r, c in result.to_update_in_account2] == [
+            ("people/bob-b", "Bobby")
+        ]
+        assert [c.resource_name for c in result.to_create_in_account2] == [
+            "people/cy-a"
+        ]
+        assert result.stats.contacts_in_account1 == 3
+
+    def test_new_duplicate_of_unchanged_pair_is_detected(self, engine, mock_api1):
+        """Test that duplicate detection still sees pairs not re-evaluated."""
+        mock_api1.list_people.return_value = (
+            [person("people/ann2-a", "Ann Other", "ann@example.com")],
+            "t2",
+        )
+
+        result = engine.analyze()
+
+        assert [
+            d.unmatched_contact.resource_name for d in result.potential_duplicates
+        ] == ["people/ann2-a"]
+        assert result.to_create_in_account2 == []
+
+    def test_deletion_is_propagated(self, engine, mock_api1):
+        """Test that a deletion since the last sync is propagated."""
+        mock_api1.list_people.return_value = (
+            [person("people/ann-a", "Ann", "ann@example.com", deleted=True)],
+            "t2",
+        )
+
+        result = engine.analyze()
+
+        assert result.to_delete_in_account2 == ["people/ann-b"]
+        assert result.to_create_in_account1 == []
 
-        mock_database.get_group_mapping_by_resource_name.side_effect = mock_get_mapping
+    def test_full_sync_analyzes_every_pair(self, engine, mock_api1, mock_api2):
+        """Test that a full sync lists and re-evaluates every contact."""
+        mock_api2.list_people.return_value = mock_api1.list_people.return_value
+        result = engine.analyze(full_sync=True)
 
-        mock_api1.batch_create_contacts.return_value = [
-            Contact("people/new", "e_new", "Jane Doe", emails=["jane@example.com"])
-        ]
+        mock_api1.list_people.assert_called_with()
+        assert len(result.matched_contacts) == 2
 
-        mock_api1.list_contact_groups.return_value = ([], None)
-        mock_api2.list_contact_groups.return_value = ([], None)
-        mock_api1.list_contacts.return_value = ([], "token1")
-        mock_api2.list_contacts.return_value = ([], "token2")
+    def test_group_changes_force_full_analysis(self, engine):
+        """Test that contacts are all analyzed when groups change."""
+        snapshot = AccountSnapshot(
+            groups=[], raw_groups=[], contacts=[], changed_resource_names=frozenset()
+        )
+        result = SyncResult()
+        assert engine._get_incremental_changes(False, snapshot, snapshot, result) == (
+            frozenset(),
+            frozenset(),
+        )
 
-        sync_engine.execute(result)
+        result.groups_to_create_in_account2.append(MagicMock())
 
-        # Verify memberships were mapped to account1's group
-        created_contacts = mock_api1.batch_create_contacts.call_args[0][0]
-        assert created_contacts[0].memberships == ["contactGroups/abc123"]
+        assert (
+            engine._get_incremental_changes(False, snapshot, snapshot, result) is None
+        )
 
-    def test_execute_updates_maps_memberships(
-        self, sync_engine, mock_api1, mock_api2, mock_database
+    def test_failed_write_is_retried_without_changes(
+        self, engine, mock_api1, mock_api2, database
     ):
-        """Test that contact update maps memberships to target account."""
-        # Source contact from account 1 with a group membership
-        source_contact = Contact(
-            "people/1",
-            "e1",
-            "John Doe",
-            emails=["john@example.com"],
-            memberships=["contactGroups/abc123"],
+        """Test that a rejected contact is analyzed again by the next sync."""
+        engine.photo_pipeline = MagicMock(spec=PhotoPipeline)
+        engine.photo_pipeline.run.return_value = []
+        mock_api1.list_people.return_value = (
+            [person("people/cy-a", "Cy", "cy@example.com")],
+            "t2",
         )
+        mock_api2.batch_create_contacts.side_effect = record_error()
 
-        result = SyncResult()
-        result.to_update_in_account2.append(("people/target2", source_contact))
+        result = engine.analyze()
+        engine.execute(result)
 
-        # Set up group mapping
-        def mock_get_mapping(resource_name, account):
-            if resource_name == "contactGroups/abc123" and account == 1:
-                return {
-                    "group_name": "family",
-                    "account1_resource_name": "contactGroups/abc123",
-                    "account2_resource_name": "contactGroups/xyz789",
-                }
-            return None
+        # The sync tokens move on; the rejected contact waits in the retry table
+        assert database.get_sync_state(ACCOUNT_1)["sync_token"] == "t2"
+        assert database.get_pending_contact_writes(ACCOUNT_1) == ["people/cy-a"]
 
-        mock_database.get_group_mapping_by_resource_name.side_effect = mock_get_mapping
+        mock_api1.list_people.return_value = ([], "t3")
+        mock_api2.list_people.return_value = ([], "t3")
+        mock_api2.batch_create_contacts.side_effect = None
+        mock_api2.batch_create_contacts.return_value = [
+            Contact("people/cy-b", "e", "Cy")
+        ]
 
-        # Mock get_contact to return current contact
-        mock_api2.get_contact.return_value = Contact(
-            "people/target2", "current_etag", "John Doe"
-        )
-        mock_api2.batch_update_contacts.return_value = [
-            Contact("people/target2", "new_etag", "John Doe")
+        result = engine.analyze()
+
+        assert result.retried_writes == [(ACCOUNT_1, "people/cy-a")]
+        assert [c.resource_name for c in result.to_create_in_account2] == [
+            "people/cy-a"
         ]
 
-        mock_api1.list_contact_groups.return_value = ([], None)
-        mock_api2.list_contact_groups.return_value = ([], None)
-        mock_api1.list_contacts.return_value = ([], "token1")
-        mock_api2.list_contacts.return_value = ([], "token2")
+        engine.execute(result)
 
-        sync_engine.execute(result)
+        assert database.get_pending_contact_writes(ACCOUNT_1) == []
+        assert database.get_sync_state(ACCOUNT_1)["sync_token"] == "t3"
 
-        # Verify batch_update_contacts was called
-        mock_api2.batch_update_contacts.assert_called_once()
-        # Get the updates that were passed
-        updates = mock_api2.batch_update_contacts.call_args[0][0]
-        assert len(updates) == 1
-        # Verify memberships were mapped
-        _resource_name, updated_contact = updates[0]
-        assert updated_contact.memberships == ["contactGroups/xyz789"]
 
-    def test_execute_creates_excludes_unmapped_memberships(
-        self, sync_engine, mock_api1, mock_api2, mock_database
-    ):
-        """Test that unmapped memberships are excluded during contact creation."""
-        contact = Contact(
-            "people/1",
-            "e1",
-            "John Doe",
-            emails=["john@example.com"],
-            memberships=[
-                "contactGroups/abc123",  # Has mapping
-                "contactGroups/unknown",  # No mapping
-                "contactGroups/myContacts",  # System group
+class TestPendingWritesWithoutMirror:
+    """Tests for retrying failed writes when contacts are listed as a delta."""
+
+    @pytest.fixture
+    def database(self):
+        """Create an initialized in-memory database with pending writes."""
+        db = SyncDatabase(":memory:")
+        db.initialize()
+        db.update_sync_state(ACCOUNT_1, sync_token="t1")
+        db.update_pending_contact_writes(
+            [],
+            [
+                (ACCOUNT_1, name, "Invalid contact")
+                for name in ("people/1", "people/2", "people/gone", "people/flaky")
             ],
         )
+        return db
 
-        result = SyncResult()
-        result.to_create_in_account2.append(contact)
+    @pytest.fixture
+    def engine(self, mock_api1, mock_api2, database):
+        """Create a SyncEngine listing contacts without the mirror."""
+        return SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=database,
+            use_llm_matching=False,
+        )
 
-        # Only abc123 has a mapping
-        def mock_get_mapping(resource_name, account):
-            if resource_name == "contactGroups/abc123" and account == 1:
-                return {
-                    "group_name": "family",
-                    "account1_resource_name": "contactGroups/abc123",
-                    "account2_resource_name": "contactGroups/xyz789",
-                }
-            return None
+    def test_pending_contacts_added_to_delta(self, engine, mock_api1):
+        """Test that pending contacts outside the delta are fetched."""
+        from googleapiclient.errors import HttpError
 
-        mock_database.get_group_mapping_by_resource_name.side_effect = mock_get_mapping
+        def get_contact(resource_name):
+            if resource_name == "people/1":
+                return Contact("people/1", "e", "Ann", emails=["ann@example.com"])
+            resp = MagicMock()
+            resp.status = 404 if resource_name == "people/gone" else 503
+            error = PeopleAPIError(f"get_contact({resource_name}) failed")
+            error.__cause__ = HttpError(resp, b"error")
+            raise error
 
-        mock_api2.batch_create_contacts.return_value = [
-            Contact("people/new", "e_new", "John Doe")
+        mock_api1.list_contacts.return_value = (
+            [Contact("people/2", "e", "Bob", emails=["bob@example.com"])],
+            "t2",
+        )
+        mock_api1.get_contact.side_effect = get_contact
+
+        snapshot = engine._fetch_account(mock_api1, ACCOUNT_1, False, "account1")
+
+        assert [c.resource_name for c in snapshot.contacts] == [
+            "people/2",
+            "people/1",
         ]
+        # A contact that is gone is not retried again; one that could not be
+        # fetched stays pending
+        assert snapshot.retried_writes == {"people/1", "people/2", "people/gone"}
+        assert mock_api1.get_contact.call_count == 3
 
-        mock_api1.list_contact_groups.return_value = ([], None)
-        mock_api2.list_contact_groups.return_value = ([], None)
-        mock_api1.list_contacts.return_value = ([], "token1")
-        mock_api2.list_contacts.return_value = ([], "token2")
+    def test_full_listing_retries_every_pending_contact(self, engine, mock_api1):
+        """Test that a full listing needs no extra requests."""
+        mock_api1.list_contacts.return_value = ([], "t2")
 
-        sync_engine.execute(result)
+        snapshot = engine._fetch_account(mock_api1, ACCOUNT_1, True, "account1")
 
-        created_contacts = mock_api2.batch_create_contacts.call_args[0][0]
-        # Only the mapped group should be included
-        assert created_contacts[0].memberships == ["contactGroups/xyz789"]
+        assert len(snapshot.retried_writes) == 4
+        mock_api1.get_contact.assert_not_called()
 
 
 # ==============================================================================
@@ -3188,6 +4036,104 @@ class TestPhotoSync:
         assert "photos" not in api_format
 
 
+class TestPhotoPipelineInEngine:
+    """Tests for running photo transfers after contact batches are written."""
+
+    @pytest.fixture
+    def engine(self, sync_engine):
+        """Sync engine with a mocked photo pipeline that succeeds."""
+        sync_engine.photo_pipeline = MagicMock(spec=PhotoPipeline)
+        sync_engine.photo_pipeline.run.side_effect = lambda tasks: [
+            PhotoResult(task=task, succeeded=True) for task in tasks
+        ]
+        return sync_engine
+
+    def _contacts(self, count):
+        return [
+            Contact(
+                f"people/{i}",
+                f"e{i}",
+                f"Contact {i}",
+                emails=[f"c{i}@example.com"],
+                photo_url=f"https://example.com/{i}.jpg",
+            )
+            for i in range(count)
+        ]
+
+    def test_creates_run_photos_once_after_batch(self, engine, mock_api2):
+        """Test photos for a created batch go through the pipeline in one run."""
+        contacts = self._contacts(3)
+        created = [
+            Contact(f"people/new{i}", f"n{i}", c.display_name)
+            for i, c in enumerate(contacts)
+        ]
+        mock_api2.batch_create_contacts.return_value = created
+        result = SyncResult(stats=SyncStats(photos_synced=3))
+
+        engine._execute_creates(contacts, mock_api2, account=2, result=result)
+
+        engine.photo_pipeline.run.assert_called_once()
+        tasks = engine.photo_pipeline.run.call_args.args[0]
+        assert [t.source_contact for t in tasks] == contacts
+        assert [t.dest_resource_name for t in tasks] == [
+            "people/new0",
+            "people/new1",
+            "people/new2",
+        ]
+        assert all(t.dest_api is mock_api2 for t in tasks)
+        assert result.stats.photos_synced == 3
+        assert result.stats.photos_failed == 0
+
+    def test_updates_use_source_contact_photo(self, engine, mock_api1):
+        """Test update photo tasks carry the source contact, not the rebuilt one."""
+        sources = self._contacts(2)
+        updates = [(f"people/dest{i}", c) for i, c in enumerate(sources)]
+        mock_api1.get_contact.side_effect = lambda rn: Contact(rn, "cur", "Current")
+        mock_api1.batch_update_contacts.side_effect = lambda pairs: [
+            Contact(rn, "updated", c.display_name) for rn, c in pairs
+        ]
+        result = SyncResult(stats=SyncStats(photos_synced=2))
+
+        engine._execute_updates(updates, mock_api1, account=1, result=result)
+
+        tasks = engine.photo_pipeline.run.call_args.args[0]
+        assert [(t.dest_resource_name, t.source_contact) for t in tasks] == updates
+
+    def test_engine_passes_shared_session_to_pipeline(self, sync_engine):
+        """Test photo downloads use the engine's pooled session."""
+        assert sync_engine.photo_pipeline.session is sync_engine.photo_session
+
+    def test_close_closes_photo_session(self, mock_api1, mock_api2, mock_database):
+        """Test the photo session lives as long as the engine."""
+        with SyncEngine(
+            api1=mock_api1, api2=mock_api2, database=mock_database
+        ) as engine:
+            engine.photo_session = MagicMock()
+
+        engine.photo_session.close.assert_called_once()
+
+    def test_failed_photos_update_stats(self, engine, mock_api2):
+        """Test failed transfers move photos from synced to failed."""
+        contacts = self._contacts(3)
+        contacts.append(Contact("people/nophoto", "e", "No Photo"))
+        mock_api2.batch_create_contacts.return_value = [
+            Contact(f"people/new{i}", f"n{i}", c.display_name)
+            for i, c in enumerate(contacts)
+        ]
+        # Second photo fails, and the delete for the photo-less contact fails
+        engine.photo_pipeline.run.side_effect = lambda tasks: [
+            PhotoResult(task=task, succeeded=i not in (1, 3), error="boom")
+            for i, task in enumerate(tasks)
+        ]
+        result = SyncResult(stats=SyncStats(photos_synced=3))
+
+        engine._execute_creates(contacts, mock_api2, account=2, result=result)
+
+        assert result.stats.photos_synced == 2
+        assert result.stats.photos_failed == 1
+        assert result.stats.created_in_account2 == 4
+
+
 # ==============================================================================
 # Contact Filtering Tests
 # ==============================================================================
@@ -5679,6 +6625,105 @@ class TestSyncWithBackup:
         assert result.stats.created_in_account1 == 1
         assert result.stats.created_in_account2 == 1
 
+    def test_sync_lists_each_account_once(
+        self, mock_api1, mock_api2, mock_database, tmp_path
+    ):
+        """Test that the backup reuses the listing done for analysis."""
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+
+        engine = SyncEngine(api1=mock_api1, api2=mock_api2, database=mock_database)
+        engine.sync(dry_run=True, backup_dir=tmp_path / "backups")
+
+        assert mock_api1.list_contacts.call_count == 1
+        assert mock_api2.list_contacts.call_count == 1
+        assert mock_api1.list_contact_groups.call_count == 1
+        assert mock_api2.list_contact_groups.call_count == 1
+        assert len(list((tmp_path / "backups").glob("backup_*.json"))) == 1
+
+    def test_incremental_sync_backup_applies_delta(
+        self, mock_api1, mock_api2, mock_database, tmp_path
+    ):
+        """Test that an incremental sync backs up previous backup plus changes."""
+        import json
+
+        from gcontact_sync.backup.manager import BackupManager
+
+        backup_dir = tmp_path / "backups"
+        previous = BackupManager(backup_dir).create_backup(
+            account1_contacts=[
+                Contact("people/a", "e1", "Alice"),
+                Contact("people/b", "e1", "Bob"),
+            ],
+            account1_groups=[],
+            account2_contacts=[Contact("people/x", "e1", "Xavier")],
+            account2_groups=[],
+            account1_sync_token="old1",
+            account2_sync_token="old2",
+        )
+        # Keep the previous backup distinct from the one created by sync()
+        previous.rename(backup_dir / "backup_20000101_000000.json")
+
+        mock_database.get_sync_state.side_effect = lambda account_id: {
+            "sync_token": "old1" if account_id == "account1" else "old2"
+        }
+        mock_api1.list_contacts.return_value = (
+            [
+                Contact("people/b", "e2", "Bobby"),
+                Contact("people/c", "e2", "Carol"),
+                Contact("people/a", "e2", "", deleted=True),
+            ],
+            "new1",
+        )
+        mock_api2.list_contacts.return_value = ([], "new2")
+
+        engine = SyncEngine(api1=mock_api1, api2=mock_api2, database=mock_database)
+        engine.sync(dry_run=True, backup_dir=backup_dir)
+
+        # Only the incremental listings were made
+        mock_api1.list_contacts.assert_called_once_with(sync_token="old1")
+        mock_api2.list_contacts.assert_called_once_with(sync_token="old2")
+
+        newest = BackupManager(backup_dir).list_backups()[0]
+        with open(newest, encoding="utf-8") as f:
+            accounts = json.load(f)["accounts"]
+        names1 = [c["display_name"] for c in accounts["account1"]["contacts"]]
+        names2 = [c["display_name"] for c in accounts["account2"]["contacts"]]
+        assert names1 == ["Bobby", "Carol"]
+        assert names2 == ["Xavier"]
+        assert accounts["account1"]["sync_token"] == "new1"
+        assert accounts["account2"]["sync_token"] == "new2"
+
+    def test_incremental_sync_backup_without_base_lists_all(
+        self, mock_api1, mock_api2, mock_database, tmp_path
+    ):
+        """Test full listing for the backup when no base backup exists."""
+        from gcontact_sync.backup.manager import BackupManager
+
+        mock_database.get_sync_state.return_value = {"sync_token": "old"}
+        full = [Contact("people/a", "e1", "Alice"), Contact("people/b", "e1", "Bob")]
+
+        def list_contacts(sync_token=None):
+            if sync_token:
+                return [], "new"
+            return full, "new"
+
+        mock_api1.list_contacts.side_effect = list_contacts
+        mock_api2.list_contacts.side_effect = list_contacts
+        mock_api1.iter_contacts.return_value = iter(full)
+        mock_api2.iter_contacts.return_value = iter(full)
+
+        engine = SyncEngine(api1=mock_api1, api2=mock_api2, database=mock_database)
+        backup_file = engine._create_pre_sync_backup(
+            BackupManager(tmp_path / "backups"), engine._fetch_accounts(False)
+        )
+
+        # The full listing is streamed straight into the backup
+        assert mock_api1.list_contacts.call_count == 1
+        mock_api1.iter_contacts.assert_called_once_with(request_sync_token=False)
+        data = BackupManager(tmp_path / "backups").load_backup(backup_file)
+        assert len(data["accounts"]["account1"]["contacts"]) == 2
+
 
 # ==============================================================================
 # Sync Label Group Tests
@@ -7378,3 +8423,217 @@ class TestGroupSyncModeIntegration:
 
         # Contact should be queued
         assert len(result.to_create_in_account2) == 1
+
+
+# ==============================================================================
+# Candidate Blocking Tests
+# ==============================================================================
+
+
+class TestMultiTierMatchBlocking:
+    """Tests for candidate blocking in SyncEngine._multi_tier_match()."""
+
+    def _make_engine(self, mock_api1, mock_api2, mock_database, use_blocking):
+        from gcontact_sync.sync.matcher import MatchConfig
+
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=mock_database,
+            match_config=MatchConfig(
+                use_llm_matching=False, use_candidate_blocking=use_blocking
+            ),
+        )
+        # Pair analysis is covered elsewhere; only matching is under test here
+        engine._analyze_contact_pair = MagicMock()
+        return engine
+
+    def _contacts(self):
+        unmatched1 = [
+            Contact("people/1", "e1", "John Smith", emails=["john@work.com"]),
+            Contact("people/2", "e2", "Alice Jones", phones=["555-123-4567"]),
+            Contact("people/3", "e3", "Zed Zulu"),
+        ]
+        unmatched2 = [
+            Contact("people/a", "ea", "Alice J", phones=["+1 555 123 4567"]),
+            Contact("people/b", "eb", "Johnny Smith", emails=["john@work.com"]),
+            Contact("people/c", "ec", "Quentin Blake"),
+        ]
+        return unmatched1, unmatched2
+
+    def test_blocking_prunes_unrelated_pairs(self, mock_api1, mock_api2, mock_database):
+        """Test that pairs without a shared blocking key are not scored."""
+        engine = self._make_engine(mock_api1, mock_api2, mock_database, True)
+        unmatched1, unmatched2 = self._contacts()
+        result = SyncResult()
+        matched1: set[str] = set()
+        matched2: set[str] = set()
+
+        found = engine._multi_tier_match(
+            unmatched1, unmatched2, matched1, matched2, result
+        )
+
+        assert found == 2
+        assert matched1 == {"people/1", "people/2"}
+        assert matched2 == {"people/a", "people/b"}
+        assert result.stats.match_pairs_considered == 2
+        assert result.stats.match_pairs_pruned == 7
+
+    def test_blocking_finds_same_matches_as_full_scan(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that blocking does not change which contacts are matched."""
+        unmatched1, unmatched2 = self._contacts()
+
+        outcomes = []
+        for use_blocking in (True, False):
+            engine = self._make_engine(
+                mock_api1, mock_api2, mock_database, use_blocking
+            )
+            result = SyncResult()
+            matched1: set[str] = set()
+            matched2: set[str] = set()
+            engine._multi_tier_match(unmatched1, unmatched2, matched1, matched2, result)
+            outcomes.append((matched1, matched2))
+
+        assert outcomes[0] == outcomes[1]
+
+    def test_blocking_disabled_scores_all_pairs(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that disabling blocking compares every cross-account pair."""
+        engine = self._make_engine(mock_api1, mock_api2, mock_database, False)
+        unmatched1, unmatched2 = self._contacts()
+        result = SyncResult()
+
+        engine._multi_tier_match(unmatched1, unmatched2, set(), set(), result)
+
+        assert result.stats.match_pairs_considered == 9
+        assert result.stats.match_pairs_pruned == 0
+
+    def test_assignment_beats_greedy_first_hit(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that a contact is not claimed by a weaker earlier partner."""
+        engine = self._make_engine(mock_api1, mock_api2, mock_database, True)
+        unmatched1 = [
+            Contact("people/1", "e1", "Alex Stone", emails=["alex@x.com"]),
+            Contact("people/2", "e2", "Alex Stone", phones=["555-000-1111"]),
+        ]
+        unmatched2 = [
+            # Exact name match for both account 1 contacts
+            Contact("people/a", "ea", "Alex Stone", emails=["other@y.com"]),
+            # Email match for the first account 1 contact only
+            Contact("people/b", "eb", "Alexander Stone", emails=["alex@x.com"]),
+        ]
+        result = SyncResult()
+        matched1: set[str] = set()
+        matched2: set[str] = set()
+
+        found = engine._multi_tier_match(
+            unmatched1, unmatched2, matched1, matched2, result
+        )
+
+        assert found == 2
+        pairs = {
+            (call.args[1].resource_name, call.args[2].resource_name)
+            for call in engine._analyze_contact_pair.call_args_list
+        }
+        assert pairs == {("people/1", "people/b"), ("people/2", "people/a")}
+
+    def test_uncertain_pairs_adjudicated_in_one_llm_call(
+        self, mock_api1, mock_api2, mock_database
+    ):
+        """Test that uncertain pairs are collected and sent to the LLM together."""
+        from gcontact_sync.sync.matcher import (
+            MatchConfidence,
+            MatchConfig,
+            MatchResult,
+            MatchTier,
+        )
+
+        engine = SyncEngine(
+            api1=mock_api1,
+            api2=mock_api2,
+            database=mock_database,
+            match_config=MatchConfig(use_llm_matching=True),
+        )
+        engine._analyze_contact_pair = MagicMock()
+
+        unmatched1 = [
+            Contact("people/1", "e1", "Jonathan Smith", emails=["js@a.com"]),
+            Contact("people/2", "e2", "Katherine Jones", emails=["kj@a.com"]),
+        ]
+        unmatched2 = [
+            Contact("people/a", "ea", "Jonathon Smyth", emails=["js@b.com"]),
+            Contact("people/b", "eb", "Catherine Jones", emails=["kj@b.com"]),
+        ]
+
+        def llm_match_many(groups):
+            results = []
+            for source, candidates in groups:
+                row = []
+                for candidate in candidates:
+                    same = source.display_name[-5:] == candidate.display_name[-5:]
+                    row.append(
+                        MatchResult(
+                            is_match=same,
+                            tier=MatchTier.LLM_MATCHED
+                            if same
+                            else MatchTier.LLM_NOT_MATCHED,
+                            confidence=MatchConfidence.LOW,
+                            score=0.9 if same else 0.1,
+                            reason="test",
+                        )
+                    )
+                results.append(row)
+            return results
+
+        engine.matcher.llm_match_many = MagicMock(side_effect=llm_match_many)
+        result = SyncResult()
+        matched1: set[str] = set()
+        matched2: set[str] = set()
+
+        found = engine._multi_tier_match(
+            unmatched1, unmatched2, matched1, matched2, result
+        )
+
+        engine.matcher.llm_match_many.assert_called_once()
+        assert found == 1
+        assert matched1 == {"people/2"}
+        assert matched2 == {"people/b"}
+
+    def test_analyze_preloads_and_flushes_llm_cache(
+        self, sync_engine, mock_api1, mock_api2
+    ):
+        """Test that analyze() wraps matching in one LLM cache session."""
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+        sync_engine.matcher.preload_llm_cache = MagicMock(return_value=0)
+        sync_engine.matcher.flush_llm_cache = MagicMock(return_value=0)
+
+        sync_engine.analyze()
+
+        sync_engine.matcher.preload_llm_cache.assert_called_once()
+        sync_engine.matcher.flush_llm_cache.assert_called_once()
+
+    def test_analyze_flushes_llm_cache_on_failure(
+        self, sync_engine, mock_api1, mock_api2
+    ):
+        """Test that LLM decisions are kept when analysis fails part way."""
+        mock_api1.list_contacts.return_value = ([], "token1")
+        mock_api2.list_contacts.return_value = ([], "token2")
+        sync_engine.matcher.preload_llm_cache = MagicMock(return_value=0)
+        sync_engine.matcher.flush_llm_cache = MagicMock(return_value=0)
+
+        with (
+            patch.object(
+                sync_engine,
+                "_analyze_all_contacts",
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            sync_engine.analyze()
+
+        sync_engine.matcher.flush_llm_cache.assert_called_once()